@@ -0,0 +1,160 @@
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from json import loads
+from multiprocessing import get_all_start_methods, get_context
+from subprocess import run  # nosec
+from sys import executable
+from time import perf_counter
+
+from benchmarks.import_time import measure_import_time
+from benchmarks.results import write_results
+
+FIRST_SCORE_SCRIPT = """
+from json import dumps
+from time import perf_counter
+
+start = perf_counter()
+from pandas import DataFrame
+from src.detecto import init_detecto
+imported = perf_counter()
+
+detector = init_detecto(method="pot")
+initialized = perf_counter()
+
+dataset = DataFrame(data={"feature_1": [float((i * 37) % 101) for i in range(0, 50)]})
+detector.timeframe.set_interval(total_rows=dataset.shape[0])
+detector.compute_exceedance_threshold(dataset=dataset, q=0.90)
+detector.extract_exceedance(dataset=dataset)
+detector.fit(dataset=dataset)
+scored = perf_counter()
+
+print(dumps({"import_s": imported - start, "init_s": initialized - imported, "first_score_s": scored - initialized}))
+"""
+
+
+def tiny_fit(detector, rows: int = 50) -> float:  # type: ignore
+    """
+    Fit a shipped detector on a tiny dataset inside a worker process and return the total anomaly score.
+
+    # Parameters
+    ------------
+        * detector (POTDetecto): The detector that was pickled and shipped to the worker.
+        * rows (int): The number of rows of the tiny dataset, default is 50.
+
+    # Returns
+    ------------
+        * float: The sum of all total anomaly scores, returned to keep the work observable.
+    """
+    from pandas import DataFrame
+
+    dataset = DataFrame(data={"feature_1": [float((i * 37) % 101) for i in range(0, rows)]})
+    detector.timeframe.set_interval(total_rows=dataset.shape[0])
+    detector.compute_exceedance_threshold(dataset=dataset, q=0.90)
+    detector.extract_exceedance(dataset=dataset)
+    detector.fit(dataset=dataset)
+    return float(detector.anomaly_score_dataset["total_anomaly_score"].sum())
+
+
+def measure_first_score(repeat: int = 5) -> dict[str, float]:
+    """
+    Measure the import, initialization, and time to first score of `init_detecto("pot")` in fresh interpreters.
+
+    # Parameters
+    ------------
+        * repeat (int): The number of fresh interpreters, the fastest run is reported to reduce noise, default is 5.
+
+    # Returns
+    ------------
+        * dict[str, float]: The seconds spent on the import, the detector initialization, the first tiny fit, and the whole process.
+    """
+    runs = []
+
+    for _ in range(0, repeat):
+        start = perf_counter()
+        process = run([executable, "-c", FIRST_SCORE_SCRIPT], capture_output=True, text=True, check=True)  # nosec
+        measured = loads(process.stdout)
+        measured["process_s"] = perf_counter() - start
+        runs.append(measured)
+
+    return min(runs, key=lambda measured_run: measured_run["process_s"])
+
+
+def measure_worker_spawn(
+    start_method: str = "spawn", workers: int = 2, tasks: int = 8
+) -> dict[str, str | int | float]:
+    """
+    Measure the cost of spawning a process pool and shipping detectors to its workers.
+
+    # Parameters
+    ------------
+        * start_method (str): The multiprocessing start method of the pool, "spawn", "fork", or "forkserver", default is "spawn".
+        * workers (int): The number of worker processes, default is 2.
+        * tasks (int): The number of detectors shipped to the workers, default is 8.
+
+    # Returns
+    ------------
+        * dict[str, str | int | float]: The seconds until the pool is created, until the first result (cold worker), until all results,
+            and the average seconds per task once the workers are warm.
+    """
+    from src.detecto import init_detecto
+
+    start = perf_counter()
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=get_context(start_method))
+    created = perf_counter()
+
+    try:
+        executor.submit(tiny_fit, init_detecto(method="pot")).result()
+        first_result = perf_counter()
+        futures = [executor.submit(tiny_fit, init_detecto(method="pot")) for _ in range(0, tasks)]
+        for future in futures:
+            future.result()
+        all_results = perf_counter()
+    finally:
+        executor.shutdown()
+
+    return {
+        "start_method": start_method,
+        "workers": workers,
+        "tasks": tasks,
+        "pool_creation_s": created - start,
+        "first_result_s": first_result - created,
+        "warm_task_s": (all_results - first_result) / tasks,
+        "total_s": all_results - start,
+    }
+
+
+def run_cold_start_benchmark(repeat: int = 5, start_methods: tuple[str, ...] | None = None) -> dict:
+    """
+    Run the complete cold start suite: import time, time to first score, and process-pool worker spawn cost.
+
+    # Parameters
+    ------------
+        * repeat (int): The number of fresh interpreters for the import and first score measurements, default is 5.
+        * start_methods (tuple[str, ...] | None): The multiprocessing start methods to measure the worker spawn cost for, default is
+            every start method of the platform, e.g. only "spawn" on Windows.
+
+    # Returns
+    ------------
+        * dict: The measurements of the suite, keyed by "import_time", "first_score", and "worker_spawn".
+    """
+    if start_methods is None:
+        start_methods = tuple(get_all_start_methods())
+
+    return {
+        "import_time": measure_import_time(module="src.detecto", repeat=repeat),
+        "first_score": measure_first_score(repeat=repeat),
+        "worker_spawn": [measure_worker_spawn(start_method=start_method) for start_method in start_methods],
+    }
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Import-time and cold-start benchmark for short-lived Detecto processes.")
+    parser.add_argument("--output", default="benchmarks/results/cold_start.json", help="The JSON file to write into.")
+    parser.add_argument("--repeat", type=int, default=5, help="The number of fresh interpreters per measurement.")
+    arguments = parser.parse_args()
+
+    print(
+        write_results(
+            path=arguments.output, benchmark="cold_start", results=run_cold_start_benchmark(repeat=arguments.repeat)
+        )
+    )
@@ -0,0 +1,71 @@
+from subprocess import run  # nosec
+from sys import executable
+from time import perf_counter
+
+# The cold start budget of `import src.detecto`, just above the measured ~1.0 s after deferring the optional modules (was ~1.3 - 1.4 s)
+IMPORT_BUDGET_MS = 1100
+
+
+def parse_import_time(stderr: str) -> dict[str, tuple[int, int]]:
+    """
+    Parse the report of `python -X importtime` into the self and cumulative import time per module.
+
+    # Parameters
+    ------------
+        * stderr (str): The standard error output of a `python -X importtime` process.
+
+    # Returns
+    ------------
+        * dict[str, tuple[int, int]]: The self and cumulative import time in microseconds, keyed by module name.
+    """
+    import_times = {}
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        import_times[module.strip()] = (int(self_us), int(cumulative_us))
+
+    return import_times
+
+
+def measure_import_time(module: str = "src.detecto", repeat: int = 5) -> dict[str, str | int | float | bool | list]:
+    """
+    Import a module in fresh interpreters with `-X importtime` and report the fastest cold start.
+
+    # Parameters
+    ------------
+        * module (str): The module to import, default is "src.detecto".
+        * repeat (int): The number of fresh interpreters, the fastest run is reported to reduce noise, default is 5.
+
+    # Returns
+    ------------
+        * dict[str, str | int | float | bool | list]: The wall time of the interpreter, the cumulative import time of the module, the slowest
+            imported top-level packages, and whether the optional plotting dependency was imported.
+    """
+    runs = []
+
+    for _ in range(0, repeat):
+        start = perf_counter()
+        process = run(
+            [executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+        )  # nosec
+        wall_time_s = perf_counter() - start
+        runs.append((wall_time_s, parse_import_time(stderr=process.stderr)))
+
+    wall_time_s, import_times = min(runs, key=lambda measured_run: measured_run[1][module][1])
+    top_level_packages = sorted(
+        [(name, times[1]) for name, times in import_times.items() if "." not in name],
+        key=lambda package: package[1],
+        reverse=True,
+    )
+
+    return {
+        "module": module,
+        "wall_time_s": wall_time_s,
+        "cumulative_import_us": import_times[module][1],
+        "total_modules": len(import_times),
+        "slowest_packages": [{"package": name, "cumulative_import_us": us} for name, us in top_level_packages[:10]],
+        "imports_matplotlib": "matplotlib" in import_times,
+    }
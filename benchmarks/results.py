@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+from json import dump
+from os import makedirs, path as os_path, replace
+from platform import platform, python_version
+
+
+def write_results(path: str, benchmark: str, results: dict | list) -> str:
+    """
+    Write benchmark results with the environment metadata into a JSON file, so regressions can be compared across runs.
+
+    # Parameters
+    ------------
+        * path (str): The path of the JSON file, the parent directories are created if they do not exist.
+        * benchmark (str): The name of the benchmark suite.
+        * results (dict | list): The measurements of the benchmark suite.
+
+    # Returns
+    ------------
+        * str: The path of the written file.
+    """
+    directory = os_path.dirname(path)
+
+    if len(directory) > 0:
+        makedirs(directory, exist_ok=True)
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w") as file:
+        dump(
+            {
+                "benchmark": benchmark,
+                "created_at": datetime.now(tz=timezone.utc).isoformat(),
+                "python_version": python_version(),
+                "platform": platform(),
+                "results": results,
+            },
+            file,
+            indent=2,
+        )
+    replace(temporary_path, path)
+    return path
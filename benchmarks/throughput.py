@@ -0,0 +1,259 @@
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from time import perf_counter, process_time
+from tracemalloc import get_traced_memory, is_tracing, reset_peak, start, stop
+from typing import Callable
+
+from numpy import cumsum, int64, ndarray
+from pandas import DataFrame
+
+from benchmarks.results import write_results
+
+DEFAULT_ROWS = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_FEATURES = (1, 10, 100, 500)
+POT_DETECTO_STAGES = (
+    "compute_exceedance_threshold",
+    "extract_exceedance",
+    "fit",
+    "compute_anomaly_threshold",
+    "detect",
+    "evaluate",
+)
+
+
+def synthetic_heavy_tailed(rows: int, features: int, seed: int = 0) -> DataFrame:
+    """
+    Create a synthetic heavy-tailed dataset with `SyntheticPOTDataset`, without the timestamp and label columns.
+
+    # Parameters
+    ------------
+        * rows (int): The number of rows (observations).
+        * features (int): The number of features (columns).
+        * seed (int): The seed of the random generator, default is 0.
+
+    # Returns
+    ------------
+        * DataFrame: The synthetic time series dataset with 1 column per feature.
+    """
+    from src.detecto.datasets.synthetic import SyntheticPOTDataset
+
+    synthetic_dataset = SyntheticPOTDataset(rows=rows, features=features, seed=seed)
+    return synthetic_dataset.to_frame()[synthetic_dataset.columns]
+
+
+def count_gpd_fits(exceedances: ndarray, t0: int) -> int:
+    """
+    Count the `genpareto.fit()` calls of a fit: one per cell after t0 with an exceedance and at least one earlier exceedance.
+
+    # Parameters
+    ------------
+        * exceedances (ndarray): The 2D array of the exceedance dataset.
+        * t0 (int): The number of rows only used for learning.
+
+    # Returns
+    ------------
+        * int: The number of GPD fits.
+    """
+    positive = exceedances > 0.0
+    positive_counts = positive.astype(int64)
+    earlier_positives = cumsum(positive_counts, axis=0) - positive_counts
+    return int((positive[t0:] & (earlier_positives[t0:] > 0)).sum())
+
+
+def time_stage(stage: Callable[[], object]) -> tuple[object, dict[str, float | int]]:
+    """
+    Run a single stage and measure its wall time, CPU time, and its own peak of traced memory.
+
+    The peak is measured with `tracemalloc` and reset before the stage, so unlike the peak RSS of the process it is not the largest
+    peak of an earlier stage, and it works on every platform. Tracing is only stopped afterwards if this function started it.
+
+    # Parameters
+    ------------
+        * stage (Callable[[], object]): The stage to run.
+
+    # Returns
+    ------------
+        * tuple[object, dict[str, float | int]]: The return value of the stage and its measurements, the peak is measured in bytes
+            above the traced memory before the stage.
+    """
+    is_started = not is_tracing()
+    if is_started:
+        start()
+
+    try:
+        reset_peak()
+        traced_start = get_traced_memory()[0]
+        wall_start, cpu_start = perf_counter(), process_time()
+        result = stage()
+        wall_s, cpu_s = perf_counter() - wall_start, process_time() - cpu_start
+        peak_traced_bytes = get_traced_memory()[1] - traced_start
+    finally:
+        if is_started:
+            stop()
+
+    return (result, {"wall_s": wall_s, "cpu_s": cpu_s, "peak_traced_bytes": peak_traced_bytes})
+
+
+def run_pot_detecto_case(rows: int, features: int, include_fit: bool = True, seed: int = 0) -> dict:
+    """
+    Time every stage of `POTDetecto` on one synthetic dataset.
+
+    # Parameters
+    ------------
+        * rows (int): The number of rows of the synthetic dataset.
+        * features (int): The number of features of the synthetic dataset.
+        * include_fit (bool): Whether to run `fit` and the stages that depend on it, default is `True`.
+        * seed (int): The seed of the synthetic dataset, default is 0.
+
+    # Returns
+    ------------
+        * dict: The measurements per stage, the number of GPD fits, and the fits per second.
+    """
+    from src.detecto.models.detectors.pot import POTDetecto
+
+    dataset = synthetic_heavy_tailed(rows=rows, features=features, seed=seed)
+    detector = POTDetecto()
+    detector.timeframe.set_interval(total_rows=rows)
+    stages = {
+        "compute_exceedance_threshold": lambda: detector.compute_exceedance_threshold(dataset=dataset, q=0.99),
+        "extract_exceedance": lambda: detector.extract_exceedance(dataset=dataset),
+        "fit": lambda: detector.fit(dataset=dataset),
+        "compute_anomaly_threshold": lambda: detector.compute_anomaly_threshold(q=0.80),
+        "detect": lambda: detector.detect(),
+        "evaluate": lambda: detector.evaluate(method="ks", stat_distance_threshold=0.05),
+    }
+    case: dict = {"suite": "pot_detecto", "rows": rows, "features": features, "stages": {}}
+
+    for name in POT_DETECTO_STAGES if include_fit else POT_DETECTO_STAGES[:2]:
+        case["stages"][name] = time_stage(stage=stages[name])[1]
+
+    if include_fit:
+        case["gpd_fits"] = count_gpd_fits(
+            exceedances=detector.exceedance_dataset.to_numpy(), t0=detector.timeframe.t0  # type: ignore
+        )
+        case["fits_per_second"] = case["gpd_fits"] / case["stages"]["fit"]["wall_s"]
+    return case
+
+
+def run_standalone_case(rows: int, features: int, include_fit: bool = True, seed: int = 0) -> dict:
+    """
+    Time every standalone POT function on one synthetic dataset.
+
+    # Parameters
+    ------------
+        * rows (int): The number of rows of the synthetic dataset.
+        * features (int): The number of features of the synthetic dataset.
+        * include_fit (bool): Whether to run `fit_pot_data` and the functions that depend on it, default is `True`.
+        * seed (int): The seed of the synthetic dataset, default is 0.
+
+    # Returns
+    ------------
+        * dict: The measurements per function, the number of GPD fits, and the fits per second.
+    """
+    from src.detecto.standalone.pot_detecto import (
+        compute_extreme_anomaly_threshold,
+        compute_pot_threshold,
+        detect_extreme_anomaly,
+        extract_pot_data,
+        fit_pot_data,
+    )
+
+    dataset = synthetic_heavy_tailed(rows=rows, features=features, seed=seed)
+    t0, t1 = int(0.6 * rows), int(0.3 * rows)
+    case: dict = {"suite": "standalone", "rows": rows, "features": features, "stages": {}}
+
+    threshold, case["stages"]["compute_pot_threshold"] = time_stage(
+        stage=lambda: compute_pot_threshold(dataset=dataset, t0=t0, q=0.99)
+    )
+    pot_data, case["stages"]["extract_pot_data"] = time_stage(
+        stage=lambda: extract_pot_data(dataset=dataset, pot_threshold_dataset=threshold)  # type: ignore
+    )
+
+    if include_fit:
+        fitted, case["stages"]["fit_pot_data"] = time_stage(
+            stage=lambda: fit_pot_data(dataset=dataset, pot_dataset=pot_data, t0=t0)  # type: ignore
+        )
+        anomaly_scores = fitted[1]  # type: ignore
+        anomaly_threshold, case["stages"]["compute_extreme_anomaly_threshold"] = time_stage(
+            stage=lambda: compute_extreme_anomaly_threshold(
+                dataset=anomaly_scores, total_anomaly_score_feature="total_anomaly_score", t1=t1
+            )
+        )
+        case["stages"]["detect_extreme_anomaly"] = time_stage(
+            stage=lambda: detect_extreme_anomaly(
+                dataset=anomaly_scores,
+                total_anomaly_score_feature="total_anomaly_score",
+                t1=t1,
+                extreme_anomaly_threshold=anomaly_threshold,  # type: ignore
+            )
+        )[1]
+        case["gpd_fits"] = count_gpd_fits(exceedances=pot_data.to_numpy(), t0=t0)  # type: ignore
+        case["fits_per_second"] = case["gpd_fits"] / case["stages"]["fit_pot_data"]["wall_s"]
+    return case
+
+
+def run_throughput_benchmark(
+    rows_grid: tuple[int, ...] = DEFAULT_ROWS,
+    features_grid: tuple[int, ...] = DEFAULT_FEATURES,
+    max_fit_cells: int | None = 100_000,
+    fresh_process: bool = True,
+    seed: int = 0,
+) -> list[dict]:
+    """
+    Run the POTDetecto and standalone suites over a grid of rows and features.
+
+    # Parameters
+    ------------
+        * rows_grid (tuple[int, ...]): The numbers of rows to benchmark, default 1k - 1M.
+        * features_grid (tuple[int, ...]): The numbers of features to benchmark, default 1 - 500.
+        * max_fit_cells (int | None): The maximum rows * features to run the fitting stages on, larger cases only time the
+            threshold and exceedance stages because the fit grows quadratically with the rows, `None` fits every case, default is 100k.
+        * fresh_process (bool): Whether every case runs in a freshly spawned process, so the cases do not share memory, default is `True`.
+        * seed (int): The seed of the synthetic datasets, default is 0.
+
+    # Returns
+    ------------
+        * list[dict]: The measurements of every case.
+    """
+    cases = [
+        (run_case, rows, features, max_fit_cells is None or rows * features <= max_fit_cells, seed)
+        for rows in rows_grid
+        for features in features_grid
+        for run_case in (run_pot_detecto_case, run_standalone_case)
+    ]
+
+    if not fresh_process:
+        return [run_case(rows, features, include_fit, seed) for run_case, rows, features, include_fit, seed in cases]
+
+    results = []
+    for run_case, rows, features, include_fit, seed in cases:
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            results.append(executor.submit(run_case, rows, features, include_fit, seed).result())
+    return results
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Throughput and scaling benchmark for the POT pipeline.")
+    parser.add_argument("--output", default="benchmarks/results/throughput.json", help="The JSON file to write into.")
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROWS), help="The grid of rows.")
+    parser.add_argument(
+        "--features", type=int, nargs="+", default=list(DEFAULT_FEATURES), help="The grid of features."
+    )
+    parser.add_argument("--max-fit-cells", type=int, default=100_000, help="The maximum rows * features to fit.")
+    parser.add_argument("--fit-all", action="store_true", help="Fit every case, also larger than `--max-fit-cells`.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the synthetic datasets.")
+    arguments = parser.parse_args()
+
+    print(
+        write_results(
+            path=arguments.output,
+            benchmark="throughput",
+            results=run_throughput_benchmark(
+                rows_grid=tuple(arguments.rows),
+                features_grid=tuple(arguments.features),
+                max_fit_cells=None if arguments.fit_all else arguments.max_fit_cells,
+                seed=arguments.seed,
+            ),
+        )
+    )
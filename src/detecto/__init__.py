@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-# Let users know if they're missing any of our hard dependencies
-__hard_dependencies = ("matplotlib", "numpy", "pandas", "scipy")
+from importlib.util import find_spec
+
+# Let users know if they're missing any of our hard dependencies, without importing them
+# Matplotlib is an optional extra (`pip install detecto[plot]`) only imported when rendering QQ plots
+__hard_dependencies = ("numpy", "pandas", "scipy")
 __missing_dependencies = []
 
 for __dependency in __hard_dependencies:
-    try:
-        __import__(__dependency)
-    except ImportError as _e:  # pragma: no cover
-        __missing_dependencies.append(f"{__dependency}: {_e}")
+    if find_spec(__dependency) is None:  # pragma: no cover
+        __missing_dependencies.append(f"{__dependency}: No module named '{__dependency}'")
 
 if __missing_dependencies:  # pragma: no cover
     raise ImportError("Unable to import required dependencies:\n" + "\n".join(__missing_dependencies))
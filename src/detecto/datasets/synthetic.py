@@ -0,0 +1,245 @@
+from typing import Iterator
+
+from numpy import arange, float64, log, ndarray, pi, sin, zeros
+from numpy.lib.format import open_memmap
+from numpy.random import default_rng, Generator
+from pandas import concat, DataFrame, Timedelta, Timestamp
+
+
+class SyntheticPOTDataset:
+    """
+    Generator of reproducible heavy-tailed time series for load testing the "Peaks Over Threshold" detectors, streamed in row chunks.
+
+    Every cell is a seasonal baseline with gaussian noise, a sparse burst drawn from a Generalised Pareto Distribution, and rarely an
+    injected anomaly whose position is labeled. Chunks are generated one at a time, so datasets of 10^8 cells and more never have to
+    fit into memory. The output is deterministic for the same `seed` and `chunk_rows`.
+
+    # Attributes
+    ------------
+        * rows (int): The total number of rows (observations).
+        * features (int): The number of features (columns), named `feature_0` ... `feature_{n-1}`.
+        * chunk_rows (int): The number of rows generated per chunk, default 10000.
+        * seed (int): The seed of the random generator, default 0.
+        * exceedance_rate (float): The probability of a GPD burst per cell, controls the sparsity of the exceedances, default 0.02.
+        * gpd_c (float): The shape parameter of the GPD bursts, > 0 is heavy tailed, default 0.3.
+        * gpd_scale (float): The scale parameter of the GPD bursts, default 20.0.
+        * anomaly_rate (float): The probability of an injected anomaly per row, default 0.001.
+        * anomaly_magnitude (float): The multiple of `gpd_scale` added on top of a GPD burst for injected anomalies, default 25.0.
+        * baseline (float): The level of the baseline, default 100.0.
+        * seasonal_amplitude (float): The amplitude of the sine seasonality, default 10.0.
+        * seasonal_period (int): The period of the seasonality in rows, default 24.
+        * noise_scale (float): The standard deviation of the gaussian noise, default 5.0.
+        * start (str): The timestamp of the first row, default "2024-01-01".
+        * freq (str): The frequency between two rows, default "1h".
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        features: int,
+        chunk_rows: int = 10_000,
+        seed: int = 0,
+        exceedance_rate: float = 0.02,
+        gpd_c: float = 0.3,
+        gpd_scale: float = 20.0,
+        anomaly_rate: float = 0.001,
+        anomaly_magnitude: float = 25.0,
+        baseline: float = 100.0,
+        seasonal_amplitude: float = 10.0,
+        seasonal_period: int = 24,
+        noise_scale: float = 5.0,
+        start: str = "2024-01-01",
+        freq: str = "1h",
+    ) -> None:
+        if rows < 1 or features < 1 or chunk_rows < 1:
+            raise ValueError("`rows`, `features`, and `chunk_rows` must be at least 1!")
+
+        if not 0.0 <= exceedance_rate <= 1.0 or not 0.0 <= anomaly_rate <= 1.0:
+            raise ValueError("`exceedance_rate` and `anomaly_rate` must be between 0.0 and 1.0!")
+
+        self.rows = rows
+        self.features = features
+        self.chunk_rows = chunk_rows
+        self.seed = seed
+        self.exceedance_rate = exceedance_rate
+        self.gpd_c = gpd_c
+        self.gpd_scale = gpd_scale
+        self.anomaly_rate = anomaly_rate
+        self.anomaly_magnitude = anomaly_magnitude
+        self.baseline = baseline
+        self.seasonal_amplitude = seasonal_amplitude
+        self.seasonal_period = seasonal_period
+        self.noise_scale = noise_scale
+        self.start = start
+        self.freq = freq
+
+    @property
+    def columns(self) -> list[str]:
+        """
+        Get the names of the generated features.
+
+        # Returns
+        ------------
+            * list[str]: The feature names `feature_0` ... `feature_{n-1}`.
+        """
+        return [f"feature_{index}" for index in range(0, self.features)]
+
+    def __gpd_sample(self, rng: Generator, size: tuple[int, int]) -> ndarray:
+        """
+        Draw samples of the Generalised Pareto Distribution with the inverse CDF, so no SciPy call is needed per chunk.
+
+        # Parameters
+        ------------
+            * rng (Generator): The random generator of the chunk.
+            * size (tuple[int, int]): The shape of the samples.
+
+        # Returns
+        ------------
+            * ndarray: The GPD samples with `gpd_c` and `gpd_scale`.
+        """
+        uniform = 1.0 - rng.random(size=size)
+
+        if self.gpd_c == 0.0:
+            return -self.gpd_scale * log(uniform)
+        return self.gpd_scale * (uniform ** (-self.gpd_c) - 1.0) / self.gpd_c
+
+    def chunks(self) -> Iterator[tuple[int, ndarray, ndarray]]:
+        """
+        Generate the dataset chunk by chunk.
+
+        # Returns
+        ------------
+            * Iterator[tuple[int, ndarray, ndarray]]: The first row of the chunk, the float64 values of shape (chunk rows, features), and
+                the boolean labels of the same shape where `True` marks an injected anomaly.
+        """
+        for chunk_index, first_row in enumerate(range(0, self.rows, self.chunk_rows)):
+            rng = default_rng(seed=[self.seed, chunk_index])
+            total_rows = min(self.chunk_rows, self.rows - first_row)
+            size = (total_rows, self.features)
+
+            row_index = arange(first_row, first_row + total_rows, dtype=float64)[:, None]
+            values = self.baseline + self.seasonal_amplitude * sin(2 * pi * row_index / self.seasonal_period)
+            values = values + rng.normal(loc=0.0, scale=self.noise_scale, size=size)
+            values += (rng.random(size=size) < self.exceedance_rate) * self.__gpd_sample(rng=rng, size=size)
+
+            labels = zeros(shape=size, dtype=bool)
+            anomalous_rows = (rng.random(size=total_rows) < self.anomaly_rate).nonzero()[0]
+            anomalous_features = rng.integers(low=0, high=self.features, size=len(anomalous_rows))
+            labels[anomalous_rows, anomalous_features] = True
+            values[labels] += (
+                self.gpd_scale * self.anomaly_magnitude
+                + self.__gpd_sample(rng=rng, size=(len(anomalous_rows), 1)).ravel()
+            )
+
+            yield (first_row, values, labels)
+
+    def __chunk_frame(self, first_row: int, values: ndarray, labels: ndarray) -> DataFrame:
+        """
+        Build the Pandas DataFrame of one chunk with the timestamp, feature, and row label columns.
+
+        # Parameters
+        ------------
+            * first_row (int): The first row of the chunk.
+            * values (ndarray): The values of the chunk.
+            * labels (ndarray): The labels of the chunk.
+
+        # Returns
+        ------------
+            * DataFrame: The chunk with a `timestamp` column, 1 column per feature, and an `is_anomaly` row label.
+        """
+        step = Timedelta(self.freq)
+        frame = DataFrame(data=values, columns=self.columns, index=range(first_row, first_row + values.shape[0]))
+        frame.insert(loc=0, column="timestamp", value=Timestamp(self.start) + step * frame.index)
+        frame["is_anomaly"] = labels.any(axis=1)
+        return frame
+
+    def to_frame(self) -> DataFrame:
+        """
+        Materialize the whole dataset in memory, only meant for small datasets and tests.
+
+        # Returns
+        ------------
+            * DataFrame: The dataset with a `timestamp` column, 1 column per feature, and an `is_anomaly` row label.
+        """
+        return concat([self.__chunk_frame(*chunk) for chunk in self.chunks()])
+
+    def to_csv(self, path: str) -> str:
+        """
+        Stream the dataset into a CSV file, chunk by chunk.
+
+        # Parameters
+        ------------
+            * path (str): The path of the CSV file.
+
+        # Returns
+        ------------
+            * str: The path of the written file.
+        """
+        for first_row, values, labels in self.chunks():
+            self.__chunk_frame(first_row=first_row, values=values, labels=labels).to_csv(
+                path, mode="w" if first_row == 0 else "a", header=first_row == 0, index=False
+            )
+        return path
+
+    def to_parquet(self, path: str) -> str:
+        """
+        Stream the dataset into a Parquet file, 1 row group per chunk. Requires the optional `pyarrow` dependency.
+
+        # Parameters
+        ------------
+            * path (str): The path of the Parquet file.
+
+        # Returns
+        ------------
+            * str: The path of the written file.
+        """
+        try:
+            from pyarrow import Table
+            from pyarrow.parquet import ParquetWriter
+        except ImportError as e:  # pragma: no cover
+            raise ImportError(
+                "Writing Parquet requires pyarrow, install it with `pip install detecto[parquet]`."
+            ) from e
+
+        writer = None
+        try:
+            for first_row, values, labels in self.chunks():
+                table = Table.from_pandas(
+                    self.__chunk_frame(first_row=first_row, values=values, labels=labels), preserve_index=False
+                )
+                if writer is None:
+                    writer = ParquetWriter(where=path, schema=table.schema)
+                writer.write_table(table=table)
+        finally:
+            if writer is not None:
+                writer.close()
+        return path
+
+    def to_memmap(self, path: str, dtype: str = "float64") -> tuple[str, str]:
+        """
+        Stream the dataset into a NumPy `.npy` memory map and the labels into a second `.npy` memory map next to it.
+
+        # Parameters
+        ------------
+            * path (str): The path of the `.npy` file of the values, the labels are written to `{path without .npy}.labels.npy`.
+            * dtype (str): The dtype of the stored values, default "float64".
+
+        # Returns
+        ------------
+            * tuple[str, str]: The paths of the values and the labels files.
+        """
+        labels_path = f"{path.removesuffix('.npy')}.labels.npy"
+        values_map = open_memmap(filename=path, mode="w+", dtype=dtype, shape=(self.rows, self.features))
+        labels_map = open_memmap(filename=labels_path, mode="w+", dtype=bool, shape=(self.rows, self.features))
+
+        for first_row, values, labels in self.chunks():
+            values_map[first_row : first_row + values.shape[0]] = values
+            labels_map[first_row : first_row + labels.shape[0]] = labels
+
+        values_map.flush()
+        labels_map.flush()
+        del values_map, labels_map
+        return (path, labels_path)
+
+    def __str__(self):
+        return "Synthetic Peak Over Threshold Dataset"
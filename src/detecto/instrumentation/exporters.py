@@ -0,0 +1,175 @@
+from abc import ABCMeta, abstractmethod
+from json import dumps
+from math import isinf, isnan
+from os import makedirs, path as os_path, replace
+from time import time
+
+
+class Exporter(metaclass=ABCMeta):
+    """
+    Exporter interface, an exporter is a recorder hook that writes the run report when the "run" event is emitted.
+
+    # Attributes
+    ------------
+        * path (str): The file the metrics are written into.
+        * labels (dict[str, str]): Constant labels added to every metric, e.g. {"pipeline": "nightly"}.
+    """
+
+    def __init__(self, path: str, labels: dict[str, str] | None = None) -> None:
+        self.path = path
+        self.labels = labels if labels is not None else {}
+
+    def __call__(self, event: str, payload: dict) -> None:
+        if event == "run":
+            directory = os_path.dirname(self.path)
+            if len(directory) > 0:
+                makedirs(directory, exist_ok=True)
+            self.export(metrics=collect_metrics(report=payload))
+
+    @abstractmethod
+    def export(self, metrics: dict[str, float | dict[str, float]]) -> None:
+        """
+        Write the metrics of a run.
+
+        # Parameters
+        ------------
+            * metrics (dict[str, float | dict[str, float]]): The metrics from `collect_metrics()`.
+
+        # Returns
+        ------------
+            * None: The metrics are written into `path`.
+        """
+        pass
+
+
+def collect_metrics(report: dict[str, dict]) -> dict[str, float | dict[str, float]]:
+    """
+    Derive the metrics of a run from the run report of a `Recorder`.
+
+    # Parameters
+    ------------
+        * report (dict[str, dict]): The "stages", "counters", and "histograms" of the run.
+
+    # Returns
+    ------------
+        * dict[str, float | dict[str, float]]: The run duration, the latency per stage, the rows and features processed, the GPD fits
+            and fits per second, the anomalies detected, the notification latency, and all other counters of the run.
+    """
+    stages = report.get("stages", {})
+    counters = report.get("counters", {})
+    fit_s = stages.get("fit", {}).get("wall_s", 0.0)
+    gpd_fits = counters.get("gpd_fits", 0)
+
+    metrics: dict[str, float | dict[str, float]] = {
+        "last_run_timestamp_seconds": time(),
+        "run_duration_seconds": stages.get("execute", {}).get(
+            "wall_s", sum(stage["wall_s"] for stage in stages.values())
+        ),
+        "stage_duration_seconds": {name: stage["wall_s"] for name, stage in stages.items()},
+        "stage_cpu_seconds": {name: stage["cpu_s"] for name, stage in stages.items()},
+        "rows_processed": counters.get("rows_processed", 0),
+        "features_processed": counters.get("features_processed", 0),
+        "gpd_fits_total": gpd_fits,
+        "fits_per_second": gpd_fits / fit_s if fit_s > 0.0 else 0.0,
+        "anomalies_detected": counters.get("anomalies_detected", 0),
+        "notification_duration_seconds": stages.get("notification", {}).get("wall_s", 0.0),
+    }
+
+    for counter, value in counters.items():
+        if counter not in ("rows_processed", "features_processed", "gpd_fits", "anomalies_detected"):
+            metrics[f"{counter}_total"] = value
+    return metrics
+
+
+def _format_prometheus_value(value: float) -> str:
+    """
+    Format a sample value in the Prometheus text format, where non-finite values are written as "+Inf", "-Inf", and "NaN".
+
+    # Parameters
+    ------------
+        * value (float): The value of the sample.
+
+    # Returns
+    ------------
+        * str: The formatted value.
+    """
+    value = float(value)
+
+    if isnan(value):
+        return "NaN"
+    if isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+class PrometheusExporter(Exporter):
+    """
+    Exporter class that writes the metrics in the Prometheus text format for the textfile collector of node-exporter.
+
+    The file is written into a temporary file and renamed, so node-exporter never scrapes a partially written file. Metrics ending in
+    "_total" are typed as counters, all others as gauges.
+
+    # Attributes
+    ------------
+        * path (str): The `.prom` file in the directory of `--collector.textfile.directory`.
+        * labels (dict[str, str]): Constant labels added to every metric.
+        * prefix (str): The prefix of every metric name, default "detecto".
+    """
+
+    def __init__(self, path: str, labels: dict[str, str] | None = None, prefix: str = "detecto") -> None:
+        super().__init__(path=path, labels=labels)
+        self.prefix = prefix
+
+    def __format_labels(self, **labels: str) -> str:
+        merged_labels = {**self.labels, **labels}
+
+        if len(merged_labels) == 0:
+            return ""
+
+        escaped_labels = []
+        for name, value in sorted(merged_labels.items()):
+            escaped_value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            escaped_labels.append(f'{name}="{escaped_value}"')
+        return "{" + ",".join(escaped_labels) + "}"
+
+    def export(self, metrics: dict[str, float | dict[str, float]]) -> None:
+        lines = []
+
+        for name, value in metrics.items():
+            metric_name = f"{self.prefix}_{name}"
+            metric_type = "counter" if name.endswith("_total") else "gauge"
+            lines.append(f"# TYPE {metric_name} {metric_type}")
+
+            if isinstance(value, dict):
+                for stage, stage_value in value.items():
+                    lines.append(
+                        f"{metric_name}{self.__format_labels(stage=stage)} {_format_prometheus_value(value=stage_value)}"
+                    )
+            else:
+                lines.append(f"{metric_name}{self.__format_labels()} {_format_prometheus_value(value=value)}")
+
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w") as file:
+            file.write("\n".join(lines) + "\n")
+        replace(temporary_path, self.path)
+
+    def __str__(self):
+        return "Prometheus Textfile Exporter"
+
+
+class JSONLinesExporter(Exporter):
+    """
+    Exporter class that appends the metrics of every run as one JSON object per line.
+
+    # Attributes
+    ------------
+        * path (str): The `.jsonl` file the runs are appended to.
+        * labels (dict[str, str]): Constant labels added to every line.
+    """
+
+    def export(self, metrics: dict[str, float | dict[str, float]]) -> None:
+        with open(self.path, "a") as file:
+            file.write(dumps({**self.labels, **metrics}) + "\n")
+
+    def __str__(self):
+        return "JSON Lines Exporter"
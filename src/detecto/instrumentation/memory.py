@@ -0,0 +1,70 @@
+from sys import getsizeof
+
+from numpy import memmap, ndarray
+from pandas import DataFrame, Series
+
+
+def deep_sizeof(obj: object) -> int:
+    """
+    Get the bytes held in memory by an object and everything it references, e.g. the nested `params` of a fitted detector.
+
+    Pandas objects are measured with `memory_usage(deep=True)`, NumPy arrays with `nbytes` unless they are memory-mapped, and
+    containers recursively. An object referenced twice is only counted once.
+
+    # Parameters
+    ------------
+        * obj (object): The object to measure.
+
+    # Returns
+    ------------
+        * int: The number of bytes, 0 for `None` and memory-mapped arrays whose data lives on disk.
+    """
+    seen: set[int] = set()
+    pending = [obj]
+    total_bytes = 0
+
+    while len(pending) > 0:
+        current = pending.pop()
+
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+
+        if isinstance(current, DataFrame):
+            total_bytes += (
+                0 if is_memory_mapped(frame=current) else int(current.memory_usage(index=True, deep=True).sum())
+            )
+        elif isinstance(current, Series):
+            total_bytes += int(current.memory_usage(index=True, deep=True))
+        elif isinstance(current, ndarray):
+            total_bytes += 0 if isinstance(current, memmap) or isinstance(current.base, memmap) else current.nbytes
+        elif isinstance(current, dict):
+            total_bytes += getsizeof(current)
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set)):
+            total_bytes += getsizeof(current)
+            pending.extend(current)
+        else:
+            total_bytes += getsizeof(current)
+    return total_bytes
+
+
+def is_memory_mapped(frame: DataFrame) -> bool:
+    """
+    Check whether the values of a single dtype Pandas DataFrame are a view of a NumPy memory map.
+
+    # Parameters
+    ------------
+        * frame (DataFrame): The DataFrame to check.
+
+    # Returns
+    ------------
+        * bool: `True` if the values live in a file on disk.
+    """
+    values = frame._mgr.blocks[0].values if len(frame._mgr.blocks) == 1 else None  # type: ignore
+    while isinstance(values, ndarray):
+        if isinstance(values, memmap):
+            return True
+        values = values.base
+    return False
@@ -0,0 +1,172 @@
+from cProfile import Profile
+from io import StringIO
+from os import makedirs, path as os_path
+from pstats import SortKey, Stats
+from sys import _current_frames
+from threading import Event, get_ident, Thread
+from types import FrameType
+from typing import Literal
+
+ProfileMethod = Literal["cprofile", "tracemalloc", "sampling"]
+
+
+class Profiler:
+    """
+    Profiler class, a context manager that profiles the enclosed code and writes the profile and a summary of the hot spots.
+
+    # Attributes
+    ------------
+        * method (ProfileMethod): "cprofile" for deterministic call timings, "tracemalloc" for the biggest allocations, or "sampling"
+            for a low-overhead statistical profile of the profiled thread.
+        * output_dir (str): The directory the profile and the summary are written into.
+        * name (str): The prefix of the written files, default "profile".
+        * top (int): The number of hot spots or allocations in the summary, default 20.
+        * interval (float): The seconds between 2 samples of the "sampling" profiler, default 0.005.
+        * files (list[str]): The paths of the written files, filled when the context exits.
+        * summary (list[dict[str, str | int | float]]): The top hot spots or allocations, filled when the context exits.
+    """
+
+    def __init__(
+        self, method: ProfileMethod, output_dir: str, name: str = "profile", top: int = 20, interval: float = 0.005
+    ) -> None:
+        if method not in ("cprofile", "tracemalloc", "sampling"):
+            raise ValueError("`method` needs to be one of these: cprofile, tracemalloc, sampling!")
+
+        self.method = method
+        self.output_dir = output_dir
+        self.name = name
+        self.top = top
+        self.interval = interval
+        self.files: list[str] = []
+        self.summary: list[dict[str, str | int | float]] = []
+        self.__profile: Profile | None = None
+        self.__samples: dict[tuple[str, ...], int] = {}
+        self.__stop_sampling = Event()
+        self.__sampler: Thread | None = None
+        self.__is_tracing_started = False
+
+    def __path(self, extension: str) -> str:
+        return os_path.join(self.output_dir, f"{self.name}.{extension}")
+
+    def __enter__(self) -> "Profiler":
+        if self.method == "cprofile":
+            self.__profile = Profile()
+            self.__profile.enable()
+        elif self.method == "tracemalloc":
+            from tracemalloc import is_tracing, start
+
+            # Tracing that was started before the profiler, e.g. by `python -X tracemalloc`, is left running on exit
+            self.__is_tracing_started = not is_tracing()
+            if self.__is_tracing_started:
+                start(25)
+        else:
+            self.__sampler = Thread(target=self.__sample, args=(get_ident(),), daemon=True)
+            self.__sampler.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        makedirs(self.output_dir, exist_ok=True)
+
+        if self.method == "cprofile":
+            self.__profile.disable()  # type: ignore
+            self.__write_cprofile()
+        elif self.method == "tracemalloc":
+            from tracemalloc import stop, take_snapshot
+
+            snapshot = take_snapshot()
+            if self.__is_tracing_started:
+                stop()
+            self.__write_tracemalloc(snapshot=snapshot)
+        else:
+            self.__stop_sampling.set()
+            self.__sampler.join()  # type: ignore
+            self.__write_sampling()
+
+    def __write_cprofile(self) -> None:
+        profile_path = self.__path(extension="prof")
+        self.__profile.dump_stats(profile_path)  # type: ignore
+
+        stream = StringIO()
+        stats = Stats(self.__profile, stream=stream).sort_stats(SortKey.CUMULATIVE)  # type: ignore
+        stats.print_stats(self.top)
+
+        for (file_name, line, function), (_, calls, total_s, cumulative_s, _) in sorted(
+            stats.stats.items(), key=lambda item: item[1][3], reverse=True  # type: ignore
+        )[: self.top]:
+            self.summary.append(
+                {
+                    "location": f"{function} ({file_name}:{line})",
+                    "calls": calls,
+                    "total_s": total_s,
+                    "cumulative_s": cumulative_s,
+                }
+            )
+        self.files = [profile_path, self.__write_summary(text=stream.getvalue())]
+
+    def __write_tracemalloc(self, snapshot) -> None:  # type: ignore
+        snapshot_path = self.__path(extension="tracemalloc")
+        snapshot.dump(snapshot_path)
+
+        lines = [f"Top {self.top} allocations by line"]
+        for statistic in snapshot.statistics("lineno")[: self.top]:
+            frame = statistic.traceback[0]
+            self.summary.append(
+                {
+                    "location": f"{frame.filename}:{frame.lineno}",
+                    "size_bytes": statistic.size,
+                    "count": statistic.count,
+                }
+            )
+            lines.append(f"{statistic.size:>14,d} B {statistic.count:>10,d} blocks  {frame.filename}:{frame.lineno}")
+        self.files = [snapshot_path, self.__write_summary(text="\n".join(lines) + "\n")]
+
+    def __sample(self, thread_id: int) -> None:
+        while not self.__stop_sampling.wait(timeout=self.interval):
+            frame: FrameType | None = _current_frames().get(thread_id)
+            stack = []
+
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+                frame = frame.f_back
+
+            if len(stack) > 0:
+                key = tuple(reversed(stack))
+                self.__samples[key] = self.__samples.get(key, 0) + 1
+
+    def __write_sampling(self) -> None:
+        collapsed_path = self.__path(extension="collapsed")
+        with open(collapsed_path, "w") as file:
+            for stack, count in self.__samples.items():
+                file.write(f"{';'.join(stack)} {count}\n")
+
+        total_samples = sum(self.__samples.values())
+        leaf_samples: dict[str, int] = {}
+        for stack, count in self.__samples.items():
+            leaf_samples[stack[-1]] = leaf_samples.get(stack[-1], 0) + count
+
+        lines = [f"Top {self.top} hot spots of {total_samples} samples every {self.interval} s"]
+        for location, count in sorted(leaf_samples.items(), key=lambda item: item[1], reverse=True)[: self.top]:
+            share = count / total_samples
+            self.summary.append({"location": location, "samples": count, "share": share})
+            lines.append(f"{count:>8d} {share:>7.1%}  {location}")
+        self.files = [collapsed_path, self.__write_summary(text="\n".join(lines) + "\n")]
+
+    def __write_summary(self, text: str) -> str:
+        summary_path = self.__path(extension="summary.txt")
+        with open(summary_path, "w") as file:
+            file.write(text)
+        return summary_path
+
+    def report(self) -> dict[str, str | list]:
+        """
+        Get the report of the profiled run.
+
+        # Returns
+        ------------
+            * dict[str, str | list]: The profiling "method", the written "files", and the "summary" of the top hot spots or allocations.
+        """
+        return {"method": self.method, "files": list(self.files), "summary": list(self.summary)}
+
+    def __str__(self):
+        return "Profiler"
@@ -0,0 +1,211 @@
+from contextlib import contextmanager, nullcontext
+from time import perf_counter, process_time
+from typing import Callable, ContextManager, Iterator
+
+from scipy.optimize import fmin
+
+Hook = Callable[[str, dict], None]
+
+_NULL_STAGE = nullcontext()
+
+
+class Recorder:
+    """
+    Recorder class that collects the stage timers, counters, and histograms of a detection run into a structured run report.
+
+    # Attributes
+    ------------
+        * enabled (bool): Whether the recorder collects anything, `True` for this class.
+        * stages (dict[str, dict[str, float | int]]): The accumulated wall time, CPU time, and number of calls per stage.
+        * counters (dict[str, int | float]): The counters of the run, e.g. "gpd_fits", "fit_failures", "skipped_rows", "cache_hits".
+        * histograms (dict[str, dict[int, int]]): The number of observations per value, e.g. the optimizer iterations per GPD fit.
+        * __hooks (list[Hook]): The callbacks that receive an event name and its payload, e.g. a metrics exporter.
+    """
+
+    enabled = True
+
+    def __init__(self, hooks: list[Hook] | None = None) -> None:
+        self.stages: dict[str, dict[str, float | int]] = {}
+        self.counters: dict[str, int | float] = {}
+        self.histograms: dict[str, dict[int, int]] = {}
+        self.__hooks: list[Hook] = list(hooks) if hooks is not None else []
+
+    def subscribe(self, hook: Hook) -> None:
+        """
+        Subscribe a callback to the events of the recorder.
+
+        # Parameters
+        ------------
+            * hook (Hook): A callable receiving the event name ("stage" or "run") and the event payload.
+
+        # Returns
+        ------------
+            * None: The hook is called for every following event.
+        """
+        self.__hooks.append(hook)
+
+    def emit(self, event: str, payload: dict) -> None:
+        """
+        Send an event to all subscribed hooks.
+
+        # Parameters
+        ------------
+            * event (str): The name of the event, "stage" after every stage and "run" with the run report at the end of a run.
+            * payload (dict): The data of the event.
+
+        # Returns
+        ------------
+            * None: All hooks are called in the order of subscription.
+        """
+        for hook in self.__hooks:
+            hook(event, payload)
+
+    def stage(self, name: str) -> ContextManager[None]:
+        """
+        Time a stage with the wall clock and the CPU clock of the process.
+
+        # Parameters
+        ------------
+            * name (str): The name of the stage, repeated stages are accumulated.
+
+        # Returns
+        ------------
+            * ContextManager[None]: The context manager that records the stage on exit, also if the stage raises.
+        """
+        return self.__stage(name=name)
+
+    @contextmanager
+    def __stage(self, name: str) -> Iterator[None]:
+        wall_start, cpu_start = perf_counter(), process_time()
+        try:
+            yield
+        finally:
+            wall_s, cpu_s = perf_counter() - wall_start, process_time() - cpu_start
+            stage = self.stages.setdefault(name, {"wall_s": 0.0, "cpu_s": 0.0, "calls": 0})
+            stage["wall_s"] += wall_s
+            stage["cpu_s"] += cpu_s
+            stage["calls"] += 1
+            self.emit(event="stage", payload={"stage": name, "wall_s": wall_s, "cpu_s": cpu_s})
+
+    def increment(self, counter: str, value: int | float = 1) -> None:
+        """
+        Increment a counter of the run.
+
+        # Parameters
+        ------------
+            * counter (str): The name of the counter.
+            * value (int | float): The increment, default is 1.
+
+        # Returns
+        ------------
+            * None: The counter is created with 0 if it does not exist yet.
+        """
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def observe(self, histogram: str, value: int) -> None:
+        """
+        Add an observation to a histogram with 1 bucket per distinct value.
+
+        # Parameters
+        ------------
+            * histogram (str): The name of the histogram.
+            * value (int): The observed value.
+
+        # Returns
+        ------------
+            * None: The bucket of the value is incremented.
+        """
+        buckets = self.histograms.setdefault(histogram, {})
+        buckets[value] = buckets.get(value, 0) + 1
+
+    def optimizer(self) -> Callable | None:
+        """
+        Get the optimizer for `scipy.stats.genpareto.fit()` that records the iterations of every fit into "optimizer_iterations".
+
+        # Returns
+        ------------
+            * Callable | None: The `scipy.optimize.fmin` wrapper, giving identical GPD params as the default optimizer.
+        """
+
+        def observed_fmin(func: Callable, x0: list[float], args: tuple = (), disp: int = 0) -> list[float]:
+            xopt, _, iterations, _, _ = fmin(func, x0, args=args, disp=disp, full_output=True)
+            self.observe(histogram="optimizer_iterations", value=int(iterations))
+            return xopt
+
+        return observed_fmin
+
+    def merge(self, report: dict[str, dict]) -> None:
+        """
+        Add the counters and histograms of another run report, e.g. of a worker process, the stages are not merged.
+
+        # Parameters
+        ------------
+            * report (dict[str, dict]): The run report of `report()`.
+
+        # Returns
+        ------------
+            * None: The counters and the histogram buckets are incremented.
+        """
+        for counter, value in report["counters"].items():
+            self.increment(counter=counter, value=value)
+
+        for histogram, buckets in report["histograms"].items():
+            merged_buckets = self.histograms.setdefault(histogram, {})
+            for value, count in buckets.items():
+                merged_buckets[value] = merged_buckets.get(value, 0) + count
+
+    def report(self) -> dict[str, dict]:
+        """
+        Get the structured run report.
+
+        # Returns
+        ------------
+            * dict[str, dict]: A copy of the "stages", "counters", and "histograms" of the run.
+        """
+        return {
+            "stages": {name: dict(stage) for name, stage in self.stages.items()},
+            "counters": dict(self.counters),
+            "histograms": {name: dict(buckets) for name, buckets in self.histograms.items()},
+        }
+
+    def reset(self) -> None:
+        """
+        Clear all stages, counters, and histograms, the hooks stay subscribed.
+
+        # Returns
+        ------------
+            * None: The recorder is ready for the next run.
+        """
+        self.stages, self.counters, self.histograms = {}, {}, {}
+
+    def __str__(self):
+        return "Recorder"
+
+
+class NullRecorder(Recorder):
+    """
+    Recorder class that records nothing, the default of every detector so disabled instrumentation costs next to nothing.
+    """
+
+    enabled = False
+
+    def emit(self, event: str, payload: dict) -> None:
+        pass
+
+    def stage(self, name: str) -> ContextManager[None]:
+        return _NULL_STAGE
+
+    def increment(self, counter: str, value: int | float = 1) -> None:
+        pass
+
+    def observe(self, histogram: str, value: int) -> None:
+        pass
+
+    def merge(self, report: dict[str, dict]) -> None:
+        pass
+
+    def optimizer(self) -> Callable | None:
+        return None
+
+    def __str__(self):
+        return "Null Recorder"
@@ -0,0 +1,327 @@
+from numpy import (
+    arange,
+    array,
+    asfortranarray,
+    clip,
+    concatenate,
+    empty,
+    float64,
+    floor,
+    full,
+    inf,
+    maximum,
+    memmap,
+    minimum,
+    ndarray,
+    searchsorted,
+    sort,
+    where,
+)
+
+from src.detecto.instrumentation.memory import deep_sizeof
+
+
+class SortedColumns:
+    """
+    SortedColumns class, the column-wise sorted values of a dataset that grow in place by 1 row at a time.
+
+    The initial values, e.g. a memory-mapped store, are never copied by an insert: the inserted rows are kept in a Fortran-ordered
+    array with spare rows, a new row is inserted into every column by shifting only the larger inserted values of that column, and the
+    capacity doubles when it is full. The quantiles select from both sorted parts with a binary search. Once more rows are inserted
+    than the initial values hold, both parts are merged, so the merges copy every row only a constant number of times on average. The
+    rows of `unsorted_values`, e.g. the rows appended to a store after its sorted values, are sorted into the inserted rows.
+
+    # Attributes
+    ------------
+        * rows (int): The number of rows.
+        * columns (int): The number of columns.
+    """
+
+    def __init__(self, values: ndarray, unsorted_values: ndarray | None = None) -> None:
+        if values.ndim != 2:
+            raise ValueError("The `values` parameter needs to be a 2D array of column-wise sorted values!")
+
+        (self.rows, self.columns) = values.shape
+        self.__values = values
+        self.__inserted = empty(shape=(0, self.columns), dtype=float64, order="F")
+        self.__inserted_rows = 0
+        self.__log = empty(shape=(0, self.columns), dtype=float64)
+        self.__log_rows = 0
+
+        if unsorted_values is not None and unsorted_values.shape[0] > 0:
+            self.__grow(capacity=max(2 * unsorted_values.shape[0], 16))
+            self.__inserted[: unsorted_values.shape[0]] = sort(unsorted_values, axis=0)
+            self.__inserted_rows = unsorted_values.shape[0]
+            self.rows += self.__inserted_rows
+
+    @property
+    def values(self) -> ndarray:
+        """
+        Get the column-wise sorted values.
+
+        # Returns
+        ------------
+            * ndarray: The (rows, columns) view of the initial values without inserted rows, otherwise a merged copy.
+        """
+        if self.__inserted_rows == 0:
+            return self.__values
+        # Both parts are sorted runs, so the stable sort merges them in linear time.
+        return sort(concatenate((self.__values, self.__inserted[: self.__inserted_rows])), axis=0, kind="stable")
+
+    @property
+    def inserted_values(self) -> ndarray:
+        """
+        Get the rows inserted since the creation or the last `clear_inserted()` in insertion order, e.g. to append them to a store.
+
+        # Returns
+        ------------
+            * ndarray: The (rows, columns) view of the inserted rows, it is invalidated by the next change.
+        """
+        return self.__log[: self.__log_rows]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Get the bytes of the buffers held in memory, including their spare rows.
+
+        # Returns
+        ------------
+            * int: The bytes of the buffers, the memory-mapped initial values count as 0 bytes.
+        """
+        return deep_sizeof(obj=self.__values) + self.__inserted.nbytes + self.__log.nbytes
+
+    def __grow(self, capacity: int) -> None:
+        inserted = empty(shape=(capacity, self.columns), dtype=float64, order="F")
+        inserted[: self.__inserted_rows] = self.__inserted[: self.__inserted_rows]
+        self.__inserted = inserted
+
+    def __merge(self) -> None:
+        self.__values = asfortranarray(self.values)
+        self.__inserted = empty(shape=(0, self.columns), dtype=float64, order="F")
+        self.__inserted_rows = 0
+
+    def insert(self, values: ndarray) -> None:
+        """
+        Insert 1 new value into every column.
+
+        # Parameters
+        ------------
+            * values (ndarray): The new value per column.
+
+        # Returns
+        ------------
+            * None: The buffer grows by 1 row.
+        """
+        if self.__inserted_rows > self.__values.shape[0]:
+            self.__merge()
+
+        if self.__inserted_rows == self.__inserted.shape[0]:
+            self.__grow(capacity=max(2 * (self.__inserted_rows + 1), 16))
+
+        if self.__log_rows == self.__log.shape[0]:
+            log = empty(shape=(max(2 * (self.__log_rows + 1), 16), self.columns), dtype=float64)
+            log[: self.__log_rows] = self.__log[: self.__log_rows]
+            self.__log = log
+
+        for column, value in enumerate(values):
+            column_values = self.__inserted[:, column]
+            position = int(searchsorted(column_values[: self.__inserted_rows], value))
+            column_values[position + 1 : self.__inserted_rows + 1] = column_values[position : self.__inserted_rows]
+            column_values[position] = value
+
+        self.__log[self.__log_rows] = values
+        self.__log_rows += 1
+        self.__inserted_rows += 1
+        self.rows += 1
+
+    def clear_inserted(self) -> None:
+        """
+        Forget the rows returned by `inserted_values`, e.g. after they are saved.
+
+        # Returns
+        ------------
+            * None: `inserted_values` is empty, the values are unchanged.
+        """
+        self.__log = empty(shape=(0, self.columns), dtype=float64)
+        self.__log_rows = 0
+
+    def rebase(self, values: ndarray) -> None:
+        """
+        Replace the sorted values by an equal array, e.g. a memory-mapped copy of `values`.
+
+        # Parameters
+        ------------
+            * values (ndarray): The column-wise sorted values of all rows.
+
+        # Returns
+        ------------
+            * None: The inserted rows are merged into `values`, `inserted_values` is kept.
+        """
+        if values.shape != (self.rows, self.columns):
+            raise ValueError(f"The `values` parameter needs the shape {(self.rows, self.columns)}!")
+
+        self.__values = values
+        self.__inserted = empty(shape=(0, self.columns), dtype=float64, order="F")
+        self.__inserted_rows = 0
+
+    def replace_column(self, column: int, values: ndarray) -> None:
+        """
+        Replace the values of 1 column, e.g. after correcting some of its values.
+
+        # Parameters
+        ------------
+            * column (int): The position of the column.
+            * values (ndarray): The sorted values of all rows.
+
+        # Returns
+        ------------
+            * None: The column is replaced in place, the initial values are copied on the first replacement.
+        """
+        if len(values) != self.rows:
+            raise ValueError(f"The `values` parameter needs {self.rows} values!")
+
+        if self.__inserted_rows > 0 or not self.__values.flags.writeable or isinstance(self.__values, memmap):
+            self.__values = array(self.values, dtype=float64, order="F")
+            self.__inserted = empty(shape=(0, self.columns), dtype=float64, order="F")
+            self.__inserted_rows = 0
+        self.__values[:, column] = values
+
+    def quantile(self, q: float) -> ndarray:
+        """
+        Calculate the quantile of every column by linear interpolation, the same as the expanding quantile of Pandas.
+
+        # Parameters
+        ------------
+            * q (float): The quantile, range values are 0.0 - 1.0.
+
+        # Returns
+        ------------
+            * ndarray: The quantile per column.
+        """
+        if self.rows == 0:
+            raise ValueError("There are no values to calculate the quantile of!")
+
+        position = q * (self.rows - 1)
+        lower = int(floor(position))
+        upper = min(lower + 1, self.rows - 1)
+        (lower_values, upper_values) = (self.__select(position=lower), self.__select(position=upper))
+        return lower_values + (upper_values - lower_values) * (position - lower)
+
+    def __select(self, position: int) -> ndarray:
+        """
+        Select the value at a position of the sorted initial and inserted values of every column.
+
+        # Parameters
+        ------------
+            * position (int): The position in the merged sorted values of a column.
+
+        # Returns
+        ------------
+            * ndarray: The value per column.
+        """
+        if self.__inserted_rows == 0:
+            return array(self.__values[position], dtype=float64)
+
+        (values, inserted) = (self.__values, self.__inserted[: self.__inserted_rows])
+        (count, columns) = (position + 1, arange(self.columns))
+        # The number of the `count` smallest values of every column that are initial values, the rest are inserted values.
+        low = full(shape=self.columns, fill_value=max(count - inserted.shape[0], 0))
+        high = full(shape=self.columns, fill_value=min(count, values.shape[0]))
+
+        while (low < high).any():
+            middle = (low + high) // 2
+            is_larger = (
+                values[minimum(middle, values.shape[0] - 1), columns]
+                < inserted[clip(count - middle - 1, 0, inserted.shape[0] - 1), columns]
+            )
+            (low, high) = (
+                where((low < high) & is_larger, middle + 1, low),
+                where((low < high) & ~is_larger, middle, high),
+            )
+
+        last_values = (
+            where(low > 0, values[maximum(low - 1, 0), columns], -inf)
+            if values.shape[0] > 0
+            else full(self.columns, -inf)
+        )
+        last_inserted = where(count - low > 0, inserted[clip(count - low - 1, 0, None), columns], -inf)
+        return maximum(last_values, last_inserted)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __str__(self):
+        return "Sorted Columns"
+
+
+class RaggedColumns:
+    """
+    RaggedColumns class, the values of every column in insertion order, every column grows in place on its own.
+
+    Like `SortedColumns`, a column keeps spare capacity that doubles when it is full and its initial values are only copied on its
+    first append, e.g. the positive exceedances of every feature that the GPD is fitted on.
+
+    # Attributes
+    ------------
+        * lengths (list[int]): The number of values per column.
+    """
+
+    def __init__(self, columns: list[ndarray]) -> None:
+        self.lengths = [len(values) for values in columns]
+        self.__buffers = list(columns)
+        self.__is_owned = [False] * len(columns)
+
+    def values(self, column: int) -> ndarray:
+        """
+        Get the values of 1 column without copying them.
+
+        # Parameters
+        ------------
+            * column (int): The position of the column.
+
+        # Returns
+        ------------
+            * ndarray: The view of the buffer of the column, it is invalidated by the next `append()` to the column.
+        """
+        return self.__buffers[column][: self.lengths[column]]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Get the bytes of the buffers of all columns held in memory, including their spare capacity.
+
+        # Returns
+        ------------
+            * int: The bytes of the buffers, memory-mapped initial values count as 0 bytes.
+        """
+        return sum(deep_sizeof(obj=buffer) for buffer in self.__buffers)
+
+    def append(self, column: int, value: float) -> None:
+        """
+        Append 1 value to a column.
+
+        # Parameters
+        ------------
+            * column (int): The position of the column.
+            * value (float): The new value.
+
+        # Returns
+        ------------
+            * None: The column grows by 1 value.
+        """
+        length = self.lengths[column]
+
+        if not self.__is_owned[column] or length == len(self.__buffers[column]):
+            buffer = empty(shape=max(2 * (length + 1), 16), dtype=float64)
+            buffer[:length] = self.__buffers[column][:length]
+            self.__buffers[column] = buffer
+            self.__is_owned[column] = True
+
+        self.__buffers[column][length] = value
+        self.lengths[column] += 1
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def __str__(self):
+        return "Ragged Columns"
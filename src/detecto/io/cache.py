@@ -0,0 +1,206 @@
+from hashlib import blake2b
+from json import dumps
+from os import listdir, path as os_path, utime
+from shutil import rmtree
+
+from numpy import ascontiguousarray, ndarray, uint8
+from pandas import DataFrame, Index, RangeIndex, Series
+from pandas.util import hash_pandas_object
+
+from src.detecto.io.store import METADATA_FILE, read_store, write_store
+
+
+class StageCache:
+    """
+    StageCache class, a content-addressed on-disk cache for the outputs of the POT stages with size-based LRU eviction.
+
+    Every entry is a store of `src.detecto.io.store` named by the fingerprint of the stage, its input datasets, and its parameters.
+    The recency of an entry is the modification time of its `metadata.json`, refreshed on every hit, so all processes sharing the
+    directory share one LRU order. Entries are written atomically and an entry evicted while it is read is a miss. Processes writing the
+    same entry at once write the same content, so a writer that loses the race keeps the entry of the winner, and a failed write only
+    costs the entry, never the stage.
+
+    # Attributes
+    ------------
+        * path (str): The directory of the cache entries.
+        * max_bytes (int): The maximum bytes of all entries, the least recently used entries are evicted above it, default is 1 GiB.
+        * hits (int): The number of `get()` calls that found an entry.
+        * misses (int): The number of `get()` calls that found no entry.
+        * evictions (int): The number of evicted entries.
+        * failed_writes (int): The number of `put()` calls that could not write their entry, e.g. on a full disk.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: str, max_bytes: int = 1 << 30) -> None:
+        if max_bytes <= 0:
+            raise ValueError("`max_bytes` must be a positive number of bytes!")
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.failed_writes = 0
+
+    def fingerprint(self, stage: str, datasets: list[DataFrame], params: dict) -> str:
+        """
+        Hash the stage, the columns, dtypes, index, and values of its input datasets, and its parameters with BLAKE2b.
+
+        The values are hashed column by column from their buffers, so no copy of a whole dataset is made.
+
+        # Parameters
+        ------------
+            * stage (str): The name of the stage, e.g. "compute_exceedance_threshold".
+            * datasets (list[DataFrame]): The input datasets of the stage.
+            * params (dict): The JSON serializable parameters of the stage.
+
+        # Returns
+        ------------
+            * str: The hex digest used as the name of the entry.
+        """
+        digest = blake2b(digest_size=20)
+        digest.update(dumps({"version": self.FORMAT_VERSION, "stage": stage, **params}, sort_keys=True).encode())
+
+        for dataset in datasets:
+            digest.update(dumps([str(column) for column in dataset.columns]).encode())
+            self.__hash_index(digest=digest, index=dataset.index)
+
+            for position in range(0, dataset.shape[1]):
+                column = dataset.iloc[:, position]
+                digest.update(str(column.dtype).encode())
+                self.__hash_values(digest=digest, values=column)
+        return digest.hexdigest()
+
+    def __hash_index(self, digest: blake2b, index: Index) -> None:
+        if isinstance(index, RangeIndex):
+            digest.update(f"range|{index.start}|{index.stop}|{index.step}".encode())
+        else:
+            digest.update(str(index.dtype).encode())
+            self.__hash_values(digest=digest, values=index)
+
+    def __hash_values(self, digest: blake2b, values: Series | Index) -> None:
+        array = values.to_numpy()
+
+        if array.dtype.kind in "biufcmM":
+            digest.update(ascontiguousarray(array).view(uint8).data)
+        else:
+            digest.update(hash_pandas_object(values, index=False).to_numpy())
+
+    def __entry_path(self, key: str) -> str:
+        return os_path.join(self.path, key)
+
+    def get(self, key: str) -> tuple[dict[str, ndarray], dict] | None:
+        """
+        Read an entry and mark it as the most recently used.
+
+        # Parameters
+        ------------
+            * key (str): The fingerprint of the entry.
+
+        # Returns
+        ------------
+            * tuple[dict[str, ndarray], dict] | None: The copy-on-write memory-mapped arrays and the metadata, or None on a miss.
+        """
+        entry_path = self.__entry_path(key=key)
+
+        try:
+            entry = read_store(path=entry_path, mmap_mode="c")
+            utime(os_path.join(entry_path, METADATA_FILE))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, arrays: dict[str, ndarray], metadata: dict) -> None:
+        """
+        Write an entry and evict the least recently used entries above `max_bytes`.
+
+        # Parameters
+        ------------
+            * key (str): The fingerprint of the entry.
+            * arrays (dict[str, ndarray]): The arrays of the stage output.
+            * metadata (dict): The JSON serializable metadata of the stage output, e.g. the column names.
+
+        # Returns
+        ------------
+            * None: An entry larger than `max_bytes` on its own is not written, a failed write is counted in `failed_writes`.
+        """
+        if sum(array.nbytes for array in arrays.values()) > self.max_bytes:
+            return
+
+        entry_path = self.__entry_path(key=key)
+
+        try:
+            write_store(path=entry_path, arrays=arrays, metadata=metadata)
+        except OSError:
+            # A concurrent writer of the same key renamed its complete entry into place first.
+            if not os_path.isfile(os_path.join(entry_path, METADATA_FILE)):
+                self.failed_writes += 1
+                return
+        self.evict()
+
+    def __entries(self) -> list[tuple[float, int, str]]:
+        """
+        List the complete entries with their recency and size.
+
+        # Returns
+        ------------
+            * list[tuple[float, int, str]]: The modification time of the metadata, the bytes, and the path of every entry, oldest first.
+        """
+        entries = []
+
+        for name in listdir(self.path) if os_path.isdir(self.path) else []:
+            entry_path = os_path.join(self.path, name)
+            if name.endswith((".tmp", ".old")) or not os_path.isfile(os_path.join(entry_path, METADATA_FILE)):
+                continue
+            try:
+                size = sum(os_path.getsize(os_path.join(entry_path, file_name)) for file_name in listdir(entry_path))
+                entries.append((os_path.getmtime(os_path.join(entry_path, METADATA_FILE)), size, entry_path))
+            except OSError:
+                continue
+        return sorted(entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """
+        Get the bytes of all entries on disk.
+
+        # Returns
+        ------------
+            * int: The total size of the entries.
+        """
+        return sum(size for (_, size, _) in self.__entries())
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until all entries fit into `max_bytes`.
+
+        # Returns
+        ------------
+            * None: The evicted entries are removed from disk and counted in `evictions`.
+        """
+        entries = self.__entries()
+        total_bytes = sum(size for (_, size, _) in entries)
+
+        for _, size, entry_path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            rmtree(entry_path, ignore_errors=True)
+            total_bytes -= size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all entries of the cache.
+
+        # Returns
+        ------------
+            * None: The cache directory is removed.
+        """
+        rmtree(self.path, ignore_errors=True)
+
+    def __str__(self):
+        return "Stage Cache"
@@ -0,0 +1,128 @@
+from typing import Callable
+
+from numpy import empty, float64, int64, nan, ndarray
+from pandas import ArrowDtype, DataFrame, SparseDtype
+
+from src.detecto.instrumentation.memory import is_memory_mapped
+
+
+def to_frame(dataset: DataFrame | ndarray | object) -> DataFrame:
+    """
+    Wrap a Pandas DataFrame, a 1D or 2D NumPy array or memory map, or a PyArrow Table as a Pandas DataFrame without copying it.
+
+    Arrays become a view with the columns "feature_0", "feature_1", ..., PyArrow Tables become a DataFrame with Arrow-backed dtypes
+    whose columns reference the Arrow buffers. PyArrow is never imported here, a Table can only be passed if it is installed.
+
+    # Parameters
+    ------------
+        * dataset (DataFrame | ndarray | pyarrow.Table): The dataset with 1 column per feature.
+
+    # Returns
+    ------------
+        * DataFrame: The dataset as a DataFrame sharing its memory.
+    """
+    if isinstance(dataset, DataFrame):
+        return dataset
+
+    if isinstance(dataset, ndarray) and dataset.ndim in (1, 2):
+        values = dataset.reshape(-1, 1) if dataset.ndim == 1 else dataset
+        return DataFrame(
+            data=values, columns=[f"feature_{feature}" for feature in range(0, values.shape[1])], copy=False
+        )
+
+    if type(dataset).__module__.split(".")[0] == "pyarrow" and hasattr(dataset, "to_pandas"):
+        return dataset.to_pandas(types_mapper=ArrowDtype)  # type: ignore
+
+    raise ValueError(
+        "The `dataset` parameter needs to be a Pandas DataFrame, a 1D or 2D NumPy array, or a PyArrow Table!"
+    )
+
+
+def is_column_backed(dataset: DataFrame) -> bool:
+    """
+    Check whether a DataFrame should be processed column by column: its values are memory-mapped or held in Arrow buffers.
+
+    # Parameters
+    ------------
+        * dataset (DataFrame): The DataFrame to check.
+
+    # Returns
+    ------------
+        * bool: `True` if the DataFrame is a view of a memory map or has an Arrow-backed column.
+    """
+    return is_memory_mapped(frame=dataset) or any(isinstance(dtype, ArrowDtype) for dtype in dataset.dtypes)
+
+
+def column_values(dataset: DataFrame, position: int) -> ndarray:
+    """
+    Get the float64 values of 1 column, a view of the mapped buffer for float64 NumPy-backed columns.
+
+    Arrow-backed columns are converted with missing values as `NaN`, so at most 1 column is copied at a time.
+
+    # Parameters
+    ------------
+        * dataset (DataFrame): The DataFrame to read from.
+        * position (int): The position of the column.
+
+    # Returns
+    ------------
+        * ndarray: The 1D float64 values of the column.
+    """
+    column = dataset.iloc[:, position]
+
+    if isinstance(column.dtype, ArrowDtype):
+        return column.to_numpy(dtype=float64, na_value=nan)
+    return column.to_numpy(dtype=float64)
+
+
+def positive_values(dataset: DataFrame, position: int) -> tuple[ndarray, ndarray]:
+    """
+    Get the rows and float64 values of the positive entries of 1 column, e.g. the exceedances the GPD is fitted on.
+
+    The stored values of a sparse column with fill value 0 are read directly, so the column is never densified, any other column is
+    read with `column_values()`.
+
+    # Parameters
+    ------------
+        * dataset (DataFrame): The DataFrame to read from.
+        * position (int): The position of the column.
+
+    # Returns
+    ------------
+        * tuple[ndarray, ndarray]: The ascending int64 rows and the float64 values of the positive entries.
+    """
+    column = dataset.iloc[:, position]
+
+    if isinstance(column.dtype, SparseDtype) and column.dtype.fill_value == 0:
+        (rows, values) = (column.array.sp_index.indices, column.array.sp_values)
+    else:
+        values = column_values(dataset=dataset, position=position)
+        rows = None
+
+    is_positive = values > 0.0
+    positive_rows = is_positive.nonzero()[0] if rows is None else rows[is_positive]
+    return (positive_rows.astype(int64, copy=False), values[is_positive].astype(float64, copy=False))
+
+
+def map_columns(
+    dataset: DataFrame, function: Callable[[int, ndarray], ndarray], output: ndarray | None = None
+) -> DataFrame:
+    """
+    Apply a function to the values of every column of a DataFrame, 1 column at a time.
+
+    # Parameters
+    ------------
+        * dataset (DataFrame): The DataFrame to read from.
+        * function (Callable[[int, ndarray], ndarray]): Maps the position and the float64 values of a column to the output column.
+        * output (ndarray | None): The Fortran-ordered float64 array with the shape of `dataset` to write into, e.g. a memory map,
+            default is a new in-memory array.
+
+    # Returns
+    ------------
+        * DataFrame: The output with the index and columns of `dataset`, sharing the memory of `output`.
+    """
+    output = output if output is not None else empty(shape=dataset.shape, dtype=float64, order="F")
+
+    for position in range(0, dataset.shape[1]):
+        output[:, position] = function(position, column_values(dataset=dataset, position=position))
+    return DataFrame(data=output, index=dataset.index, columns=dataset.columns, copy=False)
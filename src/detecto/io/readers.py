@@ -0,0 +1,144 @@
+from typing import Iterator, Literal
+
+from pandas import DataFrame, RangeIndex, read_csv
+
+
+class ChunkedReader:
+    """
+    Reader class that streams a CSV or Parquet file in row chunks, so files larger than the memory are never loaded as a whole.
+
+    Only the projected `columns` are parsed and the value columns are downcast per chunk, e.g. to "float32". Parquet requires the
+    optional `pyarrow` dependency.
+
+    # Attributes
+    ------------
+        * path (str): The CSV or Parquet file.
+        * chunk_rows (int): The number of rows per chunk, default 100000.
+        * columns (list[str] | None): The projected value columns, all columns except `index_col` if None, default is None.
+        * index_col (str | None): The column used as the index of the chunks, e.g. the timestamp, parsed as datetime for CSV, default
+            is None, then the chunks have a continuous `RangeIndex`.
+        * dtype (str | None): The dtype the value columns are downcast to, e.g. "float32", default is None that keeps the parsed dtypes.
+        * file_format (Literal["csv", "parquet"]): The format of `path`, inferred from the file extension if None.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        chunk_rows: int = 100_000,
+        columns: list[str] | None = None,
+        index_col: str | None = None,
+        dtype: str | None = None,
+        file_format: Literal["csv", "parquet"] | None = None,
+    ) -> None:
+        if chunk_rows < 1:
+            raise ValueError("`chunk_rows` must be at least 1!")
+
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self.index_col = index_col
+        self.dtype = dtype
+        self.file_format = file_format if file_format is not None else self.__infer_format(path=path)
+        self.columns = columns if columns is not None else self.__read_columns()
+
+    def __infer_format(self, path: str) -> Literal["csv", "parquet"]:
+        if path.endswith((".parquet", ".pq")):
+            return "parquet"
+        elif path.endswith((".csv", ".csv.gz", ".txt")):
+            return "csv"
+        raise ValueError(
+            "The `file_format` can't be inferred from the extension of `path`, set it to 'csv' or 'parquet'!"
+        )
+
+    def __parquet_file(self):  # type: ignore
+        try:
+            from pyarrow.parquet import ParquetFile
+        except ImportError as e:
+            raise ImportError(
+                "Reading Parquet requires pyarrow, install it with `pip install detecto[parquet]`."
+            ) from e
+
+        return ParquetFile(self.path)
+
+    def __read_columns(self) -> list[str]:
+        """
+        Read the names of all columns except `index_col` from the header or the Parquet schema.
+
+        # Returns
+        ------------
+            * list[str]: The value columns.
+        """
+        if self.file_format == "parquet":
+            names = list(self.__parquet_file().schema_arrow.names)
+        else:
+            names = list(read_csv(self.path, nrows=0).columns)
+        return [name for name in names if name != self.index_col]
+
+    @property
+    def schema(self) -> DataFrame:
+        """
+        Get an empty DataFrame with the projected value columns, e.g. as `dataset` of `POTDetecto.fit()` after an out-of-core extraction.
+
+        # Returns
+        ------------
+            * DataFrame: The DataFrame without rows.
+        """
+        return DataFrame(columns=self.columns, dtype=self.dtype if self.dtype is not None else "float64")
+
+    def count_rows(self) -> int:
+        """
+        Count the rows of the file, e.g. to set the timeframe before streaming.
+
+        A CSV file is streamed through the parser of `chunks()` with only its first column kept, so quoted fields with line breaks,
+        blank lines, and compressed files are counted exactly as `chunks()` reads them. Parquet rows are read from the file metadata.
+
+        # Returns
+        ------------
+            * int: The number of rows without the header.
+        """
+        if self.file_format == "parquet":
+            return self.__parquet_file().metadata.num_rows
+
+        return sum(
+            chunk.shape[0]
+            for chunk in read_csv(self.path, usecols=[0], dtype=str, chunksize=max(self.chunk_rows, 100_000))
+        )
+
+    def chunks(self) -> Iterator[DataFrame]:
+        """
+        Stream the projected and downcast columns of the file chunk by chunk.
+
+        # Returns
+        ------------
+            * Iterator[DataFrame]: The chunks of at most `chunk_rows` rows, indexed by `index_col` or by the row number in the file.
+        """
+        usecols = self.columns + ([self.index_col] if self.index_col is not None else [])
+
+        if self.file_format == "csv":
+            for chunk in read_csv(
+                self.path,
+                usecols=usecols,
+                index_col=self.index_col,
+                parse_dates=self.index_col is not None,
+                dtype=None if self.dtype is None else {column: self.dtype for column in self.columns},
+                chunksize=self.chunk_rows,
+            ):
+                yield chunk[self.columns]
+            return
+
+        first_row = 0
+        for batch in self.__parquet_file().iter_batches(batch_size=self.chunk_rows, columns=usecols):
+            chunk = batch.to_pandas()
+
+            if self.index_col is not None:
+                chunk = chunk.set_index(self.index_col)
+            else:
+                chunk.index = RangeIndex(start=first_row, stop=first_row + chunk.shape[0])
+
+            first_row += chunk.shape[0]
+            yield chunk[self.columns] if self.dtype is None else chunk[self.columns].astype(self.dtype)
+
+    def __iter__(self) -> Iterator[DataFrame]:
+        return self.chunks()
+
+    def __str__(self):
+        return "Chunked Reader"
@@ -0,0 +1,291 @@
+from contextlib import suppress
+from io import BytesIO
+from json import dump, load as load_json
+from os import close, fdopen, makedirs, path as os_path, remove, replace
+from shutil import rmtree
+from tempfile import mkdtemp, mkstemp
+from typing import Literal
+
+from numpy import ascontiguousarray, concatenate, load, ndarray, prod, save
+from numpy.lib import format as npy_format
+
+METADATA_FILE = "metadata.json"
+
+
+def write_store(path: str, arrays: dict[str, ndarray], metadata: dict) -> str:
+    """
+    Write a store: a directory with 1 `.npy` file per array and a `metadata.json`, replaced atomically as a whole.
+
+    `.npy` files are used instead of a single `.npz` archive, so every array can be memory-mapped on read, and every array is written
+    C-ordered, so `append_store()` can grow it in place. Every writer stages into its
+    own temporary directory next to `path`, so concurrent writers of the same store never remove each other's files: the last rename
+    wins, and a writer whose rename lost the race raises an `OSError` while `path` holds the complete store of the winner.
+
+    # Parameters
+    ------------
+        * path (str): The directory of the store, an existing store is overwritten.
+        * arrays (dict[str, ndarray]): The arrays by name, the name is the file name without `.npy`.
+        * metadata (dict): The JSON serializable metadata, e.g. the format version, column names, and scalars.
+
+    # Returns
+    ------------
+        * str: The path of the written store.
+    """
+    store_path = os_path.abspath(path)
+    makedirs(os_path.dirname(store_path), exist_ok=True)
+    temporary_path = mkdtemp(dir=os_path.dirname(store_path), prefix=f"{os_path.basename(store_path)}.", suffix=".tmp")
+    previous_path = f"{temporary_path.removesuffix('.tmp')}.old"
+
+    try:
+        for name, array in arrays.items():
+            save(file=os_path.join(temporary_path, f"{name}.npy"), arr=_c_ordered(array=array), allow_pickle=False)
+
+        with open(os_path.join(temporary_path, METADATA_FILE), "w") as file:
+            dump({**metadata, "arrays": sorted(arrays.keys())}, file, indent=2)
+
+        if os_path.isdir(path):
+            replace(path, previous_path)
+        replace(temporary_path, path)
+        rmtree(previous_path, ignore_errors=True)
+    except Exception as e:
+        with suppress(OSError):
+            if os_path.isdir(previous_path) and not os_path.isdir(path):
+                replace(previous_path, path)
+        rmtree(temporary_path, ignore_errors=True)
+        rmtree(previous_path, ignore_errors=True)
+        print(e)
+        raise
+    return path
+
+
+def append_store(path: str, rows: dict[str, ndarray], metadata: dict, arrays: dict[str, ndarray] | None = None) -> str:
+    """
+    Append rows to the arrays of a store in place instead of rewriting it, e.g. the new rows of every incremental run.
+
+    The rows are written after the committed rows of every `.npy` file and its header is updated in place, NumPy reserves room in the
+    header for a longer first axis. The new row counts are only committed by replacing `metadata.json` atomically, `read_store()` only
+    maps the committed rows, so a failed append leaves the previous store readable and the next append overwrites the rest, e.g. the rows
+    staged by `stage_rows()`. Fortran-ordered arrays of older stores can't grow in place and are rewritten C-ordered once like the
+    `arrays`. An append is not safe against concurrent writers of the same store.
+
+    # Parameters
+    ------------
+        * path (str): The directory of a store written by `write_store()`.
+        * rows (dict[str, ndarray]): The rows to append by array name, a new name is written as a new array.
+        * metadata (dict): The JSON serializable metadata that replaces the previous one.
+        * arrays (dict[str, ndarray] | None): The arrays to replace as a whole, written to a new file that is committed with the metadata, default is None.
+
+    # Returns
+    ------------
+        * str: The path of the store.
+    """
+    (_, previous_metadata) = read_store(path=path)
+    files: dict[str, str] = dict(previous_metadata.get("files", {}))
+    committed_rows: dict[str, int] = dict(previous_metadata.get("rows", {}))
+    replaced_files: list[str] = []
+    written_files: list[str] = []
+    replaced_arrays = dict(arrays if arrays is not None else {})
+
+    try:
+        for name, new_rows in rows.items():
+            file_name = files.get(name, f"{name}.npy")
+
+            if name not in previous_metadata["arrays"]:
+                replaced_arrays[name] = new_rows
+                continue
+
+            total_rows = _append_npy(
+                file_path=os_path.join(path, file_name), rows=new_rows, committed_rows=committed_rows.get(name)
+            )
+            if total_rows is None:
+                previous_rows = load(file=os_path.join(path, file_name), mmap_mode="r", allow_pickle=False)
+                replaced_arrays[name] = concatenate((previous_rows[: committed_rows.get(name)], new_rows))
+                continue
+            committed_rows[name] = total_rows
+
+        for name, array in replaced_arrays.items():
+            (file_descriptor, file_path) = mkstemp(dir=path, prefix=f"{name}.", suffix=".npy")
+            close(file_descriptor)
+            written_files.append(file_path)
+            save(file=file_path, arr=_c_ordered(array=array), allow_pickle=False)
+
+            if name in previous_metadata["arrays"]:
+                replaced_files.append(files.get(name, f"{name}.npy"))
+            files[name] = os_path.basename(file_path)
+            committed_rows[name] = array.shape[0] if array.ndim > 0 else 0
+
+        _replace_metadata(
+            path=path,
+            metadata={
+                **metadata,
+                "arrays": sorted(set(previous_metadata["arrays"]) | set(rows.keys()) | set(replaced_arrays.keys())),
+                "files": files,
+                "rows": committed_rows,
+            },
+            written_files=written_files,
+        )
+    except Exception as e:
+        for file_path in written_files:
+            with suppress(OSError):
+                remove(file_path)
+        print(e)
+        raise
+
+    for file_name in replaced_files:
+        with suppress(OSError):
+            remove(os_path.join(path, file_name))
+    return path
+
+
+def stage_rows(path: str, name: str, rows: ndarray, first_row: int) -> ndarray | None:
+    """
+    Write rows after the first rows of an array of a store without committing them, e.g. the rows of an update before it is saved.
+
+    Like a failed `append_store()`, the staged rows are invisible to `read_store()` until the next `append_store()` of the array
+    overwrites and commits them, so the array grows from the store without copying its previous rows into the memory.
+
+    # Parameters
+    ------------
+        * path (str): The directory of a store written by `write_store()`.
+        * name (str): The name of the array.
+        * rows (ndarray): The rows with the same trailing shape as the array, cast to its dtype.
+        * first_row (int): The row the new rows are written at, from the committed rows up to the rows in the file.
+
+    # Returns
+    ------------
+        * ndarray | None: The read-only memory map of the rows before `first_row` and the new rows, None if the array can't grow in place.
+    """
+    (arrays, metadata) = read_store(path=path)
+
+    if name not in arrays or arrays[name].ndim == 0:
+        return None
+
+    file_path = os_path.join(path, metadata.get("files", {}).get(name, f"{name}.npy"))
+    committed_rows = metadata.get("rows", {}).get(name, arrays[name].shape[0])
+
+    if not committed_rows <= first_row <= load(file=file_path, mmap_mode="r", allow_pickle=False).shape[0]:
+        return None
+
+    if name not in metadata.get("rows", {}):
+        # The rows of `write_store()` are committed first, so the staged rows stay invisible to `read_store()`.
+        _replace_metadata(path=path, metadata={**metadata, "rows": {**metadata.get("rows", {}), name: committed_rows}})
+
+    total_rows = _append_npy(file_path=file_path, rows=rows, committed_rows=first_row)
+    return None if total_rows is None else load(file=file_path, mmap_mode="r", allow_pickle=False)[:total_rows]
+
+
+def _replace_metadata(path: str, metadata: dict, written_files: list[str] | None = None) -> None:
+    """
+    Replace the `metadata.json` of a store atomically, it commits the rows and files of the arrays.
+
+    # Parameters
+    ------------
+        * path (str): The directory of the store.
+        * metadata (dict): The JSON serializable metadata.
+        * written_files (list[str] | None): The files written by the caller, the temporary metadata file is added to be removed on failure, default is None.
+
+    # Returns
+    ------------
+        * None: The metadata is replaced.
+    """
+    (file_descriptor, metadata_path) = mkstemp(dir=path, prefix=f"{METADATA_FILE}.", suffix=".tmp")
+    if written_files is not None:
+        written_files.append(metadata_path)
+    with fdopen(file_descriptor, "w") as file:
+        dump(metadata, file, indent=2)
+    replace(metadata_path, os_path.join(path, METADATA_FILE))
+
+
+def _c_ordered(array: ndarray) -> ndarray:
+    """
+    Get a C-ordered array, e.g. of a Fortran-ordered spilled dataset, that `_append_npy()` can grow in place.
+
+    # Parameters
+    ------------
+        * array (ndarray): The array.
+
+    # Returns
+    ------------
+        * ndarray: The array itself if it is C-contiguous, otherwise a C-contiguous copy.
+    """
+    return array if array.flags.c_contiguous else ascontiguousarray(array)
+
+
+def _append_npy(file_path: str, rows: ndarray, committed_rows: int | None) -> int | None:
+    """
+    Append rows to a C-ordered `.npy` file in place and update the first axis of its header.
+
+    # Parameters
+    ------------
+        * file_path (str): The `.npy` file.
+        * rows (ndarray): The rows with the same trailing shape as the array of the file, cast to its dtype.
+        * committed_rows (int | None): The committed rows of the file, later rows are overwritten, None if all rows are committed.
+
+    # Returns
+    ------------
+        * int | None: The rows of the file after the append, None if it can't grow in place.
+    """
+    with open(file_path, "r+b") as file:
+        version = npy_format.read_magic(file)
+        if version not in ((1, 0), (2, 0)):
+            return None
+
+        (shape, fortran_order, dtype) = (
+            npy_format.read_array_header_1_0(file) if version == (1, 0) else npy_format.read_array_header_2_0(file)
+        )
+        header_size = file.tell()
+
+        if fortran_order or len(shape) == 0 or tuple(rows.shape[1:]) != tuple(shape[1:]):
+            return None
+
+        total_rows = (shape[0] if committed_rows is None else committed_rows) + rows.shape[0]
+        header = BytesIO()
+        header_data = {
+            "descr": npy_format.dtype_to_descr(dtype),
+            "fortran_order": False,
+            "shape": (total_rows, *shape[1:]),
+        }
+        if version == (1, 0):
+            npy_format.write_array_header_1_0(header, header_data)
+        else:
+            npy_format.write_array_header_2_0(header, header_data)
+
+        if header.tell() != header_size:
+            return None
+
+        # The file is only truncated after the write, so memory maps of its rows stay valid while they are written again.
+        file.seek(header_size + (total_rows - rows.shape[0]) * dtype.itemsize * int(prod(shape[1:])))
+        file.write(ascontiguousarray(rows, dtype=dtype).data)
+        file.truncate()
+        file.seek(0)
+        file.write(header.getvalue())
+    return total_rows
+
+
+def read_store(path: str, mmap_mode: Literal["r", "c"] | None = "r") -> tuple[dict[str, ndarray], dict]:
+    """
+    Read a store written by `write_store()` and grown by `append_store()`, only the committed rows of every array.
+
+    # Parameters
+    ------------
+        * path (str): The directory of the store.
+        * mmap_mode (Literal["r", "c"] | None): "r" memory-maps the arrays read-only, "c" copy-on-write, None reads them into memory, default is "r".
+
+    # Returns
+    ------------
+        * tuple[dict[str, ndarray], dict]: The arrays by name and the metadata.
+    """
+    if not os_path.isfile(os_path.join(path, METADATA_FILE)):
+        raise ValueError(f"`{path}` is not a Detecto store, `{METADATA_FILE}` is missing!")
+
+    with open(os_path.join(path, METADATA_FILE)) as file:
+        metadata = load_json(file)
+
+    files = metadata.get("files", {})
+    committed_rows = metadata.get("rows", {})
+    arrays = {}
+
+    for name in sorted(metadata["arrays"]):
+        array = load(file=os_path.join(path, files.get(name, f"{name}.npy")), mmap_mode=mmap_mode, allow_pickle=False)
+        arrays[name] = array[: committed_rows[name]] if name in committed_rows else array
+    return (arrays, metadata)
@@ -1,13 +1,264 @@
-from random import randint
+from __future__ import annotations
 
-from matplotlib.pyplot import figure, legend, show, subplots
-from numpy import arange, max as np_max, min as np_min, quantile, sort
-from pandas import DataFrame, Series
+from contextlib import AbstractContextManager, nullcontext
+from hashlib import sha256
+from os import makedirs, path as os_path, replace
+from random import randint
+from shutil import rmtree
+from typing import Iterable, Iterator, Literal, TYPE_CHECKING
+
+from numpy import (
+    arange,
+    argsort,
+    array,
+    ascontiguousarray,
+    bincount,
+    broadcast_to,
+    clip,
+    concatenate,
+    cumsum,
+    empty,
+    float64,
+    floor,
+    full,
+    inf,
+    int64,
+    isnan,
+    load,
+    nan,
+    ndarray,
+    ones,
+    quantile,
+    save,
+    searchsorted,
+    sort,
+    split,
+    zeros,
+)
+from numpy.lib.format import open_memmap
+from pandas import concat, DataFrame, Index, RangeIndex, Series, SparseDtype
+from pandas.arrays import BooleanArray
 from scipy.stats import genpareto, ks_1samp
 
+from src.detecto.instrumentation.memory import deep_sizeof, is_memory_mapped
+from src.detecto.instrumentation.profiling import ProfileMethod, Profiler
+from src.detecto.instrumentation.recorder import NullRecorder, Recorder
+from src.detecto.io.buffers import RaggedColumns, SortedColumns
+from src.detecto.io.cache import StageCache
+from src.detecto.io.datasets import column_values, is_column_backed, map_columns, positive_values, to_frame
+from src.detecto.io.store import append_store, read_store, stage_rows, write_store
 from src.detecto.models.detectors.interface import Detecto
 from src.detecto.models.timeframes.pot import POTTimeframe
 
+# The process pool, shared memory, sparse, sketch, serving and rendering modules are only imported by the methods that use them
+if TYPE_CHECKING:  # pragma: no cover
+    from src.detecto.models.renderers.qq import QQResult
+    from src.detecto.parallel.shared import SharedArraySpec
+    from src.detecto.parallel.sketches import FeatureSketches
+    from src.detecto.serving.model import POTScoringModel
+
+
+def _gpd_params_values(values: ndarray) -> list[float]:
+    """
+    Convert the params of 1 cell of a dense params array into Python numbers as `genpareto.fit()` returns them.
+
+    # Parameters
+    ------------
+        * values (ndarray): The c, loc, scale, and optionally p-value and anomaly score of the cell.
+
+    # Returns
+    ------------
+        * list[float]: The params, the loc of a fitted cell is the integer of `floc = 0` like the result of `genpareto.fit()`.
+    """
+    params_values = values.tolist()
+    if params_values[2] != 0.0 and float(params_values[1]).is_integer():
+        params_values[1] = int(params_values[1])
+    return params_values
+
+
+def _fit_shared_features(
+    exceedance_spec: SharedArraySpec, params_spec: SharedArraySpec, feature_indices: list[int], t0: int, record: bool
+) -> dict[str, dict]:
+    """
+    Fit the GPD cells of some features in a worker process, reading the exceedances from and writing the params into shared memory.
+
+    # Parameters
+    ------------
+        * exceedance_spec (SharedArraySpec): The spec of the Fortran-ordered (rows, features) exceedances.
+        * params_spec (SharedArraySpec): The spec of the (rows - t0, features, 5) params output.
+        * feature_indices (list[int]): The features fitted by this task.
+        * t0 (int): The first row that is scored.
+        * record (bool): Whether to record the fits like the `Recorder` of the detector, it can't be pickled into the worker.
+
+    # Returns
+    ------------
+        * dict[str, dict]: The run report of the task, merged into the recorder of the detector.
+    """
+    from src.detecto.parallel.shared import attach
+
+    (exceedances, exceedance_block) = attach(spec=exceedance_spec)
+    (params_array, params_block) = attach(spec=params_spec, readonly=False)
+    recorder = Recorder() if record else NullRecorder()
+
+    try:
+        for feature_index in feature_indices:
+            _fit_feature(
+                exceedances=exceedances[:, feature_index],
+                params_array=params_array[:, feature_index],
+                t0=t0,
+                recorder=recorder,
+            )
+    finally:
+        del exceedances, params_array
+        exceedance_block.close()
+        params_block.close()
+    return recorder.report()
+
+
+def _fit_feature(exceedances: ndarray, params_array: ndarray, t0: int, recorder: Recorder) -> int:
+    """
+    Fit the GPD of 1 feature row by row on all positive exceedances before the row, like `POTDetecto.fit()`.
+
+    # Parameters
+    ------------
+        * exceedances (ndarray): The exceedances of the feature.
+        * params_array (ndarray): The (rows - t0, 5) output of c, loc, scale, p-value, and anomaly score, cells without a fit are kept.
+        * t0 (int): The first row that is scored.
+        * recorder (Recorder): The recorder of the fits.
+
+    # Returns
+    ------------
+        * int: The number of GPD fits.
+    """
+    fit_kwargs = _gpd_fit_kwargs(recorder=recorder)
+    total_fits = 0
+
+    for row in range(t0, exceedances.shape[0]):
+        cell_params = _fit_cell(exceedances=exceedances, row=row, fit_kwargs=fit_kwargs, recorder=recorder)
+        if cell_params is not None:
+            params_array[row - t0] = cell_params
+            total_fits += 1
+    return total_fits
+
+
+def _gpd_fit_kwargs(recorder: Recorder) -> dict:
+    """
+    Get the keyword arguments of `genpareto.fit()` shared by every fit of the detector.
+
+    # Parameters
+    ------------
+        * recorder (Recorder): The recorder whose optimizer records the iterations of every fit.
+
+    # Returns
+    ------------
+        * dict: `floc = 0` and the instrumented optimizer if the recorder has one.
+    """
+    optimizer = recorder.optimizer()
+    return {"floc": 0} if optimizer is None else {"floc": 0, "optimizer": optimizer}
+
+
+def _fit_cell(
+    exceedances: ndarray, row: int, fit_kwargs: dict, recorder: Recorder
+) -> tuple[float, float, float, float, float] | None:
+    """
+    Fit the GPD on the exceedances of 1 feature before a row and score the exceedance of the row, in float64 whatever the dtype of the
+    exceedances.
+
+    # Parameters
+    ------------
+        * exceedances (ndarray): The exceedances of the feature.
+        * row (int): The row of the exceedance dataset to score.
+        * fit_kwargs (dict): The keyword arguments of `genpareto.fit()`.
+        * recorder (Recorder): The recorder of the fit.
+
+    # Returns
+    ------------
+        * tuple[float, float, float, float, float] | None: The c, loc, scale, p-value, and anomaly score, or None if the row has no
+            exceedance or no exceedance precedes it.
+    """
+    exceedance_of_interest = float(exceedances[row])
+
+    if exceedance_of_interest <= 0:
+        return None
+
+    exceedances_for_learning = exceedances[:row]
+    exceedances_for_fitting = exceedances_for_learning[exceedances_for_learning > 0.0]
+
+    if len(exceedances_for_fitting) == 0:
+        return None
+
+    return _fit_positive_cell(
+        positive_exceedances=exceedances_for_fitting.astype(float64, copy=False),
+        exceedance=exceedance_of_interest,
+        fit_kwargs=fit_kwargs,
+        recorder=recorder,
+    )
+
+
+def _fit_positive_cell(
+    positive_exceedances: ndarray, exceedance: float, fit_kwargs: dict, recorder: Recorder
+) -> tuple[float, float, float, float, float]:
+    """
+    Fit the GPD on the positive exceedances of 1 feature before a row and score the exceedance of the row.
+
+    # Parameters
+    ------------
+        * positive_exceedances (ndarray): The float64 positive exceedances of the feature before the row, at least 1.
+        * exceedance (float): The positive exceedance of the row.
+        * fit_kwargs (dict): The keyword arguments of `genpareto.fit()`.
+        * recorder (Recorder): The recorder of the fit.
+
+    # Returns
+    ------------
+        * tuple[float, float, float, float, float]: The c, loc, scale, p-value, and anomaly score.
+    """
+    (c, loc, scale) = _fit_gpd(exceedances=positive_exceedances, fit_kwargs=fit_kwargs, recorder=recorder)
+    (p_value, inverted_p_value) = _score_exceedance(exceedance=exceedance, c=c, loc=loc, scale=scale)
+    return (c, loc, scale, p_value, inverted_p_value)
+
+
+def _fit_gpd(exceedances: ndarray, fit_kwargs: dict, recorder: Recorder) -> tuple[float, float, float]:
+    """
+    Fit the GPD on the exceedances with `scipy.stats.genpareto.fit()`.
+
+    # Parameters
+    ------------
+        * exceedances (ndarray): The positive exceedances to fit on.
+        * fit_kwargs (dict): The keyword arguments of `genpareto.fit()`, `floc = 0` and optionally the instrumented optimizer.
+        * recorder (Recorder): The recorder of the "gpd_fits" and "fit_failures" counters.
+
+    # Returns
+    ------------
+        * tuple[float, float, float]: The fitted c, loc, and scale.
+    """
+    try:
+        (c, loc, scale) = genpareto.fit(data=exceedances, **fit_kwargs)
+    except Exception as e:
+        recorder.increment(counter="fit_failures")
+        print(e)
+        raise
+    recorder.increment(counter="gpd_fits")
+    return (c, loc, scale)
+
+
+def _score_exceedance(exceedance: float, c: float, loc: float, scale: float) -> tuple[float, float]:
+    """
+    Calculate the p-value of an exceedance with the GPD survival function and its anomaly score.
+
+    # Parameters
+    ------------
+        * exceedance (float): The exceedance to score.
+        * c (float): The fitted shape parameter.
+        * loc (float): The fitted location parameter.
+        * scale (float): The fitted scale parameter.
+
+    # Returns
+    ------------
+        * tuple[float, float]: The p-value and the inverted p-value as anomaly score, infinite if the p-value is 0.
+    """
+    p_value: float = genpareto.sf(x=exceedance, c=c, loc=loc, scale=scale)
+    return (p_value, 1 / p_value if p_value > 0.0 else float("inf"))
+
 
 class POTDetecto(Detecto):
     """
@@ -22,33 +273,330 @@ class POTDetecto(Detecto):
         * anomaly_threshold (DataFrame | None): A single float that serves as the threshold to measure the anomalous data, default is None.
         * anomaly_dataset (DataFrame | None): A Pandas DataFrame that serves as the final dataset where anomalies are observable, default is None.
         * ktest_result (DataFrame | None): The evaluation result of the exceedances and GPD params distribution via Kolmogorov Smirnov test, default is None.
+        * qq_result (list[QQResult] | None): The sample and theoretical quantiles per feature from the "Quantile-Quantile" evaluation, default is None.
+        * qq_plot_files (list[str] | None): The paths of the rendered QQ plot pages, default is None.
+        * profile_report (dict[str, str | list] | None): The profiling method, the written files, and the top hot spots of the last profiled `fit()`, default is None.
+        * recorder (Recorder): The instrumentation of the stages, counters, and optimizer iterations, default is a `NullRecorder` that records nothing.
+        * memory_budget (int | None): The bytes the detector may hold, checked after every stage: its buffers are dropped or spilled, the outputs of `fit()` are allocated in `spill_dir` if they exceed it, and `fit()` works in feature chunks to stay within it, default is None (unlimited).
+        * spill_dir (str | None): The directory intermediate datasets are spilled into as memory-mapped `.npy` files under `memory_budget`, they are dropped if None. The outputs of a memory-mapped, Arrow-backed, or sparse dataset are always memory-mapped here, so it is required for them, default is None.
+        * spilled_files (dict[str, str]): The `.npy` files of the spilled datasets by attribute name.
+        * exceedance_threshold_q (float | None): The quantile of the last `compute_exceedance_threshold()`, reused by `update()` and `rescore()`, default is None.
+        * exceedance_threshold_method (Literal["expanding", "sketch"] | None): How the last exceedance thresholds were calculated, the expanding quantile or the static quantile of `FeatureSketches`, `rescore()` only recalculates expanding thresholds, default is None.
+        * anomaly_threshold_q (float | None): The quantile of the last `compute_anomaly_threshold()`, reused by `rescore()`, default is None.
+        * cache (StageCache | None): The on-disk cache of the outputs of `compute_exceedance_threshold()`, `extract_exceedance()`, and `fit()`, keyed by the fingerprint of their inputs and parameters, default is None.
+        * dtype (Literal["float32", "float64"]): The dtype of `exceedance_threshold_dataset` and `exceedance_dataset`, "float32" halves their memory, the thresholds are still calculated and the GPD is still fitted and scored in float64, default is "float64".
         * __params (dict[str, list[dict[int, dict[str, float | None]]]]): Private dictionary to store parameters after model fitting.
+        * __params_array (ndarray | None): The (rows, features, 5) array of c, loc, scale, p-value, and anomaly score of a fit or a loaded model, memory-mapped for an out-of-core fit, expanded into `__params` on first access.
+        * __sorted_history (SortedColumns | None): The column-wise sorted original dataset, kept with `keep_history = True` to update the expanding thresholds in `update()`, it grows in place.
+        * __positive_exceedances (RaggedColumns | None): The positive exceedances of every feature in row order that `update()` fits the GPD on, built on the first `update()` and grown in place.
+        * __persisted_rows (int | None): The rows of the store of the last `save()` or `load()`, `save(append=True)` only appends the rows after them.
+        * __persisted_positives (list[int] | None): The positive exceedances per feature in the store of the last `save()` or `load()`.
+        * __store_path (str | None): The store of the last `load()` with `mmap_mode = "r"`, `update()` stages the new rows of its memory-mapped datasets there.
+        * __row_buffers (dict[str, tuple[object, ndarray | None]]): The dataset, index, or params array grown by `update()` by name, and the buffer with spare rows it is a view of, None if it is a view of `__store_path`.
     """
 
-    def __init__(self):
+    FORMAT_VERSION = 1
+    DATASETS = ("exceedance_threshold_dataset", "exceedance_dataset", "anomaly_score_dataset", "anomaly_dataset")
+    PARAMS_FIELDS = (
+        ("gpd_params", "c"),
+        ("gpd_params", "loc"),
+        ("gpd_params", "scale"),
+        ("gpd_stats", "p_value"),
+        ("gpd_stats", "anomaly_score"),
+    )
+
+    def __init__(
+        self,
+        recorder: Recorder | None = None,
+        memory_budget: int | None = None,
+        spill_dir: str | None = None,
+        cache: StageCache | None = None,
+        dtype: Literal["float32", "float64"] = "float64",
+    ):
+        if memory_budget is not None and memory_budget <= 0:
+            raise ValueError("`memory_budget` must be a positive number of bytes!")
+
+        if dtype not in ("float32", "float64"):
+            raise ValueError("`dtype` needs to be one of these: float32, float64!")
+
         self.timeframe = POTTimeframe()
-        self.exceedance_threshold_dataset = None
-        self.exceedance_dataset = None
-        self.anomaly_score_dataset = None
-        self.anomaly_threshold = None
-        self.anomaly_dataset = None
-        self.kstest_result = None
-        self.__params = {}
+        self.exceedance_threshold_dataset: DataFrame | None = None
+        self.exceedance_dataset: DataFrame | None = None
+        self.anomaly_score_dataset: DataFrame | None = None
+        self.anomaly_threshold: float | None = None
+        self.anomaly_dataset: DataFrame | None = None
+        self.kstest_result: DataFrame | None = None
+        self.qq_result = None
+        self.qq_plot_files = None
+        self.profile_report: dict[str, str | list] | None = None
+        self.recorder = recorder if recorder is not None else NullRecorder()
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
+        self.spilled_files: dict[str, str] = {}
+        self.exceedance_threshold_q: float | None = None
+        self.exceedance_threshold_method: Literal["expanding", "sketch"] | None = None
+        self.anomaly_threshold_q: float | None = None
+        self.cache = cache
+        self.dtype = dtype
+        self.__params: dict = {}
+        self.__params_array: ndarray | None = None
+        self.__sorted_history: SortedColumns | None = None
+        self.__positive_exceedances: RaggedColumns | None = None
+        self.__persisted_rows: int | None = None
+        self.__persisted_positives: list[int] | None = None
+        self.__store_path: str | None = None
+        self.__row_buffers: dict[str, tuple[object, ndarray | None]] = {}
+
+    @property
+    def run_report(self) -> dict[str, dict]:
+        """
+        Get the structured report of the instrumented stages, counters, and histograms.
+
+        # Returns
+        ------------
+            * dict[str, dict]: The "stages", "counters", and "histograms" recorded by `recorder`, all empty if instrumentation is disabled.
+        """
+        return self.recorder.report()
+
+    def memory_report(self) -> dict[str, int]:
+        """
+        Get the bytes held in memory by every dataset, result, and buffer of the detector.
+
+        # Returns
+        ------------
+            * dict[str, int]: The bytes per attribute and their "total", spilled datasets are memory-mapped and count as 0 bytes.
+        """
+        report = {
+            attribute: deep_sizeof(obj=getattr(self, attribute))
+            for attribute in (
+                "exceedance_threshold_dataset",
+                "exceedance_dataset",
+                "anomaly_score_dataset",
+                "anomaly_dataset",
+                "kstest_result",
+                "qq_result",
+            )
+        }
+        report["params"] = deep_sizeof(obj=self.__params)
+        report["params_array"] = deep_sizeof(obj=self.__params_array)
+        report["sorted_history"] = 0 if self.__sorted_history is None else self.__sorted_history.nbytes
+        report["positive_exceedances"] = (
+            0 if self.__positive_exceedances is None else self.__positive_exceedances.nbytes
+        )
+        # The rows in use are counted by their dataset or params array, only the spare rows and unused buffers are added.
+        report["row_buffers"] = sum(
+            buffer.nbytes - (len(owner) * buffer[:1].nbytes if owner is self.__row_owner(name=name) else 0)  # type: ignore
+            for name, (owner, buffer) in self.__row_buffers.items()
+            if buffer is not None
+        )
+        report["total"] = sum(report.values())
+        return report
 
-    def __set_params_structure(self, total_rows: int) -> None:
+    def __enforce_memory_budget(self, required: tuple[str, ...] = ()) -> None:
         """
-        Initialize the parameter structure for storing model parameters.
+        Release the buffers of the detector one by one until it holds at most `memory_budget` bytes, checked after every stage.
+
+        The thresholds and the positive exceedances are dropped without `spill_dir`, since they are only read again by `update()` and
+        `save()`, the exceedances, sorted history, params, and anomaly scores are still needed and only spilled into `spill_dir`.
 
         # Parameters
         ------------
-            * total_rows (list[int]): The total number of row index from the dataset.
+            * required (tuple[str, ...]): The datasets the next stage reads, they are only spilled and never dropped, default is none.
 
         # Returns
         ------------
-            * None: Create structure assigned to `__params` attribute.
+            * None: The released buffers are replaced by read-only memory-mapped views of `spill_dir/{attribute}.npy` or set to None,
+                the "memory_budget_exceeded" counter is incremented if the detector still holds more bytes.
         """
-        for row in range(0, total_rows):
-            self.__params[row] = []
+        if self.memory_budget is None:
+            return
+
+        for attribute in (
+            "exceedance_threshold_dataset",
+            "positive_exceedances",
+            "exceedance_dataset",
+            "sorted_history",
+            "params",
+            "anomaly_score_dataset",
+        ):
+            self.__prune_row_buffers()
+            report = self.memory_report()
+
+            if report["total"] <= self.memory_budget:
+                return
+
+            if attribute == "positive_exceedances" and self.__positive_exceedances is not None:
+                # The positive exceedances are collected again from `exceedance_dataset` on the next `update()`.
+                self.__positive_exceedances = None
+                self.recorder.increment(counter="datasets_dropped")
+            elif (
+                attribute == "exceedance_threshold_dataset"
+                and attribute not in required
+                and report[attribute] > 0
+                and self.spill_dir is None
+            ):
+                self.exceedance_threshold_dataset = None
+                self.recorder.increment(counter="datasets_dropped")
+            elif self.spill_dir is not None:
+                self.__spill(attribute=attribute, report=report)
+
+        if self.memory_report()["total"] > self.memory_budget:
+            self.recorder.increment(counter="memory_budget_exceeded")
+
+    def __spill(self, attribute: str, report: dict[str, int]) -> None:
+        """
+        Spill a buffer held in memory into `spill_dir` and replace it by a read-only memory-mapped view.
+
+        # Parameters
+        ------------
+            * attribute (str): The name of the dataset, "sorted_history", or "params".
+            * report (dict[str, int]): The `memory_report()` the buffer is spilled under.
+
+        # Returns
+        ------------
+            * None: The buffer is replaced by a view of `spill_dir/{attribute}.npy`, sparse datasets are already compact and kept.
+        """
+        dataset: DataFrame | None = getattr(self, attribute, None)
+
+        if attribute == "params":
+            if len(self.__params) == 0 and report["params_array"] == 0:
+                return
+            values = self.__params_to_array()
+        elif attribute == "sorted_history":
+            if report[attribute] == 0:
+                return
+            values = self.__sorted_history.values  # type: ignore
+        elif (
+            dataset is None
+            or report[attribute] == 0
+            or any(isinstance(dtype, SparseDtype) for dtype in dataset.dtypes)
+        ):
+            return
+        else:
+            values = dataset.to_numpy(dtype=float64 if attribute == "anomaly_score_dataset" else self.dtype)
+
+        try:
+            makedirs(self.spill_dir, exist_ok=True)  # type: ignore
+            spill_path = os_path.join(self.spill_dir, f"{attribute}.npy")  # type: ignore
+            # A previous memory map of the same attribute may still be read, so it is replaced and never overwritten in place.
+            temporary_path = os_path.join(self.spill_dir, f"{attribute}.tmp.npy")  # type: ignore
+            save(file=temporary_path, arr=values)
+            replace(temporary_path, spill_path)
+            spilled_values = load(file=spill_path, mmap_mode="r")
+        except Exception as e:
+            print(e)
+            raise
+
+        if attribute == "params":
+            self.__params, self.__params_array = {}, spilled_values
+        elif attribute == "sorted_history":
+            self.__sorted_history.rebase(values=spilled_values)  # type: ignore
+        else:
+            setattr(
+                self,
+                attribute,
+                DataFrame(data=spilled_values, index=dataset.index, columns=dataset.columns, copy=False),  # type: ignore
+            )
+
+        self.spilled_files[attribute] = spill_path
+        self.recorder.increment(counter="datasets_spilled")
+
+    def __is_spilled(self, nbytes: int) -> bool:
+        """
+        Check whether a new output of `fit()` is allocated in `spill_dir` instead of the memory.
+
+        # Parameters
+        ------------
+            * nbytes (int): The bytes of the output.
+
+        # Returns
+        ------------
+            * bool: `True` for an out-of-core fit, or if the output does not fit into the headroom of `memory_budget` and `spill_dir` is set.
+        """
+        return self.__is_out_of_core() or (
+            self.memory_budget is not None
+            and self.spill_dir is not None
+            and self.memory_report()["total"] + nbytes > self.memory_budget
+        )
+
+    def __cache_key(self, stage: str, datasets: list[DataFrame], params: dict) -> str | None:
+        """
+        Get the fingerprint of a stage in `cache`.
+
+        # Parameters
+        ------------
+            * stage (str): The name of the stage.
+            * datasets (list[DataFrame]): The input datasets of the stage.
+            * params (dict): The parameters of the stage.
+
+        # Returns
+        ------------
+            * str | None: The key of the stage output, or None without `cache`.
+        """
+        if self.cache is None:
+            return None
+
+        with self.recorder.stage(name="cache_fingerprint"):
+            return self.cache.fingerprint(stage=stage, datasets=datasets, params=params)
+
+    def __cache_get(self, key: str | None) -> tuple[dict[str, ndarray], dict] | None:
+        """
+        Read a stage output from `cache` and count the hit or miss.
+
+        # Parameters
+        ------------
+            * key (str | None): The key from `__cache_key()`.
+
+        # Returns
+        ------------
+            * tuple[dict[str, ndarray], dict] | None: The arrays and metadata of the stage output, or None on a miss or without `cache`.
+        """
+        if key is None:
+            return None
+
+        cache_entry = self.cache.get(key=key)  # type: ignore
+        self.recorder.increment(counter="cache_hits" if cache_entry is not None else "cache_misses")
+        return cache_entry
+
+    def __cache_put(self, key: str | None, arrays: dict[str, ndarray], metadata: dict | None = None) -> None:
+        """
+        Write a stage output into `cache`.
+
+        # Parameters
+        ------------
+            * key (str | None): The key from `__cache_key()`.
+            * arrays (dict[str, ndarray]): The arrays of the stage output.
+            * metadata (dict | None): The metadata of the stage output, e.g. the column names, default is None.
+
+        # Returns
+        ------------
+            * None: Nothing is written without `cache`.
+        """
+        if key is None:
+            return
+
+        with self.recorder.stage(name="cache_write"):
+            self.cache.put(key=key, arrays=arrays, metadata=metadata if metadata is not None else {})  # type: ignore
+
+    def __chunk_size(self, total_rows: int, total_features: int) -> int:
+        """
+        Get the number of features fitted per chunk, so the working arrays of a chunk fit into the headroom of `memory_budget`.
+
+        # Parameters
+        ------------
+            * total_rows (int): The number of rows of the exceedance dataset.
+            * total_features (int): The number of features of the exceedance dataset.
+
+        # Returns
+        ------------
+            * int: All features without `memory_budget`, otherwise at least 1.
+        """
+        if self.memory_budget is None:
+            return max(total_features, 1)
+
+        # The positive exceedances of a chunk are read as int64 rows and float64 values, at most 2 * 8 bytes per cell.
+        headroom = self.memory_budget - self.memory_report()["total"]
+        return min(max(headroom // (total_rows * 2 * 8), 1), max(total_features, 1))
 
     @property
     def params(self) -> dict[str, list[dict[int, dict[str, float | None]]]]:
@@ -59,8 +607,261 @@ class POTDetecto(Detecto):
         ------------
             * dict[str, list[dict[int, dict[str, float | None]]]]: A dictionary containing the GPD fit parameters and statistics for each row and feature.
         """
+        if len(self.__params) == 0 and self.__params_array is not None:
+            self.__params = self.__params_from_array(params_array=self.__params_array)
         return self.__params
 
+    def __params_to_array(self, first_row: int = 0) -> ndarray:
+        """
+        Pack the nested `__params` into a dense array for `save()`.
+
+        # Parameters
+        ------------
+            * first_row (int): The first packed row, e.g. the first row appended by `save(append=True)`, default is 0.
+
+        # Returns
+        ------------
+            * ndarray: The float64 array of shape (rows - first_row, features, 5) with c, loc, scale, p-value, and anomaly score per cell.
+        """
+        if len(self.__params) == 0 and self.__params_array is not None:
+            return self.__params_array[first_row:]
+
+        params = self.params
+        params_array = empty(
+            shape=(len(params) - first_row, self.anomaly_score_dataset.shape[1] - 1, len(self.PARAMS_FIELDS))  # type: ignore
+        )
+
+        for row in range(first_row, len(params)):
+            for feature_index, data_dict in enumerate(params[row][:-1]):  # type: ignore
+                feature_params = next(iter(data_dict.values()))
+                params_array[row - first_row, feature_index] = [feature_params[group][key] for group, key in self.PARAMS_FIELDS]  # type: ignore
+        return params_array
+
+    def __params_from_array(self, params_array: ndarray) -> dict[str, list[dict[int, dict[str, float | None]]]]:
+        """
+        Expand the dense params array of a loaded model into the nested structure of `set_params()`.
+
+        # Parameters
+        ------------
+            * params_array (ndarray): The (rows, features, 5) array from `__params_to_array()`.
+
+        # Returns
+        ------------
+            * dict[str, list[dict[int, dict[str, float | None]]]]: The GPD params and statistics per row and feature, and the total anomaly score per row.
+        """
+        feature_names = [column.removeprefix("anomaly_score_") for column in self.anomaly_score_dataset.columns[:-1]]  # type: ignore
+        total_anomaly_scores = self.anomaly_score_dataset["total_anomaly_score"].to_list()  # type: ignore
+        params: dict = {}
+
+        for row in range(0, params_array.shape[0]):
+            params[row] = []
+            for feature_index, feature_name in enumerate(feature_names):
+                values = _gpd_params_values(values=params_array[row, feature_index])
+                feature_params: dict = {"gpd_params": {}, "gpd_stats": {}}
+                for (group, key), value in zip(self.PARAMS_FIELDS, values):
+                    feature_params[group][key] = value
+                params[row].append({feature_name: feature_params})
+            params[row].append({"total_anomaly_score": total_anomaly_scores[row]})
+        return params
+
+    def save(self, path: str, append: bool = False) -> str:
+        """
+        Save the fitted state: timeframe, thresholds, exceedances, anomaly scores, GPD params, detected anomalies, and KS results.
+
+        The state is written as a versioned directory of `.npy` arrays and a `metadata.json`, see `src.detecto.io.store`. With
+        `append = True`, only the rows that `update()` added since the last `save()` or `load()` of the same store are appended to its
+        arrays with `append_store()`, only the detected anomalies are rewritten. The rows inserted into the sorted history are appended
+        unsorted after it, it is only rewritten once more rows are appended than it holds.
+
+        # Parameters
+        ------------
+            * path (str): The directory to save the model into, an existing model is replaced atomically.
+            * append (bool): Whether to append the updated rows to the store at `path` instead of rewriting it, default is `False`.
+
+        # Returns
+        ------------
+            * str: The path of the saved model.
+        """
+        if self.timeframe.t0 is None:
+            raise ValueError("The timeframe is not set! Call `timeframe.set_interval()` first!")
+
+        if append and (self.__persisted_rows is None or not os_path.isdir(path)):
+            raise ValueError("There is no persisted state to append to! Call `save()` or `load()` first!")
+
+        first_row = self.__persisted_rows if append else 0
+        rows: dict[str, ndarray] = {}
+        arrays: dict[str, ndarray] = {}
+        metadata: dict = {
+            "format_version": self.FORMAT_VERSION,
+            "detector": "pot",
+            "timeframe": {"t0": self.timeframe.t0, "t1": self.timeframe.t1, "t2": self.timeframe.t2},
+            "anomaly_threshold": None if self.anomaly_threshold is None else float(self.anomaly_threshold),
+            "columns": {},
+            "kstest_result": None if self.kstest_result is None else self.kstest_result.to_dict(orient="list"),
+            "exceedance_threshold_q": self.exceedance_threshold_q,
+            "exceedance_threshold_method": self.exceedance_threshold_method,
+            "anomaly_threshold_q": self.anomaly_threshold_q,
+            "dtype": self.dtype,
+        }
+
+        first_score_row = max(first_row - self.timeframe.t0, 0)  # type: ignore
+
+        for attribute in self.DATASETS:
+            dataset: DataFrame | None = getattr(self, attribute)
+            if dataset is not None:
+                if attribute == "anomaly_dataset":
+                    arrays[attribute] = dataset.to_numpy()
+                else:
+                    dataset_first_row = first_score_row if attribute == "anomaly_score_dataset" else first_row
+                    rows[attribute] = dataset.iloc[dataset_first_row:].to_numpy()  # type: ignore
+                metadata["columns"][attribute] = list(dataset.columns)
+
+        exceedance_dataset = (
+            self.exceedance_dataset if self.exceedance_dataset is not None else self.exceedance_threshold_dataset
+        )
+        if exceedance_dataset is not None:
+            if exceedance_dataset.index.dtype.kind not in "iufM":
+                raise ValueError("Only numeric and timezone naive datetime indexes can be saved!")
+            rows["index"] = exceedance_dataset.index[first_row:].to_numpy()
+
+        if len(self.__params) > 0 or self.__params_array is not None:
+            rows["params"] = self.__params_to_array(first_row=first_score_row)
+
+        if self.__sorted_history is not None and self.exceedance_dataset is not None:
+            positive_exceedances = self.__positive_exceedance_columns()
+            persisted_positives = (
+                self.__persisted_positives
+                if append and self.__persisted_positives is not None
+                else [0] * len(positive_exceedances)
+            )
+            rows["positive_exceedances"] = concatenate(
+                [
+                    positive_exceedances.values(column=feature_index)[persisted_positives[feature_index] :]
+                    for feature_index in range(0, len(positive_exceedances))
+                ]
+            )
+            rows["positive_features"] = concatenate(
+                [
+                    full(shape=length - persisted_positives[feature_index], fill_value=feature_index, dtype=int64)
+                    for feature_index, length in enumerate(positive_exceedances.lengths)
+                ]
+            )
+
+        with self.recorder.stage(name="save"):
+            (stored_arrays, _) = read_store(path=path) if append else ({}, {})
+
+            if append and stored_arrays.get("index", empty(shape=0)).shape[0] != self.__persisted_rows:
+                raise ValueError(f"`{path}` does not hold the persisted state of the detector!")
+
+            if self.__sorted_history is not None:
+                inserted_values = self.__sorted_history.inserted_values
+                if (
+                    "sorted_history" in stored_arrays
+                    and stored_arrays.get("history_rows", empty(shape=0)).shape[0] + inserted_values.shape[0]
+                    <= stored_arrays["sorted_history"].shape[0]
+                ):
+                    rows["history_rows"] = inserted_values
+                else:
+                    arrays["sorted_history"] = self.__sorted_history.values
+                    arrays["history_rows"] = empty(shape=(0, self.__sorted_history.columns))
+
+            if append:
+                append_store(path=path, rows=rows, arrays=arrays, metadata=metadata)
+            else:
+                write_store(path=path, arrays={**rows, **arrays}, metadata=metadata)
+
+        if self.__sorted_history is not None:
+            self.__sorted_history.clear_inserted()
+
+        self.__persisted_rows = None if exceedance_dataset is None else exceedance_dataset.shape[0]
+        self.__persisted_positives = (
+            None if self.__positive_exceedances is None else list(self.__positive_exceedances.lengths)
+        )
+        return path
+
+    @classmethod
+    def load(
+        cls, path: str, mmap_mode: Literal["r", "c"] | None = "r", recorder: Recorder | None = None
+    ) -> "POTDetecto":
+        """
+        Load a model saved with `save()`, the datasets are read-only views of memory-mapped files unless `mmap_mode = None`.
+
+        With `mmap_mode = "r"`, `update()` stages the new rows of the datasets and params in the store without committing them, so the
+        rows of the store are never read into the memory, the next `save(append=True)` commits them.
+
+        # Parameters
+        ------------
+            * path (str): The directory of the saved model.
+            * mmap_mode (Literal["r", "c"] | None): "r" memory-maps read-only, "c" copy-on-write, None reads into memory, default is "r".
+            * recorder (Recorder | None): The instrumentation of the loaded detector, default is a `NullRecorder`.
+
+        # Returns
+        ------------
+            * POTDetecto: The detector with the saved state, ready for `compute_anomaly_threshold()`, `detect()`, and `evaluate()`.
+        """
+        detector = cls(recorder=recorder)
+
+        with detector.recorder.stage(name="load"):
+            arrays, metadata = read_store(path=path, mmap_mode=mmap_mode)
+
+            if metadata.get("detector") != "pot" or metadata.get("format_version") != cls.FORMAT_VERSION:
+                raise ValueError(
+                    f"`{path}` is not a POT model of format version {cls.FORMAT_VERSION}, got {metadata.get('format_version')}!"
+                )
+
+            detector.timeframe.t0 = metadata["timeframe"]["t0"]
+            detector.timeframe.t1 = metadata["timeframe"]["t1"]
+            detector.timeframe.t2 = metadata["timeframe"]["t2"]
+            detector.anomaly_threshold = metadata["anomaly_threshold"]
+
+            stored_index = Index(data=arrays["index"], copy=False) if "index" in arrays else None
+
+            for attribute, columns in metadata["columns"].items():
+                index = stored_index if attribute in ("exceedance_threshold_dataset", "exceedance_dataset") else None
+                setattr(
+                    detector, attribute, DataFrame(data=arrays[attribute], index=index, columns=columns, copy=False)
+                )
+
+            if metadata["kstest_result"] is not None:
+                detector.kstest_result = DataFrame(data=metadata["kstest_result"])
+
+            detector.exceedance_threshold_q = metadata.get("exceedance_threshold_q")
+            detector.exceedance_threshold_method = metadata.get("exceedance_threshold_method")
+            detector.anomaly_threshold_q = metadata.get("anomaly_threshold_q")
+            detector.dtype = metadata.get("dtype", "float64")
+            detector.__params_array = arrays.get("params")
+            detector.__sorted_history = (
+                SortedColumns(values=arrays["sorted_history"], unsorted_values=arrays.get("history_rows"))
+                if "sorted_history" in arrays
+                else None
+            )
+            detector.__persisted_rows = arrays["index"].shape[0] if "index" in arrays else None
+
+            if mmap_mode == "r":
+                detector.__store_path = path
+                detector.__row_buffers = {
+                    name: (rows, None)
+                    for name, rows in (
+                        ("index", stored_index),
+                        ("exceedance_threshold_dataset", detector.exceedance_threshold_dataset),
+                        ("exceedance_dataset", detector.exceedance_dataset),
+                        ("anomaly_score_dataset", detector.anomaly_score_dataset),
+                        ("params", detector.__params_array),
+                    )
+                    if rows is not None
+                }
+
+            if "positive_exceedances" in arrays:
+                total_positives = bincount(arrays["positive_features"], minlength=detector.exceedance_dataset.shape[1])  # type: ignore
+                positive_exceedances = arrays["positive_exceedances"][
+                    argsort(arrays["positive_features"], kind="stable")
+                ]
+                detector.__positive_exceedances = RaggedColumns(
+                    columns=split(positive_exceedances, cumsum(total_positives)[:-1])
+                )
+                detector.__persisted_positives = total_positives.tolist()
+        return detector
+
     def set_params(self, **kwargs: str | int | float | None) -> None:  # type: ignore
         """
         Set the parameters obtained after fitting the model.
@@ -184,6 +985,15 @@ class POTDetecto(Detecto):
         if self.timeframe.t1 is None:
             raise ValueError("`timeframes` are not set yet. Need to call `timeframe.set_interval()` first!")
 
+        if len(self.__params) == 0 and self.__params_array is not None:
+            feature_index = list(self.exceedance_dataset.columns).index(feature_name)  # type: ignore
+            gpd_params = self.__params_array[: self.timeframe.t1 + self.timeframe.t2, feature_index, :3]  # type: ignore
+            nonzero_params: list[tuple[int, tuple[float, float, float]]] = []
+            for row_index in (gpd_params != 0).any(axis=1).nonzero()[0]:
+                (c, loc, scale) = _gpd_params_values(values=gpd_params[row_index])
+                nonzero_params.append((int(row_index), (c, loc, scale)))
+            return nonzero_params
+
         if len(self.params) == 0:
             raise ValueError("`__params` is still empty. Need to call `fit()` first!")
 
@@ -209,147 +1019,1554 @@ class POTDetecto(Detecto):
                             )
         return nonzero_params
 
-    def compute_exceedance_threshold(self, dataset: DataFrame, q: float = 0.99) -> None:
+    def compute_exceedance_threshold(
+        self,
+        dataset: DataFrame | ndarray | object,
+        q: float = 0.99,
+        keep_history: bool = False,
+        sketches: FeatureSketches | None = None,
+    ) -> None:
         """
         Calculate the exceedance threshold for each feature in the dataset.
 
+        A memory-mapped dataset, a PyArrow Table, or a DataFrame with Arrow-backed dtypes is processed 1 column at a time without
+        copying it, the thresholds are written into `spill_dir` as a memory map if it is set.
+
         # Parameters
         ------------
-            * dataset (DataFrame): The dataset to calculate the threshold for.
+            * dataset (DataFrame | ndarray | pyarrow.Table): The dataset to calculate the threshold for.
             * q (float): The quantile to use for thresholding.
+            * keep_history (bool): Whether to keep the column-wise sorted dataset, so `update()` can extend the expanding thresholds, default is `False`.
+            * sketches (FeatureSketches | None): The merged quantile sketches of all shards or partitions, if set the global q-quantile of every feature is used as a static threshold for all rows instead of the expanding one, default is `None`.
 
         # Returns
         ------------
             * None: The result is a Pandas DataFrame with threshold values for each feature, assigned into `exceedance_threshold_dataset`.
         """
-        if not isinstance(dataset, DataFrame):
-            raise ValueError("The `dataset` parameter needs to be a Pandas DataFrame!")
+        dataset = to_frame(dataset=dataset)
 
         if self.timeframe.t0 is None:
             raise ValueError("The `t0` period is not set! Call `timeframe.set_interval()` first!")
 
-        try:
-            self.exceedance_threshold_dataset = dataset.expanding(min_periods=self.timeframe.t0).quantile(q=q).bfill()
-        except Exception as e:
-            print(e)
-            raise
+        if sketches is not None:
+            with self.recorder.stage(name="compute_exceedance_threshold"):
+                self.exceedance_threshold_dataset = self.__sketch_thresholds(dataset=dataset, q=q, sketches=sketches)
+                self.__sorted_history = None
+                self.exceedance_threshold_q = q
+                self.exceedance_threshold_method = "sketch"
+                self.__enforce_memory_budget(required=("exceedance_threshold_dataset",))
+            return
+
+        with self.recorder.stage(name="compute_exceedance_threshold"):
+            cache_key = self.__cache_key(
+                stage="compute_exceedance_threshold",
+                datasets=[dataset],
+                params={"t0": self.timeframe.t0, "q": q, "keep_history": keep_history, "dtype": self.dtype},
+            )
+            cache_entry = self.__cache_get(key=cache_key)
+
+            if cache_entry is not None:
+                (arrays, _) = cache_entry
+                self.exceedance_threshold_dataset = DataFrame(
+                    data=arrays["exceedance_threshold_dataset"],
+                    index=dataset.index,
+                    columns=dataset.columns,
+                    copy=False,
+                )
+                self.__sorted_history = (
+                    SortedColumns(values=arrays["sorted_history"]) if "sorted_history" in arrays else None
+                )
+            else:
+                try:
+                    if is_column_backed(dataset=dataset):
+                        self.__threshold_columns(dataset=dataset, q=q, keep_history=keep_history)
+                    else:
+                        self.exceedance_threshold_dataset = self.__expanding_thresholds(dataset=dataset, q=q)
+                        self.__sorted_history = (
+                            SortedColumns(values=sort(dataset.to_numpy(dtype=float64), axis=0))
+                            if keep_history
+                            else None
+                        )
+                except Exception as e:
+                    print(e)
+                    raise
 
-    def extract_exceedance(
-        self,
-        dataset: DataFrame,
-        fill_value: float | None = 0.0,
-        clip_lower: float | None = 0.0,
-    ) -> None:
-        """
-        Extract values from the dataset that exceed the threshold values.
+                if self.exceedance_threshold_dataset is not None:
+                    arrays = {
+                        "exceedance_threshold_dataset": self.exceedance_threshold_dataset.to_numpy(dtype=self.dtype)
+                    }
+                    if self.__sorted_history is not None:
+                        arrays["sorted_history"] = self.__sorted_history.values
+                    self.__cache_put(key=cache_key, arrays=arrays)
+
+            self.exceedance_threshold_q = q
+            self.exceedance_threshold_method = "expanding"
+            self.__enforce_memory_budget(required=("exceedance_threshold_dataset",))
+
+    def __sketch_thresholds(self, dataset: DataFrame, q: float, sketches: FeatureSketches) -> DataFrame:
+        """
+        Broadcast the global q-quantile of every feature of the merged sketches over the rows of the dataset.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame): The dataset to calculate the threshold for.
+            * q (float): The quantile to use for thresholding.
+            * sketches (FeatureSketches): The merged quantile sketches with 1 sketch per feature of the dataset.
+
+        # Returns
+        ------------
+            * DataFrame: The thresholds, the same for all rows.
+        """
+        missing_features = [str(column) for column in dataset.columns if str(column) not in sketches.sketches]
+
+        if len(missing_features) > 0:
+            raise ValueError(f"The sketches have no feature {', '.join(missing_features)}!")
+
+        quantiles = sketches.quantiles(q=q)[[str(column) for column in dataset.columns]].to_numpy(dtype=self.dtype)
+        return DataFrame(
+            data=broadcast_to(quantiles, (dataset.shape[0], dataset.shape[1])).copy(),
+            index=dataset.index,
+            columns=dataset.columns,
+            copy=False,
+        )
+
+    def __expanding_thresholds(self, dataset: DataFrame, q: float) -> DataFrame:
+        """
+        Calculate the expanding q-quantile of every feature in float64 and store it in `dtype`.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame): The dataset to calculate the threshold for.
+            * q (float): The quantile to use for thresholding.
+
+        # Returns
+        ------------
+            * DataFrame: The thresholds, backfilled before `t0`.
+        """
+        thresholds = dataset.expanding(min_periods=self.timeframe.t0).quantile(q=q).bfill()
+        return thresholds if self.dtype == "float64" else thresholds.astype(self.dtype)
+
+    def __exceedances(
+        self, dataset: DataFrame, thresholds: DataFrame, fill_value: float | None, clip_lower: float | None
+    ) -> DataFrame:
+        """
+        Subtract the thresholds from the dataset in `dtype`.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame): The original dataset.
+            * thresholds (DataFrame): The thresholds of `__expanding_thresholds()`.
+            * fill_value (float | None): Value to fill missing entries with before comparison.
+            * clip_lower (float | None): Minimum value to clip data to after subtraction.
+
+        # Returns
+        ------------
+            * DataFrame: The exceedances in `dtype`.
+        """
+        values = dataset if self.dtype == "float64" else dataset.astype(self.dtype)
+        return values.subtract(other=thresholds, fill_value=fill_value).clip(lower=clip_lower)
+
+    def __threshold_columns(self, dataset: DataFrame, q: float, keep_history: bool) -> None:
+        """
+        Calculate the expanding thresholds and the sorted history 1 column at a time from a memory-mapped or Arrow-backed dataset.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame): The dataset to calculate the threshold for.
+            * q (float): The quantile to use for thresholding.
+            * keep_history (bool): Whether to keep the column-wise sorted dataset.
+
+        # Returns
+        ------------
+            * None: The thresholds are assigned into `exceedance_threshold_dataset` and the sorted dataset into `__sorted_history`.
+        """
+        self.exceedance_threshold_dataset = map_columns(
+            dataset=dataset,
+            function=lambda _, values: Series(data=values)
+            .expanding(min_periods=self.timeframe.t0)
+            .quantile(q=q)
+            .bfill()
+            .to_numpy(),
+            output=self.__allocate(attribute="exceedance_threshold_dataset", shape=dataset.shape, dtype=self.dtype),
+        )
+        self.__sorted_history = None
+
+        if keep_history:
+            sorted_history = self.__allocate(attribute="sorted_history", shape=dataset.shape, dtype="float64")
+            map_columns(dataset=dataset, function=lambda _, values: sort(values), output=sorted_history)
+            self.__sorted_history = SortedColumns(values=sorted_history)
+
+    def __allocate(
+        self,
+        attribute: str,
+        shape: tuple[int, ...],
+        dtype: str,
+        order: Literal["C", "F"] = "F",
+        is_spilled: bool = True,
+    ) -> ndarray:
+        """
+        Allocate the zeroed output of a stage, as a memory map in `spill_dir` for an out-of-core stage.
+
+        A memory-mapped, Arrow-backed, or sparse dataset may not fit into the memory, so its full-size outputs are never allocated in
+        the memory and need `spill_dir`.
+
+        # Parameters
+        ------------
+            * attribute (str): The name of the output, the memory map is `spill_dir/{attribute}.npy`.
+            * shape (tuple[int, ...]): The shape of the output, e.g. the rows and features.
+            * dtype (str): The dtype of the output, e.g. `dtype` of the detector.
+            * order (Literal["C", "F"]): The memory layout of the output, default is "F" for the column by column stages.
+            * is_spilled (bool): Whether the output is memory-mapped, otherwise it is allocated in the memory, default is `True`.
+
+        # Returns
+        ------------
+            * ndarray: The zeroed output.
+        """
+        if not is_spilled:
+            return zeros(shape=shape, dtype=dtype, order=order)
+
+        if self.spill_dir is None:
+            raise ValueError(
+                "The `spill_dir` is not set! A memory-mapped, Arrow-backed, or sparse dataset is processed out of core and needs it!"
+            )
+
+        try:
+            makedirs(self.spill_dir, exist_ok=True)
+            spill_path = os_path.join(self.spill_dir, f"{attribute}.npy")
+            output = open_memmap(filename=spill_path, mode="w+", dtype=dtype, shape=shape, fortran_order=order == "F")
+        except Exception as e:
+            print(e)
+            raise
+
+        self.spilled_files[attribute] = spill_path
+        return output
+
+    def __is_out_of_core(self) -> bool:
+        """
+        Check whether `exceedance_dataset` is processed out of core: memory-mapped, e.g. spilled, Arrow-backed, or sparse.
+
+        # Returns
+        ------------
+            * bool: `True` if the outputs of `fit()` are memory-mapped in `spill_dir`.
+        """
+        return is_column_backed(dataset=self.exceedance_dataset) or any(  # type: ignore
+            isinstance(dtype, SparseDtype) for dtype in self.exceedance_dataset.dtypes  # type: ignore
+        )
+
+    def extract_exceedance(
+        self,
+        dataset: DataFrame | ndarray | object,
+        fill_value: float | None = 0.0,
+        clip_lower: float | None = 0.0,
+    ) -> None:
+        """
+        Extract values from the dataset that exceed the threshold values.
+
+        Like `compute_exceedance_threshold()`, a memory-mapped or Arrow-backed dataset is processed 1 column at a time.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame | ndarray | pyarrow.Table): The original dataset to compare against thresholds.
+            * exceedance_threshold_dataset (DataFrame): Calculated thresholds for the dataset.
+            * fill_value (float | None): Value to fill missing entries with before comparison.
+            * clip_lower (float | None): Minimum value to clip data to after subtraction.
+
+        # Returns
+        ------------
+            * None: The result is a Pandas DataFrame with values exceeding the thresholds, assigned into `exceedance_dataset`.
+        """
+        dataset = to_frame(dataset=dataset)
+
+        if self.exceedance_threshold_dataset is None:
+            raise ValueError(
+                "The `exceedance_threshold_dataset` is not set! Call `compute_exceedance_threshold()` first!"
+            )
+
+        with self.recorder.stage(name="extract_exceedance"):
+            cache_key = self.__cache_key(
+                stage="extract_exceedance",
+                datasets=[dataset, self.exceedance_threshold_dataset],
+                params={"fill_value": fill_value, "clip_lower": clip_lower, "dtype": self.dtype},
+            )
+            cache_entry = self.__cache_get(key=cache_key)
+
+            if cache_entry is not None:
+                (arrays, metadata) = cache_entry
+                self.exceedance_dataset = DataFrame(
+                    data=arrays["exceedance_dataset"], index=dataset.index, columns=metadata["columns"], copy=False
+                )
+            else:
+                try:
+                    if is_column_backed(dataset=dataset) and dataset.columns.equals(
+                        self.exceedance_threshold_dataset.columns
+                    ):
+                        thresholds = self.exceedance_threshold_dataset
+                        self.exceedance_dataset = map_columns(
+                            dataset=dataset,
+                            function=lambda position, values: Series(data=values.astype(self.dtype, copy=False))
+                            .subtract(Series(data=thresholds.iloc[:, position].to_numpy()), fill_value=fill_value)
+                            .clip(lower=clip_lower)
+                            .to_numpy(),
+                            output=self.__allocate(
+                                attribute="exceedance_dataset", shape=dataset.shape, dtype=self.dtype
+                            ),
+                        )
+                    else:
+                        self.exceedance_dataset = self.__exceedances(
+                            dataset=dataset,
+                            thresholds=self.exceedance_threshold_dataset,
+                            fill_value=fill_value,
+                            clip_lower=clip_lower,
+                        )
+                except Exception as e:
+                    print(e)
+                    raise
+
+                self.__cache_put(
+                    key=cache_key,
+                    arrays={"exceedance_dataset": self.exceedance_dataset.to_numpy(dtype=self.dtype)},
+                    metadata={"columns": list(self.exceedance_dataset.columns)},
+                )
+
+            self.__enforce_memory_budget()
+
+    def fit(self, **kwargs: DataFrame | list | str | int | float | None) -> None:
+        """
+        Fit the POT model on the dataset and calculate anomaly scores for each feature.
+
+        # Parameters
+        ------------
+            * kwargs:
+                * dataset (DataFrame | ndarray | pyarrow.Table): The original timeseries dataset on which the POT model is to be fitted.
+                * profile (Literal["cprofile", "tracemalloc", "sampling"] | None): Profile the fit with a `Profiler`, default is None.
+                * profile_dir (str): The directory the profile and its summary are written into, default is the current directory.
+                * checkpoint_path (str | None): The directory the progress of the fit is checkpointed into, it is removed once the fit completes, default is None.
+                * checkpoint_every (int): The number of fitted rows between 2 checkpoints, default is 1000.
+                * resume (bool): Whether to continue from the checkpoint in `checkpoint_path` if it belongs to the same exceedances, default is `False`.
+                * max_workers (int): The number of worker processes the features are fitted in, the exceedances are shared with them through
+                    shared memory instead of pickling, default is 1 that fits in-process.
+                * coordinator (Coordinator | None): Fit the features on the workers of a started `src.detecto.parallel.cluster.Coordinator`,
+                    e.g. on other machines, default is None.
+
+        # Returns
+        ------------
+            * None: The result is a Pandas DataFrame with anomaly scores for each feature in the dataset, assigned into `anomaly_score_dataset`.
+        """
+        dataset: DataFrame = kwargs.get("dataset", None)
+        profile: ProfileMethod | None = kwargs.get("profile")  # type: ignore
+        checkpoint_path: str | None = kwargs.get("checkpoint_path")  # type: ignore
+        checkpoint_every: int = kwargs.get("checkpoint_every", 1000)  # type: ignore
+        max_workers: int = kwargs.get("max_workers", 1)  # type: ignore
+        coordinator = kwargs.get("coordinator")
+
+        if dataset is None:
+            raise ValueError("The `dataset` parameter can't be None. Please assign your original dataset!")
+
+        dataset = to_frame(dataset=dataset)
+
+        if checkpoint_every < 1:
+            raise ValueError("The `checkpoint_every` parameter must be at least 1 row!")
+
+        if max_workers < 1 or [max_workers > 1, coordinator is not None, checkpoint_path is not None].count(True) > 1:
+            raise ValueError(
+                "The `max_workers` parameter must be at least 1, `max_workers`, `coordinator`, and `checkpoint_path` can't be combined!"
+            )
+
+        profiler: Profiler | None = None
+        profile_context: AbstractContextManager = nullcontext()
+
+        if profile is not None:
+            profiler = profile_context = Profiler(
+                method=profile, output_dir=str(kwargs.get("profile_dir", ".")), name="fit_profile"
+            )
+
+        with profile_context, self.recorder.stage(name="fit"):
+            self.__positive_exceedances, self.__persisted_rows = None, None
+            self.__enforce_memory_budget()
+            cache_key = self.__cache_key(
+                stage="fit",
+                datasets=[self.exceedance_dataset],  # type: ignore
+                params={"t0": self.timeframe.t0, "columns": [str(column) for column in dataset.columns]},
+            )
+            cache_entry = self.__cache_get(key=cache_key)
+
+            if cache_entry is not None:
+                (arrays, metadata) = cache_entry
+                self.anomaly_score_dataset = DataFrame(
+                    data=arrays["anomaly_score_dataset"], columns=metadata["columns"], copy=False
+                )
+                self.__params, self.__params_array = {}, arrays["params"]
+            elif max_workers > 1:
+                self.__fit_rows_shared(dataset=dataset, max_workers=max_workers)
+            elif coordinator is not None:
+                with self.recorder.stage(name="fit_sharded"):
+                    (params_array, gpd_fits) = coordinator.fit_features(  # type: ignore
+                        exceedance_dataset=self.exceedance_dataset, t0=self.timeframe.t0
+                    )
+                self.recorder.increment(counter="gpd_fits", value=gpd_fits)
+                self.__set_merged_fit_result(dataset=dataset, params_array=params_array)
+            else:
+                self.__fit_rows(
+                    dataset=dataset,
+                    checkpoint_path=checkpoint_path,
+                    checkpoint_every=checkpoint_every,
+                    resume=kwargs.get("resume", False),  # type: ignore
+                )
+                self.__cache_put(
+                    key=cache_key,
+                    arrays={
+                        "anomaly_score_dataset": self.anomaly_score_dataset.to_numpy(dtype=float64),  # type: ignore
+                        "params": self.__params_to_array(),
+                    },
+                    metadata={"columns": list(self.anomaly_score_dataset.columns)},  # type: ignore
+                )
+
+            self.__enforce_memory_budget()
+
+        if profiler is not None:
+            self.profile_report = profiler.report()
+
+    def iter_fit(
+        self, anomaly_q: float = 0.80, chunk_rows: int = 1
+    ) -> Iterator[tuple[Literal["scores", "flags"], DataFrame]]:
+        """
+        Fit and score row by row like `fit()` and yield the scores and anomaly flags of every chunk of rows as soon as it is scored.
+
+        The GPD params and the score frame are not kept, only the total anomaly scores of `t1` that `compute_anomaly_threshold()` needs.
+        Once `t1` positive and finite total anomaly scores are seen, `anomaly_threshold` is set with `anomaly_q` and every row of `t2` is
+        flagged like `detect()`. Every row is yielded exactly once in a "scores" event, a row of `t2` scored before the threshold is set
+        has a missing flag there and its flag follows in 1 "flags" event as soon as the threshold is set, so the scores are never held
+        back and every row of `t2` is flagged exactly once.
+
+        # Parameters
+        ------------
+            * anomaly_q (float): The quantile of the anomaly threshold, range values are 0.0 - 1.0, default is 0.80.
+            * chunk_rows (int): The number of rows per "scores" event, default is 1.
+
+        # Returns
+        ------------
+            * Iterator[tuple[Literal["scores", "flags"], DataFrame]]: The kind of event and its rows, indexed like `exceedance_dataset`.
+                A "scores" event has the anomaly score per feature, the "total_anomaly_score", and the nullable "is_anomaly" of a chunk,
+                "is_anomaly" is missing for the rows of `t1` and for the rows whose flag follows. A "flags" event only has the
+                "is_anomaly" of the rows of `t2` that were scored before the threshold was set.
+        """
+        if self.exceedance_dataset is None:
+            raise ValueError("`exceedance_dataset` is still None. Need to call `extract_exceedance()` first!")
+
+        if self.timeframe.t0 is None or self.timeframe.t1 is None:
+            raise ValueError("`timeframes` are not set yet. Need to call `timeframe.set_interval()` first!")
+
+        if chunk_rows < 1:
+            raise ValueError("The `chunk_rows` parameter must be at least 1 row!")
+
+        return self.__fit_row_chunks(
+            exceedance_dataset=self.exceedance_dataset,
+            t0=self.timeframe.t0,
+            t1=self.timeframe.t1,
+            anomaly_q=anomaly_q,
+            chunk_rows=chunk_rows,
+        )
+
+    def __fit_row_chunks(
+        self, exceedance_dataset: DataFrame, t0: int, t1: int, anomaly_q: float, chunk_rows: int
+    ) -> Iterator[tuple[Literal["scores", "flags"], DataFrame]]:
+        """
+        Run `iter_fit()` chunk by chunk, nothing is fitted before the first chunk is requested.
+
+        Like `compute_anomaly_threshold()`, the threshold is the quantile of the first `t1` positive and finite total anomaly scores, so
+        only the total anomaly scores of the rows of `t2` scored before it is known are kept until they can be flagged.
+
+        # Parameters
+        ------------
+            * exceedance_dataset (DataFrame): The exceedances to fit.
+            * t0 (int): The first row that is scored.
+            * t1 (int): The number of scored rows before the first flagged row.
+            * anomaly_q (float): The quantile of the anomaly threshold.
+            * chunk_rows (int): The number of rows per yielded chunk.
+
+        # Returns
+        ------------
+            * Iterator[tuple[Literal["scores", "flags"], DataFrame]]: The scores and anomaly flags of every chunk, and the flags of the
+                rows scored before the threshold.
+        """
+        feature_names = list(exceedance_dataset.columns)
+        columns = [f"anomaly_score_{feature_name}" for feature_name in feature_names]
+        exceedances = [
+            column_values(dataset=exceedance_dataset, position=feature_index)
+            for feature_index in range(0, len(feature_names))
+        ]
+        total_rows = exceedance_dataset.shape[0] - t0
+        fit_kwargs = _gpd_fit_kwargs(recorder=self.recorder)
+        threshold_scores: list[float] = []
+        unflagged_scores: list[DataFrame] = []
+        anomaly_threshold: float | None = None
+
+        for first_row in range(0, total_rows, chunk_rows):
+            last_row = min(first_row + chunk_rows, total_rows)
+            anomaly_scores = zeros(shape=(last_row - first_row, len(feature_names)))
+
+            for row in range(first_row, last_row):
+                for feature_index in range(0, len(feature_names)):
+                    cell_params = _fit_cell(
+                        exceedances=exceedances[feature_index],
+                        row=t0 + row,
+                        fit_kwargs=fit_kwargs,
+                        recorder=self.recorder,
+                    )
+                    if cell_params is not None:
+                        anomaly_scores[row - first_row, feature_index] = cell_params[4]
+
+            chunk = DataFrame(
+                data=anomaly_scores, index=exceedance_dataset.index[t0 + first_row : t0 + last_row], columns=columns
+            )
+            chunk["total_anomaly_score"] = anomaly_scores.cumsum(axis=1)[:, -1] if len(feature_names) > 0 else 0.0
+            self.recorder.increment(counter="rows_fitted", value=last_row - first_row)
+
+            for total_anomaly_score in chunk["total_anomaly_score"].tolist():
+                if len(threshold_scores) < t1 and 0 < total_anomaly_score != float("inf"):
+                    threshold_scores.append(total_anomaly_score)
+
+            if anomaly_threshold is None and len(threshold_scores) == t1:
+                anomaly_threshold = self.__set_anomaly_threshold(anomaly_scores=threshold_scores, q=anomaly_q)
+
+                if len(unflagged_scores) > 0:
+                    yield ("flags", self.__flag_scores(scores=unflagged_scores, anomaly_threshold=anomaly_threshold))
+                    unflagged_scores = []
+
+            if anomaly_threshold is None and last_row > t1:
+                unflagged_scores.append(chunk[["total_anomaly_score"]].iloc[max(t1, first_row) - first_row :])
+
+            yield (
+                "scores",
+                self.__flag_chunk(first_row=first_row, chunk=chunk, t1=t1, anomaly_threshold=anomaly_threshold),
+            )
+
+        if len(unflagged_scores) > 0:
+            if len(threshold_scores) == 0:
+                raise ValueError("There are no total anomaly scores per row > 0")
+            anomaly_threshold = self.__set_anomaly_threshold(anomaly_scores=threshold_scores, q=anomaly_q)
+            yield ("flags", self.__flag_scores(scores=unflagged_scores, anomaly_threshold=anomaly_threshold))
+
+    def __flag_scores(self, scores: list[DataFrame], anomaly_threshold: float) -> DataFrame:
+        """
+        Flag the rows of `t2` that `iter_fit()` scored before the anomaly threshold was set.
+
+        # Parameters
+        ------------
+            * scores (list[DataFrame]): The "total_anomaly_score" of the unflagged rows of every chunk.
+            * anomaly_threshold (float): The anomaly threshold.
+
+        # Returns
+        ------------
+            * DataFrame: The nullable "is_anomaly" of all unflagged rows, none of them missing.
+        """
+        flags = self.__flag_chunk(first_row=0, chunk=concat(scores), t1=0, anomaly_threshold=anomaly_threshold)
+        return flags[["is_anomaly"]]
+
+    def __set_anomaly_threshold(self, anomaly_scores: list[float], q: float) -> float:
+        """
+        Set the anomaly threshold of `iter_fit()` like `compute_anomaly_threshold()`.
+
+        # Parameters
+        ------------
+            * anomaly_scores (list[float]): The first `t1` positive and finite total anomaly scores.
+            * q (float): The quantile to calculate the threshold, range values are 0.0 - 1.0.
+
+        # Returns
+        ------------
+            * float: The threshold, also assigned into `anomaly_threshold`.
+        """
+        anomaly_threshold = float(quantile(a=anomaly_scores, q=q))
+        self.anomaly_threshold_q = q
+        self.anomaly_threshold = anomaly_threshold
+        return anomaly_threshold
+
+    def __flag_chunk(self, first_row: int, chunk: DataFrame, t1: int, anomaly_threshold: float | None) -> DataFrame:
+        """
+        Flag the rows of `t2` in a chunk of `iter_fit()` like `detect()`.
+
+        # Parameters
+        ------------
+            * first_row (int): The row of `anomaly_score_dataset` the chunk starts at.
+            * chunk (DataFrame): The scores of the chunk.
+            * t1 (int): The number of scored rows before the first flagged row.
+            * anomaly_threshold (float | None): The anomaly threshold, None if it is not known yet.
+
+        # Returns
+        ------------
+            * DataFrame: The chunk with the nullable "is_anomaly", missing for the rows of `t1` and without a threshold.
+        """
+        rows = arange(first_row, first_row + chunk.shape[0])
+        is_unflagged = rows < t1 if anomaly_threshold is not None else ones(shape=chunk.shape[0], dtype=bool)
+        is_anomaly = (
+            chunk["total_anomaly_score"].to_numpy() > anomaly_threshold
+            if anomaly_threshold is not None
+            else zeros(shape=chunk.shape[0], dtype=bool)
+        )
+
+        chunk["is_anomaly"] = BooleanArray(values=is_anomaly & ~is_unflagged, mask=is_unflagged)
+        self.recorder.increment(counter="anomalies_detected", value=int((is_anomaly & ~is_unflagged).sum()))
+        return chunk
+
+    def __fit_rows(
+        self,
+        dataset: DataFrame,
+        checkpoint_path: str | None = None,
+        checkpoint_every: int = 1000,
+        resume: bool = False,
+    ) -> None:
+        """
+        Fit the GPD row by row on all exceedances before the row and calculate the anomaly score of the row, feature by feature.
+
+        The features are fitted in chunks sized by `memory_budget`, only the positive exceedances of one chunk are held at once, read
+        column by column with `positive_values()`, so a sparse `exceedance_dataset` is never densified. With `checkpoint_path`, the row
+        cursor, the params, and the partial scores are checkpointed every `checkpoint_every` rows.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame): The original timeseries dataset on which the POT model is to be fitted.
+            * checkpoint_path (str | None): The directory of the checkpoint, default is None.
+            * checkpoint_every (int): The number of fitted rows between 2 checkpoints, default is 1000.
+            * resume (bool): Whether to continue from the checkpoint, default is `False`.
+
+        # Returns
+        ------------
+            * None: The anomaly scores are assigned into `anomaly_score_dataset` and the GPD params into `__params`.
+        """
+        feature_names = list(self.exceedance_dataset.columns)  # type: ignore
+        t0: int = self.timeframe.t0  # type: ignore
+        total_rows = self.exceedance_dataset.shape[0] - t0  # type: ignore
+        fit_kwargs = _gpd_fit_kwargs(recorder=self.recorder)
+        checkpoint = self.__read_checkpoint(path=checkpoint_path) if resume and checkpoint_path is not None else None
+        fingerprint = self.__exceedance_fingerprint() if checkpoint_path is not None else None
+
+        params_array = self.__allocate(
+            attribute="params",
+            shape=(total_rows, len(feature_names), len(self.PARAMS_FIELDS)),
+            dtype="float64",
+            order="C",
+            is_spilled=self.__is_spilled(nbytes=total_rows * len(feature_names) * len(self.PARAMS_FIELDS) * 8),
+        )
+
+        if checkpoint is not None and checkpoint[3]["fingerprint"] == fingerprint:
+            (params_array[:], total_anomaly_scores, total_fits, metadata) = checkpoint
+            chunk_size: int = metadata["chunk_size"]
+            (first_chunk_feature, first_row) = (int(metadata["cursor"][0]), int(metadata["cursor"][1]))
+            self.recorder.increment(counter="resumed_rows", value=first_row)
+        else:
+            total_anomaly_scores = zeros(shape=total_rows)
+            total_fits = zeros(shape=total_rows, dtype=int64)
+            chunk_size = self.__chunk_size(total_rows=self.exceedance_dataset.shape[0], total_features=len(feature_names))  # type: ignore
+            (first_chunk_feature, first_row) = (0, 0)
+
+        for first_feature in range(first_chunk_feature, len(feature_names), chunk_size):
+            positives = [
+                positive_values(dataset=self.exceedance_dataset, position=feature_index)  # type: ignore
+                for feature_index in range(first_feature, min(first_feature + chunk_size, len(feature_names)))
+            ]
+            first_chunk_row = first_row if first_feature == first_chunk_feature else 0
+            # The position of the next positive exceedance to score per feature, all positives before it are fitted on
+            next_positions = [int(searchsorted(positive_rows, t0 + first_chunk_row)) for positive_rows, _ in positives]
+            self.recorder.increment(counter="feature_chunks")
+
+            for row in range(first_chunk_row, total_rows):
+                for feature_index, (positive_rows, exceedances) in enumerate(positives):
+                    position = next_positions[feature_index]
+
+                    if position == len(positive_rows) or positive_rows[position] != t0 + row:
+                        continue
+                    next_positions[feature_index] += 1
+
+                    if position > 0:
+                        cell_params = _fit_positive_cell(
+                            positive_exceedances=exceedances[:position],
+                            exceedance=float(exceedances[position]),
+                            fit_kwargs=fit_kwargs,
+                            recorder=self.recorder,
+                        )
+                        total_fits[row] += 1
+                        total_anomaly_scores[row] += cell_params[4]
+                        params_array[row, first_feature + feature_index] = cell_params
+
+                if checkpoint_path is not None and (row + 1) % checkpoint_every == 0 and row + 1 < total_rows:
+                    self.__write_checkpoint(
+                        path=checkpoint_path,
+                        arrays={
+                            "params": params_array,
+                            "total_anomaly_scores": total_anomaly_scores,
+                            "total_fits": total_fits,
+                        },
+                        metadata={
+                            "fingerprint": fingerprint,
+                            "chunk_size": chunk_size,
+                            "cursor": [first_feature, row + 1],
+                        },
+                    )
+            del positives
+
+            if checkpoint_path is not None and first_feature + chunk_size < len(feature_names):
+                self.__write_checkpoint(
+                    path=checkpoint_path,
+                    arrays={
+                        "params": params_array,
+                        "total_anomaly_scores": total_anomaly_scores,
+                        "total_fits": total_fits,
+                    },
+                    metadata={
+                        "fingerprint": fingerprint,
+                        "chunk_size": chunk_size,
+                        "cursor": [first_feature + chunk_size, 0],
+                    },
+                )
+
+        self.__set_fit_result(
+            dataset=dataset,
+            params_array=params_array,
+            total_anomaly_scores=total_anomaly_scores,
+            total_fits=total_fits,
+        )
+
+        if checkpoint_path is not None:
+            rmtree(checkpoint_path, ignore_errors=True)
+
+    def __fit_rows_shared(self, dataset: DataFrame, max_workers: int) -> None:
+        """
+        Fit the features of `__fit_rows()` in a process pool, the exceedances and the params are shared memory.
+
+        The exceedances are copied column by column into 1 Fortran-ordered shared array and every task only pickles the specs of the
+        shared arrays and its feature indices. The shared arrays are unlinked when the fit ends, also if a worker crashed.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame): The original timeseries dataset on which the POT model is to be fitted.
+            * max_workers (int): The number of worker processes.
+
+        # Returns
+        ------------
+            * None: The anomaly scores are assigned into `anomaly_score_dataset` and the GPD params into `__params`.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        from src.detecto.parallel.shared import SharedArrays
+
+        t0 = self.timeframe.t0
+        if t0 is None:
+            raise ValueError("The `t0` period is not set! Call `timeframe.set_interval()` first!")
+
+        (total_rows, total_features) = self.exceedance_dataset.shape  # type: ignore
+        total_tasks = min(total_features, 4 * max_workers)
+
+        with SharedArrays() as shared_arrays, self.recorder.stage(name="fit_shared"):
+            exceedance_spec = shared_arrays.allocate(
+                key="exceedances", shape=(total_rows, total_features), order="F", fill_value=None
+            )
+            map_columns(
+                dataset=self.exceedance_dataset,  # type: ignore
+                function=lambda _, values: values,
+                output=shared_arrays.view(key="exceedances"),
+            )
+            params_spec = shared_arrays.allocate(
+                key="params", shape=(total_rows - t0, total_features, len(self.PARAMS_FIELDS))
+            )
+
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        _fit_shared_features,
+                        exceedance_spec=exceedance_spec,
+                        params_spec=params_spec,
+                        feature_indices=list(range(task, total_features, total_tasks)),
+                        t0=t0,
+                        record=self.recorder.enabled,
+                    )
+                    for task in range(0, total_tasks)
+                ]
+                for future in futures:
+                    self.recorder.merge(report=future.result())
+
+            params_array = self.__allocate(
+                attribute="params",
+                shape=(total_rows - t0, total_features, len(self.PARAMS_FIELDS)),
+                dtype="float64",
+                order="C",
+                is_spilled=self.__is_spilled(nbytes=(total_rows - t0) * total_features * len(self.PARAMS_FIELDS) * 8),
+            )
+            params_array[:] = shared_arrays.view(key="params")
+
+        self.__set_merged_fit_result(dataset=dataset, params_array=params_array)
+
+    def __set_merged_fit_result(self, dataset: DataFrame, params_array: ndarray) -> None:
+        """
+        Assign the params of a fit merged from workers, cells without a fit are 0.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame): The original timeseries dataset on which the POT model is fitted.
+            * params_array (ndarray): The (rows, features, 5) array of c, loc, scale, p-value, and anomaly score.
+
+        # Returns
+        ------------
+            * None: The anomaly scores are assigned into `anomaly_score_dataset` and the GPD params into `__params`.
+        """
+        self.__set_fit_result(
+            dataset=dataset,
+            params_array=params_array,
+            total_anomaly_scores=params_array[:, :, 4].cumsum(axis=1)[:, -1],
+            total_fits=(params_array != 0.0).any(axis=2).sum(axis=1),
+        )
+
+    def __set_fit_result(
+        self, dataset: DataFrame, params_array: ndarray, total_anomaly_scores: ndarray, total_fits: ndarray
+    ) -> None:
+        """
+        Assign the params and anomaly scores of a fit.
+
+        The params array is kept as it is, in the memory or memory-mapped, and only expanded into the nested `params` on access. The
+        anomaly scores are memory-mapped in `spill_dir` like the params for an out-of-core fit or if they exceed `memory_budget`.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame): The original timeseries dataset on which the POT model is fitted.
+            * params_array (ndarray): The (rows, features, 5) array of c, loc, scale, p-value, and anomaly score.
+            * total_anomaly_scores (ndarray): The total anomaly score of every row.
+            * total_fits (ndarray): The number of GPD fits of every row.
+
+        # Returns
+        ------------
+            * None: The anomaly scores are assigned into `anomaly_score_dataset` and the GPD params into `__params`.
+        """
+        self.recorder.increment(counter="skipped_rows", value=int((total_fits == 0).sum()))
+        self.recorder.increment(counter="rows_fitted", value=params_array.shape[0])
+        self.__params, self.__params_array = {}, params_array
+
+        (total_rows, total_features) = params_array.shape[:2]
+        anomaly_scores = self.__allocate(
+            attribute="anomaly_score_dataset",
+            shape=(total_rows, total_features + 1),
+            dtype="float64",
+            is_spilled=self.__is_spilled(nbytes=total_rows * (total_features + 1) * 8),
+        )
+        anomaly_scores[:, :total_features] = params_array[:, :, 4]
+        anomaly_scores[:, total_features] = total_anomaly_scores
+        self.anomaly_score_dataset = DataFrame(
+            data=anomaly_scores,
+            columns=[f"anomaly_score_{column}" for column in dataset.columns] + ["total_anomaly_score"],
+            copy=False,
+        )
+
+    def __exceedance_fingerprint(self) -> str:
+        """
+        Hash the timeframe, the features, and the positive exceedances that are fitted on, so a checkpoint is only resumed on the same
+        fit, 1 column at a time.
+
+        # Returns
+        ------------
+            * str: The SHA-256 hex digest.
+        """
+        digest = sha256(f"{self.timeframe.t0}|{list(self.exceedance_dataset.columns)}".encode())  # type: ignore
+
+        for feature_index in range(0, self.exceedance_dataset.shape[1]):  # type: ignore
+            (positive_rows, exceedances) = positive_values(dataset=self.exceedance_dataset, position=feature_index)  # type: ignore
+            digest.update(f"|{len(positive_rows)}|".encode())
+            digest.update(positive_rows.tobytes())
+            digest.update(exceedances.tobytes())
+        return digest.hexdigest()
+
+    def __write_checkpoint(self, path: str, arrays: dict[str, ndarray], metadata: dict) -> None:
+        """
+        Write the progress of the fit atomically into the checkpoint directory.
+
+        # Parameters
+        ------------
+            * path (str): The directory of the checkpoint.
+            * arrays (dict[str, ndarray]): The params, the partial total anomaly scores, and the number of fits per row.
+            * metadata (dict): The fingerprint of the exceedances, the feature chunk size, and the cursor of the next feature chunk and row.
+
+        # Returns
+        ------------
+            * None: The checkpoint is written with `write_store()`.
+        """
+        with self.recorder.stage(name="checkpoint"):
+            write_store(path=path, arrays=arrays, metadata={"format_version": self.FORMAT_VERSION, **metadata})
+
+    def __read_checkpoint(self, path: str) -> tuple[ndarray, ndarray, ndarray, dict] | None:
+        """
+        Read the checkpoint of an interrupted fit into memory.
+
+        # Parameters
+        ------------
+            * path (str): The directory of the checkpoint.
+
+        # Returns
+        ------------
+            * tuple[ndarray, ndarray, ndarray, dict] | None: The params, the partial total anomaly scores, the number of fits per row, and
+                the metadata, or None if there is no checkpoint.
+        """
+        if not os_path.isdir(path):
+            return None
+
+        (arrays, metadata) = read_store(path=path, mmap_mode=None)
+        return (arrays["params"], arrays["total_anomaly_scores"], arrays["total_fits"], metadata)
+
+    def extract_exceedance_from_chunks(self, chunks: Iterable[DataFrame | ndarray | object], q: float = 0.99) -> None:
+        """
+        Out-of-core `compute_exceedance_threshold()` and `extract_exceedance()`: stream the dataset in row chunks, e.g. from a
+        `ChunkedReader`, and keep only the positive exceedances.
+
+        The expanding q-quantile of n values only depends on the n - floor(q * (n - 1)) largest ones, so per feature only the largest
+        values of the whole timeframe are kept in a sorted tail, the exceedances equal the in-memory stages. The rows before `t0` are
+        thresholded with the quantile at `t0`, like the backfill of `compute_exceedance_threshold()`. Like `update()`, the chunks must
+        not contain missing values.
+
+        # Parameters
+        ------------
+            * chunks (Iterable[DataFrame | ndarray | pyarrow.Table]): The row chunks of the dataset in order, with the same features.
+            * q (float): The quantile to use for thresholding.
+
+        # Returns
+        ------------
+            * None: The exceedances are assigned into `exceedance_dataset` as a sparse DataFrame, `exceedance_threshold_dataset` is None,
+                call `fit(dataset=reader.schema)` afterwards.
+        """
+        if self.timeframe.t0 is None or self.timeframe.t0 < 1:
+            raise ValueError("The `t0` period is not set! Call `timeframe.set_interval()` first!")
+
+        from scipy.sparse import csc_matrix
+
+        with self.recorder.stage(name="extract_exceedance_from_chunks"):
+            total_rows = self.timeframe.t0 + self.timeframe.t1 + self.timeframe.t2  # type: ignore
+            tail_size = total_rows - int(floor(q * (total_rows - 1)))
+            (tail, tail_rows, positives, indexes, columns) = (None, None, [], [], None)
+            first_row = 0
+
+            for chunk in chunks:
+                chunk = to_frame(dataset=chunk)
+                values = chunk.to_numpy(dtype=float64)
+
+                if tail is None:
+                    columns = chunk.columns
+                    tail = full(shape=(tail_size, values.shape[1]), fill_value=-inf)
+                    tail_rows = full(shape=(tail_size, values.shape[1]), fill_value=-1, dtype=int64)
+
+                if list(chunk.columns) != list(columns) or first_row + values.shape[0] > total_rows:  # type: ignore
+                    raise ValueError("The `chunks` need to have the same features and at most `t0 + t1 + t2` rows!")
+
+                if isnan(values).any():
+                    raise ValueError("The `chunks` must not contain missing values!")
+
+                positives.extend(
+                    self.__tail_exceedances(
+                        values=values, first_row=first_row, tail=tail, tail_rows=tail_rows, q=q  # type: ignore
+                    )
+                )
+                indexes.append(chunk.index)
+                first_row += values.shape[0]
+                self.recorder.increment(counter="chunks_read")
+
+            if first_row < self.timeframe.t0:
+                raise ValueError("The `chunks` need to have at least `t0` rows!")
+
+            (rows, features, exceedances) = zip(*positives) if len(positives) > 0 else ((), (), ())
+            self.exceedance_dataset = DataFrame.sparse.from_spmatrix(
+                data=csc_matrix(
+                    (array(exceedances, dtype=self.dtype), (rows, features)), shape=(first_row, len(columns))  # type: ignore
+                ),
+                index=indexes[0].append(indexes[1:]),
+                columns=columns,
+            )
+            self.exceedance_threshold_dataset = None
+            self.exceedance_threshold_q = q
+            self.exceedance_threshold_method = "expanding"
+            self.__sorted_history = None
+            self.recorder.increment(counter="rows_read", value=first_row)
+            self.__enforce_memory_budget()
+
+    def __tail_exceedances(
+        self, values: ndarray, first_row: int, tail: ndarray, tail_rows: ndarray, q: float
+    ) -> list[tuple[int, int, float]]:
+        """
+        Insert the rows of a chunk into the sorted tails and calculate their positive exceedances.
 
         # Parameters
         ------------
-            * dataset (DataFrame): The original dataset to compare against thresholds.
-            * exceedance_threshold_dataset (DataFrame): Calculated thresholds for the dataset.
-            * fill_value (float | None): Value to fill missing entries with before comparison.
-            * clip_lower (float | None): Minimum value to clip data to after subtraction.
+            * values (ndarray): The (rows, features) values of the chunk.
+            * first_row (int): The row of the dataset of the first row of the chunk.
+            * tail (ndarray): The (tail size, features) column-wise ascending largest values, padded with `-inf`, updated in place.
+            * tail_rows (ndarray): The dataset row of every tail value, updated in place.
+            * q (float): The quantile to use for thresholding.
 
         # Returns
         ------------
-            * None: The result is a Pandas DataFrame with values exceeding the thresholds, assigned into `exceedance_dataset`.
+            * list[tuple[int, int, float]]: The row, feature, and exceedance of every positive exceedance of the chunk, and of the rows
+                before `t0` once the chunk reaches `t0`.
+        """
+        positives = []
+        tail_size = tail.shape[0]
+
+        for chunk_row in range(0, values.shape[0]):
+            row = first_row + chunk_row
+
+            for feature_index in (values[chunk_row] > tail[0]).nonzero()[0]:
+                position = int(searchsorted(tail[:, feature_index], values[chunk_row, feature_index]))
+                tail[: position - 1, feature_index] = tail[1:position, feature_index]
+                tail_rows[: position - 1, feature_index] = tail_rows[1:position, feature_index]
+                (tail[position - 1, feature_index], tail_rows[position - 1, feature_index]) = (
+                    values[chunk_row, feature_index],
+                    row,
+                )
+
+            if row + 1 < self.timeframe.t0:  # type: ignore
+                continue
+
+            # The sorted position i of the row + 1 values seen so far is the tail position i - (row + 1 - tail size).
+            quantile_position = q * row
+            lower = int(floor(quantile_position))
+            upper = min(lower + 1, row)
+            offset = tail_size - (row + 1)
+            thresholds = (
+                tail[lower + offset] + (tail[upper + offset] - tail[lower + offset]) * (quantile_position - lower)
+            ).astype(self.dtype)
+
+            if row + 1 == self.timeframe.t0:
+                tail_exceedances = tail.astype(self.dtype) - thresholds
+                for tail_index, feature_index in zip(*(tail_exceedances > 0.0).nonzero()):
+                    positives.append(
+                        (
+                            int(tail_rows[tail_index, feature_index]),
+                            int(feature_index),
+                            tail_exceedances[tail_index, feature_index],
+                        )
+                    )
+                continue
+
+            exceedances = values[chunk_row].astype(self.dtype) - thresholds
+            for feature_index in (exceedances > 0.0).nonzero()[0]:
+                positives.append((row, int(feature_index), exceedances[feature_index]))
+        return positives
+
+    def update(self, dataset: DataFrame) -> None:
+        """
+        Append new rows to a fitted model: extend the expanding thresholds and exceedances, and fit and score only the new rows.
+
+        Like `fit()`, the GPD of a feature is only fitted for a new row with an exceedance, so the number of fits per run only depends on
+        the new rows. `t0` stays fixed and `t1` grows by the new rows, the scores equal a full `fit()` with the same timeframe.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame): The new rows with the same features as the fitted dataset.
+
+        # Returns
+        ------------
+            * None: The new rows are appended to `exceedance_threshold_dataset`, `exceedance_dataset`, `anomaly_score_dataset`, and `__params`,
+                call `compute_anomaly_threshold()` and `detect()` afterwards.
         """
         if not isinstance(dataset, DataFrame):
             raise ValueError("The `dataset` parameter needs to be a Pandas DataFrame!")
 
-        if self.exceedance_threshold_dataset is None:
+        if self.__sorted_history is None or self.anomaly_score_dataset is None:
             raise ValueError(
-                "The `exceedance_threshold_dataset` is not set! Call `compute_exceedance_threshold()` first!"
+                "There is no history to update! Call `compute_exceedance_threshold(keep_history=True)` and `fit()` first!"
             )
 
-        try:
-            self.exceedance_dataset = dataset.subtract(
-                other=self.exceedance_threshold_dataset, fill_value=fill_value
-            ).clip(lower=clip_lower)
-        except Exception as e:
-            print(e)
-            raise
+        if list(dataset.columns) != list(self.exceedance_dataset.columns):  # type: ignore
+            raise ValueError("The `dataset` parameter needs the same features as the fitted dataset!")
 
-    def fit(self, **kwargs: DataFrame | list | str | int | float | None) -> None:
+        with self.recorder.stage(name="update"):
+            self.__update_rows(dataset=dataset)
+            self.__enforce_memory_budget()
+
+    def __update_rows(self, dataset: DataFrame) -> None:
         """
-        Fit the POT model on the dataset and calculate anomaly scores for each feature.
+        Run `update()`: extend the sorted history row by row, then fit and score only the features with a new exceedance.
 
         # Parameters
         ------------
-            * kwargs:
-                * dataset (DataFrame): The original timeseries dataset on which the POT model is to be fitted.
+            * dataset (DataFrame): The new rows.
 
         # Returns
         ------------
-            * None: The result is a Pandas DataFrame with anomaly scores for each feature in the dataset, assigned into `anomaly_score_dataset`.
+            * None: The new rows are appended to the datasets and params.
         """
-        dataset: DataFrame = kwargs.get("dataset", None)
-
-        if dataset is None:
-            raise ValueError("The `dataset` parameter can't be None. Please assign your original dataset!")
-        elif type(dataset) != DataFrame:
-            raise ValueError("The `dataset` parameter needs to be a Pandas DataFrame!")
+        new_values = dataset.to_numpy(dtype=float64)
+        (total_rows, total_features) = new_values.shape
+        sorted_history: SortedColumns = self.__sorted_history  # type: ignore
+        positive_exceedances = self.__positive_exceedance_columns()
+        thresholds = empty(shape=new_values.shape)
 
-        anomaly_scores = dataset.drop(dataset.index).add_prefix("anomaly_score_").to_dict(orient="list")
-        anomaly_scores["total_anomaly_score"] = []
-        t1_t2_exceedances = self.exceedance_dataset.iloc[self.timeframe.t0 :]  # type: ignore
-
-        self.__set_params_structure(total_rows=t1_t2_exceedances.shape[0])
-
-        for row in range(0, t1_t2_exceedances.shape[0]):
-            exceedances_for_learning = self.exceedance_dataset.iloc[: self.timeframe.t0 + row]  # type: ignore
-            exceedances_of_interest = t1_t2_exceedances.iloc[[row]]
-            total_anomaly_score_per_row = 0.0
-
-            for feature_name in t1_t2_exceedances.columns:
-                exceedances_for_fitting: list[float | None] = exceedances_for_learning[feature_name][
-                    exceedances_for_learning[feature_name] > 0.0
-                ].to_list()
-                if exceedances_of_interest[feature_name].iloc[0] > 0:
-                    if len(exceedances_for_fitting) > 0:
-                        (c, loc, scale) = genpareto.fit(data=exceedances_for_fitting, floc=0)
-                        p_value: float = genpareto.sf(
-                            x=exceedances_of_interest[feature_name].iloc[0], c=c, loc=loc, scale=scale
-                        )
-                        inverted_p_value = 1 / p_value if p_value > 0.0 else float("inf")
-                        total_anomaly_score_per_row += inverted_p_value
-                        self.set_params(
-                            feature_name=feature_name,
-                            row=row,
-                            c=c,
-                            loc=loc,
-                            scale=scale,
-                            p_value=p_value,
-                            anomaly_score=inverted_p_value,
-                        )
-                        anomaly_scores[f"anomaly_score_{feature_name}"].append(inverted_p_value)
-                    else:
-                        self.set_params(
-                            feature_name=feature_name,
-                            row=row,
-                            c=0.0,
-                            loc=0.0,
-                            scale=0.0,
-                            p_value=0.0,
-                            anomaly_score=0.0,
-                        )
-                        anomaly_scores[f"anomaly_score_{feature_name}"].append(0.0)
-                else:
-                    self.set_params(
-                        feature_name=feature_name,
-                        row=row,
-                        c=0.0,
-                        loc=0.0,
-                        scale=0.0,
-                        p_value=0.0,
-                        anomaly_score=0.0,
+        for row in range(0, total_rows):
+            sorted_history.insert(values=new_values[row])
+            thresholds[row] = sorted_history.quantile(q=self.exceedance_threshold_q)  # type: ignore
+
+        new_exceedances = clip(new_values.astype(self.dtype) - thresholds.astype(self.dtype), a_min=0.0, a_max=None)
+        params_array = zeros(shape=(total_rows, total_features, len(self.PARAMS_FIELDS)))
+        changed_features = (new_exceedances > 0.0).any(axis=0).nonzero()[0]
+        fit_kwargs = _gpd_fit_kwargs(recorder=self.recorder)
+
+        for feature_index in changed_features:
+            for row in (new_exceedances[:, feature_index] > 0.0).nonzero()[0]:
+                exceedance = float(new_exceedances[row, feature_index])
+
+                if positive_exceedances.lengths[feature_index] > 0:
+                    params_array[row, feature_index] = _fit_positive_cell(
+                        positive_exceedances=positive_exceedances.values(column=feature_index),
+                        exceedance=exceedance,
+                        fit_kwargs=fit_kwargs,
+                        recorder=self.recorder,
                     )
-                    anomaly_scores[f"anomaly_score_{feature_name}"].append(0.0)
+
+                positive_exceedances.append(column=feature_index, value=exceedance)
+
+        self.__append_rows(
+            index=dataset.index,
+            thresholds=thresholds,
+            exceedances=new_exceedances,
+            params_array=params_array,
+            total_anomaly_scores=params_array[:, :, 4].cumsum(axis=1)[:, -1].tolist(),
+        )
+        self.timeframe.t1 += total_rows  # type: ignore
+        self.recorder.increment(counter="rows_updated", value=total_rows)
+        self.recorder.increment(counter="refitted_features", value=len(changed_features))
+
+    def __positive_exceedance_columns(self) -> RaggedColumns:
+        """
+        Get the positive exceedances of every feature in row order, collected from `exceedance_dataset` 1 column at a time on first use.
+
+        # Returns
+        ------------
+            * RaggedColumns: The positive exceedances per feature, `update()` appends the new ones in place.
+        """
+        if self.__positive_exceedances is None:
+            self.__positive_exceedances = RaggedColumns(
+                columns=[
+                    positive_values(dataset=self.exceedance_dataset, position=feature_index)[1]  # type: ignore
+                    for feature_index in range(0, self.exceedance_dataset.shape[1])  # type: ignore
+                ]
+            )
+        return self.__positive_exceedances
+
+    def __append_rows(
+        self,
+        index: Index,
+        thresholds: ndarray,
+        exceedances: ndarray,
+        params_array: ndarray,
+        total_anomaly_scores: list[float],
+    ) -> None:
+        """
+        Append the thresholds, exceedances, anomaly scores, and params of the rows of `update()` without copying the previous rows.
+
+        # Parameters
+        ------------
+            * index (Index): The index of the new rows.
+            * thresholds (ndarray): The exceedance thresholds of the new rows.
+            * exceedances (ndarray): The exceedances of the new rows.
+            * params_array (ndarray): The (rows, features, 5) params of the new rows.
+            * total_anomaly_scores (list[float]): The total anomaly score of every new row.
+
+        # Returns
+        ------------
+            * None: The datasets are replaced by views of their grown rows, see `__grow_rows()`.
+        """
+        self.__prune_row_buffers()
+        exceedance_dataset: DataFrame = self.exceedance_dataset  # type: ignore
+
+        if isinstance(exceedance_dataset.index, RangeIndex):
+            # A range index stays a range index without values if the new rows continue it.
+            grown_index = exceedance_dataset.index.append(index)
+        else:
+            (index_values, index_buffer) = self.__grow_rows(
+                name="index", rows=exceedance_dataset.index, new_rows=index.to_numpy()
+            )
+            grown_index = Index(data=index_values, name=exceedance_dataset.index.name, copy=False)
+            self.__row_buffers["index"] = (grown_index, index_buffer)
+
+        for attribute, new_rows in (("exceedance_threshold_dataset", thresholds), ("exceedance_dataset", exceedances)):
+            dataset: DataFrame | None = getattr(self, attribute)
+            if dataset is None:
+                continue
+            (values, buffer) = self.__grow_rows(name=attribute, rows=dataset, new_rows=new_rows.astype(self.dtype))
+            grown_dataset = DataFrame(data=values, index=grown_index, columns=dataset.columns, copy=False)
+            setattr(self, attribute, grown_dataset)
+            self.__row_buffers[attribute] = (grown_dataset, buffer)
+
+        anomaly_scores = empty(shape=(params_array.shape[0], params_array.shape[1] + 1))
+        anomaly_scores[:, :-1] = params_array[:, :, 4]
+        anomaly_scores[:, -1] = total_anomaly_scores
+        (values, buffer) = self.__grow_rows(
+            name="anomaly_score_dataset", rows=self.anomaly_score_dataset, new_rows=anomaly_scores  # type: ignore
+        )
+        self.anomaly_score_dataset = DataFrame(
+            data=values, columns=self.anomaly_score_dataset.columns, copy=False  # type: ignore
+        )
+        self.__row_buffers["anomaly_score_dataset"] = (self.anomaly_score_dataset, buffer)
+
+        if len(self.__params) == 0 and self.__params_array is not None:
+            (self.__params_array, buffer) = self.__grow_rows(
+                name="params", rows=self.__params_array, new_rows=params_array
+            )
+            self.__row_buffers["params"] = (self.__params_array, buffer)
+        else:
+            self.__set_params_rows(
+                first_row=len(self.__params), params_array=params_array, total_anomaly_scores=total_anomaly_scores
+            )
+
+    def __grow_rows(
+        self, name: str, rows: DataFrame | Index | ndarray, new_rows: ndarray
+    ) -> tuple[ndarray, ndarray | None]:
+        """
+        Append rows to a dataset, index, or params array without copying its previous rows.
+
+        The rows of a memory-mapped dataset of the loaded store are staged in the store with `stage_rows()`, so they are never read into
+        the memory. Otherwise the rows are written into the spare rows of a buffer whose capacity doubles when it is full, the previous
+        rows are only copied when the buffer is created or full.
+
+        # Parameters
+        ------------
+            * name (str): The name of the rows in `__row_buffers` and in the store, e.g. "exceedance_dataset".
+            * rows (DataFrame | Index | ndarray): The current rows.
+            * new_rows (ndarray): The new rows.
+
+        # Returns
+        ------------
+            * tuple[ndarray, ndarray | None]: The view of all rows and the buffer it is a view of, None if it is a view of the store.
+        """
+        (grown_rows, buffer) = self.__row_buffers.get(name, (None, None))
+        (total_rows, first_row) = (len(rows) + new_rows.shape[0], len(rows))
+
+        if grown_rows is rows and buffer is None and self.__store_path is not None:
+            values = stage_rows(path=self.__store_path, name=name, rows=new_rows, first_row=first_row)
+            if values is not None:
+                return (values, None)
+
+        if grown_rows is not rows or buffer is None or total_rows > buffer.shape[0]:
+            buffer = empty(shape=(max(2 * total_rows, 16), *new_rows.shape[1:]), dtype=new_rows.dtype)
+            buffer[:first_row] = rows if isinstance(rows, ndarray) else rows.to_numpy(dtype=new_rows.dtype)
+
+        buffer[first_row:total_rows] = new_rows
+        return (buffer[:total_rows], buffer)
+
+    def __row_owner(self, name: str) -> object:
+        """
+        Get the current dataset, index, or params array of a name of `__row_buffers`.
+
+        # Parameters
+        ------------
+            * name (str): The name, "index", "params", or the name of a dataset.
+
+        # Returns
+        ------------
+            * object: The current rows, None if they are not set.
+        """
+        if name == "index":
+            return None if self.exceedance_dataset is None else self.exceedance_dataset.index
+        if name == "params":
+            return self.__params_array
+        return getattr(self, name)
+
+    def __prune_row_buffers(self) -> None:
+        """
+        Release the buffers of `__row_buffers` whose rows were replaced, e.g. by `fit()`, `rescore()`, or a spill.
+
+        # Returns
+        ------------
+            * None: Only the buffers of the current rows are kept.
+        """
+        self.__row_buffers = {
+            name: (rows, buffer)
+            for name, (rows, buffer) in self.__row_buffers.items()
+            if rows is self.__row_owner(name=name)
+        }
+
+    def __set_params_rows(self, first_row: int, params_array: ndarray, total_anomaly_scores: list[float]) -> None:
+        """
+        Set the params of consecutive rows from a dense params array with `set_params()`.
+
+        # Parameters
+        ------------
+            * first_row (int): The row of the first params.
+            * params_array (ndarray): The (rows, features, 5) array of c, loc, scale, p-value, and anomaly score.
+            * total_anomaly_scores (list[float]): The total anomaly score of every row.
+
+        # Returns
+        ------------
+            * None: The params are appended to `__params`.
+        """
+        for row in range(0, params_array.shape[0]):
+            self.__params[first_row + row] = []
+            for feature_index, feature_name in enumerate(self.exceedance_dataset.columns):  # type: ignore
+                (c, loc, scale, p_value, anomaly_score) = _gpd_params_values(values=params_array[row, feature_index])
+                self.set_params(
+                    feature_name=feature_name,
+                    row=first_row + row,
+                    c=c,
+                    loc=loc,
+                    scale=scale,
+                    p_value=p_value,
+                    anomaly_score=anomaly_score,
+                )
             self.set_params(
-                feature_name="total_anomaly_score", row=row, total_anomaly_score_per_row=total_anomaly_score_per_row
+                feature_name="total_anomaly_score",
+                row=first_row + row,
+                total_anomaly_score_per_row=total_anomaly_scores[row],
+            )
+
+    def rescore(self, dataset: DataFrame, corrections: DataFrame) -> DataFrame:
+        """
+        Apply corrected historical values and recompute only what depends on them.
+
+        A correction at row k only affects the expanding thresholds and exceedances from row k, so they are only recalculated for the
+        corrected features from their first corrected row. Static thresholds of `FeatureSketches` are kept, only the exceedances of the
+        corrected rows change. The GPD fits and scores are only recomputed for the cells of a feature at and after its first changed
+        exceedance, all cells before are reused. If the anomaly threshold and the detection ran before, they are recomputed too.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame): The original dataset the model was fitted on.
+            * corrections (DataFrame): The corrected values, indexed by the labels of the corrected rows of `dataset`, with a subset of its features.
+
+        # Returns
+        ------------
+            * DataFrame: The detected rows whose anomaly flag changed, indexed by their `dataset` label, with the columns `was_anomaly` and `is_anomaly`.
+        """
+        if not isinstance(dataset, DataFrame) or not isinstance(corrections, DataFrame):
+            raise ValueError("The `dataset` and `corrections` parameters need to be Pandas DataFrames!")
+
+        if (
+            self.anomaly_score_dataset is None
+            or self.exceedance_dataset is None
+            or self.exceedance_threshold_q is None
+        ):
+            raise ValueError("`anomaly_score_dataset` is still None. Need to call `.fit()` first!")
+
+        if self.exceedance_threshold_method == "sketch" and self.exceedance_threshold_dataset is None:
+            raise ValueError(
+                "The sketch thresholds are not set! Call `compute_exceedance_threshold()` with the sketches again first!"
+            )
+
+        if dataset.shape != self.exceedance_dataset.shape:
+            raise ValueError("The `dataset` parameter needs to be the dataset the model was fitted on!")
+
+        if not corrections.index.isin(dataset.index).all() or not corrections.columns.isin(dataset.columns).all():
+            raise ValueError("The `corrections` need to be rows and features of the `dataset`!")
+
+        previous_anomalies = (
+            None if self.anomaly_dataset is None else self.anomaly_dataset["is_anomaly"].to_numpy().copy()
+        )
+
+        with self.recorder.stage(name="rescore"):
+            self.__positive_exceedances, self.__persisted_rows = None, None
+            self.__rescore_rows(dataset=dataset, corrections=corrections)
+            self.__enforce_memory_budget()
+
+            if self.anomaly_threshold_q is not None:
+                self.compute_anomaly_threshold(q=self.anomaly_threshold_q)
+
+            if previous_anomalies is None:
+                return DataFrame(data={"was_anomaly": [], "is_anomaly": []}, dtype=bool)
+
+            self.detect()
+            current_anomalies = self.anomaly_dataset["is_anomaly"].to_numpy()  # type: ignore
+            changed_rows = (previous_anomalies != current_anomalies).nonzero()[0]
+            self.recorder.increment(counter="changed_anomaly_flags", value=len(changed_rows))
+
+            return DataFrame(
+                data={"was_anomaly": previous_anomalies[changed_rows], "is_anomaly": current_anomalies[changed_rows]},
+                index=dataset.index[self.timeframe.t0 + self.timeframe.t1 + changed_rows],  # type: ignore
+            )
+
+    def __rescore_rows(self, dataset: DataFrame, corrections: DataFrame) -> None:
+        """
+        Recompute the thresholds, exceedances, GPD params, and scores of `rescore()` for the corrected features from their first
+        corrected row.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame): The original dataset.
+            * corrections (DataFrame): The corrected values.
+
+        # Returns
+        ------------
+            * None: The columns of the corrected features are replaced in the datasets and params.
+        """
+        t0: int = self.timeframe.t0  # type: ignore
+        corrected_rows = dataset.index.get_indexer(corrections.index)
+        fit_kwargs = _gpd_fit_kwargs(recorder=self.recorder)
+        first_rescored_row: int | None = None
+
+        for column in corrections.columns:
+            feature_index = dataset.columns.get_loc(column)
+            values = dataset.iloc[:, feature_index].to_numpy(dtype=float64, copy=True)
+            corrected_values = corrections[column].to_numpy(dtype=float64)
+            is_corrected = ~isnan(corrected_values) & (corrected_values != values[corrected_rows])
+
+            if not is_corrected.any():
+                continue
+
+            values[corrected_rows[is_corrected]] = corrected_values[is_corrected]
+            (first_row, thresholds) = self.__rescore_thresholds(
+                values=values, feature_index=feature_index, first_corrected_row=int(corrected_rows[is_corrected].min())
             )
-            anomaly_scores["total_anomaly_score"].append(total_anomaly_score_per_row)
-        self.anomaly_score_dataset = DataFrame(data=anomaly_scores)
+            exceedances = self.exceedance_dataset.iloc[:, feature_index].to_numpy(dtype=float64, copy=True)  # type: ignore
+            previous_exceedances = exceedances[first_row:].copy()
+            exceedances[first_row:] = clip(
+                values[first_row:].astype(self.dtype) - thresholds.astype(self.dtype), a_min=0.0, a_max=None
+            )
+            changed_exceedances = (exceedances[first_row:] != previous_exceedances).nonzero()[0]
+
+            if self.exceedance_threshold_method != "sketch" and self.exceedance_threshold_dataset is not None:
+                self.exceedance_threshold_dataset = self.__replace_column(
+                    dataset=self.exceedance_threshold_dataset,
+                    position=feature_index,
+                    first_row=first_row,
+                    values=thresholds.astype(self.dtype),
+                )
+            self.exceedance_dataset = self.__replace_column(
+                dataset=self.exceedance_dataset,  # type: ignore
+                position=feature_index,
+                first_row=first_row,
+                values=exceedances[first_row:].astype(self.dtype),
+            )
+
+            if len(changed_exceedances) == 0:
+                continue
+
+            first_scored_row = max(first_row + int(changed_exceedances[0]) - t0, 0)
+            params_array = zeros(shape=(exceedances.shape[0] - t0 - first_scored_row, len(self.PARAMS_FIELDS)))
+
+            for row in range(0, params_array.shape[0]):
+                cell_params = _fit_cell(
+                    exceedances=exceedances,
+                    row=t0 + first_scored_row + row,
+                    fit_kwargs=fit_kwargs,
+                    recorder=self.recorder,
+                )
+                if cell_params is not None:
+                    params_array[row] = cell_params
+                self.recorder.increment(counter="rescored_cells")
+
+            self.anomaly_score_dataset = self.__replace_column(
+                dataset=self.anomaly_score_dataset,  # type: ignore
+                position=feature_index,
+                first_row=first_scored_row,
+                values=params_array[:, 4],
+            )
+            self.__set_params_column(
+                feature_index=feature_index, first_row=first_scored_row, params_array=params_array
+            )
+            first_rescored_row = (
+                first_scored_row if first_rescored_row is None else min(first_rescored_row, first_scored_row)
+            )
+
+        if first_rescored_row is not None:
+            total_anomaly_scores = (
+                self.anomaly_score_dataset.iloc[first_rescored_row:, :-1].to_numpy(dtype=float64).cumsum(axis=1)[:, -1]  # type: ignore
+            )
+            self.anomaly_score_dataset = self.__replace_column(
+                dataset=self.anomaly_score_dataset,  # type: ignore
+                position=self.anomaly_score_dataset.shape[1] - 1,  # type: ignore
+                first_row=first_rescored_row,
+                values=total_anomaly_scores,
+            )
+            self.__set_params_column(
+                feature_index=None, first_row=first_rescored_row, params_array=total_anomaly_scores
+            )
+
+    def __rescore_thresholds(
+        self, values: ndarray, feature_index: int, first_corrected_row: int
+    ) -> tuple[int, ndarray]:
+        """
+        Get the exceedance thresholds of 1 corrected feature from its first changed row, recalculated only if they are expanding.
+
+        An expanding threshold at row r only depends on the rows up to r, so the sorted rows before the first correction are extended
+        row by row. The rows before `t0` are backfilled with the threshold of row `t0 - 1`, a correction before `t0` changes them all.
+
+        # Parameters
+        ------------
+            * values (ndarray): The corrected float64 values of the feature.
+            * feature_index (int): The position of the feature.
+            * first_corrected_row (int): The first corrected row.
+
+        # Returns
+        ------------
+            * tuple[int, ndarray]: The first row whose threshold may change and the thresholds from that row.
+        """
+        if self.exceedance_threshold_method == "sketch":
+            thresholds = self.exceedance_threshold_dataset.iloc[first_corrected_row:, feature_index]  # type: ignore
+            return (first_corrected_row, thresholds.to_numpy(dtype=float64))
+
+        t0: int = self.timeframe.t0  # type: ignore
+        first_row = 0 if first_corrected_row < t0 else first_corrected_row
+        sorted_values = SortedColumns(values=sort(values[:first_corrected_row]).reshape(-1, 1))
+        thresholds = empty(shape=values.shape[0] - first_row)
+
+        for row in range(first_corrected_row, values.shape[0]):
+            sorted_values.insert(values=values[row : row + 1])
+            if row >= t0 - 1:
+                thresholds[row - first_row] = sorted_values.quantile(q=self.exceedance_threshold_q)[0]  # type: ignore
+
+        thresholds[: max(t0 - 1 - first_row, 0)] = thresholds[max(t0 - 1 - first_row, 0)]
+
+        if self.__sorted_history is not None:
+            self.__sorted_history.replace_column(column=feature_index, values=sorted_values.values[:, 0])
+        return (first_row, thresholds)
+
+    def __replace_column(self, dataset: DataFrame, position: int, first_row: int, values: ndarray) -> DataFrame:
+        """
+        Replace the values of 1 column from a row without copying the other columns or changing the original dataset.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame): The dataset.
+            * position (int): The position of the column.
+            * first_row (int): The first replaced row.
+            * values (ndarray): The new values from `first_row`.
+
+        # Returns
+        ------------
+            * DataFrame: A shallow copy of the dataset with the new column.
+        """
+        column = dataset.iloc[:, position].to_numpy(dtype=float64, copy=True)
+        column[first_row:] = values
+        replaced_dataset = dataset.copy(deep=False)
+        replaced_dataset.isetitem(position, column.astype(dataset.dtypes.iloc[position], copy=False))
+        return replaced_dataset
+
+    def __set_params_column(self, feature_index: int | None, first_row: int, params_array: ndarray) -> None:
+        """
+        Replace the params of 1 feature, or the total anomaly scores, from a row.
+
+        # Parameters
+        ------------
+            * feature_index (int | None): The position of the feature, None for the total anomaly scores.
+            * first_row (int): The first replaced row of the params.
+            * params_array (ndarray): The (rows, 5) params of the feature, or the total anomaly score per row.
+
+        # Returns
+        ------------
+            * None: The params are replaced in `__params`, or in `__params_array` of a loaded model.
+        """
+        if len(self.__params) == 0 and self.__params_array is not None:
+            if feature_index is None:
+                return
+            if not self.__params_array.flags.writeable:
+                self.__params_array = self.__params_array.copy()
+            self.__params_array[first_row : first_row + params_array.shape[0], feature_index] = params_array
+            return
+
+        feature_name = None if feature_index is None else self.exceedance_dataset.columns[feature_index]  # type: ignore
+
+        for row, values in enumerate(params_array, start=first_row):
+            if feature_name is None:
+                self.__params[row][-1] = {"total_anomaly_score": float(values)}
+                continue
+
+            (c, loc, scale, p_value, anomaly_score) = _gpd_params_values(values=values)
+            self.__params[row][feature_index] = {
+                feature_name: {
+                    "gpd_params": {"c": c, "loc": loc, "scale": scale},
+                    "gpd_stats": {"p_value": p_value, "anomaly_score": anomaly_score},
+                }
+            }
 
     def compute_anomaly_threshold(self, q: float = 0.80) -> None:
         """
@@ -367,26 +2584,30 @@ class POTDetecto(Detecto):
         if self.anomaly_score_dataset is None:
             raise ValueError("`anomaly_score_dataset` is still None. Need to call `.fit()` first!")
 
-        try:
-            anomaly_scores = (
-                self.anomaly_score_dataset[  # type: ignore
-                    (self.anomaly_score_dataset["total_anomaly_score"] > 0)  # type: ignore
-                    & (self.anomaly_score_dataset["total_anomaly_score"] != float("inf"))  # type: ignore
-                ]
-                .iloc[: self.timeframe.t1]["total_anomaly_score"]
-                .to_list()
+        with self.recorder.stage(name="compute_anomaly_threshold"):
+            try:
+                anomaly_scores = (
+                    self.anomaly_score_dataset[  # type: ignore
+                        (self.anomaly_score_dataset["total_anomaly_score"] > 0)  # type: ignore
+                        & (self.anomaly_score_dataset["total_anomaly_score"] != float("inf"))  # type: ignore
+                    ]
+                    .iloc[: self.timeframe.t1]["total_anomaly_score"]
+                    .to_list()
+                )
+            except Exception as e:
+                print(e)
+                raise
+
+            if len(anomaly_scores) == 0:
+                raise ValueError("There are no total anomaly scores per row > 0")
+
+            self.anomaly_threshold_q = q
+            self.anomaly_threshold = float(
+                quantile(
+                    a=anomaly_scores,
+                    q=q,
+                )
             )
-        except Exception as e:
-            print(e)
-            raise
-
-        if len(anomaly_scores) == 0:
-            raise ValueError("There are no total anomaly scores per row > 0")
-
-        self.anomaly_threshold = quantile(
-            a=anomaly_scores,
-            q=q,
-        )
 
     def detect(self, **kwargs: DataFrame | list | str | int | float | None) -> None:
         """
@@ -409,16 +2630,89 @@ class POTDetecto(Detecto):
 
         anomaly_data = {}
 
-        try:
-            t2_dataset: DataFrame = self.anomaly_score_dataset.iloc[self.timeframe.t1 :]  # type: ignore
-            anomaly_data["is_anomaly"] = (
-                t2_dataset["total_anomaly_score"].apply(lambda x: x > self.anomaly_threshold).to_list()
+        with self.recorder.stage(name="detect"):
+            try:
+                t2_dataset: DataFrame = self.anomaly_score_dataset.iloc[self.timeframe.t1 :]  # type: ignore
+                anomaly_data["is_anomaly"] = (
+                    t2_dataset["total_anomaly_score"].apply(lambda x: x > self.anomaly_threshold).to_list()
+                )
+            except Exception as e:
+                print(e)
+                raise
+
+            self.anomaly_dataset = DataFrame(data=anomaly_data)
+            self.recorder.increment(counter="anomalies_detected", value=sum(anomaly_data["is_anomaly"]))
+            self.__enforce_memory_budget()
+
+    def __last_gpd_params(self, total_features: int) -> tuple[ndarray, ndarray]:
+        """
+        Get the GPD params of the last fitted cell of every feature, i.e. the fit of `fit()` or `update()` on all earlier exceedances.
+
+        # Parameters
+        ------------
+            * total_features (int): The number of features.
+
+        # Returns
+        ------------
+            * tuple[ndarray, ndarray]: The float64 c and scale per feature, NaN for a feature without any fitted cell.
+        """
+        c = full(shape=total_features, fill_value=nan, dtype=float64)
+        scale = full(shape=total_features, fill_value=nan, dtype=float64)
+
+        if len(self.__params) == 0 and self.__params_array is not None:
+            is_fitted = (self.__params_array[:, :, :3] != 0).any(axis=2)
+
+            for feature_index in range(0, total_features):
+                fitted_rows = is_fitted[:, feature_index].nonzero()[0]
+                if len(fitted_rows) > 0:
+                    (c[feature_index], _, scale[feature_index]) = self.__params_array[
+                        fitted_rows[-1], feature_index, :3
+                    ]
+            return (c, scale)
+
+        is_missing = isnan(c)
+        for row in range(len(self.__params) - 1, -1, -1):
+            for feature_index, data_dict in enumerate(self.__params[row][:-1]):  # type: ignore
+                gpd_params = next(iter(data_dict.values()))["gpd_params"]  # type: ignore
+                if is_missing[feature_index] and any(gpd_params[key] != 0 for key in ("c", "loc", "scale")):
+                    (c[feature_index], scale[feature_index]) = (gpd_params["c"], gpd_params["scale"])
+                    is_missing[feature_index] = False
+
+            if not is_missing.any():
+                break
+        return (c, scale)
+
+    def to_scoring_model(self) -> POTScoringModel:
+        """
+        Export the frozen scoring model: the last exceedance threshold and the GPD params of the last fitted cell of every feature.
+
+        The params are the ones `fit()` and `update()` computed, nothing is refitted, and they are exported in float64 whatever the
+        `dtype` of the detector.
+
+        # Returns
+        ------------
+            * POTScoringModel: The immutable model that scores new batches without refitting, with `anomaly_threshold` if it is set.
+        """
+        if self.exceedance_threshold_dataset is None or self.exceedance_dataset is None:
+            raise ValueError(
+                "`exceedance_threshold_dataset` or `exceedance_dataset` is None. Need to call `extract_exceedance()` first!"
             )
-        except Exception as e:
-            print(e)
-            raise
 
-        self.anomaly_dataset = DataFrame(data=anomaly_data)
+        if len(self.__params) == 0 and self.__params_array is None:
+            raise ValueError("`__params` is still empty. Need to call `fit()` first!")
+
+        from src.detecto.serving.model import POTScoringModel
+
+        with self.recorder.stage(name="to_scoring_model"):
+            (c, scale) = self.__last_gpd_params(total_features=self.exceedance_dataset.shape[1])
+
+            return POTScoringModel(
+                features=tuple(str(column) for column in self.exceedance_dataset.columns),
+                thresholds=self.exceedance_threshold_dataset.iloc[-1].to_numpy(dtype=float64),
+                c=c,
+                scale=scale,
+                anomaly_threshold=self.anomaly_threshold,
+            )
 
     def __ks_1sample(self, nonzero_exceedance_dataset: list[Series], stat_distance_threshold: float = 0.05) -> None:
         """
@@ -473,9 +2767,7 @@ class POTDetecto(Detecto):
             }
         )
 
-    def __qq_calculation(
-        self, is_random_row: bool = False
-    ) -> list[tuple[list[float], list[float], tuple[float, float, float]]]:
+    def __qq_calculation(self, is_random_row: bool = False) -> list[QQResult]:
         """
         Calculate the theoretical quantile via the `scipy.genpareto.ppf()` with GPD params from `scipy.genpareto.fit()` as arguments.
 
@@ -485,78 +2777,63 @@ class POTDetecto(Detecto):
 
         # Returns
         ------------
-            * list[tuple[list[float], list[float], tuple[float, float, float]]]: A list of sorted exceedances, theoretical quantile scores, and parameters.
+            * list[QQResult]: A list of sorted exceedances, theoretical quantile scores, and parameters per feature, features without any fitted params are skipped.
         """
+        from src.detecto.models.renderers.qq import QQResult
+
         qqs = []
         for feature_name in self.exceedance_dataset.columns:  # type: ignore
-            exceedence_series = self.exceedance_dataset[feature_name].copy()  # type: ignore
-            nonzero_exceedences = exceedence_series[exceedence_series > 0]
-            sorted_nonzero_exceedences = sort(nonzero_exceedences)
-            q = arange(1, len(sorted_nonzero_exceedences) + 1) / (len(sorted_nonzero_exceedences) + 1)
             nonzero_params = self.__get_nonzero_params(feature_name=feature_name)
 
+            if len(nonzero_params) == 0:
+                continue
+
+            exceedence_array = self.exceedance_dataset[feature_name].to_numpy()  # type: ignore
+            sorted_nonzero_exceedences = sort(exceedence_array[exceedence_array > 0])
+            q = arange(1, len(sorted_nonzero_exceedences) + 1) / (len(sorted_nonzero_exceedences) + 1)
+
             if is_random_row:
-                randomized_params = nonzero_params[randint(a=0, b=len(nonzero_params) - 1)][1]
-                theoretical_q = genpareto.ppf(
-                    q=q, c=randomized_params[0], loc=randomized_params[1], scale=randomized_params[2]
-                )
-                qqs.append(
-                    (
-                        sorted_nonzero_exceedences,
-                        theoretical_q,
-                        (randomized_params[0], randomized_params[1], randomized_params[2]),
-                    )
-                )
+                (c, loc, scale) = nonzero_params[randint(a=0, b=len(nonzero_params) - 1)][1]
             else:
-                theoretical_q = genpareto.ppf(
-                    q=q, c=nonzero_params[-1][1][0], loc=nonzero_params[-1][1][1], scale=nonzero_params[-1][1][2]
-                )
-                qqs.append(
-                    (
-                        sorted_nonzero_exceedences,
-                        theoretical_q,
-                        (nonzero_params[-1][1][0], nonzero_params[-1][1][1], nonzero_params[-1][1][2]),
-                    )
+                (c, loc, scale) = nonzero_params[-1][1]
+
+            qqs.append(
+                QQResult(
+                    feature_name=feature_name,
+                    sample_quantiles=sorted_nonzero_exceedences,
+                    theoretical_quantiles=genpareto.ppf(q=q, c=c, loc=loc, scale=scale),
+                    c=c,
+                    loc=loc,
+                    scale=scale,
                 )
+            )
         return qqs
 
-    def __qq_plot(self, is_random_row: bool = False):
+    def __qq_plot(
+        self,
+        output_dir: str,
+        features_per_page: int = 10,
+        file_format: Literal["png", "svg"] = "png",
+        max_workers: int | None = None,
+    ) -> list[str]:
         """
         Plot the sample quantile in y axis and theoretical quantile in x axis for visual observation of the linear correlation between exceedances and the GPD params.
 
         # Parameters
         ------------
-            * is_random_row (bool): A flag to indicate whether to randomly get the non-zero parameters or simply the last one, default is `False`.
+            * output_dir (str): The directory where the plot pages are written.
+            * features_per_page (int): The number of features (1 plot per feature) per page, default is 10.
+            * file_format (Literal["png", "svg"]): The format of the written pages, default is "png".
+            * max_workers (int | None): The number of worker processes that render the pages, default is the number of CPUs.
 
         # Returns
         ------------
-            * None: Display plots of exceedances and theoretical quantile (green line), 1 plot per feature.
+            * list[str]: The paths of the written plot pages, rendered headlessly from `qq_result`.
         """
-        qqs = self.__qq_calculation(is_random_row=is_random_row)
-
-        fig, axs = subplots(figsize=(20, 15), nrows=len(qqs))
-
-        x_label = "Theoretical Quantiles"
-        y_label = "Sample Quantiles"
+        from src.detecto.models.renderers.qq import QQRenderer
 
-        for index in range(0, len(qqs)):
-            ax = axs[index]
-            ax.scatter(qqs[index][1], qqs[index][0], c="black", label=f"{len(qqs[index][0])} Exceedences > 0")
-            ax.plot(
-                [np_min(qqs[index][1]), np_max(qqs[index][1])],
-                [np_min(qqs[index][1]), np_max(qqs[index][1])],
-                c="lime",
-                lw=2,
-                label=f"\nFitted GPD Params:\n    c: {round(qqs[index][2][0], 3)}\n    loc: {round(qqs[index][2][1], 3)}\n    scale: {round(qqs[index][2][2], 3)}",
-            )
-            ax.set_xlabel(x_label)
-            ax.set_ylabel(y_label)
-            ax.set_box_aspect(0.5)
-            ax.legend(loc="upper left", shadow=True, fancybox=True)
-            ax.set_title("\nGPD Params", fontsize=10)
-
-        fig.suptitle("QQ Plot - GPD", fontsize=22)
-        show()
+        renderer = QQRenderer(features_per_page=features_per_page, file_format=file_format, max_workers=max_workers)
+        return renderer.render(results=self.qq_result, output_dir=output_dir)  # type: ignore
 
     def evaluate(self, **kwargs: DataFrame | list | str | int | float | None) -> None:
         """
@@ -569,17 +2846,38 @@ class POTDetecto(Detecto):
                     * "ks": 1 sample "Kolmogorov Smirnov" test evaluates the statistical distance between two distributions.
                     * "qq": The "Quantile-Quantile" plot evaluates visually the linear correlation between the sample and theoretical quantiles.
                 * stat_distance_threshold (float): This parameter only utilised when using Kolmogorov Smirnov test to reject or accept the h0.
+                * is_qq_random_row (bool): Only for "qq", use the GPD params of a random row instead of the last one, default is `False`.
+                * output_dir (str | None): Only for "qq", the directory to write the plot pages into, no plots are rendered if `None`.
+                * features_per_page (int): Only for "qq", the number of features per plot page, default is 10.
+                * file_format (Literal["png", "svg"]): Only for "qq", the format of the plot pages, default is "png".
+                * max_workers (int | None): Only for "qq", the number of processes that render the plot pages, default is the number of CPUs.
 
         # Returns
         ------------
-            * None: The test result is either a Pandas DataFrame assigned to `kstest_result` or a plot to observe the visual correlation if `method = "qq"`.
+            * None: The test result is either a Pandas DataFrame assigned to `kstest_result` or a list of `QQResult` assigned to `qq_result` if `method = "qq"`, optionally rendered into `qq_plot_files`.
         """
         if self.exceedance_dataset is None:
             raise ValueError("`exceedance_dataset` is still None. Need to call `extract_exceedance()` first!")
 
+        with self.recorder.stage(name="evaluate"):
+            self.__evaluate(**kwargs)
+            self.__enforce_memory_budget()
+
+    def __evaluate(self, **kwargs: DataFrame | list | str | int | float | None) -> None:
+        """
+        Run the evaluation method of `evaluate()`.
+
+        # Parameters
+        ------------
+            * kwargs: The parameters of `evaluate()`.
+
+        # Returns
+        ------------
+            * None: The result is assigned to `kstest_result` or `qq_result` and `qq_plot_files`.
+        """
         filtered_exceedances_by_feature = [
-            self.exceedance_dataset[self.exceedance_dataset[feature_name] > 0][feature_name].copy()
-            for feature_name in self.exceedance_dataset.columns
+            self.exceedance_dataset[self.exceedance_dataset[feature_name] > 0][feature_name].copy()  # type: ignore
+            for feature_name in self.exceedance_dataset.columns  # type: ignore
         ]
 
         if kwargs.get("method") == "ks":
@@ -589,8 +2887,17 @@ class POTDetecto(Detecto):
                 stat_distance_threshold=stat_distance_threshold,  # type: ignore
             )
         elif kwargs.get("method") == "qq":
-            is_qq_random_row = kwargs.get("is_qq_random_row")
-            self.__qq_plot(is_random_row=is_qq_random_row)  # type: ignore
+            is_qq_random_row = kwargs.get("is_qq_random_row", False)
+            self.qq_result = self.__qq_calculation(is_random_row=is_qq_random_row)  # type: ignore
+            output_dir = kwargs.get("output_dir")
+
+            if output_dir is not None:
+                self.qq_plot_files = self.__qq_plot(
+                    output_dir=output_dir,  # type: ignore
+                    features_per_page=kwargs.get("features_per_page", 10),  # type: ignore
+                    file_format=kwargs.get("file_format", "png"),  # type: ignore
+                    max_workers=kwargs.get("max_workers"),  # type: ignore
+                )
 
     def __str__(self):
         return "Peak Over Threshold Anomaly Detector"
@@ -0,0 +1,19 @@
+from abc import ABCMeta, abstractmethod
+
+
+class Renderer(metaclass=ABCMeta):
+    @abstractmethod
+    def render(self, results: list, output_dir: str) -> list[str]:
+        """
+        Render the evaluation results of a Detecto model into files.
+
+        # Parameters
+        ------------
+            * results (list): The evaluation results to render, the type depends on the renderer.
+            * output_dir (str): The directory where the rendered files are written.
+
+        # Returns
+        ------------
+            * list[str]: The paths of all written files.
+        """
+        pass
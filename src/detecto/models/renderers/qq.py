@@ -0,0 +1,177 @@
+from concurrent.futures import ProcessPoolExecutor
+from os import makedirs, path as os_path
+from typing import Literal
+
+from numpy import max as np_max, min as np_min, ndarray
+
+from src.detecto.models.renderers.interface import Renderer
+
+
+class QQResult:
+    """
+    The result of the "Quantile-Quantile" calculation of one feature, computed without any plotting dependency.
+
+    # Attributes
+    ------------
+        * feature_name (str): The name of the feature (column) the quantiles belong to.
+        * sample_quantiles (ndarray): The sorted non-zero exceedances of the feature.
+        * theoretical_quantiles (ndarray): The theoretical quantiles from `scipy.genpareto.ppf()` with the fitted GPD params.
+        * c (float): The fitted shape parameter of the GPD.
+        * loc (float): The fitted location parameter of the GPD.
+        * scale (float): The fitted scale parameter of the GPD.
+    """
+
+    def __init__(
+        self,
+        feature_name: str,
+        sample_quantiles: ndarray,
+        theoretical_quantiles: ndarray,
+        c: float,
+        loc: float,
+        scale: float,
+    ) -> None:
+        self.feature_name = feature_name
+        self.sample_quantiles = sample_quantiles
+        self.theoretical_quantiles = theoretical_quantiles
+        self.c = c
+        self.loc = loc
+        self.scale = scale
+
+    @property
+    def params(self) -> tuple[float, float, float]:
+        """
+        Get the fitted GPD params used to compute the theoretical quantiles.
+
+        # Returns
+        ------------
+            * tuple[float, float, float]: The GPD params c, loc, and scale.
+        """
+        return (self.c, self.loc, self.scale)
+
+    def __len__(self) -> int:
+        return len(self.sample_quantiles)
+
+    def __str__(self):
+        return f"QQ Result of {self.feature_name}"
+
+
+def _render_qq_page(qqs: list[QQResult], file_path: str, dpi: int = 100) -> str:
+    """
+    Render one page of QQ plots, 1 plot per feature, with the non-interactive Agg canvas and write it into a file.
+
+    # Parameters
+    ------------
+        * qqs (list[QQResult]): The QQ results of the features on this page.
+        * file_path (str): The path of the file to write, the extension determines the format (png or svg).
+        * dpi (int): The resolution of the rendered page, default is 100.
+
+    # Returns
+    ------------
+        * str: The path of the written file.
+    """
+    try:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+    except ImportError as e:  # pragma: no cover
+        raise ImportError(
+            "Rendering QQ plots requires matplotlib, install it with `pip install detecto[plot]`."
+        ) from e
+
+    fig = Figure(figsize=(20, 5 * len(qqs)))
+    FigureCanvasAgg(figure=fig)
+    axs = fig.subplots(nrows=len(qqs), squeeze=False)
+
+    x_label = "Theoretical Quantiles"
+    y_label = "Sample Quantiles"
+
+    for index, qq in enumerate(qqs):
+        ax = axs[index][0]
+        ax.scatter(qq.theoretical_quantiles, qq.sample_quantiles, c="black", label=f"{len(qq)} Exceedences > 0")
+        ax.plot(
+            [np_min(qq.theoretical_quantiles), np_max(qq.theoretical_quantiles)],
+            [np_min(qq.theoretical_quantiles), np_max(qq.theoretical_quantiles)],
+            c="lime",
+            lw=2,
+            label=f"\nFitted GPD Params:\n    c: {round(qq.c, 3)}\n    loc: {round(qq.loc, 3)}\n    scale: {round(qq.scale, 3)}",
+        )
+        ax.set_xlabel(x_label)
+        ax.set_ylabel(y_label)
+        ax.set_box_aspect(0.5)
+        ax.legend(loc="upper left", shadow=True, fancybox=True)
+        ax.set_title(f"\nGPD Params - {qq.feature_name}", fontsize=10)
+
+    fig.suptitle("QQ Plot - GPD", fontsize=22)
+    fig.savefig(file_path, dpi=dpi)
+    fig.clear()
+    return file_path
+
+
+class QQRenderer(Renderer):
+    """
+    Renderer class that writes the QQ plots of all features into pages of image files, rendered in a process pool.
+
+    # Attributes
+    ------------
+        * features_per_page (int): The number of features (1 plot per feature) rendered on one page, default 10.
+        * file_format (Literal["png", "svg"]): The format of the written pages, default "png".
+        * max_workers (int | None): The number of worker processes, `None` uses the number of CPUs and 1 renders in-process.
+        * dpi (int): The resolution of the rendered pages, default 100.
+    """
+
+    def __init__(
+        self,
+        features_per_page: int = 10,
+        file_format: Literal["png", "svg"] = "png",
+        max_workers: int | None = None,
+        dpi: int = 100,
+    ) -> None:
+        if features_per_page < 1:
+            raise ValueError("`features_per_page` must be at least 1!")
+
+        if file_format not in ("png", "svg"):
+            raise ValueError("`file_format` needs to be either 'png' or 'svg'!")
+
+        self.features_per_page = features_per_page
+        self.file_format = file_format
+        self.max_workers = max_workers
+        self.dpi = dpi
+
+    def render(self, results: list[QQResult], output_dir: str, prefix: str = "qq_plot") -> list[str]:  # type: ignore
+        """
+        Split the QQ results into pages of `features_per_page` features and render each page into a file.
+
+        # Parameters
+        ------------
+            * results (list[QQResult]): The QQ results from `POTDetecto.evaluate(method="qq")`.
+            * output_dir (str): The directory where the pages are written, created if it does not exist.
+            * prefix (str): The prefix of the file names, the page number is appended, default "qq_plot".
+
+        # Returns
+        ------------
+            * list[str]: The paths of all written pages, ordered by page number.
+        """
+        if len(results) == 0:
+            raise ValueError("There are no QQ results to render!")
+
+        makedirs(output_dir, exist_ok=True)
+
+        pages = [
+            (
+                results[start : start + self.features_per_page],
+                os_path.join(output_dir, f"{prefix}_{page:04d}.{self.file_format}"),
+            )
+            for page, start in enumerate(range(0, len(results), self.features_per_page))
+        ]
+
+        if self.max_workers == 1:
+            return [_render_qq_page(qqs=qqs, file_path=file_path, dpi=self.dpi) for qqs, file_path in pages]
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(_render_qq_page, qqs=qqs, file_path=file_path, dpi=self.dpi)
+                for qqs, file_path in pages
+            ]
+            return [future.result() for future in futures]
+
+    def __str__(self):
+        return "QQ Plot Renderer"
@@ -0,0 +1,544 @@
+from collections import deque
+from json import dumps, loads
+from socket import create_connection, create_server, socket, timeout as socket_timeout
+from struct import calcsize, pack, unpack
+from threading import Condition, Thread
+from time import monotonic
+from typing import Callable, Iterable
+
+from numpy import ascontiguousarray, float64, frombuffer, int64, ndarray, prod, uint8, zeros
+from pandas import DataFrame, RangeIndex
+
+from src.detecto.instrumentation.recorder import NullRecorder
+from src.detecto.models.detectors.pot import _fit_feature
+from src.detecto.parallel.fleet import _score_groups, GroupResult, GroupTask
+
+FRAME_HEADER = "!IQ"
+
+Message = tuple[dict, dict[str, ndarray]]
+
+
+def send_message(connection: socket, header: dict, arrays: dict[str, ndarray] | None = None) -> None:
+    """
+    Send 1 message of the coordinator/worker protocol: a JSON header followed by the raw bytes of the arrays.
+
+    The frame starts with the byte lengths of the header and of all arrays, the dtype and shape of every array are part of the header,
+    so no Python object is ever unpickled from the network.
+
+    # Parameters
+    ------------
+        * connection (socket): The connected socket.
+        * header (dict): The JSON serializable header, e.g. the "type" of the message.
+        * arrays (dict[str, ndarray] | None): The arrays of the message, default is None.
+
+    # Returns
+    ------------
+        * None: The message is sent completely.
+    """
+    arrays = arrays if arrays is not None else {}
+    buffers = [ascontiguousarray(array).reshape(-1).view(uint8).data for array in arrays.values()]
+    header_bytes = dumps(
+        {**header, "arrays": [[name, array.dtype.str, list(array.shape)] for name, array in arrays.items()]}
+    ).encode()
+
+    connection.sendall(pack(FRAME_HEADER, len(header_bytes), sum(buffer.nbytes for buffer in buffers)) + header_bytes)
+    for buffer in buffers:
+        connection.sendall(buffer)
+
+
+def receive_message(connection: socket) -> Message:
+    """
+    Receive 1 message sent with `send_message()`.
+
+    # Parameters
+    ------------
+        * connection (socket): The connected socket.
+
+    # Returns
+    ------------
+        * tuple[dict, dict[str, ndarray]]: The header and the arrays of the message.
+    """
+    (header_size, payload_size) = unpack(
+        FRAME_HEADER, __receive_exactly(connection=connection, size=calcsize(FRAME_HEADER))
+    )
+    header = loads(__receive_exactly(connection=connection, size=header_size))
+    payload = __receive_exactly(connection=connection, size=payload_size)
+    arrays: dict[str, ndarray] = {}
+    offset = 0
+
+    for name, dtype, shape in header.pop("arrays"):
+        array = frombuffer(payload, dtype=dtype, count=int(prod(shape)), offset=offset).reshape(shape)
+        arrays[name] = array
+        offset += array.nbytes
+    return (header, arrays)
+
+
+def __receive_exactly(connection: socket, size: int) -> bytearray:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+
+    while received < size:
+        chunk_size = connection.recv_into(view[received:], size - received)
+        if chunk_size == 0:
+            raise ConnectionError("The connection was closed before the message was complete!")
+        received += chunk_size
+    return buffer
+
+
+class Coordinator:
+    """
+    Coordinator class that serves shards of the POT chain to workers over TCP and merges their results.
+
+    Workers connect with `Worker.run()`, e.g. from other machines, and pull 1 shard at a time, so faster workers take more shards.
+    A shard in flight on a worker whose connection breaks or times out is re-dispatched to the next idle worker. Features are sharded
+    by `POTDetecto.fit(dataset=..., coordinator=coordinator)` and entities by `Fleet(coordinator=coordinator)`.
+
+    # Attributes
+    ------------
+        * host (str): The interface the coordinator listens on, default "127.0.0.1".
+        * port (int): The port the coordinator listens on, 0 picks a free port, see `address`.
+        * timeout (float): The seconds a worker may take per shard, and a run may go without any completed shard, default 300.
+        * max_attempts (int): The number of dispatches of a shard before the run fails, default 3.
+        * redispatched_shards (int): The number of shards dispatched again after a lost worker.
+        * completed_shards (int): The number of completed shards.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, timeout: float = 300.0, max_attempts: int = 3) -> None:
+        if max_attempts < 1:
+            raise ValueError("`max_attempts` must be at least 1!")
+
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.redispatched_shards = 0
+        self.completed_shards = 0
+        self.__condition = Condition()
+        self.__server: socket | None = None
+        self.__threads: list[Thread] = []
+        self.__connections: list[socket] = []
+        self.__is_closed = False
+        self.__shards: list[Message] = []
+        self.__pending: deque[int] = deque()
+        self.__attempts: list[int] = []
+        self.__results: dict[int, Message] = {}
+        self.__error: str | None = None
+        self.__last_progress = monotonic()
+        self.__generation = 0
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """
+        Get the address the workers connect to.
+
+        # Returns
+        ------------
+            * tuple[str, int]: The host and the bound port.
+        """
+        if self.__server is None:
+            raise ValueError("The coordinator is not started! Call `start()` first!")
+        return self.__server.getsockname()[:2]
+
+    def start(self) -> tuple[str, int]:
+        """
+        Listen for workers and accept them in a background thread.
+
+        # Returns
+        ------------
+            * tuple[str, int]: The address the workers connect to.
+        """
+        self.__server = create_server(address=(self.host, self.port))
+        self.__server.settimeout(0.2)
+        thread = Thread(target=self.__accept, daemon=True)
+        thread.start()
+        self.__threads.append(thread)
+        return self.address
+
+    def __accept(self) -> None:
+        while not self.__is_closed:
+            try:
+                (connection, _) = self.__server.accept()  # type: ignore
+            except socket_timeout:
+                continue
+            except OSError:
+                return
+
+            connection.settimeout(self.timeout)
+            thread = Thread(target=self.__serve, args=(connection,), daemon=True)
+            thread.start()
+            self.__threads.append(thread)
+            self.__connections.append(connection)
+
+    def __serve(self, connection: socket) -> None:
+        """
+        Serve the shards to 1 worker until the coordinator is closed.
+
+        # Parameters
+        ------------
+            * connection (socket): The connection of the worker.
+
+        # Returns
+        ------------
+            * None: A shard in flight is re-dispatched if the connection breaks or times out.
+        """
+        (shard_id, generation) = (None, 0)
+
+        try:
+            (header, arrays) = receive_message(connection=connection)
+
+            while True:
+                if header["type"] == "result":
+                    self.__complete(shard_id=shard_id, generation=generation, message=(header, arrays))  # type: ignore
+                elif header["type"] == "error":
+                    self.__fail(
+                        generation=generation, message=f"Shard {shard_id} failed on a worker, {header['message']}!"
+                    )
+
+                (shard_id, generation) = self.__next_shard()
+                if shard_id is None:
+                    send_message(connection=connection, header={"type": "shutdown"})
+                    return
+
+                (shard_header, shard_arrays) = self.__shards[shard_id]
+                send_message(connection=connection, header={"type": "shard", **shard_header}, arrays=shard_arrays)
+                (header, arrays) = receive_message(connection=connection)
+        except (OSError, ValueError):
+            if shard_id is not None:
+                self.__requeue(shard_id=shard_id, generation=generation)
+        finally:
+            connection.close()
+
+    def __next_shard(self) -> tuple[int | None, int]:
+        """
+        Wait for the next pending shard of the current run.
+
+        # Returns
+        ------------
+            * tuple[int | None, int]: The shard and the run it belongs to, the shard is None once the coordinator is closed.
+        """
+        with self.__condition:
+            while not self.__is_closed and len(self.__pending) == 0:
+                self.__condition.wait()
+
+            if self.__is_closed:
+                return (None, self.__generation)
+
+            shard_id = self.__pending.popleft()
+            self.__attempts[shard_id] += 1
+            return (shard_id, self.__generation)
+
+    def __complete(self, shard_id: int, generation: int, message: Message) -> None:
+        with self.__condition:
+            if generation == self.__generation and shard_id not in self.__results:
+                self.__results[shard_id] = message
+                self.completed_shards += 1
+                self.__last_progress = monotonic()
+            self.__condition.notify_all()
+
+    def __requeue(self, shard_id: int, generation: int) -> None:
+        with self.__condition:
+            if generation != self.__generation or shard_id in self.__results:
+                return
+
+            if self.__attempts[shard_id] >= self.max_attempts:
+                self.__error = f"Shard {shard_id} was lost {self.__attempts[shard_id]} times!"
+            else:
+                self.__pending.appendleft(shard_id)
+                self.redispatched_shards += 1
+            self.__condition.notify_all()
+
+    def __fail(self, generation: int, message: str) -> None:
+        with self.__condition:
+            if generation == self.__generation:
+                self.__error = message
+            self.__condition.notify_all()
+
+    def run(self, shards: list[Message]) -> list[Message]:
+        """
+        Dispatch the shards to the connected and connecting workers and wait for all results.
+
+        # Parameters
+        ------------
+            * shards (list[tuple[dict, dict[str, ndarray]]]): The header with the "kind" of the shard and its arrays.
+
+        # Returns
+        ------------
+            * list[tuple[dict, dict[str, ndarray]]]: The result header and arrays of every shard in the order of `shards`.
+        """
+        if self.__server is None:
+            self.start()
+
+        with self.__condition:
+            (self.__shards, self.__results, self.__error) = (shards, {}, None)
+            self.__generation += 1
+            self.__pending = deque(range(0, len(shards)))
+            self.__attempts = [0] * len(shards)
+            self.__last_progress = monotonic()
+            self.__condition.notify_all()
+
+            while len(self.__results) < len(shards) and self.__error is None:
+                if monotonic() - self.__last_progress > self.timeout:
+                    self.__error = f"No shard completed within {self.timeout} seconds!"
+                    break
+                self.__condition.wait(timeout=0.2)
+
+            self.__pending.clear()
+            if self.__error is not None:
+                raise RuntimeError(self.__error)
+            return [self.__results[shard_id] for shard_id in range(0, len(shards))]
+
+    def fit_features(self, exceedance_dataset: DataFrame, t0: int, features_per_shard: int = 1) -> tuple[ndarray, int]:
+        """
+        Fit the GPD cells of `POTDetecto.fit()` on the workers, sharded by feature.
+
+        # Parameters
+        ------------
+            * exceedance_dataset (DataFrame): The exceedances of all features.
+            * t0 (int): The first row that is scored.
+            * features_per_shard (int): The number of features per shard, default 1.
+
+        # Returns
+        ------------
+            * tuple[ndarray, int]: The (rows - t0, features, 5) params and the number of GPD fits.
+        """
+        (total_rows, total_features) = exceedance_dataset.shape
+        shards = [
+            (
+                {
+                    "kind": "fit_features",
+                    "t0": t0,
+                    "feature_indices": list(range(first, min(first + features_per_shard, total_features))),
+                },
+                {
+                    "exceedances": exceedance_dataset.iloc[:, first : first + features_per_shard].to_numpy(
+                        dtype=float64
+                    )
+                },
+            )
+            for first in range(0, total_features, features_per_shard)
+        ]
+        params_array = zeros(shape=(total_rows - t0, total_features, 5))
+        gpd_fits = 0
+
+        for header, arrays in self.run(shards=shards):
+            params_array[:, header["feature_indices"]] = arrays["params"]
+            gpd_fits += header["gpd_fits"]
+        return (params_array, gpd_fits)
+
+    def score_groups(self, batches: Iterable[list[GroupTask]], score_kwargs: dict) -> list[GroupResult]:
+        """
+        Run the POT chain of `Fleet.detect()` on the workers, sharded by batches of entities.
+
+        # Parameters
+        ------------
+            * batches (Iterable[list[tuple[Hashable, Index, list[str], ndarray]]]): The batches of groups of `Fleet`.
+            * score_kwargs (dict): The quantiles, the timeframe keyword arguments, and the error handling of the groups.
+
+        # Returns
+        ------------
+            * list[tuple[Hashable, DataFrame | None, str | None]]: The key, the detected rows or None, and the error message or None of every group.
+        """
+        (shards, shard_groups) = ([], [])
+
+        for batch in batches:
+            shards.append(
+                (
+                    {"kind": "score_groups", "metrics": [metrics for (_, _, metrics, _) in batch], **score_kwargs},
+                    {f"values_{index}": values for index, (_, _, _, values) in enumerate(batch)},
+                )
+            )
+            shard_groups.append([(key, timestamps) for (key, timestamps, _, _) in batch])
+
+        results: list[GroupResult] = []
+        for (header, arrays), groups in zip(self.run(shards=shards), shard_groups):
+            for index, (key, timestamps) in enumerate(groups):
+                if header["errors"][index] is not None:
+                    results.append((key, None, header["errors"][index]))
+                    continue
+
+                results.append(
+                    (
+                        key,
+                        DataFrame(
+                            data={
+                                "timestamp": timestamps[arrays[f"rows_{index}"]],
+                                "total_anomaly_score": arrays[f"total_anomaly_score_{index}"],
+                                "anomaly_threshold": header["anomaly_thresholds"][index],
+                                "is_anomaly": arrays[f"is_anomaly_{index}"],
+                            }
+                        ),
+                        None,
+                    )
+                )
+        return results
+
+    def close(self) -> None:
+        """
+        Send the shutdown to all idle workers and stop listening.
+
+        # Returns
+        ------------
+            * None: The connections and the server socket are closed.
+        """
+        with self.__condition:
+            self.__is_closed = True
+            self.__condition.notify_all()
+
+        for thread in self.__threads[1:]:
+            thread.join(timeout=1.0)
+        for connection in self.__connections:
+            connection.close()
+        if self.__server is not None:
+            self.__server.close()
+        if len(self.__threads) > 0:
+            self.__threads[0].join(timeout=1.0)
+
+    def __enter__(self) -> "Coordinator":
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def __str__(self):
+        return "Coordinator"
+
+
+class Worker:
+    """
+    Worker class that pulls shards from a `Coordinator` over TCP and sends back their results until it is shut down.
+
+    # Attributes
+    ------------
+        * host (str): The host of the coordinator.
+        * port (int): The port of the coordinator.
+        * timeout (float): The seconds to wait for the connection to the coordinator, default 30.
+        * handlers (dict[str, Callable[[dict, dict[str, ndarray]], tuple[dict, dict[str, ndarray]]]]): The function per shard "kind".
+        * completed_shards (int): The number of completed shards.
+    """
+
+    def __init__(self, host: str, port: int, timeout: float = 30.0) -> None:
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.completed_shards = 0
+        self.handlers: dict[str, Callable[[dict, dict[str, ndarray]], Message]] = {
+            "fit_features": self.__fit_features,
+            "score_groups": self.__score_groups,
+        }
+
+    def run(self) -> int:
+        """
+        Connect to the coordinator and process shards until it sends the shutdown.
+
+        # Returns
+        ------------
+            * int: The number of completed shards.
+        """
+        with create_connection(address=(self.host, self.port), timeout=self.timeout) as connection:
+            connection.settimeout(None)
+            send_message(connection=connection, header={"type": "ready"})
+
+            while True:
+                (header, arrays) = receive_message(connection=connection)
+                if header["type"] == "shutdown":
+                    return self.completed_shards
+
+                try:
+                    (result_header, result_arrays) = self.handlers[header["kind"]](header, arrays)
+                except Exception as e:
+                    send_message(
+                        connection=connection, header={"type": "error", "message": f"{type(e).__name__}: {e}"}
+                    )
+                    continue
+
+                self.completed_shards += 1
+                send_message(connection=connection, header={"type": "result", **result_header}, arrays=result_arrays)
+
+    def __fit_features(self, header: dict, arrays: dict[str, ndarray]) -> Message:
+        """
+        Fit the GPD cells of the features of a shard.
+
+        # Parameters
+        ------------
+            * header (dict): The "t0" and "feature_indices" of the shard.
+            * arrays (dict[str, ndarray]): The (rows, features) "exceedances" of the shard.
+
+        # Returns
+        ------------
+            * tuple[dict, dict[str, ndarray]]: The "feature_indices" and "gpd_fits", and the (rows - t0, features, 5) "params".
+        """
+        exceedances = arrays["exceedances"]
+        params_array = zeros(shape=(exceedances.shape[0] - header["t0"], exceedances.shape[1], 5))
+        gpd_fits = sum(
+            _fit_feature(
+                exceedances=exceedances[:, index],
+                params_array=params_array[:, index],
+                t0=header["t0"],
+                recorder=NullRecorder(),
+            )
+            for index in range(0, exceedances.shape[1])
+        )
+        return ({"feature_indices": header["feature_indices"], "gpd_fits": gpd_fits}, {"params": params_array})
+
+    def __score_groups(self, header: dict, arrays: dict[str, ndarray]) -> Message:
+        """
+        Run the POT chain on the groups of a shard.
+
+        # Parameters
+        ------------
+            * header (dict): The "metrics" of every group and the keyword arguments of `_score_groups()`.
+            * arrays (dict[str, ndarray]): The "values_{index}" of every group.
+
+        # Returns
+        ------------
+            * tuple[dict, dict[str, ndarray]]: The "errors" and "anomaly_thresholds" per group, and the detected "rows_{index}",
+                "total_anomaly_score_{index}", and "is_anomaly_{index}".
+        """
+        groups: list[GroupTask] = [
+            (index, RangeIndex(stop=arrays[f"values_{index}"].shape[0]), metrics, arrays[f"values_{index}"])
+            for index, metrics in enumerate(header["metrics"])
+        ]
+        results = _score_groups(
+            groups=groups,
+            exceedance_q=header["exceedance_q"],
+            anomaly_q=header["anomaly_q"],
+            timeframe_kwargs=header["timeframe_kwargs"],
+            errors=header["errors"],
+        )
+        result_header: dict[str, list] = {"errors": [], "anomaly_thresholds": []}
+        result_arrays: dict[str, ndarray] = {}
+
+        for index, detected_rows, error in results:
+            result_header["errors"].append(error)
+            result_header["anomaly_thresholds"].append(
+                None
+                if detected_rows is None or detected_rows.shape[0] == 0
+                else float(detected_rows["anomaly_threshold"].iloc[0])
+            )
+            if detected_rows is not None:
+                result_arrays[f"rows_{index}"] = detected_rows["timestamp"].to_numpy(dtype=int64)
+                result_arrays[f"total_anomaly_score_{index}"] = detected_rows["total_anomaly_score"].to_numpy()
+                result_arrays[f"is_anomaly_{index}"] = detected_rows["is_anomaly"].to_numpy()
+        return (result_header, result_arrays)
+
+    def __str__(self):
+        return "Worker"
+
+
+def run_worker(host: str, port: int, timeout: float = 30.0) -> int:
+    """
+    Run a `Worker` until the coordinator shuts it down, e.g. as the target of a `multiprocessing.Process` or on another machine.
+
+    # Parameters
+    ------------
+        * host (str): The host of the coordinator.
+        * port (int): The port of the coordinator.
+        * timeout (float): The seconds to wait for the connection to the coordinator, default 30.
+
+    # Returns
+    ------------
+        * int: The number of completed shards.
+    """
+    return Worker(host=host, port=port, timeout=timeout).run()
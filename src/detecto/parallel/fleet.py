@@ -0,0 +1,332 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from os import cpu_count
+from typing import Hashable, Iterator, Literal
+
+from numpy import ndarray
+from pandas import concat, DataFrame, Index
+
+from src.detecto.instrumentation.recorder import NullRecorder, Recorder
+from src.detecto.models.detectors.pot import POTDetecto
+
+GroupTask = tuple[Hashable, Index, list[str], ndarray]
+GroupResult = tuple[Hashable, DataFrame | None, str | None]
+
+
+def _score_groups(
+    groups: list[GroupTask],
+    exceedance_q: float,
+    anomaly_q: float,
+    timeframe_kwargs: dict[str, float | bool],
+    errors: Literal["raise", "skip"],
+) -> list[GroupResult]:
+    """
+    Run the POT chain on the wide datasets of a batch of groups, in a worker process or in-process.
+
+    # Parameters
+    ------------
+        * groups (list[tuple[Hashable, Index, list[str], ndarray]]): The key, timestamps, metrics, and (rows, metrics) values of every group.
+        * exceedance_q (float): The quantile of `compute_exceedance_threshold()`.
+        * anomaly_q (float): The quantile of `compute_anomaly_threshold()`.
+        * timeframe_kwargs (dict[str, float | bool]): The percentages and `prod_mode` of `timeframe.set_interval()`.
+        * errors (Literal["raise", "skip"]): Whether a failing group raises or is returned with its error message.
+
+    # Returns
+    ------------
+        * list[tuple[Hashable, DataFrame | None, str | None]]: The key, the detected rows or None, and the error message or None of every group.
+    """
+    results: list[GroupResult] = []
+
+    for key, timestamps, metrics, values in groups:
+        try:
+            dataset = DataFrame(data=values, columns=metrics, copy=False)
+            detector = POTDetecto()
+            detector.timeframe.set_interval(total_rows=dataset.shape[0], **timeframe_kwargs)
+            detector.compute_exceedance_threshold(dataset=dataset, q=exceedance_q)
+            detector.extract_exceedance(dataset=dataset)
+            detector.fit(dataset=dataset)
+            detector.compute_anomaly_threshold(q=anomaly_q)
+            detector.detect()
+        except Exception as e:
+            if errors == "raise":
+                raise
+            results.append((key, None, f"{type(e).__name__}: {e}"))
+            continue
+
+        first_detected_row = detector.timeframe.t0 + detector.timeframe.t1  # type: ignore
+        total_detected_rows = detector.anomaly_dataset.shape[0]  # type: ignore
+        results.append(
+            (
+                key,
+                DataFrame(
+                    data={
+                        "timestamp": timestamps[first_detected_row : first_detected_row + total_detected_rows],
+                        "total_anomaly_score": detector.anomaly_score_dataset["total_anomaly_score"]  # type: ignore
+                        .iloc[detector.timeframe.t1 :]
+                        .to_numpy(),
+                        "anomaly_threshold": float(detector.anomaly_threshold),  # type: ignore
+                        "is_anomaly": detector.anomaly_dataset["is_anomaly"].to_numpy(),  # type: ignore
+                    }
+                ),
+                None,
+            )
+        )
+    return results
+
+
+class Fleet:
+    """
+    Fleet class that runs the POT chain per group of a long-format dataset, e.g. per host, across a process pool.
+
+    The long-format rows (timestamp, entity, metric, value) are pivoted once into 1 wide dataset per group with 1 feature per metric.
+    The fitting cost of a group grows with its rows squared times its metrics, so the groups are scheduled largest first and small
+    groups are packed into batches. Every idle worker takes the next batch from the shared queue, so a straggling large group never
+    blocks the small ones behind it.
+
+    # Attributes
+    ------------
+        * timestamp_col (str): The column of the timestamps, default "timestamp".
+        * entity_col (str | list[str]): The column or columns of the group key, default "entity_id".
+        * metric_col (str): The column of the metric names, default "metric".
+        * value_col (str): The column of the values, default "value".
+        * exceedance_q (float): The quantile of the exceedance thresholds, default 0.99.
+        * anomaly_q (float): The quantile of the anomaly thresholds, default 0.80.
+        * max_workers (int | None): The number of worker processes, `None` uses the number of CPUs and 1 runs in-process.
+        * errors (Literal["raise", "skip"]): Whether a failing group, e.g. without any exceedance, raises or is skipped and recorded in
+            `failed_groups`, default "raise".
+        * batches_per_worker (int): The minimum number of batches per worker, small groups are packed into batches of at most
+            1 / (`max_workers` * `batches_per_worker`) of the total cost, default 16.
+        * timeframe_kwargs (dict[str, float | bool]): The percentages and `prod_mode` of `POTTimeframe.set_interval()` per group,
+            default is `prod_mode = True` that detects the last timestamp of every group.
+        * recorder (Recorder): The instrumentation of the run, default is a `NullRecorder` that records nothing.
+        * failed_groups (dict[Hashable, str]): The error message of every skipped group of the last `detect()`.
+        * coordinator (Coordinator | None): Run the batches on the workers of a started `src.detecto.parallel.cluster.Coordinator`, e.g.
+            on other machines, instead of the process pool, default is None.
+    """
+
+    def __init__(
+        self,
+        timestamp_col: str = "timestamp",
+        entity_col: str | list[str] = "entity_id",
+        metric_col: str = "metric",
+        value_col: str = "value",
+        exceedance_q: float = 0.99,
+        anomaly_q: float = 0.80,
+        max_workers: int | None = None,
+        errors: Literal["raise", "skip"] = "raise",
+        batches_per_worker: int = 16,
+        recorder: Recorder | None = None,
+        coordinator: object | None = None,
+        **timeframe_kwargs: float | bool,
+    ) -> None:
+        if errors not in ("raise", "skip"):
+            raise ValueError("`errors` needs to be either 'raise' or 'skip'!")
+
+        if batches_per_worker < 1:
+            raise ValueError("`batches_per_worker` must be at least 1!")
+
+        self.timestamp_col = timestamp_col
+        self.entity_col = entity_col
+        self.metric_col = metric_col
+        self.value_col = value_col
+        self.exceedance_q = exceedance_q
+        self.anomaly_q = anomaly_q
+        self.max_workers = max_workers
+        self.errors = errors
+        self.batches_per_worker = batches_per_worker
+        self.timeframe_kwargs = timeframe_kwargs if len(timeframe_kwargs) > 0 else {"prod_mode": True}
+        self.recorder = recorder if recorder is not None else NullRecorder()
+        self.failed_groups: dict[Hashable, str] = {}
+        self.coordinator = coordinator
+
+    @property
+    def run_report(self) -> dict[str, dict]:
+        """
+        Get the structured report of the last `detect()` run.
+
+        # Returns
+        ------------
+            * dict[str, dict]: The "stages", "counters", and "histograms" recorded by `recorder`, all empty if instrumentation is disabled.
+        """
+        return self.recorder.report()
+
+    @property
+    def entity_cols(self) -> list[str]:
+        """
+        Get the columns of the group key as a list.
+
+        # Returns
+        ------------
+            * list[str]: The entity columns.
+        """
+        return [self.entity_col] if isinstance(self.entity_col, str) else list(self.entity_col)
+
+    def __wide_dataset(self, dataset: DataFrame) -> DataFrame:
+        """
+        Pivot the long-format dataset into 1 column per metric, indexed by the group key and the timestamp.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame): The long-format dataset.
+
+        # Returns
+        ------------
+            * DataFrame: The wide dataset sorted by group and timestamp, the last value of duplicated rows is kept.
+        """
+        missing_columns = [
+            column
+            for column in self.entity_cols + [self.timestamp_col, self.metric_col, self.value_col]
+            if column not in dataset.columns
+        ]
+        if len(missing_columns) > 0:
+            raise ValueError(f"The `dataset` is missing the long-format columns {missing_columns}!")
+
+        return dataset.pivot_table(
+            index=self.entity_cols + [self.timestamp_col],
+            columns=self.metric_col,
+            values=self.value_col,
+            aggfunc="last",
+            sort=True,
+        )
+
+    def __batches(self, wide_dataset: DataFrame, total_workers: int) -> Iterator[list[GroupTask]]:
+        """
+        Split the wide dataset into batches of groups, the most expensive groups first.
+
+        # Parameters
+        ------------
+            * wide_dataset (DataFrame): The wide dataset of `__wide_dataset()`.
+            * total_workers (int): The number of worker processes.
+
+        # Returns
+        ------------
+            * Iterator[list[tuple[Hashable, Index, list[str], ndarray]]]: The batches, a group is only sliced when its batch is submitted.
+        """
+        group_levels = 0 if len(self.entity_cols) == 1 else list(range(0, len(self.entity_cols)))
+        positions = wide_dataset.groupby(level=group_levels, sort=True).indices
+        metric_counts = wide_dataset.notna().groupby(level=group_levels, sort=True).any().sum(axis=1)
+        costs = {key: len(rows) ** 2 * int(metric_counts.loc[key]) for key, rows in positions.items()}
+        max_batch_cost = max(sum(costs.values()) // (total_workers * self.batches_per_worker), 1)
+        batch: list[GroupTask] = []
+        batch_cost = 0
+
+        for key in sorted(costs, key=lambda key: costs[key], reverse=True):
+            group = wide_dataset.iloc[positions[key]].dropna(axis=1, how="all")
+            batch.append((key, group.index.get_level_values(-1), list(group.columns), group.to_numpy(dtype="float64")))
+            batch_cost += costs[key]
+
+            if batch_cost >= max_batch_cost:
+                yield batch
+                batch, batch_cost = [], 0
+
+        if len(batch) > 0:
+            yield batch
+
+    def detect(self, dataset: DataFrame) -> DataFrame:
+        """
+        Run the POT chain per group and combine the detected rows of all groups into 1 anomaly table.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame): The long-format dataset with the timestamp, entity, metric, and value columns.
+
+        # Returns
+        ------------
+            * DataFrame: The entity columns, the timestamp, the "total_anomaly_score", the "anomaly_threshold", and "is_anomaly" of the
+                detected rows of every group, sorted by group and timestamp.
+        """
+        self.failed_groups = {}
+
+        with self.recorder.stage(name="fleet_detect"):
+            with self.recorder.stage(name="fleet_partition"):
+                wide_dataset = self.__wide_dataset(dataset=dataset)
+
+            total_workers = self.max_workers if self.max_workers is not None else (cpu_count() or 1)
+            score_kwargs = {
+                "exceedance_q": self.exceedance_q,
+                "anomaly_q": self.anomaly_q,
+                "timeframe_kwargs": self.timeframe_kwargs,
+                "errors": self.errors,
+            }
+            results: list[GroupResult] = []
+
+            if self.coordinator is not None:
+                results = self.coordinator.score_groups(  # type: ignore
+                    batches=self.__batches(wide_dataset=wide_dataset, total_workers=total_workers),
+                    score_kwargs=score_kwargs,
+                )
+            elif total_workers == 1:
+                for batch in self.__batches(wide_dataset=wide_dataset, total_workers=1):
+                    results.extend(_score_groups(groups=batch, **score_kwargs))  # type: ignore
+            else:
+                results = self.__score_in_pool(
+                    wide_dataset=wide_dataset, total_workers=total_workers, score_kwargs=score_kwargs
+                )
+
+            return self.__combine(results=results)
+
+    def __score_in_pool(self, wide_dataset: DataFrame, total_workers: int, score_kwargs: dict) -> list[GroupResult]:
+        """
+        Submit the batches to a process pool, keeping at most 2 batches per worker in flight so only those are pickled at once.
+
+        # Parameters
+        ------------
+            * wide_dataset (DataFrame): The wide dataset of `__wide_dataset()`.
+            * total_workers (int): The number of worker processes.
+            * score_kwargs (dict): The keyword arguments of `_score_groups()` besides the groups.
+
+        # Returns
+        ------------
+            * list[tuple[Hashable, DataFrame | None, str | None]]: The results of all groups in completion order.
+        """
+        results: list[GroupResult] = []
+        pending: set[Future] = set()
+        batches = self.__batches(wide_dataset=wide_dataset, total_workers=total_workers)
+
+        with ProcessPoolExecutor(max_workers=total_workers) as executor:
+            for batch in batches:
+                if len(pending) >= 2 * total_workers:
+                    done, pending = wait(fs=pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results.extend(future.result())
+                pending.add(executor.submit(_score_groups, groups=batch, **score_kwargs))
+
+            for future in pending:
+                results.extend(future.result())
+        return results
+
+    def __combine(self, results: list[GroupResult]) -> DataFrame:
+        """
+        Concatenate the detected rows of the groups and record the failed groups.
+
+        # Parameters
+        ------------
+            * results (list[tuple[Hashable, DataFrame | None, str | None]]): The results of `_score_groups()`.
+
+        # Returns
+        ------------
+            * DataFrame: The combined anomaly table sorted by group and timestamp.
+        """
+        frames = []
+
+        for key, detected_rows, error in sorted(results, key=lambda result: result[0]):  # type: ignore
+            if detected_rows is None:
+                self.failed_groups[key] = error  # type: ignore
+                continue
+
+            key_values = key if isinstance(key, tuple) else (key,)
+            for column, value in reversed(list(zip(self.entity_cols, key_values))):
+                detected_rows.insert(loc=0, column=column, value=value)
+            frames.append(detected_rows.rename(columns={"timestamp": self.timestamp_col}))
+
+        self.recorder.increment(counter="groups_scored", value=len(frames))
+        self.recorder.increment(counter="groups_failed", value=len(self.failed_groups))
+
+        if len(frames) == 0:
+            return DataFrame(
+                columns=self.entity_cols
+                + [self.timestamp_col, "total_anomaly_score", "anomaly_threshold", "is_anomaly"]
+            )
+        return concat(frames, ignore_index=True)
+
+    def __str__(self):
+        return "Fleet"
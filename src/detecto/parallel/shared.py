@@ -0,0 +1,148 @@
+from multiprocessing.shared_memory import SharedMemory
+from typing import Literal
+
+from numpy import dtype as np_dtype, ndarray, prod
+
+SharedArraySpec = tuple[str, tuple[int, ...], str, Literal["C", "F"]]
+
+
+def attach(spec: SharedArraySpec, readonly: bool = True) -> tuple[ndarray, SharedMemory]:
+    """
+    Attach a NumPy view to an array published by `SharedArrays` in another process, without copying it.
+
+    The view must be dropped before the returned block is closed, only the owning `SharedArrays` unlinks the block.
+
+    # Parameters
+    ------------
+        * spec (tuple[str, tuple[int, ...], str, Literal["C", "F"]]): The block name, shape, dtype, and memory order of the array.
+        * readonly (bool): Whether the view is read-only, default is `True`, output arrays are attached with `False`.
+
+    # Returns
+    ------------
+        * tuple[ndarray, SharedMemory]: The view and the attached block.
+    """
+    (name, shape, dtype, order) = spec
+    block = SharedMemory(name=name)
+    array: ndarray = ndarray(shape=shape, dtype=dtype, buffer=block.buf, order=order)
+    array.flags.writeable = not readonly
+    return (array, block)
+
+
+class SharedArrays:
+    """
+    SharedArrays class that owns the `multiprocessing.shared_memory` blocks of the arrays shared with worker processes.
+
+    An input array is published once and every worker attaches a view by the name in its spec with `attach()`, so only the small
+    specs are pickled per task. Outputs are preallocated the same way and written by the workers in place. Used as a context manager,
+    all blocks are unlinked on exit, also if a worker crashed and the pool raised; if the owning process itself is killed, the
+    resource tracker of `multiprocessing` unlinks them.
+
+    # Attributes
+    ------------
+        * specs (dict[str, tuple[str, tuple[int, ...], str, Literal["C", "F"]]]): The spec of every shared array by key.
+    """
+
+    def __init__(self) -> None:
+        self.specs: dict[str, SharedArraySpec] = {}
+        self.__blocks: dict[str, SharedMemory] = {}
+
+    def allocate(
+        self,
+        key: str,
+        shape: tuple[int, ...],
+        dtype: str = "float64",
+        order: Literal["C", "F"] = "C",
+        fill_value: float | None = 0.0,
+    ) -> SharedArraySpec:
+        """
+        Allocate a shared array, e.g. an output written by the workers.
+
+        # Parameters
+        ------------
+            * key (str): The key of the array.
+            * shape (tuple[int, ...]): The shape of the array.
+            * dtype (str): The dtype of the array, default "float64".
+            * order (Literal["C", "F"]): The memory order, "F" keeps the columns of a 2D array contiguous, default "C".
+            * fill_value (float | None): The initial value of all elements, uninitialized if None, default is 0.0.
+
+        # Returns
+        ------------
+            * tuple[str, tuple[int, ...], str, Literal["C", "F"]]: The spec to `attach()` the array.
+        """
+        if key in self.specs:
+            raise ValueError(f"The shared array `{key}` already exists!")
+
+        block = SharedMemory(create=True, size=max(int(prod(shape)) * np_dtype(dtype).itemsize, 1))
+        self.__blocks[key] = block
+        self.specs[key] = (block.name, tuple(int(size) for size in shape), dtype, order)
+
+        if fill_value is not None:
+            self.view(key=key).fill(fill_value)
+        return self.specs[key]
+
+    def publish(self, key: str, array: ndarray) -> SharedArraySpec:
+        """
+        Copy an array into a new shared array once, keeping its memory order.
+
+        # Parameters
+        ------------
+            * key (str): The key of the array.
+            * array (ndarray): The array to share.
+
+        # Returns
+        ------------
+            * tuple[str, tuple[int, ...], str, Literal["C", "F"]]: The spec to `attach()` the array.
+        """
+        order: Literal["C", "F"] = "F" if array.flags.f_contiguous and not array.flags.c_contiguous else "C"
+        spec = self.allocate(key=key, shape=array.shape, dtype=array.dtype.str, order=order, fill_value=None)
+        self.view(key=key)[...] = array
+        return spec
+
+    def view(self, key: str) -> ndarray:
+        """
+        Get a writable view of a shared array in the owning process.
+
+        # Parameters
+        ------------
+            * key (str): The key of the array.
+
+        # Returns
+        ------------
+            * ndarray: The view, copy the results out of it before `close()`.
+        """
+        (_, shape, dtype, order) = self.specs[key]
+        return ndarray(shape=shape, dtype=dtype, buffer=self.__blocks[key].buf, order=order)
+
+    def close(self) -> None:
+        """
+        Close and unlink all shared arrays.
+
+        # Returns
+        ------------
+            * None: The blocks are released, a block whose views are still referenced is freed once they are dropped.
+        """
+        for block in self.__blocks.values():
+            try:
+                block.close()
+            except BufferError:
+                pass
+
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+
+        self.__blocks = {}
+        self.specs = {}
+
+    def __enter__(self) -> "SharedArrays":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def __str__(self):
+        return "Shared Arrays"
@@ -0,0 +1,383 @@
+from math import ceil
+from typing import Iterable
+
+from numpy import argsort, asarray, concatenate, cumsum, empty, float64, full, isnan, ndarray, searchsorted, sort
+from pandas import DataFrame, Series
+
+from src.detecto.io.datasets import column_values, to_frame
+from src.detecto.io.store import read_store, write_store
+
+
+class QuantileSketch:
+    """
+    QuantileSketch class, a mergeable KLL sketch of the quantiles of 1 feature.
+
+    The values are kept in compactors, the items of level h weigh 2^h. A full level is sorted and every other item is promoted to the
+    next level, alternating the first item between compactions, so the sketch keeps about 3 * `k` items and a rank error of about
+    1 / `k` of the count however many values it summarizes. As long as no level was compacted the quantiles are exact and equal the
+    linear interpolation of Pandas.
+
+    # Attributes
+    ------------
+        * k (int): The capacity of the top level, larger is more accurate, default 200.
+        * count (int): The number of summarized values, missing values are skipped.
+    """
+
+    def __init__(self, k: int = 200) -> None:
+        if k < 8:
+            raise ValueError("`k` must be at least 8!")
+
+        self.k = k
+        self.count = 0
+        self.__levels: list[ndarray] = [empty(shape=0)]
+        self.__compactions: list[int] = [0]
+
+    @property
+    def is_exact(self) -> bool:
+        """
+        Check whether the sketch still holds all values.
+
+        # Returns
+        ------------
+            * bool: `True` if no level was compacted.
+        """
+        return len(self.__levels) == 1
+
+    def __capacity(self, level: int) -> int:
+        return max(int(ceil(self.k * (2 / 3) ** (len(self.__levels) - 1 - level))), 2)
+
+    def __compress(self) -> None:
+        """
+        Compact the lowest full level until all levels are within their capacity.
+
+        # Returns
+        ------------
+            * None: The levels are replaced, the total weight stays the count.
+        """
+        while True:
+            full_levels = [
+                level for level in range(0, len(self.__levels)) if len(self.__levels[level]) > self.__capacity(level)
+            ]
+            if len(full_levels) == 0:
+                return
+
+            level = full_levels[0]
+            if level + 1 == len(self.__levels):
+                self.__levels.append(empty(shape=0))
+                self.__compactions.append(0)
+
+            items = sort(self.__levels[level])
+            kept_items = items[: len(items) % 2]
+            offset = len(kept_items) + self.__compactions[level] % 2
+            self.__levels[level + 1] = concatenate((self.__levels[level + 1], items[offset::2]))
+            self.__levels[level] = kept_items
+            self.__compactions[level] += 1
+
+    def update(self, values: ndarray | Iterable[float]) -> "QuantileSketch":
+        """
+        Add values to the sketch.
+
+        # Parameters
+        ------------
+            * values (ndarray | Iterable[float]): The new values, missing values are skipped.
+
+        # Returns
+        ------------
+            * QuantileSketch: The updated sketch.
+        """
+        new_values = asarray(values if isinstance(values, ndarray) else list(values), dtype=float64).ravel()
+        new_values = new_values[~isnan(new_values)]
+
+        self.__levels[0] = concatenate((self.__levels[0], new_values))
+        self.count += len(new_values)
+        self.__compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Merge another sketch of the same feature into this sketch, e.g. the sketch of another shard or partition.
+
+        # Parameters
+        ------------
+            * other (QuantileSketch): The sketch with the same `k`.
+
+        # Returns
+        ------------
+            * QuantileSketch: This sketch summarizing the values of both.
+        """
+        if other.k != self.k:
+            raise ValueError("Only sketches with the same `k` can be merged!")
+
+        (other_levels, other_compactions) = other.__state()
+        for level, items in enumerate(other_levels):
+            if level == len(self.__levels):
+                self.__levels.append(empty(shape=0))
+                self.__compactions.append(0)
+            self.__levels[level] = concatenate((self.__levels[level], items))
+            self.__compactions[level] += other_compactions[level]
+
+        self.count += other.count
+        self.__compress()
+        return self
+
+    def __state(self) -> tuple[list[ndarray], list[int]]:
+        return (self.__levels, self.__compactions)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile of the summarized values.
+
+        # Parameters
+        ------------
+            * q (float): The quantile, range values are 0.0 - 1.0.
+
+        # Returns
+        ------------
+            * float: The estimate, exact while `is_exact`, NaN if the sketch is empty.
+        """
+        if self.count == 0:
+            return float("nan")
+
+        position = q * (self.count - 1)
+
+        if self.is_exact:
+            items = sort(self.__levels[0])
+            lower = int(position)
+            upper = min(lower + 1, self.count - 1)
+            return float(items[lower] + (items[upper] - items[lower]) * (position - lower))
+
+        items = concatenate(self.__levels)
+        weights = concatenate(
+            [full(shape=len(level_items), fill_value=2**level) for level, level_items in enumerate(self.__levels)]
+        )
+        order = argsort(items, kind="stable")
+        cumulative_weights = cumsum(weights[order])
+        index = min(int(searchsorted(cumulative_weights, position + 1, side="left")), len(items) - 1)
+        return float(items[order][index])
+
+    def to_arrays(self) -> tuple[ndarray, dict]:
+        """
+        Serialize the sketch.
+
+        # Returns
+        ------------
+            * tuple[ndarray, dict]: The items of all levels and the JSON serializable "k", "count", "level_sizes", and "compactions".
+        """
+        return (
+            concatenate(self.__levels),
+            {
+                "k": self.k,
+                "count": self.count,
+                "level_sizes": [len(items) for items in self.__levels],
+                "compactions": list(self.__compactions),
+            },
+        )
+
+    @classmethod
+    def from_arrays(cls, items: ndarray, metadata: dict) -> "QuantileSketch":
+        """
+        Deserialize a sketch of `to_arrays()`.
+
+        # Parameters
+        ------------
+            * items (ndarray): The items of all levels.
+            * metadata (dict): The "k", "count", "level_sizes", and "compactions" of the sketch.
+
+        # Returns
+        ------------
+            * QuantileSketch: The sketch.
+        """
+        sketch = cls(k=metadata["k"])
+        offsets = cumsum([0] + metadata["level_sizes"])
+        sketch.count = metadata["count"]
+        sketch.__levels = [items[offsets[level] : offsets[level + 1]].copy() for level in range(0, len(offsets) - 1)]
+        sketch.__compactions = list(metadata["compactions"])
+        return sketch
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self.__levels)
+
+    def __str__(self):
+        return "Quantile Sketch"
+
+
+class FeatureSketches:
+    """
+    FeatureSketches class that holds 1 `QuantileSketch` per feature to compute the exceedance thresholds without the raw data.
+
+    Every shard or daily partition is summarized locally with `update()`, the summaries are persisted with `save()` or sent as arrays,
+    and the coordinator merges them with `merge()` into the global thresholds of `quantiles()`, e.g. for
+    `POTDetecto.compute_exceedance_threshold(dataset=..., sketches=sketches)`.
+
+    # Attributes
+    ------------
+        * k (int): The capacity of the sketches, default 200.
+        * sketches (dict[str, QuantileSketch]): The sketch per feature.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, k: int = 200) -> None:
+        self.k = k
+        self.sketches: dict[str, QuantileSketch] = {}
+
+    def update(self, dataset: DataFrame | ndarray | object) -> "FeatureSketches":
+        """
+        Summarize the values of a dataset, 1 column at a time.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame | ndarray | pyarrow.Table): The shard or partition with 1 column per feature.
+
+        # Returns
+        ------------
+            * FeatureSketches: The updated sketches, new features get a new sketch.
+        """
+        dataset = to_frame(dataset=dataset)
+
+        for position, column in enumerate(dataset.columns):
+            self.sketches.setdefault(str(column), QuantileSketch(k=self.k)).update(
+                values=column_values(dataset=dataset, position=position)
+            )
+        return self
+
+    def merge(self, other: "FeatureSketches") -> "FeatureSketches":
+        """
+        Merge the sketches of another shard or partition feature by feature.
+
+        # Parameters
+        ------------
+            * other (FeatureSketches): The sketches with the same `k`.
+
+        # Returns
+        ------------
+            * FeatureSketches: These sketches summarizing the values of both.
+        """
+        if other.k != self.k:
+            raise ValueError("Only sketches with the same `k` can be merged!")
+
+        for feature, sketch in other.sketches.items():
+            if feature in self.sketches:
+                self.sketches[feature].merge(other=sketch)
+            else:
+                self.sketches[feature] = QuantileSketch.from_arrays(*sketch.to_arrays())
+        return self
+
+    @classmethod
+    def merge_all(cls, sketches: Iterable["FeatureSketches"]) -> "FeatureSketches":
+        """
+        Merge the sketches of all shards into new sketches, e.g. on the coordinator.
+
+        # Parameters
+        ------------
+            * sketches (Iterable[FeatureSketches]): The sketches of the shards.
+
+        # Returns
+        ------------
+            * FeatureSketches: The merged sketches.
+        """
+        merged_sketches: FeatureSketches | None = None
+
+        for shard_sketches in sketches:
+            if merged_sketches is None:
+                merged_sketches = cls(k=shard_sketches.k)
+            merged_sketches.merge(other=shard_sketches)
+
+        if merged_sketches is None:
+            raise ValueError("There are no sketches to merge!")
+        return merged_sketches
+
+    def quantiles(self, q: float) -> Series:
+        """
+        Estimate the q-quantile of every feature.
+
+        # Parameters
+        ------------
+            * q (float): The quantile, range values are 0.0 - 1.0.
+
+        # Returns
+        ------------
+            * Series: The estimates indexed by feature.
+        """
+        return Series(data={feature: sketch.quantile(q=q) for feature, sketch in self.sketches.items()}, dtype=float64)
+
+    def to_arrays(self) -> tuple[dict[str, ndarray], dict]:
+        """
+        Serialize the sketches, e.g. to send them to the coordinator.
+
+        # Returns
+        ------------
+            * tuple[dict[str, ndarray], dict]: The "items" of all sketches and the JSON serializable metadata per feature.
+        """
+        serialized = [sketch.to_arrays() for sketch in self.sketches.values()]
+        return (
+            {"items": concatenate([items for (items, _) in serialized]) if len(serialized) > 0 else empty(shape=0)},
+            {
+                "format_version": self.FORMAT_VERSION,
+                "k": self.k,
+                "features": list(self.sketches.keys()),
+                "sketches": [metadata for (_, metadata) in serialized],
+            },
+        )
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, ndarray], metadata: dict) -> "FeatureSketches":
+        """
+        Deserialize the sketches of `to_arrays()`.
+
+        # Parameters
+        ------------
+            * arrays (dict[str, ndarray]): The "items" of all sketches.
+            * metadata (dict): The metadata of `to_arrays()`.
+
+        # Returns
+        ------------
+            * FeatureSketches: The sketches.
+        """
+        if metadata.get("format_version") != cls.FORMAT_VERSION:
+            raise ValueError(f"The sketches are not of format version {cls.FORMAT_VERSION}!")
+
+        feature_sketches = cls(k=metadata["k"])
+        offset = 0
+
+        for feature, sketch_metadata in zip(metadata["features"], metadata["sketches"]):
+            size = sum(sketch_metadata["level_sizes"])
+            feature_sketches.sketches[feature] = QuantileSketch.from_arrays(
+                items=arrays["items"][offset : offset + size], metadata=sketch_metadata
+            )
+            offset += size
+        return feature_sketches
+
+    def save(self, path: str) -> str:
+        """
+        Persist the sketches as a store of `src.detecto.io.store`, e.g. after every daily partition.
+
+        # Parameters
+        ------------
+            * path (str): The directory to save the sketches into, existing sketches are replaced atomically.
+
+        # Returns
+        ------------
+            * str: The path of the saved sketches.
+        """
+        (arrays, metadata) = self.to_arrays()
+        return write_store(path=path, arrays=arrays, metadata=metadata)
+
+    @classmethod
+    def load(cls, path: str) -> "FeatureSketches":
+        """
+        Load the sketches saved with `save()`.
+
+        # Parameters
+        ------------
+            * path (str): The directory of the saved sketches.
+
+        # Returns
+        ------------
+            * FeatureSketches: The sketches.
+        """
+        (arrays, metadata) = read_store(path=path, mmap_mode=None)
+        return cls.from_arrays(arrays=arrays, metadata=metadata)
+
+    def __str__(self):
+        return "Feature Sketches"
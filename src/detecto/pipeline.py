@@ -1,12 +1,38 @@
+from contextlib import AbstractContextManager, nullcontext
+from datetime import datetime
+from os import path as os_path
 from typing import Literal
 
 from pandas import DataFrame
 
+from src.detecto.instrumentation.profiling import ProfileMethod, Profiler
+from src.detecto.instrumentation.recorder import Hook, NullRecorder, Recorder
+from src.detecto.io.cache import StageCache
 from src.detecto.models.detectors.factory import init_detecto
+from src.detecto.models.detectors.pot import POTDetecto
 from src.detecto.models.notifications.factory import get_notification
 
 
 class Pipeline:
+    """
+    Pipeline class that runs all stages of a Detecto model on a dataset and notifies about the detected anomalies.
+
+    # Attributes
+    ------------
+        * temporal_feature (Series): The time feature of the dataset.
+        * dataset (DataFrame): The dataset without the time feature.
+        * detecto (Detecto): The Detecto model created from `detecto_method`.
+        * notification (Notification): The notification created from `notification_platform`.
+        * recorder (Recorder): The instrumentation shared with the Detecto model, a `NullRecorder` unless `instrument = True` or
+            `hooks` are given, e.g. a `PrometheusExporter` or a `JSONLinesExporter` that write the metrics of every run.
+        * profile_report (dict[str, str | list] | None): The profiling method, the written files, and the top hot spots of the last
+            profiled `execute()`, default is None.
+        * state_path (str | None): The directory the state of the POT detector is persisted into for `execute(incremental=True)`,
+            default is None.
+        * cache (StageCache | None): Only for "pot", the on-disk cache of the threshold, exceedance, and fitting stages, so reruns on
+            the same dataset skip them, default is None.
+    """
+
     def __init__(
         self,
         dataset: DataFrame,
@@ -15,17 +41,26 @@ class Pipeline:
             "autoencoder", "block-maxima", "dbscan", "iso-forest", "mad", "1class-svm", "pot", "z-score"
         ],
         notification_platform: Literal["email", "slack"],
+        instrument: bool = False,
+        hooks: list[Hook] | None = None,
+        state_path: str | None = None,
+        cache: StageCache | None = None,
         **kwargs: list[str] | str | int,
     ):
         self.temporal_feature = dataset[temporal_feature]
         self.dataset = dataset.drop(columns=[temporal_feature])
+        self.recorder = Recorder(hooks=hooks) if instrument or hooks else NullRecorder()
+        self.profile_report: dict[str, str | list] | None = None
+        self.state_path = state_path
+        self.cache = cache
         self.detecto = init_detecto(method=detecto_method)
         if detecto_method == "pot":
             self.detecto.timeframe.set_interval(total_rows=self.dataset.shape[0], prod_mode=True)  # type: ignore
+            self.detecto.recorder = self.recorder  # type: ignore
+            self.detecto.cache = cache  # type: ignore
         if notification_platform == "email":
             self.notification = get_notification(
                 platform=notification_platform,
-                platform=kwargs.get("platform"),  # type: ignore
                 sender_address=kwargs.get("sender_address"),  # type: ignore
                 password=kwargs.get("password"),  # type: ignore
                 recipient_addresses=kwargs.get("recipient_addresses"),  # type: ignore
@@ -35,12 +70,138 @@ class Pipeline:
         elif notification_platform == "slack":
             self.notification = get_notification(platform=notification_platform, webhook_url=kwargs.get("webhook_url"))  # type: ignore
 
-    def execute(self) -> DataFrame:
-        self.detecto.compute_exceedance_threshold(dataset=self.dataset)  # type: ignore
-        self.detecto.extract_exceedance(dataset=self.dataset)  # type: ignore
-        self.detecto.fit(dataset=self.dataset)  # type: ignore
-        self.detecto.compute_anomaly_threshold()  # type: ignore
-        self.detecto.detect()  # type: ignore
-        self.detecto.evaluate(method="ks", stat_distance_threshold=0.05)  # type: ignore
-        #! TODO: Set a conditional based on the kstest_result "is_identical"
-        #! TODO: Set a conditional to send email, slack, or both notifications
+    @property
+    def run_report(self) -> dict[str, dict]:
+        """
+        Get the structured report of the last `execute()` run.
+
+        # Returns
+        ------------
+            * dict[str, dict]: The "stages", "counters", and "histograms" of the run, all empty if `instrument = False`.
+        """
+        return self.recorder.report()
+
+    def __anomaly_data(self) -> list[dict[str, str | float | int | datetime]]:
+        """
+        Collect the anomalous data points of the rows detected as anomalies in the format of the notifications.
+
+        # Returns
+        ------------
+            * list[dict[str, str | float | int | datetime]]: The date, column, and value of every feature with an anomaly score > 0.
+        """
+        # An incremental run may only get the new rows, so the rows of the detector are mapped onto the last rows of `dataset`.
+        first_dataset_row = self.detecto.exceedance_dataset.shape[0] - self.dataset.shape[0]  # type: ignore
+        first_detected_row = self.detecto.timeframe.t0 + self.detecto.timeframe.t1 - first_dataset_row  # type: ignore
+        anomaly_data = []
+
+        for detected_row, is_anomaly in enumerate(self.detecto.anomaly_dataset["is_anomaly"]):  # type: ignore
+            if not is_anomaly or first_detected_row + detected_row < 0:
+                continue
+
+            row = first_detected_row + detected_row
+            scores = self.detecto.anomaly_score_dataset.iloc[self.detecto.timeframe.t1 + detected_row]  # type: ignore
+            for feature_name in self.dataset.columns:
+                if scores[f"anomaly_score_{feature_name}"] > 0:
+                    anomaly_data.append(
+                        {
+                            "date": self.temporal_feature.iloc[row],
+                            "column": feature_name,
+                            "anomaly": self.dataset[feature_name].iloc[row],
+                        }
+                    )
+        return anomaly_data
+
+    def __update_state(self) -> None:
+        """
+        Load the persisted POT detector from `state_path` and update it with the rows of `dataset` after the persisted rows.
+
+        The rows of `dataset` are matched by their index, so it can hold only the new rows or the whole history, the persisted rows are
+        not read again.
+
+        # Returns
+        ------------
+            * None: The loaded and updated detector is assigned into `detecto`.
+        """
+        self.detecto = POTDetecto.load(path=self.state_path, recorder=self.recorder)  # type: ignore
+        self.detecto.cache = self.cache
+        persisted_index = self.detecto.exceedance_dataset.index  # type: ignore
+        total_persisted_rows = int(self.dataset.index.searchsorted(persisted_index[-1], side="right"))
+
+        if total_persisted_rows not in (0, len(persisted_index)):
+            raise ValueError(
+                "The `dataset` needs to hold the rows after the persisted state, or the whole history including them!"
+            )
+
+        if total_persisted_rows < self.dataset.shape[0]:
+            self.detecto.update(dataset=self.dataset.iloc[total_persisted_rows:])
+
+    def execute(
+        self,
+        notify: bool = False,
+        message: str = "Detecto detected anomalies in your data:",
+        profile: ProfileMethod | None = None,
+        profile_dir: str = ".",
+        incremental: bool = False,
+    ) -> DataFrame:
+        """
+        Run all stages of the Detecto model on the dataset and optionally notify about the detected anomalies.
+
+        # Parameters
+        ------------
+            * notify (bool): Whether to send the detected anomalies via `notification`, default is `False`.
+            * message (str): The custom message of the notification.
+            * profile (Literal["cprofile", "tracemalloc", "sampling"] | None): Profile the whole run with a `Profiler`, default is None.
+            * profile_dir (str): The directory the profile and its summary are written into, default is the current directory.
+            * incremental (bool): Only for "pot", load the persisted state from `state_path`, update it with the rows of `dataset`
+                after the persisted rows, which can be only the new rows, score and detect only those with the persisted anomaly
+                threshold, and append them to the persisted state. The KS evaluation is skipped and its persisted result is kept. The
+                first run fits and evaluates the whole dataset, default is `False`.
+
+        # Returns
+        ------------
+            * DataFrame: The `anomaly_dataset` of the Detecto model.
+        """
+        if incremental and (self.state_path is None or not isinstance(self.detecto, POTDetecto)):
+            raise ValueError("`incremental = True` needs `detecto_method = 'pot'` and a `state_path`!")
+
+        self.recorder.reset()
+        profiler: Profiler | None = None
+        profile_context: AbstractContextManager = nullcontext()
+
+        if profile is not None:
+            profiler = profile_context = Profiler(method=profile, output_dir=profile_dir, name="execute_profile")
+
+        with profile_context, self.recorder.stage(name="execute"):
+            is_update = incremental and os_path.isdir(self.state_path)  # type: ignore
+
+            if is_update:
+                self.__update_state()
+            else:
+                self.detecto.compute_exceedance_threshold(dataset=self.dataset, keep_history=incremental)  # type: ignore
+                self.detecto.extract_exceedance(dataset=self.dataset)  # type: ignore
+                self.detecto.fit(dataset=self.dataset)  # type: ignore
+
+            if not is_update or self.detecto.anomaly_threshold is None:  # type: ignore
+                self.detecto.compute_anomaly_threshold()  # type: ignore
+            self.detecto.detect()  # type: ignore
+
+            if not is_update:
+                self.detecto.evaluate(method="ks", stat_distance_threshold=0.05)  # type: ignore
+            #! TODO: Set a conditional based on the kstest_result "is_identical"
+
+            if incremental:
+                self.detecto.save(path=self.state_path, append=is_update)  # type: ignore
+
+            anomaly_data = self.__anomaly_data() if notify else []
+            if len(anomaly_data) > 0:
+                with self.recorder.stage(name="notification"):
+                    self.notification.setup(data=anomaly_data, message=message)
+                    self.notification.send
+
+        if profiler is not None:
+            self.profile_report = profiler.report()
+
+        self.recorder.increment(counter="rows_processed", value=self.dataset.shape[0])
+        self.recorder.increment(counter="features_processed", value=self.dataset.shape[1])
+        self.recorder.emit(event="run", payload=self.recorder.report())
+        return self.detecto.anomaly_dataset  # type: ignore
@@ -0,0 +1,393 @@
+from io import BytesIO
+from json import loads
+from os import fstat, path as os_path
+from threading import Event
+from time import sleep
+from typing import BinaryIO, Iterator, Literal
+
+from numpy import float64
+from pandas import concat, DataFrame, RangeIndex, read_csv, to_datetime
+
+from src.detecto.io.store import read_store, write_store
+from src.detecto.models.detectors.pot import POTDetecto
+
+DETECTOR_DIR = "detector"
+CURSOR_DIR = "cursor"
+
+
+class TailFollower:
+    """
+    TailFollower class that tails a growing CSV or NDJSON file and feeds the appended rows to a fitted `POTDetecto` with `update()`.
+
+    Every poll continues at the byte offset after the last consumed line, so the file is never re-read from the start, and a partially
+    written last line is left for the next poll. The new lines are parsed and scored `batch_rows` at a time and the rows whose total
+    anomaly score is above `anomaly_threshold` are emitted per batch. After every `checkpoint_every` batches the detector and the read
+    offset are persisted into `state_dir`: the cursor is written first with the previous and the next position, then the detector, and
+    on restart the position that matches the saved detector is resumed, so a crash in between neither skips nor re-scores rows. A
+    truncated or replaced file is followed again from its start.
+
+    # Attributes
+    ------------
+        * path (str): The followed CSV or NDJSON file, a CSV file needs a header line.
+        * state_dir (str): The directory of the persisted detector and cursor.
+        * detector (POTDetecto): The detector fitted with `compute_exceedance_threshold(keep_history=True)`, `fit()`, and
+            `compute_anomaly_threshold()`, restored from `state_dir` if it has a checkpoint.
+        * index_col (str | None): The column used as the index of the rows, e.g. the timestamp, parsed as datetime, default is None,
+            then the rows are numbered continuously.
+        * file_format (Literal["csv", "ndjson"]): The format of `path`, inferred from the file extension if None.
+        * batch_rows (int): The number of rows per `update()`, default 1000.
+        * checkpoint_every (int): The number of batches between 2 checkpoints, rows after the last checkpoint are re-scored after a
+            crash, default 1.
+        * poll_interval (float): The seconds `follow()` waits when there are no new lines, default 1.0.
+        * offset (int): The byte offset after the last consumed line.
+        * rows_read (int): The number of consumed rows.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        path: str,
+        state_dir: str,
+        detector: POTDetecto | None = None,
+        index_col: str | None = None,
+        file_format: Literal["csv", "ndjson"] | None = None,
+        batch_rows: int = 1000,
+        checkpoint_every: int = 1,
+        poll_interval: float = 1.0,
+        start: Literal["beginning", "end"] = "beginning",
+    ) -> None:
+        if batch_rows < 1 or checkpoint_every < 1:
+            raise ValueError("`batch_rows` and `checkpoint_every` must be at least 1!")
+
+        if start not in ("beginning", "end"):
+            raise ValueError("`start` needs to be one of these: beginning, end!")
+
+        self.path = path
+        self.state_dir = state_dir
+        self.index_col = index_col
+        self.file_format = file_format if file_format is not None else self.__infer_format(path=path)
+        self.batch_rows = batch_rows
+        self.checkpoint_every = checkpoint_every
+        self.poll_interval = poll_interval
+        self.detector = self.__restore_detector(detector=detector)
+
+        if self.detector.anomaly_threshold is None:
+            raise ValueError("The detector has no `anomaly_threshold`! Call `compute_anomaly_threshold()` first!")
+
+        self.__committed_cursor: dict = self.__restore_cursor(start=start)
+        self.offset: int = self.__committed_cursor["offset"]
+        self.rows_read: int = self.__committed_cursor["rows_read"]
+        self.__inode: int | None = self.__committed_cursor["inode"]
+        self.__header: list[str] | None = self.__committed_cursor["header"]
+        self.__uncommitted_batches: int = 0
+
+    def __infer_format(self, path: str) -> Literal["csv", "ndjson"]:
+        if path.endswith((".ndjson", ".jsonl")):
+            return "ndjson"
+        elif path.endswith((".csv", ".txt")):
+            return "csv"
+        raise ValueError(
+            "The `file_format` can't be inferred from the extension of `path`, set it to 'csv' or 'ndjson'!"
+        )
+
+    def __restore_detector(self, detector: POTDetecto | None) -> POTDetecto:
+        """
+        Load the checkpointed detector of `state_dir`, or use the given detector if there is no checkpoint yet.
+
+        # Parameters
+        ------------
+            * detector (POTDetecto | None): The fitted detector of the first run.
+
+        # Returns
+        ------------
+            * POTDetecto: The detector to update.
+        """
+        detector_path = os_path.join(self.state_dir, DETECTOR_DIR)
+
+        if os_path.isdir(detector_path):
+            return POTDetecto.load(
+                path=detector_path, mmap_mode=None, recorder=None if detector is None else detector.recorder
+            )
+
+        if detector is None:
+            raise ValueError(f"There is no checkpoint in `{self.state_dir}`, the `detector` parameter can't be None!")
+        return detector
+
+    def __restore_cursor(self, start: Literal["beginning", "end"]) -> dict:
+        """
+        Load the checkpointed cursor that matches the rows of the detector, or start a new cursor.
+
+        # Parameters
+        ------------
+            * start (Literal["beginning", "end"]): Where a new cursor starts, "end" skips the lines already in the file.
+
+        # Returns
+        ------------
+            * dict: The "offset", "rows_read", "inode", and "header" of the cursor, and the "detector_rows" it belongs to.
+        """
+        detector_rows = self.detector.anomaly_score_dataset.shape[0]  # type: ignore
+        cursor_path = os_path.join(self.state_dir, CURSOR_DIR)
+
+        if os_path.isdir(cursor_path):
+            (_, metadata) = read_store(path=cursor_path, mmap_mode=None)
+
+            if metadata.get("format_version") != self.FORMAT_VERSION:
+                raise ValueError(f"`{cursor_path}` is not a cursor of format version {self.FORMAT_VERSION}!")
+
+            for cursor in (metadata["cursor"], metadata["previous_cursor"]):
+                if cursor is not None and cursor["detector_rows"] == detector_rows:
+                    return cursor
+            raise ValueError(f"The cursor in `{cursor_path}` doesn't match the rows of the detector!")
+
+        cursor = {"offset": 0, "rows_read": 0, "inode": None, "header": None, "detector_rows": detector_rows}
+
+        if start == "end" and os_path.isfile(self.path):
+            with open(self.path, "rb") as file:
+                cursor["inode"] = fstat(file.fileno()).st_ino
+                cursor["header"] = self.__read_header(file=file) if self.file_format == "csv" else None
+                if self.file_format == "ndjson" or cursor["header"] is not None:
+                    cursor["offset"] = self.__last_line_end(file=file)
+        return cursor
+
+    def __read_header(self, file: BinaryIO) -> list[str] | None:
+        """
+        Read the header line of a CSV file.
+
+        # Parameters
+        ------------
+            * file (BinaryIO): The file opened at its start.
+
+        # Returns
+        ------------
+            * list[str] | None: The column names, or None if the header line isn't complete yet.
+        """
+        line = file.readline()
+        if not line.endswith(b"\n"):
+            return None
+        return list(read_csv(BytesIO(line), nrows=0).columns)
+
+    def __last_line_end(self, file) -> int:  # type: ignore
+        """
+        Find the offset after the last complete line of a file.
+
+        # Parameters
+        ------------
+            * file (BinaryIO): The opened file.
+
+        # Returns
+        ------------
+            * int: The offset after the last newline, 0 if there is none.
+        """
+        size = file.seek(0, 2)
+        position = size
+
+        while position > 0:
+            block_start = max(position - (1 << 16), 0)
+            file.seek(block_start)
+            block = file.read(position - block_start)
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                return block_start + newline + 1
+            position = block_start
+        return 0
+
+    def __new_lines(self) -> Iterator[tuple[list[bytes], int]]:
+        """
+        Read the complete lines after `offset` in batches, a truncated or replaced file is read from its start.
+
+        # Returns
+        ------------
+            * Iterator[tuple[list[bytes], int]]: The non-empty lines of every batch and the offset after its last line.
+        """
+        if not os_path.isfile(self.path):
+            return
+
+        with open(self.path, "rb") as file:
+            status = fstat(file.fileno())
+
+            if status.st_ino != self.__inode or status.st_size < self.offset:
+                if self.__inode is not None:
+                    self.detector.recorder.increment(counter="files_rotated")
+                self.offset = 0
+                self.__inode = status.st_ino
+                self.__header = None
+
+            file.seek(self.offset)
+
+            if self.file_format == "csv" and self.__header is None:
+                self.__header = self.__read_header(file=file)
+                if self.__header is None:
+                    return
+                self.offset = file.tell()
+
+            lines: list[bytes] = []
+            end_offset = self.offset
+
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+
+                end_offset += len(line)
+                if len(line.strip()) > 0:
+                    lines.append(line)
+
+                if len(lines) == self.batch_rows:
+                    yield (lines, end_offset)
+                    lines = []
+
+            if len(lines) > 0 or end_offset > self.offset:
+                yield (lines, end_offset)
+
+    def __parse(self, lines: list[bytes]) -> DataFrame:
+        """
+        Parse a batch of lines into the features of the detector.
+
+        # Parameters
+        ------------
+            * lines (list[bytes]): The complete CSV or NDJSON lines.
+
+        # Returns
+        ------------
+            * DataFrame: The float64 rows, indexed by `index_col` or by the row number in the file.
+        """
+        try:
+            if self.file_format == "csv":
+                dataset = read_csv(BytesIO(b"".join(lines)), names=self.__header, header=None)
+            else:
+                dataset = DataFrame.from_records(data=[loads(line) for line in lines])
+
+            if self.index_col is not None:
+                dataset = dataset.set_index(self.index_col)
+                dataset.index = to_datetime(dataset.index)
+            else:
+                dataset.index = RangeIndex(start=self.rows_read, stop=self.rows_read + dataset.shape[0])
+
+            return dataset[list(self.detector.exceedance_dataset.columns)].astype(float64)  # type: ignore
+        except Exception as e:
+            print(e)
+            raise
+
+    def __score(self, dataset: DataFrame) -> DataFrame:
+        """
+        Update the detector with a batch and select its anomalous rows.
+
+        # Parameters
+        ------------
+            * dataset (DataFrame): The parsed rows.
+
+        # Returns
+        ------------
+            * DataFrame: The "total_anomaly_score" of the rows above `anomaly_threshold`, indexed like `dataset`.
+        """
+        self.detector.update(dataset=dataset)
+        total_anomaly_scores = self.detector.anomaly_score_dataset["total_anomaly_score"].to_numpy()[-dataset.shape[0] :]  # type: ignore
+        is_anomaly = total_anomaly_scores > self.detector.anomaly_threshold
+
+        self.detector.recorder.increment(counter="rows_followed", value=dataset.shape[0])
+        self.detector.recorder.increment(counter="anomalies_emitted", value=int(is_anomaly.sum()))
+        return DataFrame(
+            data={"total_anomaly_score": total_anomaly_scores[is_anomaly]}, index=dataset.index[is_anomaly]
+        )
+
+    def batches(self) -> Iterator[DataFrame]:
+        """
+        Score the complete lines appended since the last poll, batch by batch.
+
+        # Returns
+        ------------
+            * Iterator[DataFrame]: The anomalies of every scored batch as soon as it is scored, possibly empty.
+        """
+        for lines, end_offset in self.__new_lines():
+            anomalies = None
+
+            if len(lines) > 0:
+                dataset = self.__parse(lines=lines)
+                anomalies = self.__score(dataset=dataset)
+                self.rows_read += dataset.shape[0]
+                self.__uncommitted_batches += 1
+
+            self.offset = end_offset
+
+            if self.__uncommitted_batches >= self.checkpoint_every:
+                self.checkpoint()
+
+            if anomalies is not None:
+                yield anomalies
+
+    def poll(self) -> DataFrame:
+        """
+        Score all complete lines appended since the last poll.
+
+        # Returns
+        ------------
+            * DataFrame: The "total_anomaly_score" of all anomalous new rows.
+        """
+        anomalies = list(self.batches())
+        if len(anomalies) == 0:
+            return DataFrame(data={"total_anomaly_score": []}, dtype=float64)
+        return concat(anomalies)
+
+    def follow(self, stop: Event | None = None) -> Iterator[DataFrame]:
+        """
+        Follow the file until `stop` is set, waiting `poll_interval` seconds whenever there are no new lines.
+
+        # Parameters
+        ------------
+            * stop (Event | None): The event that ends the loop, default is None that follows forever.
+
+        # Returns
+        ------------
+            * Iterator[DataFrame]: The anomalies of every batch that has any, as they occur.
+        """
+        while stop is None or not stop.is_set():
+            rows_read = self.rows_read
+
+            for anomalies in self.batches():
+                if anomalies.shape[0] > 0:
+                    yield anomalies
+                if stop is not None and stop.is_set():
+                    return
+
+            if self.rows_read == rows_read:
+                if stop is None:
+                    sleep(self.poll_interval)
+                else:
+                    stop.wait(timeout=self.poll_interval)
+
+        if self.__uncommitted_batches > 0:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """
+        Persist the cursor and the detector into `state_dir`.
+
+        # Returns
+        ------------
+            * None: The cursor with the previous and the next position is written first, then the detector.
+        """
+        cursor = {
+            "offset": self.offset,
+            "rows_read": self.rows_read,
+            "inode": self.__inode,
+            "header": self.__header,
+            "detector_rows": self.detector.anomaly_score_dataset.shape[0],  # type: ignore
+        }
+
+        with self.detector.recorder.stage(name="follower_checkpoint"):
+            write_store(
+                path=os_path.join(self.state_dir, CURSOR_DIR),
+                arrays={},
+                metadata={
+                    "format_version": self.FORMAT_VERSION,
+                    "cursor": cursor,
+                    "previous_cursor": self.__committed_cursor,
+                },
+            )
+            self.detector.save(path=os_path.join(self.state_dir, DETECTOR_DIR))
+
+        self.__committed_cursor = cursor
+        self.__uncommitted_batches = 0
+
+    def __str__(self):
+        return "Tail Follower"
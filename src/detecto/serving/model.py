@@ -0,0 +1,220 @@
+from dataclasses import dataclass, field
+
+from numpy import (
+    array,
+    asarray,
+    copyto,
+    divide,
+    errstate,
+    exp,
+    float64,
+    inf,
+    isnan,
+    log1p,
+    multiply,
+    ndarray,
+    subtract,
+    zeros,
+)
+from pandas import DataFrame
+
+from src.detecto.io.store import read_store, write_store
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class POTScoringModel:
+    """
+    POTScoringModel class, the frozen inference part of a fitted `POTDetecto`, exported with `POTDetecto.to_scoring_model()`.
+
+    Every feature has 1 exceedance threshold and the GPD params of its last fitted cell, so a new row is scored without refitting: the
+    anomaly score of a feature is the inverted GPD p-value of its exceedance, 0 without exceedance, and the total anomaly score of a row is
+    their sum like in `fit()`. The arrays are read-only and the attributes can't be reassigned, a scoring call only allocates its own
+    outputs, so 1 model is safely shared by many threads.
+
+    # Attributes
+    ------------
+        * features (tuple[str, ...]): The feature names in the column order of the arrays.
+        * thresholds (ndarray): The exceedance threshold per feature.
+        * c (ndarray): The fitted GPD shape parameter per feature, NaN for a feature without exceedances.
+        * scale (ndarray): The fitted GPD scale parameter per feature, NaN for a feature without exceedances, the loc is always 0.
+        * anomaly_threshold (float | None): The threshold of the total anomaly score for `predict()`, default is None.
+    """
+
+    FORMAT_VERSION = 1
+
+    features: tuple[str, ...]
+    thresholds: ndarray
+    c: ndarray
+    scale: ndarray
+    anomaly_threshold: float | None = None
+    _inverse_c: ndarray = field(init=False, repr=False)
+    _is_exponential: ndarray = field(init=False, repr=False)
+    _is_fitted: ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        arrays = {
+            "thresholds": array(self.thresholds, dtype=float64),
+            "c": array(self.c, dtype=float64),
+            "scale": array(self.scale, dtype=float64),
+        }
+        features = tuple(str(feature) for feature in self.features)
+
+        if any(values.shape != (len(features),) for values in arrays.values()):
+            raise ValueError("The `thresholds`, `c`, and `scale` parameters need 1 value per feature!")
+
+        is_fitted = (arrays["scale"] > 0.0) & ~isnan(arrays["c"])
+        is_exponential = is_fitted & (arrays["c"] == 0.0)
+        inverse_c = zeros(shape=len(features))
+        divide(1.0, arrays["c"], out=inverse_c, where=is_fitted & ~is_exponential)
+        arrays.update({"_inverse_c": inverse_c, "_is_exponential": is_exponential, "_is_fitted": is_fitted})
+
+        for name, values in arrays.items():
+            values.flags.writeable = False
+            object.__setattr__(self, name, values)
+        object.__setattr__(self, "features", features)
+        object.__setattr__(
+            self, "anomaly_threshold", None if self.anomaly_threshold is None else float(self.anomaly_threshold)
+        )
+
+    def __values(self, batch: DataFrame | ndarray) -> ndarray:
+        """
+        Get the batch as a 2D float64 array in the feature order of the model, without copying it if possible.
+
+        # Parameters
+        ------------
+            * batch (DataFrame | ndarray): The rows to score, a DataFrame needs all features, an array needs their order.
+
+        # Returns
+        ------------
+            * ndarray: The (rows, features) values.
+        """
+        if isinstance(batch, DataFrame):
+            missing_features = [feature for feature in self.features if feature not in batch.columns]
+            if len(missing_features) > 0:
+                raise ValueError(f"The `batch` parameter has no feature {', '.join(missing_features)}!")
+            batch = batch[list(self.features)].to_numpy(dtype=float64)
+
+        values = asarray(batch, dtype=float64)
+        values = values.reshape(1, -1) if values.ndim == 1 else values
+
+        if values.ndim != 2 or values.shape[1] != len(self.features):
+            raise ValueError(f"The `batch` parameter needs {len(self.features)} features per row!")
+        return values
+
+    def score_features(self, batch: DataFrame | ndarray) -> ndarray:
+        """
+        Calculate the anomaly score of every feature of every row.
+
+        # Parameters
+        ------------
+            * batch (DataFrame | ndarray): The rows to score, 1 row can be a 1D array.
+
+        # Returns
+        ------------
+            * ndarray: The (rows, features) anomaly scores, infinite beyond the support of the GPD, 0 without exceedance.
+        """
+        values = self.__values(batch=batch)
+
+        with errstate(divide="ignore", invalid="ignore", over="ignore"):
+            exceedances = subtract(values, self.thresholds)
+            has_exceedance = exceedances > 0.0
+            has_exceedance &= self._is_fitted
+            divide(exceedances, self.scale, out=exceedances)
+
+            log_scores = multiply(exceedances, self.c)
+            log1p(log_scores, out=log_scores)
+            multiply(log_scores, self._inverse_c, out=log_scores)
+            copyto(log_scores, exceedances, where=self._is_exponential)
+            copyto(log_scores, inf, where=isnan(log_scores))
+            exp(log_scores, out=log_scores)
+
+        copyto(log_scores, 0.0, where=~has_exceedance)
+        return log_scores
+
+    def score(self, batch: DataFrame | ndarray) -> ndarray:
+        """
+        Calculate the total anomaly score of every row.
+
+        # Parameters
+        ------------
+            * batch (DataFrame | ndarray): The rows to score, 1 row can be a 1D array.
+
+        # Returns
+        ------------
+            * ndarray: The total anomaly score per row.
+        """
+        return self.score_features(batch=batch).sum(axis=1)
+
+    def predict(self, batch: DataFrame | ndarray) -> ndarray:
+        """
+        Flag the rows whose total anomaly score is above the anomaly threshold, like `POTDetecto.detect()`.
+
+        # Parameters
+        ------------
+            * batch (DataFrame | ndarray): The rows to flag, 1 row can be a 1D array.
+
+        # Returns
+        ------------
+            * ndarray: `True` per anomalous row.
+        """
+        if self.anomaly_threshold is None:
+            raise ValueError(
+                "The model has no `anomaly_threshold`! Call `compute_anomaly_threshold()` before exporting it!"
+            )
+
+        return self.score(batch=batch) > self.anomaly_threshold
+
+    def save(self, path: str) -> str:
+        """
+        Save the model as a store of `src.detecto.io.store`.
+
+        # Parameters
+        ------------
+            * path (str): The directory to save the model into, an existing model is replaced atomically.
+
+        # Returns
+        ------------
+            * str: The path of the saved model.
+        """
+        return write_store(
+            path=path,
+            arrays={"thresholds": self.thresholds, "c": self.c, "scale": self.scale},
+            metadata={
+                "format_version": self.FORMAT_VERSION,
+                "detector": "pot_scoring",
+                "features": list(self.features),
+                "anomaly_threshold": self.anomaly_threshold,
+            },
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "POTScoringModel":
+        """
+        Load a model saved with `save()`.
+
+        # Parameters
+        ------------
+            * path (str): The directory of the saved model.
+
+        # Returns
+        ------------
+            * POTScoringModel: The frozen model.
+        """
+        (arrays, metadata) = read_store(path=path, mmap_mode=None)
+
+        if metadata.get("detector") != "pot_scoring" or metadata.get("format_version") != cls.FORMAT_VERSION:
+            raise ValueError(f"`{path}` is not a POT scoring model of format version {cls.FORMAT_VERSION}!")
+
+        return cls(
+            features=tuple(metadata["features"]),
+            thresholds=arrays["thresholds"],
+            c=arrays["c"],
+            scale=arrays["scale"],
+            anomaly_threshold=metadata["anomaly_threshold"],
+        )
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def __str__(self):
+        return "POT Scoring Model"
@@ -0,0 +1,553 @@
+from asyncio import (
+    AbstractEventLoop,
+    Future,
+    get_running_loop,
+    IncompleteReadError,
+    LimitOverrunError,
+    run,
+    Server,
+    start_server,
+    StreamReader,
+    StreamWriter,
+    Task,
+    TimerHandle,
+)
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from http import HTTPStatus
+from json import dumps, loads
+from math import ceil, isfinite
+from time import perf_counter
+
+from numpy import full, nan, ndarray, vstack
+
+from src.detecto.instrumentation.recorder import Recorder
+from src.detecto.io.store import read_store
+from src.detecto.models.detectors.pot import POTDetecto
+from src.detecto.serving.model import POTScoringModel
+
+PendingBatch = list[tuple[ndarray, Future]]
+
+
+def load_scoring_model(path: str) -> POTScoringModel:
+    """
+    Load a persisted POT model for serving: a saved `POTScoringModel`, or a saved `POTDetecto` that is exported on load.
+
+    # Parameters
+    ------------
+        * path (str): The directory of the saved model.
+
+    # Returns
+    ------------
+        * POTScoringModel: The frozen model, it needs an `anomaly_threshold`.
+    """
+    (_, metadata) = read_store(path=path)
+
+    if metadata.get("detector") == "pot_scoring":
+        return POTScoringModel.load(path=path)
+    return POTDetecto.load(path=path).to_scoring_model()
+
+
+class ScoringServer:
+    """
+    ScoringServer class, an asyncio HTTP/1.1 server of the standard library that scores observations with a frozen `POTScoringModel`.
+
+    `POST /score` takes a JSON object of feature values, a JSON list of them, or NDJSON with 1 object per line, a list of 1 value per
+    feature is accepted instead of an object and a missing feature is not scored. The rows of all requests that arrive within
+    `batch_window` seconds are scored in 1 vectorized call in a worker thread and every request gets its own "total_anomaly_score" and
+    "is_anomaly" back, as JSON lists or as NDJSON for an NDJSON request, an infinite score is `null`. `GET /metrics` returns the
+    counters, the latency histogram and percentiles, and the throughput, `GET /health` returns "ok".
+
+    # Attributes
+    ------------
+        * model (POTScoringModel): The frozen model with an `anomaly_threshold`.
+        * host (str): The interface to listen on, default is "127.0.0.1".
+        * port (int): The port to listen on, 0 picks a free port, see `address`, default is 0.
+        * batch_window (float): The seconds the first request of a micro-batch waits for more requests, default is 0.005.
+        * max_batch_rows (int): The rows that flush a micro-batch before the window ends, default is 4096.
+        * max_body_bytes (int): The largest accepted request body, larger requests get "413 Payload Too Large", default is 16 MiB.
+        * recorder (Recorder): The counters "requests", "rows_scored", "batches", and "bad_requests", and the histograms
+            "request_latency_ms" and "batch_rows".
+    """
+
+    def __init__(
+        self,
+        model: POTScoringModel,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        batch_window: float = 0.005,
+        max_batch_rows: int = 4096,
+        max_body_bytes: int = 16 * 1024 * 1024,
+    ) -> None:
+        if model.anomaly_threshold is None:
+            raise ValueError(
+                "The model has no `anomaly_threshold`! Call `compute_anomaly_threshold()` before exporting it!"
+            )
+
+        if batch_window < 0.0 or max_batch_rows < 1:
+            raise ValueError("`batch_window` can't be negative and `max_batch_rows` must be at least 1!")
+
+        self.model = model
+        self.host = host
+        self.port = port
+        self.batch_window = batch_window
+        self.max_batch_rows = max_batch_rows
+        self.max_body_bytes = max_body_bytes
+        self.recorder = Recorder()
+        self.__feature_positions = {feature: position for position, feature in enumerate(model.features)}
+        self.__server: Server | None = None
+        self.__executor: ThreadPoolExecutor | None = None
+        self.__loop: AbstractEventLoop | None = None
+        self.__pending: PendingBatch = []
+        self.__pending_rows = 0
+        self.__flush_handle: TimerHandle | None = None
+        self.__tasks: set[Task] = set()
+        self.__writers: set[StreamWriter] = set()
+        self.__started_at = 0.0
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """
+        Get the address the server listens on.
+
+        # Returns
+        ------------
+            * tuple[str, int]: The host and the bound port.
+        """
+        if self.__server is None:
+            raise ValueError("The server is not started! Call `start()` first!")
+
+        (host, port) = self.__server.sockets[0].getsockname()[:2]
+        return (host, port)
+
+    @property
+    def metrics(self) -> dict[str, dict | float]:
+        """
+        Get the latency and throughput of the server since `start()`.
+
+        # Returns
+        ------------
+            * dict[str, dict | float]: The "counters" and "histograms" of `recorder`, the "latency_ms" percentiles "p50", "p90", "p99", and
+                "max", the "uptime_seconds", and the "requests_per_second" and "rows_per_second".
+        """
+        report = self.recorder.report()
+        uptime = max(perf_counter() - self.__started_at, 1e-9) if self.__started_at > 0.0 else 0.0
+        latencies = report["histograms"].get("request_latency_ms", {})
+
+        return {
+            "counters": report["counters"],
+            "histograms": report["histograms"],
+            "latency_ms": {
+                "p50": self.__percentile(histogram=latencies, q=0.50),
+                "p90": self.__percentile(histogram=latencies, q=0.90),
+                "p99": self.__percentile(histogram=latencies, q=0.99),
+                "max": float(max(latencies)) if len(latencies) > 0 else 0.0,
+            },
+            "uptime_seconds": uptime,
+            "requests_per_second": report["counters"].get("requests", 0) / uptime if uptime > 0.0 else 0.0,
+            "rows_per_second": report["counters"].get("rows_scored", 0) / uptime if uptime > 0.0 else 0.0,
+        }
+
+    def __percentile(self, histogram: dict[int, int], q: float) -> float:
+        """
+        Get a percentile of a histogram of the recorder.
+
+        # Parameters
+        ------------
+            * histogram (dict[int, int]): The number of observations per value.
+            * q (float): The quantile, range values are 0.0 - 1.0.
+
+        # Returns
+        ------------
+            * float: The smallest value with at least q of the observations at or below it, 0 without observations.
+        """
+        total = sum(histogram.values())
+        seen = 0
+
+        for value in sorted(histogram):
+            seen += histogram[value]
+            if seen >= q * total:
+                return float(value)
+        return 0.0
+
+    async def start(self) -> None:
+        """
+        Start listening, the connections are served on the running event loop.
+
+        # Returns
+        ------------
+            * None: The server accepts connections until `close()`.
+        """
+        self.__loop = get_running_loop()
+        self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="detecto-scoring")
+        self.__server = await start_server(self.__handle, host=self.host, port=self.port)
+        self.__started_at = perf_counter()
+
+    async def serve_forever(self) -> None:
+        """
+        Start the server if needed and serve until the task is cancelled.
+
+        # Returns
+        ------------
+            * None: The server is closed on cancellation.
+        """
+        if self.__server is None:
+            await self.start()
+
+        try:
+            await self.__server.serve_forever()  # type: ignore
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """
+        Stop listening, close the open connections, and score the pending micro-batch.
+
+        # Returns
+        ------------
+            * None: The server and its scoring thread are released.
+        """
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+            self.__server = None
+
+        if len(self.__pending) > 0:
+            self.__flush()
+
+        for task in list(self.__tasks):
+            with suppress(Exception):
+                await task
+
+        for writer in list(self.__writers):
+            writer.close()
+
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+
+    async def __aenter__(self) -> "ScoringServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
+
+    async def score(self, rows: ndarray) -> tuple[ndarray, ndarray]:
+        """
+        Score rows within the next micro-batch.
+
+        # Parameters
+        ------------
+            * rows (ndarray): The (rows, features) values in the feature order of the model.
+
+        # Returns
+        ------------
+            * tuple[ndarray, ndarray]: The total anomaly score and the anomaly flag per row.
+        """
+        future: Future = self.__loop.create_future()  # type: ignore
+        self.__pending.append((rows, future))
+        self.__pending_rows += rows.shape[0]
+
+        if self.__pending_rows >= self.max_batch_rows:
+            self.__flush()
+        elif self.__flush_handle is None:
+            self.__flush_handle = self.__loop.call_later(self.batch_window, self.__flush)  # type: ignore
+        return await future
+
+    def __flush(self) -> None:
+        """
+        Hand the pending requests over to a scoring task and start the next micro-batch.
+
+        # Returns
+        ------------
+            * None: The scoring task resolves the future of every pending request.
+        """
+        if self.__flush_handle is not None:
+            self.__flush_handle.cancel()
+            self.__flush_handle = None
+
+        (pending, self.__pending, self.__pending_rows) = (self.__pending, [], 0)
+        task = self.__loop.create_task(self.__score_batch(pending=pending))  # type: ignore
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    async def __score_batch(self, pending: PendingBatch) -> None:
+        """
+        Score the rows of all pending requests in 1 vectorized call in the scoring thread.
+
+        # Parameters
+        ------------
+            * pending (PendingBatch): The rows and the future of every request of the micro-batch.
+
+        # Returns
+        ------------
+            * None: Every future gets the slices of its rows, or the exception of the scoring call.
+        """
+        batch = vstack([rows for (rows, _) in pending])
+
+        try:
+            scores = await self.__loop.run_in_executor(self.__executor, self.model.score, batch)  # type: ignore
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        is_anomaly = scores > self.model.anomaly_threshold
+        self.recorder.increment(counter="batches")
+        self.recorder.increment(counter="rows_scored", value=batch.shape[0])
+        self.recorder.observe(histogram="batch_rows", value=batch.shape[0])
+
+        first_row = 0
+        for rows, future in pending:
+            last_row = first_row + rows.shape[0]
+            if not future.done():
+                future.set_result((scores[first_row:last_row], is_anomaly[first_row:last_row]))
+            first_row = last_row
+
+    async def __handle(self, reader: StreamReader, writer: StreamWriter) -> None:
+        """
+        Serve the requests of 1 connection, the connection is kept alive unless the client sends "Connection: close".
+
+        # Parameters
+        ------------
+            * reader (StreamReader): The incoming stream.
+            * writer (StreamWriter): The outgoing stream.
+
+        # Returns
+        ------------
+            * None: The connection is closed once the client closes it or the request is malformed.
+        """
+        self.__writers.add(writer)
+
+        try:
+            while True:
+                request = await self.__read_request(reader=reader)
+                if request is None:
+                    break
+
+                started_at = perf_counter()
+                (status, headers, body) = (
+                    request if isinstance(request[0], HTTPStatus) else await self.__route(*request)
+                )
+                keep_alive = status < 400 and headers.get("connection", "").lower() != "close"
+
+                writer.write(self.__response(status=status, body=body, keep_alive=keep_alive))
+                await writer.drain()
+                self.recorder.increment(counter="requests")
+                self.recorder.observe(
+                    histogram="request_latency_ms", value=int(ceil((perf_counter() - started_at) * 1000))
+                )
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, IncompleteReadError, LimitOverrunError):
+            pass
+        finally:
+            self.__writers.discard(writer)
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def __read_request(self, reader: StreamReader) -> tuple | None:
+        """
+        Read 1 HTTP/1.1 request.
+
+        # Parameters
+        ------------
+            * reader (StreamReader): The incoming stream.
+
+        # Returns
+        ------------
+            * tuple | None: The method, path, lower-case headers, and body, an error status, headers, and body for a malformed or too
+                large request, or None once the client closed the connection.
+        """
+        request_line = await reader.readline()
+        if len(request_line) == 0:
+            return None
+
+        headers: dict[str, str] = {}
+        while True:
+            header_line = (await reader.readline()).decode("latin-1").strip()
+            if len(header_line) == 0:
+                break
+            (name, _, value) = header_line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            (method, path, _) = request_line.decode("latin-1").split()
+            content_length = int(headers.get("content-length", "0"))
+        except ValueError:
+            self.recorder.increment(counter="bad_requests")
+            return (HTTPStatus.BAD_REQUEST, headers, self.__error(message="The request is malformed!"))
+
+        if content_length > self.max_body_bytes:
+            self.recorder.increment(counter="bad_requests")
+            return (
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                headers,
+                self.__error(message="The request body is too large!"),
+            )
+
+        body = await reader.readexactly(content_length) if content_length > 0 else b""
+        return (method, path.split("?")[0], headers, body)
+
+    async def __route(
+        self, method: str, path: str, headers: dict[str, str], body: bytes
+    ) -> tuple[HTTPStatus, dict[str, str], tuple[str, bytes]]:
+        """
+        Dispatch 1 request to its endpoint.
+
+        # Parameters
+        ------------
+            * method (str): The HTTP method.
+            * path (str): The path without query string.
+            * headers (dict[str, str]): The lower-case request headers.
+            * body (bytes): The request body.
+
+        # Returns
+        ------------
+            * tuple[HTTPStatus, dict[str, str], tuple[str, bytes]]: The status, the request headers, and the content type and body.
+        """
+        if path == "/health" and method == "GET":
+            return (HTTPStatus.OK, headers, ("text/plain", b"ok"))
+
+        if path == "/metrics" and method == "GET":
+            return (HTTPStatus.OK, headers, ("application/json", dumps(self.metrics).encode()))
+
+        if path != "/score":
+            return (HTTPStatus.NOT_FOUND, headers, self.__error(message=f"There is no endpoint `{path}`!"))
+
+        if method != "POST":
+            return (HTTPStatus.METHOD_NOT_ALLOWED, headers, self.__error(message="Only POST can score!"))
+
+        is_ndjson = "ndjson" in headers.get("content-type", "")
+
+        try:
+            rows = self.__rows(observations=self.__observations(body=body, is_ndjson=is_ndjson))
+        except (ValueError, TypeError) as e:
+            self.recorder.increment(counter="bad_requests")
+            return (HTTPStatus.BAD_REQUEST, headers, self.__error(message=str(e)))
+
+        (scores, is_anomaly) = await self.score(rows=rows) if rows.shape[0] > 0 else (rows[:, 0], rows[:, 0] > 0.0)
+        total_anomaly_scores = [float(score) if isfinite(score) else None for score in scores.tolist()]
+
+        if is_ndjson:
+            lines = [
+                dumps({"total_anomaly_score": score, "is_anomaly": flag})
+                for score, flag in zip(total_anomaly_scores, is_anomaly.tolist())
+            ]
+            return (HTTPStatus.OK, headers, ("application/x-ndjson", "".join(f"{line}\n" for line in lines).encode()))
+
+        return (
+            HTTPStatus.OK,
+            headers,
+            (
+                "application/json",
+                dumps({"total_anomaly_score": total_anomaly_scores, "is_anomaly": is_anomaly.tolist()}).encode(),
+            ),
+        )
+
+    def __observations(self, body: bytes, is_ndjson: bool) -> list:
+        """
+        Parse the observations of a JSON or NDJSON body.
+
+        # Parameters
+        ------------
+            * body (bytes): The request body.
+            * is_ndjson (bool): Whether the body has 1 JSON observation per line.
+
+        # Returns
+        ------------
+            * list: The observations.
+        """
+        if is_ndjson:
+            return [loads(line) for line in body.splitlines() if len(line.strip()) > 0]
+
+        observations = loads(body)
+        return (
+            observations
+            if isinstance(observations, list) and not self.__is_value_list(observations)
+            else [observations]
+        )
+
+    def __is_value_list(self, observation: list) -> bool:
+        return len(observation) > 0 and not isinstance(observation[0], (dict, list))
+
+    def __rows(self, observations: list) -> ndarray:
+        """
+        Convert the observations into rows in the feature order of the model.
+
+        # Parameters
+        ------------
+            * observations (list): Objects of feature values or lists of 1 value per feature, unknown keys are ignored.
+
+        # Returns
+        ------------
+            * ndarray: The (observations, features) rows, NaN for a missing or null value.
+        """
+        rows = full(shape=(len(observations), len(self.model.features)), fill_value=nan)
+
+        for row, observation in enumerate(observations):
+            if isinstance(observation, dict):
+                for feature, value in observation.items():
+                    position = self.__feature_positions.get(feature)
+                    if position is not None and value is not None:
+                        rows[row, position] = float(value)
+            elif isinstance(observation, list) and len(observation) == len(self.model.features):
+                rows[row] = [nan if value is None else float(value) for value in observation]
+            else:
+                raise ValueError(
+                    "Every observation needs to be an object of feature values or a list of 1 value per feature!"
+                )
+        return rows
+
+    def __error(self, message: str) -> tuple[str, bytes]:
+        return ("application/json", dumps({"error": message}).encode())
+
+    def __response(self, status: HTTPStatus, body: tuple[str, bytes], keep_alive: bool) -> bytes:
+        """
+        Build an HTTP/1.1 response.
+
+        # Parameters
+        ------------
+            * status (HTTPStatus): The status of the response.
+            * body (tuple[str, bytes]): The content type and the body.
+            * keep_alive (bool): Whether the connection stays open.
+
+        # Returns
+        ------------
+            * bytes: The status line, the headers, and the body.
+        """
+        (content_type, content) = body
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(content)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        return head.encode("latin-1") + content
+
+    def __str__(self):
+        return "Scoring Server"
+
+
+def run_server(path: str, host: str = "127.0.0.1", port: int = 8080, batch_window: float = 0.005) -> None:
+    """
+    Load a persisted POT model and serve it until interrupted.
+
+    # Parameters
+    ------------
+        * path (str): The directory of a saved `POTScoringModel` or `POTDetecto`.
+        * host (str): The interface to listen on, default is "127.0.0.1".
+        * port (int): The port to listen on, default is 8080.
+        * batch_window (float): The seconds the first request of a micro-batch waits for more requests, default is 0.005.
+
+    # Returns
+    ------------
+        * None: The server runs until the process is interrupted.
+    """
+    server = ScoringServer(model=load_scoring_model(path=path), host=host, port=port, batch_window=batch_window)
+    with suppress(KeyboardInterrupt):
+        run(server.serve_forever())
@@ -1,46 +1,152 @@
-from numpy import quantile
-from pandas import DataFrame
+from numpy import float64, ndarray, quantile, zeros
+from pandas import DataFrame, Series
 from scipy.stats import genpareto
 
+from src.detecto.io.cache import StageCache
+from src.detecto.io.datasets import is_column_backed, map_columns, to_frame
+from src.detecto.models.detectors.pot import _gpd_params_values
 
-def compute_pot_threshold(dataset: DataFrame, t0: int, q: float = 0.99) -> DataFrame:
+
+def compute_pot_threshold(
+    dataset: DataFrame | ndarray | object, t0: int, q: float = 0.99, cache: StageCache | None = None
+) -> DataFrame:
     """
     Calculate the exceedance threshold for each feature in the dataset.
 
+    A memory-mapped dataset, a PyArrow Table, or a DataFrame with Arrow-backed dtypes is processed 1 column at a time without copying it.
+
     # Parameters
     ------------
-        * dataset (DataFrame): The dataset to calculate the threshold for.
+        * dataset (DataFrame | ndarray | pyarrow.Table): The dataset to calculate the threshold for.
         * t0 (int): The minimum timeframe of observation to have a value, otherwise `np.NaN`.
         * q (float): The quantile to use for thresholding.
+        * cache (StageCache | None): The on-disk cache to reuse the threshold of the same dataset and parameters from, default is None.
+
+    # Returns
+    ------------
+        * DataFrame: The threshold for each feature.
+    """
+    dataset = to_frame(dataset=dataset)
+
+    if cache is None:
+        return __pot_threshold(dataset=dataset, t0=t0, q=q)
+
+    cache_key = cache.fingerprint(stage="compute_pot_threshold", datasets=[dataset], params={"t0": t0, "q": q})
+    cache_entry = cache.get(key=cache_key)
+
+    if cache_entry is not None:
+        return DataFrame(
+            data=cache_entry[0]["pot_threshold"], index=dataset.index, columns=dataset.columns, copy=False
+        )
+
+    pot_threshold_dataset = __pot_threshold(dataset=dataset, t0=t0, q=q)
+    cache.put(key=cache_key, arrays={"pot_threshold": pot_threshold_dataset.to_numpy(dtype=float64)}, metadata={})
+    return pot_threshold_dataset
+
+
+def __pot_threshold(dataset: DataFrame, t0: int, q: float) -> DataFrame:
+    """
+    Calculate the expanding quantile of every feature, 1 column at a time for memory-mapped and Arrow-backed datasets.
+
+    # Parameters
+    ------------
+        * dataset (DataFrame): The dataset to calculate the threshold for.
+        * t0 (int): The minimum timeframe of observation to have a value.
+        * q (float): The quantile to use for thresholding.
 
     # Returns
     ------------
         * DataFrame: The threshold for each feature.
     """
-    return dataset.expanding(min_periods=t0).quantile(q=q).bfill()
+    if not is_column_backed(dataset=dataset):
+        return dataset.expanding(min_periods=t0).quantile(q=q).bfill()
+
+    return map_columns(
+        dataset=dataset,
+        function=lambda _, values: Series(data=values).expanding(min_periods=t0).quantile(q=q).bfill().to_numpy(),
+    )
+
+
+def __pot_data(
+    dataset: DataFrame, pot_threshold_dataset: DataFrame, fill_value: float | None, clip_lower: float | None
+) -> DataFrame:
+    """
+    Subtract the thresholds from the dataset, 1 column at a time for memory-mapped and Arrow-backed datasets.
+
+    # Parameters
+    ------------
+        * dataset (DataFrame): The original dataset to compare against thresholds.
+        * pot_threshold_dataset (DataFrame): The DataFrame with POT thresholds to compute the exceedances.
+        * fill_value (float | None): Value to fill missing entries with before comparison.
+        * clip_lower (float | None): Minimum value to clip data to after subtraction.
+
+    # Returns
+    ------------
+        * DataFrame: The dataset with values exceeding the thresholds.
+    """
+    if not is_column_backed(dataset=dataset) or not dataset.columns.equals(pot_threshold_dataset.columns):
+        return dataset.subtract(pot_threshold_dataset, fill_value=fill_value).clip(lower=clip_lower)
+
+    return map_columns(
+        dataset=dataset,
+        function=lambda position, values: Series(data=values)
+        .subtract(Series(data=pot_threshold_dataset.iloc[:, position].to_numpy()), fill_value=fill_value)
+        .clip(lower=clip_lower)
+        .to_numpy(),
+    )
 
 
 def extract_pot_data(
-    dataset: DataFrame,
+    dataset: DataFrame | ndarray | object,
     pot_threshold_dataset: DataFrame,
     fill_value: float | None = 0.0,
     clip_lower: float | None = 0.0,
+    cache: StageCache | None = None,
 ) -> DataFrame:
     """
     Extract values from the dataset that exceed the threshold values.
 
+    Like `compute_pot_threshold()`, a memory-mapped or Arrow-backed dataset is processed 1 column at a time.
+
     # Parameters
     ------------
-        * dataset (DataFrame): The original dataset to compare against thresholds.
+        * dataset (DataFrame | ndarray | pyarrow.Table): The original dataset to compare against thresholds.
         * pot_threshold_dataset (DataFrame): The DataFrame with POT thresholds to compute the exceedances.
         * fill_value (float | None): Value to fill missing entries with before comparison.
         * clip_lower (float | None): Minimum value to clip data to after subtraction.
+        * cache (StageCache | None): The on-disk cache to reuse the exceedances of the same datasets and parameters from, default is None.
 
     # Returns
     ------------
         * DataFrame: The dataset with values exceeding the thresholds.
     """
-    return dataset.subtract(pot_threshold_dataset, fill_value=fill_value).clip(lower=clip_lower)
+    dataset = to_frame(dataset=dataset)
+
+    if cache is None:
+        return __pot_data(
+            dataset=dataset, pot_threshold_dataset=pot_threshold_dataset, fill_value=fill_value, clip_lower=clip_lower
+        )
+
+    cache_key = cache.fingerprint(
+        stage="extract_pot_data",
+        datasets=[dataset, pot_threshold_dataset],
+        params={"fill_value": fill_value, "clip_lower": clip_lower},
+    )
+    cache_entry = cache.get(key=cache_key)
+
+    if cache_entry is not None:
+        (arrays, metadata) = cache_entry
+        return DataFrame(data=arrays["pot_data"], index=dataset.index, columns=metadata["columns"], copy=False)
+
+    pot_dataset = __pot_data(
+        dataset=dataset, pot_threshold_dataset=pot_threshold_dataset, fill_value=fill_value, clip_lower=clip_lower
+    )
+    cache.put(
+        key=cache_key,
+        arrays={"pot_data": pot_dataset.to_numpy(dtype=float64)},
+        metadata={"columns": list(pot_dataset.columns)},
+    )
+    return pot_dataset
 
 
 def __set_gpd_params_structure(total_rows: int) -> dict[int, list]:
@@ -178,22 +284,144 @@ def set_gpd_params(
     params[row].append(data)
 
 
+def __gpd_params_to_array(
+    gpd_params: dict[int, list[dict[str, dict[str, float] | float]]], feature_names: list[str]
+) -> ndarray:
+    """
+    Pack the GPD params of `fit_pot_data()` into a dense array for the cache.
+
+    # Parameters
+    ------------
+        * gpd_params (dict[int, list[dict[str, dict[str, float] | float]]]): The GPD params and statistics per row.
+        * feature_names (list[str]): The names of the fitted features.
+
+    # Returns
+    ------------
+        * ndarray: The float64 array of shape (rows, features, 5) with c, loc, scale, p-value, and anomaly score per cell.
+    """
+    params_array = zeros(shape=(len(gpd_params), len(feature_names), 5))
+
+    for row, row_params in gpd_params.items():
+        for feature_index, (feature_name, data_dict) in enumerate(zip(feature_names, row_params[:-1])):
+            feature_params: dict = data_dict[feature_name]  # type: ignore
+            params_array[row, feature_index] = [
+                feature_params["gpd_params"]["c"],
+                feature_params["gpd_params"]["loc"],
+                feature_params["gpd_params"]["scale"],
+                feature_params["gpd_stats"]["p_value"],
+                feature_params["gpd_stats"]["anomaly_score"],
+            ]
+    return params_array
+
+
+def __gpd_params_from_array(
+    params_array: ndarray, feature_names: list[str], total_anomaly_scores: list[float]
+) -> dict[int, list[dict[str, dict[str, float] | float]]]:
+    """
+    Expand a dense params array of the cache into the GPD params of `fit_pot_data()`.
+
+    # Parameters
+    ------------
+        * params_array (ndarray): The (rows, features, 5) array from `__gpd_params_to_array()`.
+        * feature_names (list[str]): The names of the fitted features.
+        * total_anomaly_scores (list[float]): The total anomaly score of every row.
+
+    # Returns
+    ------------
+        * dict[int, list[dict[str, dict[str, float] | float]]]: The GPD params and statistics per row.
+    """
+    gpd_params = __set_gpd_params_structure(total_rows=params_array.shape[0])
+
+    for row in range(0, params_array.shape[0]):
+        for feature_index, feature_name in enumerate(feature_names):
+            (c, loc, scale, p_value, anomaly_score) = _gpd_params_values(values=params_array[row, feature_index])
+            set_gpd_params(
+                params=gpd_params,
+                feature_name=feature_name,
+                row=row,
+                c=c,
+                loc=loc,
+                scale=scale,
+                p_value=p_value,
+                anomaly_score=anomaly_score,
+            )
+        set_gpd_params(
+            params=gpd_params,
+            feature_name="total_anomaly_score",
+            row=row,
+            anomaly_score=total_anomaly_scores[row],
+        )
+    return gpd_params
+
+
 def fit_pot_data(
-    dataset: DataFrame, pot_dataset: DataFrame, t0: int
+    dataset: DataFrame | ndarray | object, pot_dataset: DataFrame, t0: int, cache: StageCache | None = None
 ) -> tuple[dict[int, list[dict[str, dict[str, float] | float]]], DataFrame]:
     """
     Fit the POT model on the dataset and calculate anomaly scores for each feature.
 
     # Parameters
     ------------
-        * dataset (DataFrame): The dataset on which the POT model is to be fitted.
-        * kwargs:
-            * exceedance_dataset (DataFrame): The dataset containing exceedance values.
+        * dataset (DataFrame | ndarray | pyarrow.Table): The dataset on which the POT model is to be fitted.
+        * pot_dataset (DataFrame): The dataset containing exceedance values.
+        * t0 (int): The number of rows only used for learning.
+        * cache (StageCache | None): The on-disk cache to reuse the params and scores of the same exceedances and `t0` from, default is None.
 
     # Returns
     ------------
         * DataFrame: Anomaly scores for each feature in the dataset.
     """
+    dataset = to_frame(dataset=dataset)
+
+    if cache is None:
+        return __fit_pot_data(dataset=dataset, pot_dataset=pot_dataset, t0=t0)
+
+    feature_names = list(dataset.columns)
+    cache_key = cache.fingerprint(
+        stage="fit_pot_data",
+        datasets=[pot_dataset],
+        params={"t0": t0, "columns": [str(feature_name) for feature_name in feature_names]},
+    )
+    cache_entry = cache.get(key=cache_key)
+
+    if cache_entry is not None:
+        (arrays, metadata) = cache_entry
+        anomaly_scores = DataFrame(data=arrays["anomaly_scores"], columns=metadata["columns"], copy=False)
+        gpd_params = __gpd_params_from_array(
+            params_array=arrays["params"],
+            feature_names=feature_names,
+            total_anomaly_scores=anomaly_scores["total_anomaly_score"].to_list(),
+        )
+        return (gpd_params, anomaly_scores)
+
+    (gpd_params, anomaly_scores) = __fit_pot_data(dataset=dataset, pot_dataset=pot_dataset, t0=t0)
+    cache.put(
+        key=cache_key,
+        arrays={
+            "anomaly_scores": anomaly_scores.to_numpy(dtype=float64),
+            "params": __gpd_params_to_array(gpd_params=gpd_params, feature_names=feature_names),
+        },
+        metadata={"columns": list(anomaly_scores.columns)},
+    )
+    return (gpd_params, anomaly_scores)
+
+
+def __fit_pot_data(
+    dataset: DataFrame, pot_dataset: DataFrame, t0: int
+) -> tuple[dict[int, list[dict[str, dict[str, float] | float]]], DataFrame]:
+    """
+    Fit the GPD row by row on all exceedances before the row and calculate the anomaly scores of the row.
+
+    # Parameters
+    ------------
+        * dataset (DataFrame): The dataset on which the POT model is to be fitted.
+        * pot_dataset (DataFrame): The dataset containing exceedance values.
+        * t0 (int): The number of rows only used for learning.
+
+    # Returns
+    ------------
+        * tuple[dict[int, list[dict[str, dict[str, float] | float]]], DataFrame]: The GPD params per row and the anomaly scores.
+    """
     anomaly_scores = dataset.drop(dataset.index).add_prefix("anomaly_score_").to_dict(orient="list")
     anomaly_scores["total_anomaly_score"] = []
     t1_t2_pot_data = pot_dataset.iloc[t0:]  # type: ignore
@@ -0,0 +1,55 @@
+from json import load
+from multiprocessing import get_all_start_methods
+from os import path as os_path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from benchmarks.cold_start import measure_first_score, measure_worker_spawn, run_cold_start_benchmark, tiny_fit
+from benchmarks.results import write_results
+from src.detecto.models.detectors.pot import POTDetecto
+
+
+class TestColdStartBenchmark(TestCase):
+    def test_tiny_fit_function(self):
+        self.assertGreater(a=tiny_fit(POTDetecto()), b=0.0)
+
+    def test_measure_first_score_function(self):
+        result = measure_first_score(repeat=1)
+
+        self.assertEqual(first=set(result.keys()), second={"import_s", "init_s", "first_score_s", "process_s"})
+        self.assertGreater(a=result["process_s"], b=result["first_score_s"])
+
+    def test_measure_worker_spawn_function(self):
+        result = measure_worker_spawn(start_method="spawn", workers=1, tasks=1)
+
+        self.assertEqual(first=result["start_method"], second="spawn")
+        self.assertGreater(a=result["total_s"], b=result["first_result_s"])  # type: ignore
+
+    def test_run_cold_start_benchmark_function(self):
+        with patch(target="benchmarks.cold_start.measure_import_time", return_value={}), patch(
+            target="benchmarks.cold_start.measure_first_score", return_value={}
+        ), patch(
+            target="benchmarks.cold_start.measure_worker_spawn",
+            side_effect=lambda start_method: {"start_method": start_method},
+        ):
+            result = run_cold_start_benchmark(repeat=1)
+
+        self.assertEqual(
+            first=[spawn["start_method"] for spawn in result["worker_spawn"]], second=get_all_start_methods()
+        )
+
+    def test_write_results_function(self):
+        with TemporaryDirectory() as output_dir:
+            path = write_results(
+                path=os_path.join(output_dir, "results", "cold_start.json"),
+                benchmark="cold_start",
+                results={"first_score": {"first_score_s": 0.2}},
+            )
+
+            with open(path) as file:
+                recorded = load(file)
+
+        self.assertEqual(first=recorded["benchmark"], second="cold_start")
+        self.assertEqual(first=recorded["results"], second={"first_score": {"first_score_s": 0.2}})
+        self.assertIn(member="python_version", container=recorded)
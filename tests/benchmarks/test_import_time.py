@@ -0,0 +1,52 @@
+from os import environ
+from subprocess import run  # nosec
+from sys import executable
+from unittest import TestCase
+
+from benchmarks.import_time import IMPORT_BUDGET_MS, measure_import_time, parse_import_time
+
+
+class TestImportTimeBenchmark(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.import_budget_us = int(environ.get("DETECTO_IMPORT_BUDGET_MS", IMPORT_BUDGET_MS)) * 1000
+
+    def test_parse_import_time_function(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   _io\n"
+            "import time:      1500 |       2700 | src.detecto\n"
+        )
+
+        self.assertEqual(
+            first=parse_import_time(stderr=stderr), second={"_io": (120, 120), "src.detecto": (1500, 2700)}
+        )
+
+    def test_import_does_not_load_plotting_dependency(self):
+        result = measure_import_time(module="src.detecto", repeat=1)
+
+        self.assertFalse(expr=result["imports_matplotlib"])
+
+    def test_import_does_not_load_deferred_modules(self):
+        process = run(
+            [executable, "-X", "importtime", "-c", "import src.detecto"], capture_output=True, text=True, check=True
+        )  # nosec
+        import_times = parse_import_time(stderr=process.stderr)
+
+        for module in (
+            "concurrent.futures.process",
+            "multiprocessing.shared_memory",
+            "src.detecto.parallel.shared",
+            "src.detecto.parallel.sketches",
+            "src.detecto.serving.model",
+            "src.detecto.models.renderers.qq",
+        ):
+            self.assertNotIn(member=module, container=import_times)
+
+    def test_import_time_is_within_cold_start_budget(self):
+        result = measure_import_time(module="src.detecto", repeat=3)
+
+        self.assertLessEqual(a=result["cumulative_import_us"], b=self.import_budget_us)  # type: ignore
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,62 @@
+from tracemalloc import is_tracing
+from unittest import TestCase
+
+from numpy import array, ones
+
+from benchmarks.throughput import (
+    count_gpd_fits,
+    POT_DETECTO_STAGES,
+    run_throughput_benchmark,
+    synthetic_heavy_tailed,
+    time_stage,
+)
+
+
+class TestThroughputBenchmark(TestCase):
+    def test_synthetic_heavy_tailed_function(self):
+        dataset = synthetic_heavy_tailed(rows=100, features=3, seed=1)
+
+        self.assertEqual(first=dataset.shape, second=(100, 3))
+        self.assertEqual(first=list(dataset.columns), second=["feature_0", "feature_1", "feature_2"])
+        self.assertFalse(expr=dataset.isna().any().any())
+        self.assertTrue(expr=dataset.equals(synthetic_heavy_tailed(rows=100, features=3, seed=1)))
+
+    def test_count_gpd_fits_function(self):
+        exceedances = array([[0.0, 1.0], [2.0, 0.0], [0.0, 3.0], [4.0, 5.0]])
+
+        self.assertEqual(first=count_gpd_fits(exceedances=exceedances, t0=1), second=3)
+
+    def test_time_stage_function(self):
+        (_, small) = time_stage(stage=lambda: ones(shape=1_000))
+        (values, large) = time_stage(stage=lambda: ones(shape=1_000_000))
+
+        self.assertEqual(first=len(values), second=1_000_000)  # type: ignore
+        self.assertGreaterEqual(a=large["peak_traced_bytes"], b=8_000_000)
+        self.assertLess(a=small["peak_traced_bytes"], b=1_000_000)
+        self.assertFalse(expr=is_tracing())
+
+    def test_run_throughput_benchmark_function(self):
+        results = run_throughput_benchmark(
+            rows_grid=(500,), features_grid=(1, 2), max_fit_cells=500, fresh_process=False
+        )
+
+        self.assertEqual(first=len(results), second=4)
+        self.assertEqual(first=list(results[0]["stages"].keys()), second=list(POT_DETECTO_STAGES))
+        self.assertIn(member="fits_per_second", container=results[0])
+        self.assertEqual(first=results[1]["suite"], second="standalone")
+        self.assertIn(member="fit_pot_data", container=results[1]["stages"])
+        self.assertEqual(
+            first=list(results[2]["stages"].keys()), second=["compute_exceedance_threshold", "extract_exceedance"]
+        )
+        self.assertNotIn(member="fits_per_second", container=results[3])
+        self.assertIn(
+            member="fit",
+            container=run_throughput_benchmark(
+                rows_grid=(600,), features_grid=(1,), max_fit_cells=None, fresh_process=False
+            )[0]["stages"],
+        )
+
+        for result in results:
+            for measurements in result["stages"].values():
+                self.assertGreaterEqual(a=measurements["wall_s"], b=0.0)
+                self.assertGreaterEqual(a=measurements["peak_traced_bytes"], b=0)
@@ -0,0 +1,95 @@
+from os import path as os_path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import concatenate, load
+from pandas import read_csv, testing as pd_testing
+
+from src.detecto.datasets.synthetic import SyntheticPOTDataset
+
+
+class TestSyntheticPOTDataset(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.synthetic_dataset = SyntheticPOTDataset(
+            rows=1000, features=4, chunk_rows=300, seed=3, exceedance_rate=0.05, anomaly_rate=0.01
+        )
+
+    def test_string_method(self):
+        self.assertEqual(first=str(self.synthetic_dataset), second="Synthetic Peak Over Threshold Dataset")
+
+    def test_chunks_method(self):
+        chunks = list(self.synthetic_dataset.chunks())
+
+        self.assertEqual(first=[first_row for first_row, _, _ in chunks], second=[0, 300, 600, 900])
+        self.assertEqual(first=[values.shape for _, values, _ in chunks], second=[(300, 4)] * 3 + [(100, 4)])
+
+        labels = concatenate([chunk_labels for _, _, chunk_labels in chunks])
+        values = concatenate([chunk_values for _, chunk_values, _ in chunks])
+
+        self.assertTrue(expr=labels.any())
+        self.assertTrue(expr=(labels.sum(axis=1) <= 1).all())
+        self.assertGreater(a=values[labels].min(), b=values[~labels].mean() + 400.0)
+
+    def test_chunks_method_is_reproducible(self):
+        for (_, values_1, labels_1), (_, values_2, labels_2) in zip(
+            self.synthetic_dataset.chunks(),
+            SyntheticPOTDataset(
+                rows=1000, features=4, chunk_rows=300, seed=3, exceedance_rate=0.05, anomaly_rate=0.01
+            ).chunks(),
+        ):
+            self.assertTrue(expr=(values_1 == values_2).all())
+            self.assertTrue(expr=(labels_1 == labels_2).all())
+
+    def test_exceedance_rate_controls_sparsity(self):
+        dense = SyntheticPOTDataset(rows=2000, features=2, exceedance_rate=0.2, anomaly_rate=0.0, noise_scale=0.0)
+        sparse = SyntheticPOTDataset(rows=2000, features=2, exceedance_rate=0.01, anomaly_rate=0.0, noise_scale=0.0)
+
+        def bursts(synthetic_dataset: SyntheticPOTDataset) -> int:
+            frame = synthetic_dataset.to_frame()
+            return int((frame[synthetic_dataset.columns] > 100.0 + 10.0 + 1e-9).sum().sum())
+
+        self.assertGreater(a=bursts(dense), b=10 * bursts(sparse))
+
+    def test_to_frame_method(self):
+        frame = self.synthetic_dataset.to_frame()
+
+        self.assertEqual(
+            first=list(frame.columns),
+            second=["timestamp", "feature_0", "feature_1", "feature_2", "feature_3", "is_anomaly"],
+        )
+        self.assertEqual(first=frame.shape[0], second=1000)
+        self.assertEqual(first=str(frame["timestamp"].iloc[25]), second="2024-01-02 01:00:00")
+
+    def test_to_csv_method(self):
+        with TemporaryDirectory() as output_dir:
+            path = self.synthetic_dataset.to_csv(path=os_path.join(output_dir, "synthetic.csv"))
+            frame = read_csv(path, parse_dates=["timestamp"])
+
+        pd_testing.assert_frame_equal(left=frame, right=self.synthetic_dataset.to_frame().reset_index(drop=True))
+
+    def test_to_memmap_method(self):
+        with TemporaryDirectory() as output_dir:
+            values_path, labels_path = self.synthetic_dataset.to_memmap(path=os_path.join(output_dir, "synthetic.npy"))
+            values = load(values_path, mmap_mode="r")
+            labels = load(labels_path)
+
+            self.assertEqual(first=labels_path, second=os_path.join(output_dir, "synthetic.labels.npy"))
+            self.assertEqual(first=values.shape, second=(1000, 4))
+            self.assertTrue(
+                expr=(values == self.synthetic_dataset.to_frame()[self.synthetic_dataset.columns].to_numpy()).all()
+            )
+            self.assertEqual(
+                first=int(labels.any(axis=1).sum()), second=int(self.synthetic_dataset.to_frame()["is_anomaly"].sum())
+            )
+            del values
+
+    def test_init_method_catches_value_error(self):
+        with self.assertRaises(expected_exception=ValueError):
+            SyntheticPOTDataset(rows=0, features=1)
+
+        with self.assertRaises(expected_exception=ValueError):
+            SyntheticPOTDataset(rows=10, features=1, exceedance_rate=1.5)
+
+    def tearDown(self) -> None:
+        return super().tearDown()
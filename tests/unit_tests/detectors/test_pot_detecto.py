@@ -1,10 +1,23 @@
+from os import listdir, path as os_path, stat
+from tempfile import TemporaryDirectory
 from unittest import TestCase
+from unittest.mock import patch
 
-from pandas import DataFrame, testing as pd_testing
+from numpy import load, save, sort, testing as np_testing
+from numpy.random import default_rng
+from pandas import concat, DataFrame, date_range, testing as pd_testing
+from pandas.arrays import SparseArray
 from scipy.stats import genpareto, ks_1samp
 
+from src.detecto.instrumentation.memory import is_memory_mapped
+from src.detecto.instrumentation.recorder import NullRecorder, Recorder
+from src.detecto.io.cache import StageCache
+from src.detecto.io.readers import ChunkedReader
+from src.detecto.io.store import read_store
 from src.detecto.models.detectors.interface import Detecto
 from src.detecto.models.detectors.pot import POTDetecto
+from src.detecto.models.renderers.qq import QQResult
+from src.detecto.parallel.sketches import FeatureSketches
 
 
 class TestPOTDetecto(TestCase):
@@ -1548,6 +1561,854 @@ class TestPOTDetecto(TestCase):
 
         pd_testing.assert_frame_equal(left=self.detector.kstest_result, right=expected_kstest_result)
 
+    def test_evaluate_method_with_qq(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                "df_1_feature_1": genpareto.rvs(c=0.3, scale=10.0, size=60, random_state=rng),
+                "df_1_feature_2": genpareto.rvs(c=0.1, scale=5.0, size=60, random_state=rng),
+            }
+        )
+        self.detector.timeframe.set_interval(total_rows=test_df.shape[0])
+        self.detector.compute_exceedance_threshold(dataset=test_df, q=0.90)
+        self.detector.extract_exceedance(dataset=test_df)
+        self.detector.fit(dataset=test_df)
+        self.detector.evaluate(method="ks", stat_distance_threshold=0.5)
+        self.detector.evaluate(method="qq")
+
+        self.assertEqual(first=len(self.detector.qq_result), second=2)  # type: ignore
+        self.assertIsNone(obj=self.detector.qq_plot_files)
+
+        for index, qq in enumerate(self.detector.qq_result):  # type: ignore
+            feature_name = test_df.columns[index]
+            exceedances = self.detector.exceedance_dataset[feature_name].to_numpy()  # type: ignore
+
+            self.assertIsInstance(obj=qq, cls=QQResult)
+            self.assertEqual(first=qq.feature_name, second=feature_name)
+            self.assertEqual(first=qq.sample_quantiles.tolist(), second=sort(exceedances[exceedances > 0]).tolist())
+            self.assertEqual(first=len(qq.theoretical_quantiles), second=len(qq))
+            self.assertEqual(
+                first=qq.params,
+                second=tuple(self.detector.kstest_result.iloc[index][["c", "loc", "scale"]]),  # type: ignore
+            )
+
+        with TemporaryDirectory() as output_dir:
+            self.detector.evaluate(method="qq", output_dir=output_dir, features_per_page=1, max_workers=1)
+
+            self.assertEqual(
+                first=self.detector.qq_plot_files,
+                second=[os_path.join(output_dir, "qq_plot_0000.png"), os_path.join(output_dir, "qq_plot_0001.png")],
+            )
+            for file_path in self.detector.qq_plot_files:  # type: ignore
+                self.assertTrue(expr=os_path.isfile(file_path))
+
+    def test_fit_method_with_recorder(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                "df_1_feature_1": genpareto.rvs(c=0.3, scale=10.0, size=60, random_state=rng),
+                "df_1_feature_2": genpareto.rvs(c=0.1, scale=5.0, size=60, random_state=rng),
+            }
+        )
+        detector = POTDetecto(recorder=Recorder())
+
+        for pot_detecto in (self.detector, detector):
+            pot_detecto.timeframe.set_interval(total_rows=test_df.shape[0])
+            pot_detecto.compute_exceedance_threshold(dataset=test_df, q=0.90)
+            pot_detecto.extract_exceedance(dataset=test_df)
+            pot_detecto.fit(dataset=test_df)
+
+        pd_testing.assert_frame_equal(left=detector.anomaly_score_dataset, right=self.detector.anomaly_score_dataset)
+        self.assertEqual(first=detector.params, second=self.detector.params)
+
+        exceedances = detector.exceedance_dataset.iloc[detector.timeframe.t0 :]  # type: ignore
+        expected_fits = int((detector.anomaly_score_dataset.drop(columns=["total_anomaly_score"]) > 0).sum().sum())  # type: ignore
+        report = detector.run_report
+
+        self.assertEqual(
+            first=list(report["stages"].keys()), second=["compute_exceedance_threshold", "extract_exceedance", "fit"]
+        )
+        self.assertEqual(first=report["counters"]["gpd_fits"], second=expected_fits)
+        self.assertEqual(first=report["counters"]["rows_fitted"], second=exceedances.shape[0])
+        self.assertEqual(
+            first=report["counters"]["skipped_rows"], second=int(((exceedances > 0).sum(axis=1) == 0).sum())
+        )
+        self.assertEqual(first=sum(report["histograms"]["optimizer_iterations"].values()), second=expected_fits)
+        self.assertIsInstance(obj=self.detector.recorder, cls=NullRecorder)
+
+    def test_memory_report_method(self):
+        self.assertEqual(first=self.detector.memory_report()["exceedance_dataset"], second=0)
+
+        self.detector.compute_exceedance_threshold(dataset=self.df_1, q=0.90)
+        self.detector.extract_exceedance(dataset=self.df_1)
+        self.detector.fit(dataset=self.df_1)
+        report = self.detector.memory_report()
+
+        self.assertEqual(
+            first=list(report.keys()),
+            second=[
+                "exceedance_threshold_dataset",
+                "exceedance_dataset",
+                "anomaly_score_dataset",
+                "anomaly_dataset",
+                "kstest_result",
+                "qq_result",
+                "params",
+                "params_array",
+                "sorted_history",
+                "positive_exceedances",
+                "row_buffers",
+                "total",
+            ],
+        )
+        self.assertGreaterEqual(
+            a=report["exceedance_dataset"], b=self.detector.exceedance_dataset.to_numpy().nbytes  # type: ignore
+        )
+        self.assertLess(a=report["params"], b=report["params_array"])
+        self.assertEqual(first=report["params_array"], second=self.detector._POTDetecto__params_array.nbytes)  # type: ignore
+        self.assertEqual(first=report["sorted_history"], second=0)
+        self.assertEqual(first=report["anomaly_dataset"], second=0)
+        self.assertEqual(first=report["total"], second=sum(report.values()) - report["total"])
+
+    def test_fit_method_with_memory_budget(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=50, random_state=rng)
+                for feature in range(0, 4)
+            }
+        )
+
+        with TemporaryDirectory() as spill_dir:
+            spilling_detector = POTDetecto(recorder=Recorder(), memory_budget=1, spill_dir=spill_dir)
+            dropping_detector = POTDetecto(recorder=Recorder(), memory_budget=1)
+
+            for pot_detecto in (self.detector, spilling_detector, dropping_detector):
+                pot_detecto.timeframe.set_interval(total_rows=test_df.shape[0])
+                pot_detecto.compute_exceedance_threshold(dataset=test_df, q=0.90)
+                pot_detecto.extract_exceedance(dataset=test_df)
+                pot_detecto.fit(dataset=test_df)
+
+            self.assertEqual(
+                first=spilling_detector.spilled_files,
+                second={
+                    "exceedance_threshold_dataset": os_path.join(spill_dir, "exceedance_threshold_dataset.npy"),
+                    "exceedance_dataset": os_path.join(spill_dir, "exceedance_dataset.npy"),
+                    "params": os_path.join(spill_dir, "params.npy"),
+                    "anomaly_score_dataset": os_path.join(spill_dir, "anomaly_score_dataset.npy"),
+                },
+            )
+            self.assertEqual(first=spilling_detector.memory_report()["exceedance_dataset"], second=0)
+            pd_testing.assert_frame_equal(
+                left=spilling_detector.exceedance_dataset, right=self.detector.exceedance_dataset
+            )
+
+            for pot_detecto in (spilling_detector, dropping_detector):
+                pd_testing.assert_frame_equal(
+                    left=pot_detecto.anomaly_score_dataset, right=self.detector.anomaly_score_dataset
+                )
+                self.assertEqual(first=pot_detecto.params, second=self.detector.params)
+                self.assertEqual(first=pot_detecto.run_report["counters"]["feature_chunks"], second=4)
+
+        self.assertIsNone(obj=dropping_detector.exceedance_threshold_dataset)
+        self.assertEqual(first=dropping_detector.spilled_files, second={})
+        self.assertEqual(first=dropping_detector.run_report["counters"]["datasets_dropped"], second=1)
+        self.assertEqual(first=self.detector.memory_budget, second=None)
+
+        with self.assertRaises(expected_exception=ValueError):
+            POTDetecto(memory_budget=0)
+
+    def test_fit_method_within_memory_budget(self):
+        test_df = DataFrame(
+            data={
+                f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=600, random_state=feature)
+                for feature in range(0, 20)
+            }
+        )
+
+        with TemporaryDirectory() as spill_dir:
+            detector = POTDetecto(recorder=Recorder(), memory_budget=200_000, spill_dir=spill_dir)
+
+            for pot_detecto in (self.detector, detector):
+                pot_detecto.timeframe.set_interval(total_rows=test_df.shape[0])
+                pot_detecto.compute_exceedance_threshold(dataset=test_df, q=0.90, keep_history=True)
+                pot_detecto.extract_exceedance(dataset=test_df)
+                pot_detecto.fit(dataset=test_df)
+
+            self.assertLessEqual(a=detector.memory_report()["total"], b=200_000)
+            self.assertIn(member="params", container=detector.spilled_files)
+
+            self.assertEqual(first=detector.params, second=self.detector.params)
+            self.assertGreater(a=detector.memory_report()["params"], b=200_000)
+
+            for pot_detecto in (self.detector, detector):
+                pot_detecto.update(dataset=test_df.iloc[:10])
+                pot_detecto.compute_anomaly_threshold(q=0.80)
+                pot_detecto.detect()
+
+            self.assertLessEqual(a=detector.memory_report()["total"], b=200_000)
+            self.assertEqual(first=detector.params, second=self.detector.params)
+            pd_testing.assert_frame_equal(
+                left=detector.anomaly_score_dataset, right=self.detector.anomaly_score_dataset
+            )
+            pd_testing.assert_frame_equal(left=detector.anomaly_dataset, right=self.detector.anomaly_dataset)
+            self.assertNotIn(member="memory_budget_exceeded", container=detector.run_report["counters"])
+
+    def test_save_and_load_methods(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                "df_1_feature_1": genpareto.rvs(c=0.3, scale=10.0, size=60, random_state=rng),
+                "df_1_feature_2": genpareto.rvs(c=0.1, scale=5.0, size=60, random_state=rng),
+            },
+            index=date_range(start="2024-01-01", periods=60, freq="1h"),
+        )
+        self.detector.timeframe.set_interval(total_rows=test_df.shape[0])
+        self.detector.compute_exceedance_threshold(dataset=test_df, q=0.90)
+        self.detector.extract_exceedance(dataset=test_df)
+        self.detector.fit(dataset=test_df)
+        self.detector.compute_anomaly_threshold(q=0.80)
+        self.detector.detect()
+        self.detector.evaluate(method="ks", stat_distance_threshold=0.05)
+
+        with TemporaryDirectory() as output_dir:
+            model_path = self.detector.save(path=os_path.join(output_dir, "pot_model"))
+            detector = POTDetecto.load(path=model_path)
+
+            self.assertEqual(
+                first=(detector.timeframe.t0, detector.timeframe.t1, detector.timeframe.t2),
+                second=(self.detector.timeframe.t0, self.detector.timeframe.t1, self.detector.timeframe.t2),
+            )
+            self.assertEqual(first=detector.anomaly_threshold, second=self.detector.anomaly_threshold)
+            self.assertFalse(expr=detector.exceedance_dataset.to_numpy().flags.writeable)  # type: ignore
+            self.assertEqual(first=detector.memory_report()["anomaly_score_dataset"], second=0)
+
+            for attribute in POTDetecto.DATASETS + ("kstest_result",):
+                pd_testing.assert_frame_equal(
+                    left=getattr(detector, attribute), right=getattr(self.detector, attribute), check_freq=False
+                )
+
+            self.assertEqual(first=detector.params, second=self.detector.params)
+
+            detector.detect()
+            pd_testing.assert_frame_equal(left=detector.anomaly_dataset, right=self.detector.anomaly_dataset)
+
+            with open(os_path.join(model_path, "metadata.json"), "w") as file:
+                file.write('{"format_version": 0, "detector": "pot", "arrays": []}')
+
+            with self.assertRaises(expected_exception=ValueError):
+                POTDetecto.load(path=model_path)
+
+        with self.assertRaises(expected_exception=ValueError):
+            POTDetecto().save(path="pot_model")
+
+    def test_update_method(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=80, random_state=rng)
+                for feature in range(0, 3)
+            }
+        )
+        detector = POTDetecto(recorder=Recorder())
+        detector.timeframe.set_interval(total_rows=60, prod_mode=True)
+        detector.compute_exceedance_threshold(dataset=test_df.iloc[:60], q=0.90, keep_history=True)
+        detector.extract_exceedance(dataset=test_df.iloc[:60])
+        detector.fit(dataset=test_df.iloc[:60])
+
+        with TemporaryDirectory() as output_dir:
+            model_path = detector.save(path=os_path.join(output_dir, "pot_model"))
+            loaded_detector = POTDetecto.load(path=model_path, recorder=Recorder())
+            loaded_detector.update(dataset=test_df.iloc[60:70])
+            loaded_detector.save(path=model_path)
+            loaded_detector = POTDetecto.load(path=model_path, recorder=Recorder())
+            loaded_detector.update(dataset=test_df.iloc[70:])
+
+            appended_path = detector.save(path=os_path.join(output_dir, "appended_pot_model"))
+            for first_row, last_row in ((60, 65), (65, 70)):
+                appended_detector = POTDetecto.load(path=appended_path, recorder=Recorder())
+                appended_detector.update(dataset=test_df.iloc[first_row:last_row])
+                appended_detector.save(path=appended_path, append=True)
+
+            index_file = os_path.join(appended_path, "index.npy")
+            index_size = os_path.getsize(index_file)
+            appended_detector = POTDetecto.load(path=appended_path, recorder=Recorder())
+            appended_detector.update(dataset=test_df.iloc[70:])
+            appended_detector.save(path=appended_path, append=True)
+            appended_detector = POTDetecto.load(path=appended_path)
+
+            self.assertEqual(first=os_path.getsize(index_file), second=index_size + 10 * 8)
+            self.assertEqual(first=appended_detector.timeframe.t1, second=44)
+
+            with self.assertRaises(expected_exception=ValueError):
+                POTDetecto.load(path=model_path).save(path=appended_path, append=True)
+
+            with self.assertRaises(expected_exception=ValueError):
+                self.detector.save(path=appended_path, append=True)
+
+        detector.update(dataset=test_df.iloc[60:])
+        self.detector.timeframe.t0, self.detector.timeframe.t1, self.detector.timeframe.t2 = (
+            detector.timeframe.t0,
+            detector.timeframe.t1,
+            detector.timeframe.t2,
+        )
+        self.detector.compute_exceedance_threshold(dataset=test_df, q=0.90)
+        self.detector.extract_exceedance(dataset=test_df)
+        self.detector.fit(dataset=test_df)
+
+        self.assertEqual(
+            first=(detector.timeframe.t0, detector.timeframe.t1, detector.timeframe.t2), second=(35, 44, 1)
+        )
+
+        for pot_detecto in (detector, loaded_detector, appended_detector):
+            for attribute in ("exceedance_threshold_dataset", "exceedance_dataset", "anomaly_score_dataset"):
+                pd_testing.assert_frame_equal(
+                    left=getattr(pot_detecto, attribute), right=getattr(self.detector, attribute)
+                )
+
+            self.assertEqual(first=pot_detecto.params, second=self.detector.params)
+
+        updated_exceedances = (detector.exceedance_dataset.iloc[60:] > 0).to_numpy()  # type: ignore
+        self.assertEqual(first=detector.run_report["counters"]["rows_updated"], second=20)
+        self.assertEqual(
+            first=detector.run_report["counters"]["refitted_features"], second=updated_exceedances.any(axis=0).sum()
+        )
+        self.assertLessEqual(
+            a=detector.run_report["counters"]["gpd_fits"] - (detector.anomaly_score_dataset.iloc[:25, :3] > 0).sum().sum(),  # type: ignore
+            b=updated_exceedances.sum(),
+        )
+
+        with self.assertRaises(expected_exception=ValueError):
+            self.detector.update(dataset=test_df.iloc[70:])
+
+        with self.assertRaises(expected_exception=ValueError):
+            detector.update(dataset=test_df.iloc[70:, :2])
+
+    def test_update_method_with_memory_mapped_store(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=80, random_state=rng)
+                for feature in range(0, 3)
+            }
+        )
+        detector = POTDetecto()
+        detector.timeframe.set_interval(total_rows=60, prod_mode=True)
+        detector.compute_exceedance_threshold(dataset=test_df.iloc[:60], q=0.90, keep_history=True)
+        detector.extract_exceedance(dataset=test_df.iloc[:60])
+        detector.fit(dataset=test_df.iloc[:60])
+
+        with TemporaryDirectory() as output_dir:
+            model_path = detector.save(path=os_path.join(output_dir, "pot_model"))
+            inodes = {name: stat(os_path.join(model_path, name)).st_ino for name in listdir(model_path)}
+            loaded_detector = POTDetecto.load(path=model_path)
+
+            with patch(target="src.detecto.models.detectors.pot.concat") as concat_mock:
+                loaded_detector.update(dataset=test_df.iloc[60:70])
+
+            concat_mock.assert_not_called()
+            for attribute in ("exceedance_threshold_dataset", "exceedance_dataset", "anomaly_score_dataset"):
+                self.assertTrue(expr=is_memory_mapped(frame=getattr(loaded_detector, attribute)))
+
+            loaded_detector.save(path=model_path, append=True)
+            (arrays, metadata) = read_store(path=model_path)
+
+            self.assertEqual(first=arrays["sorted_history"].shape, second=(60, 3))
+            np_testing.assert_array_equal(x=arrays["history_rows"], y=test_df.iloc[60:70].to_numpy())
+            self.assertTrue(expr=arrays["anomaly_score_dataset"].flags.c_contiguous)
+            self.assertEqual(
+                first={
+                    name: stat(os_path.join(model_path, name)).st_ino for name in inodes if name != "metadata.json"
+                },
+                second={name: inode for (name, inode) in inodes.items() if name != "metadata.json"},
+            )
+
+            loaded_detector = POTDetecto.load(path=model_path)
+            loaded_detector.update(dataset=test_df.iloc[70:])
+
+        detector.update(dataset=test_df.iloc[60:])
+
+        for attribute in ("exceedance_threshold_dataset", "exceedance_dataset", "anomaly_score_dataset"):
+            pd_testing.assert_frame_equal(left=getattr(loaded_detector, attribute), right=getattr(detector, attribute))
+
+        self.assertEqual(first=loaded_detector.params, second=detector.params)
+
+    def test_fit_method_with_checkpoint_and_resume(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=80, random_state=rng)
+                for feature in range(0, 3)
+            }
+        )
+        detector = POTDetecto(recorder=Recorder())
+
+        for pot_detecto in (self.detector, detector):
+            pot_detecto.timeframe.set_interval(total_rows=test_df.shape[0])
+            pot_detecto.compute_exceedance_threshold(dataset=test_df, q=0.90)
+            pot_detecto.extract_exceedance(dataset=test_df)
+
+        self.detector.fit(dataset=test_df)
+        gpd_fit = genpareto.fit
+        total_calls = []
+
+        def preempted_fit(*args, **kwargs):
+            total_calls.append(1)
+            if len(total_calls) > 10:
+                raise RuntimeError("pre-empted")
+            return gpd_fit(*args, **kwargs)
+
+        with TemporaryDirectory() as output_dir:
+            checkpoint_path = os_path.join(output_dir, "fit_checkpoint")
+
+            with patch.object(target=genpareto, attribute="fit", side_effect=preempted_fit):
+                with self.assertRaises(expected_exception=RuntimeError):
+                    detector.fit(dataset=test_df, checkpoint_path=checkpoint_path, checkpoint_every=5)
+
+            self.assertTrue(expr=os_path.isfile(os_path.join(checkpoint_path, "metadata.json")))
+
+            detector.fit(dataset=test_df, checkpoint_path=checkpoint_path, checkpoint_every=5, resume=True)
+
+            self.assertFalse(expr=os_path.exists(checkpoint_path))
+
+        pd_testing.assert_frame_equal(left=detector.anomaly_score_dataset, right=self.detector.anomaly_score_dataset)
+        self.assertEqual(first=detector.params, second=self.detector.params)
+        self.assertGreater(a=detector.run_report["counters"]["resumed_rows"], b=0)
+        expected_fits = int((self.detector.anomaly_score_dataset.drop(columns=["total_anomaly_score"]) > 0).sum().sum())  # type: ignore
+        self.assertLess(a=detector.run_report["counters"]["gpd_fits"] - 10, b=expected_fits)
+        self.assertGreater(a=detector.run_report["stages"]["checkpoint"]["calls"], b=0)
+
+        with self.assertRaises(expected_exception=ValueError):
+            detector.fit(dataset=test_df, checkpoint_path="fit_checkpoint", checkpoint_every=0)
+
+    def test_rescore_method(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=80, random_state=rng)
+                for feature in range(0, 3)
+            }
+        )
+        corrections = DataFrame(data={"df_1_feature_1": [500.0, 0.0]}, index=[70, 72])
+        corrected_df = test_df.copy()
+        corrected_df.loc[corrections.index, "df_1_feature_1"] = corrections["df_1_feature_1"]
+        detector = POTDetecto(recorder=Recorder())
+
+        for pot_detecto, dataset in ((detector, test_df), (self.detector, corrected_df)):
+            pot_detecto.timeframe.set_interval(total_rows=dataset.shape[0])
+            pot_detecto.compute_exceedance_threshold(dataset=dataset, q=0.90)
+            pot_detecto.extract_exceedance(dataset=dataset)
+            pot_detecto.fit(dataset=dataset)
+            pot_detecto.compute_anomaly_threshold(q=0.80)
+            pot_detecto.detect()
+
+        previous_anomalies = detector.anomaly_dataset["is_anomaly"].to_numpy()  # type: ignore
+        changed_anomalies = detector.rescore(dataset=test_df, corrections=corrections)
+
+        for attribute in POTDetecto.DATASETS:
+            pd_testing.assert_frame_equal(left=getattr(detector, attribute), right=getattr(self.detector, attribute))
+
+        self.assertEqual(first=detector.params, second=self.detector.params)
+        self.assertEqual(first=detector.anomaly_threshold, second=self.detector.anomaly_threshold)
+        self.assertEqual(first=list(changed_anomalies.columns), second=["was_anomaly", "is_anomaly"])
+        self.assertEqual(
+            first=list(changed_anomalies.index),
+            second=[
+                row + 72
+                for row, is_anomaly in enumerate(self.detector.anomaly_dataset["is_anomaly"])  # type: ignore
+                if is_anomaly != previous_anomalies[row]
+            ],
+        )
+        self.assertGreater(a=len(changed_anomalies), b=0)
+        self.assertEqual(first=detector.run_report["counters"]["rescored_cells"], second=80 - 70)
+        self.assertNotEqual(first=test_df.loc[70, "df_1_feature_1"], second=500.0)
+
+        with self.assertRaises(expected_exception=ValueError):
+            detector.rescore(dataset=test_df, corrections=DataFrame(data={"df_1_feature_1": [1.0]}, index=[100]))
+
+    def test_rescore_method_with_loaded_model_and_early_correction(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=80, random_state=rng)
+                for feature in range(0, 3)
+            }
+        )
+        corrections = DataFrame(data={"df_1_feature_2": [90.0]}, index=[10])
+        corrected_df = test_df.copy()
+        corrected_df.loc[10, "df_1_feature_2"] = 90.0
+        detector = POTDetecto(recorder=Recorder())
+
+        for pot_detecto, dataset in ((detector, test_df), (self.detector, corrected_df)):
+            pot_detecto.timeframe.set_interval(total_rows=dataset.shape[0])
+            pot_detecto.compute_exceedance_threshold(dataset=dataset, q=0.90, keep_history=True)
+            pot_detecto.extract_exceedance(dataset=dataset)
+            pot_detecto.fit(dataset=dataset)
+
+        with TemporaryDirectory() as output_dir:
+            loaded_detector = POTDetecto.load(path=detector.save(path=os_path.join(output_dir, "pot_model")))
+            loaded_detector.rescore(dataset=test_df, corrections=corrections)
+
+            for attribute in ("exceedance_threshold_dataset", "exceedance_dataset", "anomaly_score_dataset"):
+                pd_testing.assert_frame_equal(
+                    left=getattr(loaded_detector, attribute), right=getattr(self.detector, attribute)
+                )
+
+            self.assertEqual(first=loaded_detector.params, second=self.detector.params)
+            self.assertEqual(first=loaded_detector.exceedance_threshold_method, second="expanding")
+
+    def test_rescore_method_with_sketch_thresholds(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=80, random_state=rng)
+                for feature in range(0, 3)
+            }
+        )
+        corrections = DataFrame(data={"df_1_feature_0": [500.0]}, index=[50])
+        corrected_df = test_df.copy()
+        corrected_df.loc[50, "df_1_feature_0"] = 500.0
+        sketches = FeatureSketches().update(dataset=test_df)
+        detector = POTDetecto(recorder=Recorder())
+
+        for pot_detecto, dataset in ((detector, test_df), (self.detector, corrected_df)):
+            pot_detecto.timeframe.set_interval(total_rows=dataset.shape[0])
+            pot_detecto.compute_exceedance_threshold(dataset=dataset, q=0.90, sketches=sketches)
+            pot_detecto.extract_exceedance(dataset=dataset)
+            pot_detecto.fit(dataset=dataset)
+
+        previous_thresholds = detector.exceedance_threshold_dataset.copy()  # type: ignore
+        detector.rescore(dataset=test_df, corrections=corrections)
+
+        self.assertEqual(first=detector.exceedance_threshold_method, second="sketch")
+        pd_testing.assert_frame_equal(left=detector.exceedance_threshold_dataset, right=previous_thresholds)
+
+        for attribute in ("exceedance_dataset", "anomaly_score_dataset"):
+            pd_testing.assert_frame_equal(left=getattr(detector, attribute), right=getattr(self.detector, attribute))
+
+        self.assertEqual(first=detector.params, second=self.detector.params)
+        self.assertEqual(first=detector.run_report["counters"]["rescored_cells"], second=80 - 50)
+
+    def test_fit_method_with_cache(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                "df_1_feature_1": genpareto.rvs(c=0.3, scale=10.0, size=60, random_state=rng),
+                "df_1_feature_2": genpareto.rvs(c=0.1, scale=5.0, size=60, random_state=rng),
+            },
+            index=date_range(start="2024-01-01", periods=60, freq="1h"),
+        )
+
+        with TemporaryDirectory() as cache_dir:
+            detectors = [POTDetecto(recorder=Recorder(), cache=StageCache(path=cache_dir)) for _ in range(0, 2)]
+
+            for detector in [self.detector] + detectors:
+                detector.timeframe.set_interval(total_rows=test_df.shape[0])
+                detector.compute_exceedance_threshold(dataset=test_df, q=0.90, keep_history=True)
+                detector.extract_exceedance(dataset=test_df)
+                detector.fit(dataset=test_df)
+
+            (missing_detector, cached_detector) = detectors
+
+            self.assertEqual(first=missing_detector.run_report["counters"]["cache_misses"], second=3)
+            self.assertEqual(first=cached_detector.run_report["counters"]["cache_hits"], second=3)
+            self.assertNotIn(member="gpd_fits", container=cached_detector.run_report["counters"])
+
+            for attribute in ("exceedance_threshold_dataset", "exceedance_dataset", "anomaly_score_dataset"):
+                pd_testing.assert_frame_equal(
+                    left=getattr(cached_detector, attribute), right=getattr(self.detector, attribute), check_freq=False
+                )
+
+            self.assertEqual(first=cached_detector.params, second=self.detector.params)
+
+            cached_detector.update(
+                dataset=test_df.iloc[:2].set_index(test_df.index[:2] + (test_df.index[-1] - test_df.index[0]))
+            )
+
+            self.assertEqual(first=cached_detector.anomaly_score_dataset.shape[0], second=self.detector.anomaly_score_dataset.shape[0] + 2)  # type: ignore
+
+            cached_detector.compute_exceedance_threshold(dataset=test_df, q=0.95)
+
+            self.assertEqual(first=cached_detector.run_report["counters"]["cache_misses"], second=1)
+
+    def test_fit_method_with_memory_mapped_dataset(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                f"feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=60, random_state=rng)
+                for feature in range(0, 3)
+            }
+        )
+
+        with TemporaryDirectory() as output_dir:
+            save(file=os_path.join(output_dir, "dataset.npy"), arr=test_df.to_numpy())
+            memory_map = load(file=os_path.join(output_dir, "dataset.npy"), mmap_mode="r")
+            detector = POTDetecto(spill_dir=os_path.join(output_dir, "spill"))
+
+            for pot_detecto, dataset in ((self.detector, test_df), (detector, memory_map)):
+                pot_detecto.timeframe.set_interval(total_rows=test_df.shape[0])
+                pot_detecto.compute_exceedance_threshold(dataset=dataset, q=0.90, keep_history=True)
+                pot_detecto.extract_exceedance(dataset=dataset)
+                pot_detecto.fit(dataset=dataset)
+
+            for attribute in ("exceedance_threshold_dataset", "exceedance_dataset", "anomaly_score_dataset"):
+                pd_testing.assert_frame_equal(
+                    left=getattr(detector, attribute), right=getattr(self.detector, attribute)
+                )
+
+            self.assertEqual(first=detector.params, second=self.detector.params)
+            self.assertEqual(
+                first=sorted(detector.spilled_files.keys()),
+                second=[
+                    "anomaly_score_dataset",
+                    "exceedance_dataset",
+                    "exceedance_threshold_dataset",
+                    "params",
+                    "sorted_history",
+                ],
+            )
+            self.assertEqual(first=detector.memory_report()["exceedance_dataset"], second=0)
+
+            detector.update(dataset=test_df.iloc[:2].set_axis([60, 61]))
+            self.detector.update(dataset=test_df.iloc[:2].set_axis([60, 61]))
+
+            pd_testing.assert_frame_equal(
+                left=detector.anomaly_score_dataset, right=self.detector.anomaly_score_dataset
+            )
+            del memory_map, detector
+
+        with self.assertRaises(expected_exception=ValueError):
+            self.detector.compute_exceedance_threshold(dataset=[1.0, 2.0])
+
+    def test_extract_exceedance_from_chunks_method(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                f"feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=60, random_state=rng).round(decimals=3)
+                for feature in range(0, 3)
+            }
+        )
+
+        with TemporaryDirectory() as output_dir:
+            detector = POTDetecto(recorder=Recorder(), spill_dir=os_path.join(output_dir, "spill"))
+            test_df.to_csv(os_path.join(output_dir, "dataset.csv"), index=False)
+            reader = ChunkedReader(path=os_path.join(output_dir, "dataset.csv"), chunk_rows=7)
+
+            for pot_detecto in (self.detector, detector):
+                pot_detecto.timeframe.set_interval(total_rows=reader.count_rows())
+
+            self.detector.compute_exceedance_threshold(dataset=test_df, q=0.90)
+            self.detector.extract_exceedance(dataset=test_df)
+            self.detector.fit(dataset=test_df)
+            detector.extract_exceedance_from_chunks(chunks=reader.chunks(), q=0.90)
+
+            with patch.object(target=SparseArray, attribute="__array__", side_effect=AssertionError("densified")):
+                detector.fit(dataset=reader.schema)
+
+            pd_testing.assert_frame_equal(
+                left=detector.anomaly_score_dataset, right=self.detector.anomaly_score_dataset
+            )
+            self.assertEqual(first=detector.params, second=self.detector.params)
+            self.assertEqual(first=sorted(detector.spilled_files.keys()), second=["anomaly_score_dataset", "params"])
+            self.assertTrue(expr=is_memory_mapped(frame=detector.anomaly_score_dataset))
+
+            in_memory_detector = POTDetecto()
+            in_memory_detector.timeframe.set_interval(total_rows=reader.count_rows())
+            in_memory_detector.extract_exceedance_from_chunks(chunks=reader.chunks(), q=0.90)
+
+            with self.assertRaises(expected_exception=ValueError):
+                in_memory_detector.fit(dataset=reader.schema)
+
+            self.assertIsNone(obj=in_memory_detector.anomaly_score_dataset)
+
+        pd_testing.assert_frame_equal(
+            left=detector.exceedance_dataset.sparse.to_dense(), right=self.detector.exceedance_dataset  # type: ignore
+        )
+        self.assertIsNone(obj=detector.exceedance_threshold_dataset)
+        self.assertLess(
+            a=detector.memory_report()["exceedance_dataset"], b=self.detector.memory_report()["exceedance_dataset"]
+        )
+        self.assertEqual(first=detector.run_report["counters"]["chunks_read"], second=9)
+
+        with self.assertRaises(expected_exception=ValueError):
+            detector.extract_exceedance_from_chunks(chunks=[test_df, test_df], q=0.90)
+
+        with self.assertRaises(expected_exception=ValueError):
+            detector.extract_exceedance_from_chunks(chunks=[test_df.iloc[:10]], q=0.90)
+
+    def test_fit_method_with_float32_dtype(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=80, random_state=rng)
+                for feature in range(0, 3)
+            }
+        )
+        detector = POTDetecto(dtype="float32")
+
+        for pot_detecto in (self.detector, detector):
+            pot_detecto.timeframe.set_interval(total_rows=60, prod_mode=True)
+            pot_detecto.compute_exceedance_threshold(dataset=test_df.iloc[:60], q=0.90, keep_history=True)
+            pot_detecto.extract_exceedance(dataset=test_df.iloc[:60])
+            pot_detecto.fit(dataset=test_df.iloc[:60])
+            pot_detecto.update(dataset=test_df.iloc[60:])
+            pot_detecto.compute_anomaly_threshold(q=0.90)
+            pot_detecto.detect()
+
+        self.assertTrue(expr=(detector.exceedance_threshold_dataset.dtypes == "float32").all())  # type: ignore
+        self.assertTrue(expr=(detector.exceedance_dataset.dtypes == "float32").all())  # type: ignore
+        self.assertTrue(expr=(detector.anomaly_score_dataset.dtypes == "float64").all())  # type: ignore
+        self.assertLess(
+            a=detector.memory_report()["exceedance_dataset"],
+            b=0.6 * self.detector.memory_report()["exceedance_dataset"],
+        )
+        pd_testing.assert_frame_equal(
+            left=detector.anomaly_score_dataset,
+            right=self.detector.anomaly_score_dataset,
+            check_exact=False,
+            rtol=1e-2,
+        )
+        pd_testing.assert_frame_equal(left=detector.anomaly_dataset, right=self.detector.anomaly_dataset)
+
+        with TemporaryDirectory() as output_dir:
+            loaded_detector = POTDetecto.load(path=detector.save(path=os_path.join(output_dir, "pot_model")))
+            self.assertEqual(first=loaded_detector.dtype, second="float32")
+
+        with self.assertRaises(expected_exception=ValueError):
+            POTDetecto(dtype="int8")  # type: ignore
+
+    def test_compute_exceedance_threshold_method_with_sketches(self):
+        sketches = FeatureSketches.merge_all(
+            sketches=[
+                FeatureSketches().update(dataset=self.df_1.iloc[:5]),
+                FeatureSketches().update(dataset=self.df_1.iloc[5:]),
+            ]
+        )
+        self.detector.compute_exceedance_threshold(dataset=self.df_1, q=0.99, sketches=sketches)
+
+        pd_testing.assert_frame_equal(
+            left=self.detector.exceedance_threshold_dataset,
+            right=DataFrame(data={column: [self.df_1[column].quantile(q=0.99)] * 10 for column in self.df_1.columns}),
+        )
+        self.assertEqual(first=self.detector.exceedance_threshold_q, second=0.99)
+
+        with self.assertRaises(expected_exception=ValueError):
+            self.detector.compute_exceedance_threshold(
+                dataset=self.df_1.assign(df_1_feature_3=1.0), q=0.99, sketches=sketches
+            )
+
+    def test_iter_fit_method_yields_scores_and_flags_per_chunk(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=80, random_state=rng)
+                for feature in range(0, 3)
+            }
+        )
+        detector = POTDetecto(recorder=Recorder())
+
+        for pot_detecto in (self.detector, detector):
+            pot_detecto.timeframe.set_interval(total_rows=80)
+            pot_detecto.compute_exceedance_threshold(dataset=test_df, q=0.90)
+            pot_detecto.extract_exceedance(dataset=test_df)
+        self.detector.fit(dataset=test_df)
+        self.detector.compute_anomaly_threshold(q=0.90)
+        self.detector.detect()
+
+        events = detector.iter_fit(anomaly_q=0.90, chunk_rows=7)
+        yielded_events: dict[str, list[DataFrame]] = {"scores": [], "flags": []}
+
+        for kind, rows in events:
+            yielded_events[kind].append(rows)
+            self.assertEqual(
+                first=sum(len(chunk) for chunk in yielded_events["scores"]),
+                second=detector.run_report["counters"]["rows_fitted"],
+            )
+
+        t1 = self.detector.timeframe.t1
+        score_dataset = concat(yielded_events["scores"])
+        late_flags = concat(yielded_events["flags"])
+        flags = concat([score_dataset["is_anomaly"].dropna(), late_flags["is_anomaly"]]).sort_index()
+
+        self.assertEqual(first=len(yielded_events["flags"]), second=1)
+        self.assertEqual(first=list(late_flags.columns), second=["is_anomaly"])
+        self.assertFalse(expr=late_flags["is_anomaly"].isna().any())
+        self.assertEqual(
+            first=score_dataset.index.tolist(), second=test_df.index[self.detector.timeframe.t0 :].tolist()  # type: ignore
+        )
+        pd_testing.assert_frame_equal(
+            left=score_dataset.drop(columns=["is_anomaly"]).reset_index(drop=True),
+            right=self.detector.anomaly_score_dataset,
+        )
+        self.assertTrue(expr=score_dataset["is_anomaly"].iloc[:t1].isna().all())
+        self.assertTrue(expr=score_dataset["is_anomaly"].loc[late_flags.index].isna().all())
+        self.assertEqual(first=flags.index.tolist(), second=score_dataset.index[t1:].tolist())
+        self.assertEqual(
+            first=flags.tolist(), second=self.detector.anomaly_dataset["is_anomaly"].tolist()  # type: ignore
+        )
+        self.assertEqual(first=detector.anomaly_threshold, second=self.detector.anomaly_threshold)
+        self.assertIsNone(obj=detector.anomaly_score_dataset)
+
+        with self.assertRaises(expected_exception=ValueError):
+            detector.iter_fit(chunk_rows=0)
+
+        with self.assertRaises(expected_exception=ValueError):
+            POTDetecto().iter_fit()
+
+    def test_fit_method_with_shared_memory_workers(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(
+            data={
+                f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=60, random_state=rng)
+                for feature in range(0, 5)
+            }
+        )
+        detector = POTDetecto(recorder=Recorder())
+
+        for pot_detecto in (self.detector, detector):
+            pot_detecto.timeframe.set_interval(total_rows=60)
+            pot_detecto.compute_exceedance_threshold(dataset=test_df, q=0.90)
+            pot_detecto.extract_exceedance(dataset=test_df)
+
+        self.detector.fit(dataset=test_df)
+        detector.fit(dataset=test_df, max_workers=2)
+
+        pd_testing.assert_frame_equal(left=detector.anomaly_score_dataset, right=self.detector.anomaly_score_dataset)
+        self.assertEqual(first=detector.params, second=self.detector.params)
+        self.assertEqual(
+            first=detector.run_report["counters"]["gpd_fits"],
+            second=int((self.detector.anomaly_score_dataset.iloc[:, :5] > 0).sum().sum()),  # type: ignore
+        )
+        self.assertEqual(
+            first=sum(detector.run_report["histograms"]["optimizer_iterations"].values()),
+            second=detector.run_report["counters"]["gpd_fits"],
+        )
+
+        with self.assertRaises(expected_exception=ValueError):
+            detector.fit(dataset=test_df, max_workers=2, checkpoint_path="checkpoint")
+
+        with self.assertRaises(expected_exception=ValueError):
+            detector.fit(dataset=test_df, max_workers=0)
+
+    def test_fit_method_with_profile(self):
+        rng = default_rng(seed=7)
+        test_df = DataFrame(data={"df_1_feature_1": genpareto.rvs(c=0.3, scale=10.0, size=40, random_state=rng)})
+        self.detector.timeframe.set_interval(total_rows=test_df.shape[0])
+        self.detector.compute_exceedance_threshold(dataset=test_df, q=0.90)
+        self.detector.extract_exceedance(dataset=test_df)
+
+        self.assertIsNone(obj=self.detector.profile_report)
+
+        with TemporaryDirectory() as output_dir:
+            self.detector.fit(dataset=test_df, profile="cprofile", profile_dir=output_dir)
+            report = self.detector.profile_report
+
+            self.assertEqual(first=report["method"], second="cprofile")  # type: ignore
+            self.assertTrue(expr=all(os_path.isfile(file) for file in report["files"]))  # type: ignore
+            self.assertTrue(expr=report["files"][0].endswith("fit_profile.prof"))  # type: ignore
+            self.assertTrue(expr=any("fit" in hot_spot["location"] for hot_spot in report["summary"]))  # type: ignore
+        self.assertEqual(first=self.detector.run_report, second={"stages": {}, "counters": {}, "histograms": {}})
+
     def test_params_attributes(self):
         expected_params = {
             0: [
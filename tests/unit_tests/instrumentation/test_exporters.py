@@ -0,0 +1,108 @@
+from json import loads
+from os import path as os_path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.detecto.instrumentation.exporters import collect_metrics, Exporter, JSONLinesExporter, PrometheusExporter
+from src.detecto.instrumentation.recorder import Recorder
+
+
+class TestExporters(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.report: dict[str, dict] = {
+            "stages": {
+                "execute": {"wall_s": 3.0, "cpu_s": 2.5, "calls": 1},
+                "fit": {"wall_s": 2.0, "cpu_s": 2.0, "calls": 1},
+                "notification": {"wall_s": 0.25, "cpu_s": 0.01, "calls": 1},
+            },
+            "counters": {
+                "gpd_fits": 50,
+                "rows_processed": 1000,
+                "features_processed": 4,
+                "anomalies_detected": 1,
+                "skipped_rows": 7,
+            },
+            "histograms": {},
+        }
+
+    def test_collect_metrics_function(self):
+        metrics = collect_metrics(report=self.report)
+
+        self.assertEqual(first=metrics["run_duration_seconds"], second=3.0)
+        self.assertEqual(
+            first=metrics["stage_duration_seconds"], second={"execute": 3.0, "fit": 2.0, "notification": 0.25}
+        )
+        self.assertEqual(first=metrics["fits_per_second"], second=25.0)
+        self.assertEqual(first=metrics["gpd_fits_total"], second=50)
+        self.assertEqual(first=metrics["rows_processed"], second=1000)
+        self.assertEqual(first=metrics["features_processed"], second=4)
+        self.assertEqual(first=metrics["anomalies_detected"], second=1)
+        self.assertEqual(first=metrics["notification_duration_seconds"], second=0.25)
+        self.assertEqual(first=metrics["skipped_rows_total"], second=7)
+
+    def test_collect_metrics_function_with_empty_report(self):
+        metrics = collect_metrics(report={"stages": {}, "counters": {}, "histograms": {}})
+
+        self.assertEqual(first=metrics["run_duration_seconds"], second=0)
+        self.assertEqual(first=metrics["fits_per_second"], second=0.0)
+
+    def test_prometheus_exporter(self):
+        with TemporaryDirectory() as output_dir:
+            path = os_path.join(output_dir, "textfile", "detecto.prom")
+            exporter = PrometheusExporter(path=path, labels={"pipeline": 'night"ly'})
+            exporter(event="stage", payload={})
+
+            self.assertFalse(expr=os_path.exists(path))
+
+            exporter(event="run", payload=self.report)
+
+            with open(path) as file:
+                lines = file.read().splitlines()
+
+        self.assertIsInstance(obj=exporter, cls=Exporter)
+        self.assertEqual(first=str(exporter), second="Prometheus Textfile Exporter")
+        self.assertIn(member="# TYPE detecto_run_duration_seconds gauge", container=lines)
+        self.assertIn(member='detecto_run_duration_seconds{pipeline="night\\"ly"} 3.0', container=lines)
+        self.assertIn(member='detecto_stage_duration_seconds{pipeline="night\\"ly",stage="fit"} 2.0', container=lines)
+        self.assertIn(member='detecto_fits_per_second{pipeline="night\\"ly"} 25.0', container=lines)
+        self.assertIn(member="# TYPE detecto_gpd_fits_total counter", container=lines)
+        self.assertIn(member="# TYPE detecto_skipped_rows_total counter", container=lines)
+        self.assertIn(member="# TYPE detecto_rows_processed gauge", container=lines)
+
+    def test_prometheus_exporter_with_non_finite_values(self):
+        with TemporaryDirectory() as output_dir:
+            path = os_path.join(output_dir, "detecto.prom")
+            PrometheusExporter(path=path).export(
+                metrics={
+                    "fits_per_second": float("inf"),
+                    "stage_duration_seconds": {"fit": float("nan"), "detect": -float("inf")},
+                }
+            )
+
+            with open(path) as file:
+                lines = file.read().splitlines()
+
+        self.assertIn(member="detecto_fits_per_second +Inf", container=lines)
+        self.assertIn(member='detecto_stage_duration_seconds{stage="fit"} NaN', container=lines)
+        self.assertIn(member='detecto_stage_duration_seconds{stage="detect"} -Inf', container=lines)
+
+    def test_json_lines_exporter(self):
+        with TemporaryDirectory() as output_dir:
+            path = os_path.join(output_dir, "detecto.jsonl")
+            exporter = JSONLinesExporter(path=path, labels={"pipeline": "nightly"})
+            recorder = Recorder(hooks=[exporter])
+            recorder.emit(event="run", payload=self.report)
+            recorder.emit(event="run", payload=self.report)
+
+            with open(path) as file:
+                lines = [loads(line) for line in file.read().splitlines()]
+
+        self.assertEqual(first=str(exporter), second="JSON Lines Exporter")
+        self.assertEqual(first=len(lines), second=2)
+        self.assertEqual(first=lines[0]["pipeline"], second="nightly")
+        self.assertEqual(first=lines[0]["anomalies_detected"], second=1)
+        self.assertEqual(first=lines[1]["stage_duration_seconds"]["fit"], second=2.0)
+
+    def tearDown(self) -> None:
+        return super().tearDown()
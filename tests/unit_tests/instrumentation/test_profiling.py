@@ -0,0 +1,95 @@
+from os import path as os_path
+from pstats import Stats
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from tracemalloc import is_tracing, start as start_tracing, stop as stop_tracing
+from unittest import TestCase
+
+from numpy import ones
+
+from src.detecto.instrumentation.profiling import Profiler
+
+
+def busy_loop(seconds: float) -> int:
+    total, start = 0, perf_counter()
+    while perf_counter() - start < seconds:
+        total += sum(range(0, 1_000))
+    return total
+
+
+class TestProfiler(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = TemporaryDirectory()
+        self.output_dir = self.temporary_directory.name
+
+    def test_init_method(self):
+        profiler = Profiler(method="cprofile", output_dir=self.output_dir)
+
+        self.assertEqual(first=str(profiler), second="Profiler")
+        self.assertEqual(first=profiler.report(), second={"method": "cprofile", "files": [], "summary": []})
+
+        with self.assertRaises(expected_exception=ValueError):
+            Profiler(method="perf", output_dir=self.output_dir)  # type: ignore
+
+    def test_cprofile_method(self):
+        with Profiler(method="cprofile", output_dir=self.output_dir, name="fit_profile", top=5) as profiler:
+            busy_loop(seconds=0.05)
+
+        report = profiler.report()
+
+        self.assertEqual(
+            first=report["files"],
+            second=[
+                os_path.join(self.output_dir, "fit_profile.prof"),
+                os_path.join(self.output_dir, "fit_profile.summary.txt"),
+            ],
+        )
+        self.assertEqual(first=len(report["summary"]), second=5)
+        self.assertTrue(expr=any("busy_loop" in str(hot_spot["location"]) for hot_spot in profiler.summary))
+        self.assertGreater(a=Stats(report["files"][0]).total_calls, b=0)  # type: ignore
+
+    def test_tracemalloc_method(self):
+        with Profiler(method="tracemalloc", output_dir=self.output_dir, top=3) as profiler:
+            allocation = ones(shape=(1_000, 1_000))
+
+        report = profiler.report()
+
+        self.assertTrue(expr=all(os_path.isfile(file) for file in report["files"]))
+        self.assertTrue(expr=report["files"][0].endswith("profile.tracemalloc"))
+        self.assertLessEqual(a=len(report["summary"]), b=3)
+        self.assertGreaterEqual(a=report["summary"][0]["size_bytes"], b=allocation.nbytes)  # type: ignore
+
+    def test_tracemalloc_method_with_tracing_started(self):
+        start_tracing()
+
+        try:
+            with Profiler(method="tracemalloc", output_dir=self.output_dir):
+                ones(shape=1_000)
+
+            self.assertTrue(expr=is_tracing())
+        finally:
+            stop_tracing()
+
+        with Profiler(method="tracemalloc", output_dir=self.output_dir):
+            self.assertTrue(expr=is_tracing())
+
+        self.assertFalse(expr=is_tracing())
+
+    def test_sampling_method(self):
+        with Profiler(method="sampling", output_dir=self.output_dir, interval=0.001) as profiler:
+            busy_loop(seconds=0.2)
+
+        report = profiler.report()
+
+        with open(report["files"][0]) as file:
+            collapsed_stacks = file.read().splitlines()
+
+        self.assertTrue(expr=report["files"][0].endswith("profile.collapsed"))
+        self.assertGreater(a=len(collapsed_stacks), b=0)
+        self.assertTrue(expr=any("busy_loop" in stack for stack in collapsed_stacks))
+        self.assertAlmostEqual(first=sum(hot_spot["share"] for hot_spot in report["summary"]), second=1.0)  # type: ignore
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+        return super().tearDown()
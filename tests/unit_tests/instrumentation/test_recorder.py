@@ -0,0 +1,98 @@
+from unittest import TestCase
+
+from scipy.stats import genpareto
+
+from src.detecto.instrumentation.recorder import NullRecorder, Recorder
+
+
+class TestRecorder(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.events: list[tuple[str, dict]] = []
+        self.recorder = Recorder(hooks=[lambda event, payload: self.events.append((event, payload))])
+
+    def test_string_method(self):
+        self.assertEqual(first=str(self.recorder), second="Recorder")
+        self.assertEqual(first=str(NullRecorder()), second="Null Recorder")
+
+    def test_stage_method(self):
+        with self.recorder.stage(name="fit"):
+            sum(range(0, 10_000))
+
+        with self.assertRaises(expected_exception=ValueError):
+            with self.recorder.stage(name="fit"):
+                raise ValueError("failed stage")
+
+        report = self.recorder.report()
+
+        self.assertEqual(first=report["stages"]["fit"]["calls"], second=2)
+        self.assertGreater(a=report["stages"]["fit"]["wall_s"], b=0.0)
+        self.assertEqual(first=[event for event, _ in self.events], second=["stage", "stage"])
+        self.assertEqual(first=self.events[0][1]["stage"], second="fit")
+
+    def test_increment_and_observe_methods(self):
+        self.recorder.increment(counter="gpd_fits")
+        self.recorder.increment(counter="gpd_fits", value=2)
+        self.recorder.observe(histogram="optimizer_iterations", value=40)
+        self.recorder.observe(histogram="optimizer_iterations", value=40)
+        self.recorder.observe(histogram="optimizer_iterations", value=55)
+
+        self.assertEqual(
+            first=self.recorder.report(),
+            second={
+                "stages": {},
+                "counters": {"gpd_fits": 3},
+                "histograms": {"optimizer_iterations": {40: 2, 55: 1}},
+            },
+        )
+
+        self.recorder.reset()
+
+        self.assertEqual(first=self.recorder.report(), second={"stages": {}, "counters": {}, "histograms": {}})
+
+    def test_merge_method(self):
+        worker_recorder = Recorder()
+        worker_recorder.increment(counter="gpd_fits", value=2)
+        worker_recorder.observe(histogram="optimizer_iterations", value=40)
+        self.recorder.increment(counter="gpd_fits")
+        self.recorder.observe(histogram="optimizer_iterations", value=40)
+
+        self.recorder.merge(report=worker_recorder.report())
+        null_recorder = NullRecorder()
+        null_recorder.merge(report=worker_recorder.report())
+
+        self.assertEqual(first=self.recorder.report()["counters"], second={"gpd_fits": 3})
+        self.assertEqual(first=self.recorder.report()["histograms"], second={"optimizer_iterations": {40: 2}})
+        self.assertEqual(first=null_recorder.report()["counters"], second={})
+
+    def test_subscribe_and_emit_methods(self):
+        received = []
+        self.recorder.subscribe(hook=lambda event, payload: received.append(event))
+        self.recorder.emit(event="run", payload={})
+
+        self.assertEqual(first=received, second=["run"])
+        self.assertEqual(first=self.events, second=[("run", {})])
+
+    def test_optimizer_method_gives_identical_params(self):
+        data = genpareto.rvs(c=0.2, scale=3.0, size=50, random_state=11)
+
+        self.assertEqual(
+            first=genpareto.fit(data, floc=0, optimizer=self.recorder.optimizer()), second=genpareto.fit(data, floc=0)
+        )
+        self.assertEqual(first=sum(self.recorder.histograms["optimizer_iterations"].values()), second=1)
+
+    def test_null_recorder_records_nothing(self):
+        null_recorder = NullRecorder(hooks=[lambda event, payload: self.events.append((event, payload))])
+
+        with null_recorder.stage(name="fit"):
+            null_recorder.increment(counter="gpd_fits")
+            null_recorder.observe(histogram="optimizer_iterations", value=3)
+        null_recorder.emit(event="run", payload={})
+
+        self.assertFalse(expr=null_recorder.enabled)
+        self.assertIsNone(obj=null_recorder.optimizer())
+        self.assertEqual(first=null_recorder.report(), second={"stages": {}, "counters": {}, "histograms": {}})
+        self.assertEqual(first=self.events, second=[])
+
+    def tearDown(self) -> None:
+        return super().tearDown()
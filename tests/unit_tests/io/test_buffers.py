@@ -0,0 +1,94 @@
+from unittest import TestCase
+
+from numpy import concatenate, empty, quantile, sort, testing as np_testing
+from numpy.random import default_rng
+from pandas import DataFrame
+
+from src.detecto.io.buffers import RaggedColumns, SortedColumns
+
+
+class TestSortedColumns(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.values = default_rng(seed=7).normal(size=(50, 3))
+
+    def test_insert_method(self):
+        initial_values = sort(self.values[:5], axis=0)
+        sorted_columns = SortedColumns(values=initial_values)
+
+        for row in self.values[5:]:
+            sorted_columns.insert(values=row)
+
+        self.assertEqual(first=len(sorted_columns), second=50)
+        self.assertGreaterEqual(a=sorted_columns.nbytes, b=sorted_columns.values.nbytes)
+        np_testing.assert_array_equal(x=sorted_columns.values, y=sort(self.values, axis=0))
+        np_testing.assert_array_equal(x=initial_values, y=sort(self.values[:5], axis=0))
+
+    def test_inserted_values_property(self):
+        initial_values = sort(self.values[:20], axis=0)
+        initial_values.flags.writeable = False
+        sorted_columns = SortedColumns(values=initial_values, unsorted_values=self.values[20:30])
+
+        for row in self.values[30:]:
+            sorted_columns.insert(values=row)
+
+        self.assertEqual(first=len(sorted_columns), second=50)
+        np_testing.assert_array_equal(x=sorted_columns.inserted_values, y=self.values[30:])
+        np_testing.assert_array_equal(x=sorted_columns.values, y=sort(self.values, axis=0))
+        np_testing.assert_array_equal(x=sorted_columns.quantile(q=0.9), y=quantile(self.values, q=0.9, axis=0))
+
+        sorted_columns.clear_inserted()
+        self.assertEqual(first=sorted_columns.inserted_values.shape, second=(0, 3))
+
+        sorted_columns.insert(values=self.values[0])
+        sorted_columns.rebase(values=sort(concatenate((self.values, self.values[:1])), axis=0))
+        np_testing.assert_array_equal(x=sorted_columns.inserted_values, y=self.values[:1])
+
+        with self.assertRaises(expected_exception=ValueError):
+            sorted_columns.rebase(values=initial_values)
+
+    def test_replace_column_method(self):
+        initial_values = sort(self.values, axis=0)
+        initial_values.flags.writeable = False
+        sorted_columns = SortedColumns(values=initial_values)
+        sorted_columns.replace_column(column=1, values=initial_values[:, 0])
+
+        np_testing.assert_array_equal(x=sorted_columns.values[:, 1], y=initial_values[:, 0])
+        np_testing.assert_array_equal(x=sorted_columns.values[:, 2], y=initial_values[:, 2])
+
+        with self.assertRaises(expected_exception=ValueError):
+            sorted_columns.replace_column(column=1, values=initial_values[:5, 0])
+
+    def test_quantile_method(self):
+        sorted_columns = SortedColumns(values=empty(shape=(0, 3)))
+        quantiles = []
+
+        for row in self.values:
+            sorted_columns.insert(values=row)
+            quantiles.append(sorted_columns.quantile(q=0.9))
+
+        np_testing.assert_allclose(
+            actual=quantiles, desired=DataFrame(data=self.values).expanding().quantile(q=0.9).to_numpy()
+        )
+
+        with self.assertRaises(expected_exception=ValueError):
+            SortedColumns(values=empty(shape=(0, 3))).quantile(q=0.9)
+
+        with self.assertRaises(expected_exception=ValueError):
+            SortedColumns(values=self.values[:, 0])
+
+
+class TestRaggedColumns(TestCase):
+    def test_append_method(self):
+        values = default_rng(seed=7).normal(size=40)
+        ragged_columns = RaggedColumns(columns=[values[:3], values[:0]])
+
+        for value in values[3:]:
+            ragged_columns.append(column=0, value=value)
+        ragged_columns.append(column=1, value=1.0)
+
+        self.assertEqual(first=len(ragged_columns), second=2)
+        self.assertEqual(first=ragged_columns.lengths, second=[40, 1])
+        self.assertGreaterEqual(a=ragged_columns.nbytes, b=41 * 8)
+        np_testing.assert_array_equal(x=ragged_columns.values(column=0), y=values)
+        np_testing.assert_array_equal(x=ragged_columns.values(column=1), y=[1.0])
@@ -0,0 +1,125 @@
+from concurrent.futures import ThreadPoolExecutor
+from os import listdir, path as os_path, utime
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from numpy import arange, testing as np_testing
+from pandas import DataFrame
+
+from src.detecto.io.cache import StageCache
+
+
+class TestStageCache(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = TemporaryDirectory()
+        self.cache = StageCache(path=os_path.join(self.temporary_directory.name, "cache"), max_bytes=1_000)
+        self.df_1 = DataFrame(
+            data={
+                "df_1_feature_1": [10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+                "df_1_feature_2": [15, 17, 24, 36, 23, 15, 75, 56, 89, 105],
+            }
+        )
+
+    def test_string_method(self):
+        self.assertEqual(first=str(self.cache), second="Stage Cache")
+
+    def test_fingerprint_method(self):
+        key = self.cache.fingerprint(stage="fit", datasets=[self.df_1], params={"t0": 6})
+
+        self.assertEqual(
+            first=key, second=self.cache.fingerprint(stage="fit", datasets=[self.df_1.copy()], params={"t0": 6})
+        )
+        self.assertNotEqual(
+            first=key, second=self.cache.fingerprint(stage="fit", datasets=[self.df_1], params={"t0": 7})
+        )
+        self.assertNotEqual(
+            first=key, second=self.cache.fingerprint(stage="detect", datasets=[self.df_1], params={"t0": 6})
+        )
+        self.assertNotEqual(
+            first=key, second=self.cache.fingerprint(stage="fit", datasets=[self.df_1.astype(float)], params={"t0": 6})
+        )
+        self.assertNotEqual(
+            first=key, second=self.cache.fingerprint(stage="fit", datasets=[self.df_1.iloc[::-1]], params={"t0": 6})
+        )
+        self.assertNotEqual(
+            first=key,
+            second=self.cache.fingerprint(
+                stage="fit", datasets=[self.df_1.set_index(self.df_1.index + 1)], params={"t0": 6}
+            ),
+        )
+
+        changed_df = self.df_1.copy()
+        changed_df.iloc[9, 1] = 106
+
+        self.assertNotEqual(
+            first=key, second=self.cache.fingerprint(stage="fit", datasets=[changed_df], params={"t0": 6})
+        )
+
+        labeled_df = self.df_1.assign(label=["a"] * 10)
+
+        self.assertEqual(
+            first=self.cache.fingerprint(stage="fit", datasets=[labeled_df], params={}),
+            second=self.cache.fingerprint(stage="fit", datasets=[labeled_df.copy()], params={}),
+        )
+
+    def test_get_and_put_methods(self):
+        self.assertIsNone(obj=self.cache.get(key="missing"))
+
+        self.cache.put(key="entry", arrays={"values": arange(10.0)}, metadata={"columns": ["a"]})
+        (arrays, metadata) = self.cache.get(key="entry")  # type: ignore
+
+        np_testing.assert_array_equal(x=arrays["values"], y=arange(10.0))
+        self.assertEqual(first=metadata["columns"], second=["a"])
+        self.assertEqual(first=(self.cache.hits, self.cache.misses), second=(1, 1))
+
+        arrays["values"][0] = 1.0
+
+        np_testing.assert_array_equal(x=self.cache.get(key="entry")[0]["values"], y=arange(10.0))  # type: ignore
+
+    def test_put_method_with_concurrent_writers(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda _: self.cache.put(key="entry", arrays={"values": arange(10.0)}, metadata={}), range(0, 32)
+                )
+            )
+
+        np_testing.assert_array_equal(x=self.cache.get(key="entry")[0]["values"], y=arange(10.0))  # type: ignore
+        self.assertEqual(first=listdir(self.cache.path), second=["entry"])
+
+    def test_put_method_with_failed_write(self):
+        with patch(target="src.detecto.io.cache.write_store", side_effect=OSError("No space left on device")):
+            self.cache.put(key="entry", arrays={"values": arange(10.0)}, metadata={})
+
+        self.assertEqual(first=self.cache.failed_writes, second=1)
+        self.assertIsNone(obj=self.cache.get(key="entry"))
+
+    def test_put_method_evicts_least_recently_used_entries(self):
+        for age, key in enumerate(["old", "used", "new"]):
+            self.cache.put(key=key, arrays={"values": arange(40.0)}, metadata={})
+            utime(os_path.join(self.cache.path, key, "metadata.json"), times=(age, age))
+
+        self.assertIsNotNone(obj=self.cache.get(key="used"))
+
+        self.cache.put(key="newest", arrays={"values": arange(40.0)}, metadata={})
+
+        self.assertEqual(first=sorted(listdir(self.cache.path)), second=["newest", "used"])
+        self.assertEqual(first=self.cache.evictions, second=2)
+        self.assertLessEqual(a=self.cache.size_bytes, b=self.cache.max_bytes)
+
+        self.cache.put(key="too_large", arrays={"values": arange(200.0)}, metadata={})
+
+        self.assertFalse(expr=os_path.exists(os_path.join(self.cache.path, "too_large")))
+
+        self.cache.clear()
+
+        self.assertEqual(first=self.cache.size_bytes, second=0)
+
+        with self.assertRaises(expected_exception=ValueError):
+            StageCache(path=self.cache.path, max_bytes=0)
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+        return super().tearDown()
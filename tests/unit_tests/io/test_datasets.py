@@ -0,0 +1,78 @@
+from importlib.util import find_spec
+from os import path as os_path
+from tempfile import TemporaryDirectory
+from unittest import skipUnless, TestCase
+
+from numpy import arange, array, load, save, shares_memory, testing as np_testing
+from pandas import DataFrame, testing as pd_testing
+from scipy.sparse import csc_matrix
+
+from src.detecto.io.datasets import column_values, is_column_backed, map_columns, positive_values, to_frame
+
+
+class TestDatasets(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = TemporaryDirectory()
+        self.path = os_path.join(self.temporary_directory.name, "values.npy")
+        save(file=self.path, arr=arange(12, dtype=float).reshape(4, 3))
+        self.values = load(file=self.path, mmap_mode="r")
+
+    def test_to_frame_function(self):
+        frame = to_frame(dataset=self.values)
+
+        self.assertEqual(first=list(frame.columns), second=["feature_0", "feature_1", "feature_2"])
+        self.assertTrue(expr=shares_memory(frame.to_numpy(), self.values))
+        self.assertEqual(first=to_frame(dataset=arange(4.0)).shape, second=(4, 1))
+        self.assertIs(expr1=to_frame(dataset=frame), expr2=frame)
+
+        with self.assertRaises(expected_exception=ValueError):
+            to_frame(dataset=[1.0, 2.0])
+
+    def test_is_column_backed_function(self):
+        self.assertTrue(expr=is_column_backed(dataset=to_frame(dataset=self.values)))
+        self.assertFalse(expr=is_column_backed(dataset=DataFrame(data=arange(12.0).reshape(4, 3))))
+
+    def test_column_values_function(self):
+        values = column_values(dataset=to_frame(dataset=self.values), position=1)
+
+        np_testing.assert_array_equal(x=values, y=[1.0, 4.0, 7.0, 10.0])
+        self.assertTrue(expr=shares_memory(values, self.values))
+
+    def test_positive_values_function(self):
+        values = array([[0.0, 1.5], [2.0, 0.0], [0.0, 3.0], [-1.0, 0.0]])
+        sparse_frame = DataFrame.sparse.from_spmatrix(data=csc_matrix(values))
+
+        for frame in (DataFrame(data=values), sparse_frame):
+            (rows, positives) = positive_values(dataset=frame, position=1)
+
+            np_testing.assert_array_equal(x=rows, y=[0, 2])
+            np_testing.assert_array_equal(x=positives, y=[1.5, 3.0])
+            np_testing.assert_array_equal(x=positive_values(dataset=frame, position=0)[0], y=[1])
+
+        (rows, positives) = positive_values(dataset=to_frame(dataset=self.values), position=0)
+
+        np_testing.assert_array_equal(x=rows, y=[1, 2, 3])
+        np_testing.assert_array_equal(x=positives, y=[3.0, 6.0, 9.0])
+
+    def test_map_columns_function(self):
+        frame = map_columns(dataset=to_frame(dataset=self.values), function=lambda position, values: values * position)
+
+        pd_testing.assert_frame_equal(
+            left=frame, right=DataFrame(data=self.values * arange(3), columns=["feature_0", "feature_1", "feature_2"])
+        )
+        self.assertTrue(expr=frame.to_numpy().flags.f_contiguous)
+
+    @skipUnless(condition=find_spec("pyarrow") is not None, reason="pyarrow is not installed")
+    def test_to_frame_function_with_arrow_table(self):  # pragma: no cover
+        from pyarrow import table
+
+        frame = to_frame(dataset=table({"feature_0": [1.0, None, 3.0]}))
+
+        self.assertTrue(expr=is_column_backed(dataset=frame))
+        np_testing.assert_array_equal(x=column_values(dataset=frame, position=0), y=[1.0, float("nan"), 3.0])
+
+    def tearDown(self) -> None:
+        del self.values
+        self.temporary_directory.cleanup()
+        return super().tearDown()
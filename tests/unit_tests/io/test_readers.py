@@ -0,0 +1,96 @@
+from importlib.util import find_spec
+from os import path as os_path
+from tempfile import TemporaryDirectory
+from unittest import skipIf, skipUnless, TestCase
+
+from pandas import concat, DataFrame, date_range, testing as pd_testing
+
+from src.detecto.io.readers import ChunkedReader
+
+
+class TestChunkedReader(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = TemporaryDirectory()
+        self.path = os_path.join(self.temporary_directory.name, "metrics.csv")
+        self.df_1 = DataFrame(
+            data={
+                "timestamp": date_range(start="2024-01-01", periods=10, freq="1h"),
+                "df_1_feature_1": [10.5, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+                "df_1_feature_2": [15, 17, 24, 36, 23, 15, 75, 56, 89, 105],
+                "df_1_feature_3": ["a"] * 10,
+            }
+        )
+        self.df_1.to_csv(self.path, index=False)
+
+    def test_string_method(self):
+        self.assertEqual(first=str(ChunkedReader(path=self.path)), second="Chunked Reader")
+
+    def test_chunks_method(self):
+        reader = ChunkedReader(path=self.path, chunk_rows=4, columns=["df_1_feature_2", "df_1_feature_1"])
+        chunks = list(reader)
+
+        self.assertEqual(first=[chunk.shape[0] for chunk in chunks], second=[4, 4, 2])
+        pd_testing.assert_frame_equal(
+            left=concat(chunks), right=self.df_1[["df_1_feature_2", "df_1_feature_1"]], check_index_type=False
+        )
+        self.assertEqual(first=reader.count_rows(), second=10)
+
+    def test_count_rows_method_with_quoted_line_breaks(self):
+        quoted_path = os_path.join(self.temporary_directory.name, "quoted.csv")
+        self.df_1.assign(df_1_feature_3=["first line\nsecond line"] * 10).to_csv(quoted_path, index=False)
+        reader = ChunkedReader(path=quoted_path, chunk_rows=4, columns=["df_1_feature_1"])
+
+        self.assertEqual(first=reader.count_rows(), second=10)
+        self.assertEqual(first=sum(chunk.shape[0] for chunk in reader.chunks()), second=10)
+
+    def test_chunks_method_with_index_and_dtype(self):
+        reader = ChunkedReader(
+            path=self.path,
+            chunk_rows=3,
+            columns=["df_1_feature_1", "df_1_feature_2"],
+            index_col="timestamp",
+            dtype="float32",
+        )
+        frame = concat(reader.chunks())
+
+        self.assertEqual(first=list(frame.dtypes), second=["float32", "float32"])
+        pd_testing.assert_index_equal(
+            left=frame.index,
+            right=date_range(start="2024-01-01", periods=10, freq="1h", name="timestamp"),
+            exact=False,
+        )
+        self.assertEqual(first=list(reader.schema.columns), second=["df_1_feature_1", "df_1_feature_2"])
+        self.assertEqual(first=reader.schema.shape[0], second=0)
+
+        all_columns_reader = ChunkedReader(path=self.path, index_col="timestamp")
+
+        self.assertEqual(
+            first=all_columns_reader.columns, second=["df_1_feature_1", "df_1_feature_2", "df_1_feature_3"]
+        )
+
+    def test_init_method_catches_value_error(self):
+        with self.assertRaises(expected_exception=ValueError):
+            ChunkedReader(path="metrics.json")
+
+        with self.assertRaises(expected_exception=ValueError):
+            ChunkedReader(path=self.path, chunk_rows=0)
+
+    @skipIf(condition=find_spec("pyarrow") is not None, reason="pyarrow is installed")
+    def test_parquet_without_pyarrow(self):
+        with self.assertRaises(expected_exception=ImportError):
+            ChunkedReader(path="metrics.parquet")
+
+    @skipUnless(condition=find_spec("pyarrow") is not None, reason="pyarrow is not installed")
+    def test_chunks_method_with_parquet(self):  # pragma: no cover
+        parquet_path = os_path.join(self.temporary_directory.name, "metrics.parquet")
+        self.df_1.to_parquet(parquet_path, index=False)
+        reader = ChunkedReader(path=parquet_path, chunk_rows=4, columns=["df_1_feature_1"], dtype="float32")
+        frame = concat(reader.chunks())
+
+        self.assertEqual(first=reader.count_rows(), second=10)
+        pd_testing.assert_frame_equal(left=frame, right=self.df_1[["df_1_feature_1"]].astype("float32"))
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+        return super().tearDown()
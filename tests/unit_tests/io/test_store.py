@@ -0,0 +1,147 @@
+from concurrent.futures import ThreadPoolExecutor
+from os import listdir, path as os_path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from numpy import arange, asfortranarray, memmap, testing as np_testing
+
+from src.detecto.io.store import append_store, read_store, stage_rows, write_store
+
+
+class TestStore(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = TemporaryDirectory()
+        self.path = os_path.join(self.temporary_directory.name, "model")
+        self.arrays = {"values": arange(12, dtype=float).reshape(4, 3), "labels": arange(4) > 1}
+
+    def test_write_and_read_store_functions(self):
+        self.assertEqual(
+            first=write_store(path=self.path, arrays=self.arrays, metadata={"format_version": 1}), second=self.path
+        )
+
+        arrays, metadata = read_store(path=self.path)
+
+        self.assertEqual(first=metadata, second={"format_version": 1, "arrays": ["labels", "values"]})
+        self.assertIsInstance(obj=arrays["values"], cls=memmap)
+        self.assertFalse(expr=arrays["values"].flags.writeable)
+        np_testing.assert_array_equal(x=arrays["values"], y=self.arrays["values"])
+        np_testing.assert_array_equal(x=arrays["labels"], y=self.arrays["labels"])
+
+        in_memory_arrays, _ = read_store(path=self.path, mmap_mode=None)
+
+        self.assertNotIsInstance(obj=in_memory_arrays["values"], cls=memmap)
+
+    def test_write_store_function_replaces_store(self):
+        write_store(path=self.path, arrays=self.arrays, metadata={})
+        write_store(path=self.path, arrays={"values": self.arrays["values"] * 2}, metadata={})
+
+        arrays, _ = read_store(path=self.path)
+
+        self.assertEqual(first=list(arrays.keys()), second=["values"])
+        np_testing.assert_array_equal(x=arrays["values"], y=self.arrays["values"] * 2)
+        self.assertEqual(first=listdir(self.temporary_directory.name), second=["model"])
+
+    def test_write_store_function_with_concurrent_writers(self):
+        def write(version: int) -> bool:
+            try:
+                write_store(
+                    path=self.path, arrays={"values": self.arrays["values"] * version}, metadata={"version": version}
+                )
+            except OSError:
+                return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            written = list(executor.map(write, range(1, 33)))
+
+        arrays, metadata = read_store(path=self.path)
+
+        self.assertTrue(expr=any(written))
+        np_testing.assert_array_equal(x=arrays["values"], y=self.arrays["values"] * metadata["version"])
+        self.assertEqual(first=listdir(self.temporary_directory.name), second=["model"])
+
+    def test_append_store_function(self):
+        write_store(
+            path=self.path,
+            arrays={**self.arrays, "spilled": asfortranarray(self.arrays["values"])},
+            metadata={"version": 1},
+        )
+        values_file = os_path.join(self.path, "values.npy")
+        values_size = os_path.getsize(values_file)
+        new_rows = arange(12, 18, dtype=float).reshape(2, 3)
+
+        append_store(
+            path=self.path,
+            rows={"values": new_rows, "spilled": new_rows, "scores": arange(2, dtype=float)},
+            arrays={"labels": arange(6) > 1},
+            metadata={"version": 2},
+        )
+        arrays, metadata = read_store(path=self.path)
+
+        self.assertEqual(first=metadata["version"], second=2)
+        self.assertEqual(first=metadata["rows"]["values"], second=6)
+        self.assertEqual(first=os_path.getsize(values_file), second=values_size + new_rows.nbytes)
+        self.assertIsInstance(obj=arrays["values"], cls=memmap)
+        np_testing.assert_array_equal(x=arrays["values"], y=arange(18, dtype=float).reshape(6, 3))
+        np_testing.assert_array_equal(x=arrays["spilled"], y=arange(18, dtype=float).reshape(6, 3))
+        np_testing.assert_array_equal(x=arrays["scores"], y=arange(2, dtype=float))
+        np_testing.assert_array_equal(x=arrays["labels"], y=arange(6) > 1)
+        self.assertTrue(expr=arrays["spilled"].flags.c_contiguous)
+        self.assertEqual(
+            first=sorted(listdir(self.path)),
+            second=sorted(
+                [
+                    "metadata.json",
+                    "values.npy",
+                    "spilled.npy",
+                    *[metadata["files"][name] for name in ("labels", "scores")],
+                ]
+            ),
+        )
+
+        with patch(target="src.detecto.io.store.replace", side_effect=OSError("interrupted")):
+            with self.assertRaises(expected_exception=OSError):
+                append_store(path=self.path, rows={"values": new_rows + 6}, metadata={"version": 3})
+
+        arrays, metadata = read_store(path=self.path)
+
+        self.assertEqual(first=metadata["version"], second=2)
+        np_testing.assert_array_equal(x=arrays["values"], y=arange(18, dtype=float).reshape(6, 3))
+
+        append_store(path=self.path, rows={"values": new_rows + 6}, metadata={"version": 3})
+        arrays, _ = read_store(path=self.path)
+
+        np_testing.assert_array_equal(x=arrays["values"], y=arange(24, dtype=float).reshape(8, 3))
+        self.assertEqual(first=os_path.getsize(values_file), second=values_size + 2 * new_rows.nbytes)
+
+    def test_stage_rows_function(self):
+        write_store(path=self.path, arrays=self.arrays, metadata={"version": 1})
+        new_rows = arange(12, 18, dtype=float).reshape(2, 3)
+
+        staged_values = stage_rows(path=self.path, name="values", rows=new_rows, first_row=4)
+        arrays, metadata = read_store(path=self.path)
+
+        self.assertIsInstance(obj=staged_values, cls=memmap)
+        np_testing.assert_array_equal(x=staged_values, y=arange(18, dtype=float).reshape(6, 3))  # type: ignore
+        self.assertEqual(first=metadata["rows"], second={"values": 4})
+        np_testing.assert_array_equal(x=arrays["values"], y=self.arrays["values"])
+
+        staged_values = stage_rows(path=self.path, name="values", rows=new_rows + 6, first_row=6)
+        append_store(path=self.path, rows={"values": staged_values[4:]}, metadata={"version": 2})  # type: ignore
+        arrays, _ = read_store(path=self.path)
+
+        np_testing.assert_array_equal(x=staged_values, y=arange(24, dtype=float).reshape(8, 3))  # type: ignore
+        np_testing.assert_array_equal(x=arrays["values"], y=arange(24, dtype=float).reshape(8, 3))
+        self.assertIsNone(obj=stage_rows(path=self.path, name="values", rows=new_rows, first_row=2))
+        self.assertIsNone(obj=stage_rows(path=self.path, name="values", rows=new_rows, first_row=9))
+        self.assertIsNone(obj=stage_rows(path=self.path, name="missing", rows=new_rows, first_row=0))
+
+    def test_read_store_function_with_invalid_path(self):
+        with self.assertRaises(expected_exception=ValueError):
+            read_store(path=self.temporary_directory.name)
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+        return super().tearDown()
@@ -0,0 +1,155 @@
+from multiprocessing import Event, Process
+from os import _exit
+from socket import socketpair
+from unittest import TestCase
+
+from numpy import array, array_equal, datetime64
+from numpy.random import default_rng
+from pandas import DataFrame, testing as pd_testing
+from scipy.stats import genpareto
+
+from src.detecto.models.detectors.pot import POTDetecto
+from src.detecto.parallel.cluster import Coordinator, receive_message, run_worker, send_message, Worker
+from src.detecto.parallel.fleet import Fleet
+
+
+def _run_crashing_worker(host: str, port: int, crashed) -> None:  # type: ignore
+    def crash(header: dict, arrays: dict) -> None:
+        crashed.set()
+        _exit(1)
+
+    worker = Worker(host=host, port=port)
+    worker.handlers["fit_features"] = crash  # type: ignore
+    worker.run()
+
+
+def _run_worker_after_crash(host: str, port: int, crashed) -> None:  # type: ignore
+    crashed.wait(timeout=30.0)
+    run_worker(host=host, port=port)
+
+
+class TestCluster(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        rng = default_rng(seed=7)
+        self.test_df = DataFrame(
+            data={
+                f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=60, random_state=rng)
+                for feature in range(0, 4)
+            }
+        )
+        self.coordinator = Coordinator(timeout=60.0)
+        self.coordinator.start()
+        self.detector = POTDetecto()
+        self.detector.timeframe.set_interval(total_rows=60)
+        self.detector.compute_exceedance_threshold(dataset=self.test_df, q=0.90)
+        self.detector.extract_exceedance(dataset=self.test_df)
+        self.detector.fit(dataset=self.test_df)
+
+    def tearDown(self) -> None:
+        self.coordinator.close()
+        super().tearDown()
+
+    def __sharded_detector(self) -> POTDetecto:
+        detector = POTDetecto()
+        detector.timeframe.set_interval(total_rows=60)
+        detector.compute_exceedance_threshold(dataset=self.test_df, q=0.90)
+        detector.extract_exceedance(dataset=self.test_df)
+        detector.fit(dataset=self.test_df, coordinator=self.coordinator)
+        return detector
+
+    def test_string_method(self):
+        self.assertEqual(first=str(self.coordinator), second="Coordinator")
+        self.assertEqual(first=str(Worker(host="127.0.0.1", port=0)), second="Worker")
+
+    def test_send_and_receive_message_functions(self):
+        (left, right) = socketpair()
+        arrays = {
+            "values": array([[1.5, 2.5], [3.5, 4.5]]).T,
+            "timestamps": array([datetime64("2024-01-01"), datetime64("2024-01-02")]),
+            "empty": array([], dtype=bool),
+        }
+
+        with left, right:
+            send_message(connection=left, header={"type": "shard", "t0": 3}, arrays=arrays)
+            (header, received_arrays) = receive_message(connection=right)
+
+        self.assertEqual(first=header, second={"type": "shard", "t0": 3})
+        for name, values in arrays.items():
+            self.assertTrue(expr=array_equal(received_arrays[name], values))
+            self.assertEqual(first=received_arrays[name].dtype, second=values.dtype)
+
+    def test_fit_method_with_coordinator(self):
+        workers = [
+            Process(target=run_worker, kwargs=dict(zip(("host", "port"), self.coordinator.address)))
+            for _ in range(0, 2)
+        ]
+        for worker in workers:
+            worker.start()
+
+        detector = self.__sharded_detector()
+
+        pd_testing.assert_frame_equal(left=detector.anomaly_score_dataset, right=self.detector.anomaly_score_dataset)
+        self.assertEqual(first=detector.params, second=self.detector.params)
+        self.assertEqual(first=self.coordinator.completed_shards, second=4)
+
+        self.coordinator.close()
+        for worker in workers:
+            worker.join(timeout=10.0)
+            self.assertEqual(first=worker.exitcode, second=0)
+
+    def test_fit_method_with_coordinator_redispatches_lost_shards(self):
+        (host, port) = self.coordinator.address
+        crashed = Event()
+        workers = [
+            Process(target=_run_crashing_worker, args=(host, port, crashed)),
+            Process(target=_run_worker_after_crash, args=(host, port, crashed)),
+        ]
+        for worker in workers:
+            worker.start()
+
+        detector = self.__sharded_detector()
+
+        pd_testing.assert_frame_equal(left=detector.anomaly_score_dataset, right=self.detector.anomaly_score_dataset)
+        self.assertEqual(first=self.coordinator.redispatched_shards, second=1)
+
+        self.coordinator.close()
+        for worker in workers:
+            worker.join(timeout=10.0)
+
+    def test_fleet_with_coordinator(self):
+        long_dataset = self.test_df.iloc[:40, :2].assign(entity_id="host_a", timestamp=range(0, 40))
+        long_dataset = DataFrame(
+            data=[
+                *long_dataset.melt(id_vars=["entity_id", "timestamp"], var_name="metric").to_dict(orient="records"),
+                *self.test_df.iloc[:, 2:]
+                .assign(entity_id="host_b", timestamp=range(0, 60))
+                .melt(id_vars=["entity_id", "timestamp"], var_name="metric")
+                .to_dict(orient="records"),
+            ]
+        )
+        worker = Process(target=run_worker, kwargs=dict(zip(("host", "port"), self.coordinator.address)))
+        worker.start()
+
+        fleet = Fleet(exceedance_q=0.90, coordinator=self.coordinator, batches_per_worker=1, max_workers=2)
+        anomaly_table = fleet.detect(dataset=long_dataset)
+        self.coordinator.close()
+        worker.join(timeout=10.0)
+
+        pd_testing.assert_frame_equal(
+            left=anomaly_table, right=Fleet(exceedance_q=0.90, max_workers=1).detect(dataset=long_dataset)
+        )
+        self.assertEqual(first=anomaly_table.shape[0], second=2)
+
+    def test_coordinator_catches_errors(self):
+        with self.assertRaises(expected_exception=ValueError):
+            Coordinator(max_attempts=0)
+
+        with self.assertRaises(expected_exception=ValueError):
+            Coordinator().address
+
+        with self.assertRaises(expected_exception=RuntimeError), Coordinator(timeout=0.5) as coordinator:
+            coordinator.run(shards=[({"kind": "fit_features"}, {})])
+
+        with self.assertRaises(expected_exception=ValueError):
+            self.detector.fit(dataset=self.test_df, coordinator=self.coordinator, max_workers=2)
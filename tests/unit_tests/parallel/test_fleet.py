@@ -0,0 +1,123 @@
+from unittest import TestCase
+
+from numpy.random import default_rng
+from pandas import concat, DataFrame, date_range, testing as pd_testing
+from scipy.stats import genpareto
+
+from src.detecto.instrumentation.recorder import Recorder
+from src.detecto.models.detectors.pot import POTDetecto
+from src.detecto.parallel.fleet import Fleet
+
+
+class TestFleet(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        rng = default_rng(seed=7)
+        self.wide_datasets = {
+            entity: DataFrame(
+                data={
+                    metric: genpareto.rvs(c=0.3, scale=10.0, size=total_rows, random_state=rng)
+                    for metric in ("cpu", "memory")
+                },
+                index=date_range(start="2024-01-01", periods=total_rows, freq="h", name="timestamp"),
+            )
+            for entity, total_rows in (("host_a", 40), ("host_b", 60), ("host_c", 30))
+        }
+        self.long_dataset = (
+            concat(
+                [
+                    wide_dataset.melt(ignore_index=False, var_name="metric", value_name="value")
+                    .reset_index()
+                    .assign(entity_id=entity)
+                    for entity, wide_dataset in self.wide_datasets.items()
+                ],
+                ignore_index=True,
+            )
+            .sample(frac=1.0, random_state=1)
+            .reset_index(drop=True)
+        )
+        self.fleet = Fleet(
+            exceedance_q=0.90,
+            max_workers=2,
+            recorder=Recorder(),
+            t0_percentage=0.6,
+            t1_percentage=0.3,
+            t2_percentage=0.1,
+        )
+
+    def test_string_method(self):
+        self.assertEqual(first=str(self.fleet), second="Fleet")
+
+    def test_detect_method_equals_one_detector_per_entity(self):
+        anomaly_table = self.fleet.detect(dataset=self.long_dataset)
+
+        self.assertEqual(
+            first=list(anomaly_table.columns),
+            second=["entity_id", "timestamp", "total_anomaly_score", "anomaly_threshold", "is_anomaly"],
+        )
+        self.assertEqual(first=anomaly_table["entity_id"].unique().tolist(), second=["host_a", "host_b", "host_c"])
+
+        for entity, wide_dataset in self.wide_datasets.items():
+            detector = POTDetecto()
+            detector.timeframe.set_interval(total_rows=wide_dataset.shape[0])
+            detector.compute_exceedance_threshold(dataset=wide_dataset.reset_index(drop=True), q=0.90)
+            detector.extract_exceedance(dataset=wide_dataset.reset_index(drop=True))
+            detector.fit(dataset=wide_dataset.reset_index(drop=True))
+            detector.compute_anomaly_threshold(q=0.80)
+            detector.detect()
+            entity_table = anomaly_table[anomaly_table["entity_id"] == entity]
+
+            self.assertEqual(
+                first=entity_table["timestamp"].tolist(),
+                second=wide_dataset.index[detector.timeframe.t0 + detector.timeframe.t1 :].tolist(),  # type: ignore
+            )
+            self.assertEqual(
+                first=entity_table["total_anomaly_score"].tolist(),
+                second=detector.anomaly_score_dataset["total_anomaly_score"].iloc[detector.timeframe.t1 :].tolist(),  # type: ignore
+            )
+            self.assertEqual(first=entity_table["is_anomaly"].tolist(), second=detector.anomaly_dataset["is_anomaly"].tolist())  # type: ignore
+
+        self.assertEqual(first=self.fleet.run_report["counters"]["groups_scored"], second=3)
+
+    def test_detect_method_in_process(self):
+        fleet = Fleet(exceedance_q=0.90, max_workers=1, t0_percentage=0.6, t1_percentage=0.3, t2_percentage=0.1)
+
+        pd_testing.assert_frame_equal(
+            left=fleet.detect(dataset=self.long_dataset), right=self.fleet.detect(dataset=self.long_dataset)
+        )
+
+    def test_detect_method_with_failed_groups(self):
+        long_dataset = concat(
+            [
+                self.long_dataset,
+                DataFrame(
+                    data={
+                        "timestamp": date_range(start="2024-01-01", periods=3, freq="h"),
+                        "entity_id": "host_d",
+                        "metric": "cpu",
+                        "value": [1.0, 1.0, 1.0],
+                    }
+                ),
+            ],
+            ignore_index=True,
+        )
+        fleet = Fleet(exceedance_q=0.90, max_workers=2, errors="skip", prod_mode=True)
+        anomaly_table = fleet.detect(dataset=long_dataset)
+
+        self.assertEqual(first=list(fleet.failed_groups), second=["host_d"])
+        self.assertEqual(
+            first=anomaly_table.groupby("entity_id").size().to_dict(), second={"host_a": 1, "host_b": 1, "host_c": 1}
+        )
+
+        with self.assertRaises(expected_exception=ValueError):
+            Fleet(exceedance_q=0.90, max_workers=1).detect(dataset=long_dataset)
+
+    def test_fleet_catches_value_error(self):
+        with self.assertRaises(expected_exception=ValueError):
+            Fleet(errors="ignore")  # type: ignore
+
+        with self.assertRaises(expected_exception=ValueError):
+            Fleet(batches_per_worker=0)
+
+        with self.assertRaises(expected_exception=ValueError):
+            self.fleet.detect(dataset=self.long_dataset.drop(columns=["metric"]))
@@ -0,0 +1,68 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from os import _exit
+from unittest import TestCase
+
+from numpy import arange, array_equal, asfortranarray, zeros
+
+from src.detecto.parallel.shared import attach, SharedArrays, SharedArraySpec
+
+
+def _double_into_output(input_spec: SharedArraySpec, output_spec: SharedArraySpec, column: int) -> bool:
+    (values, input_block) = attach(spec=input_spec)
+    (output, output_block) = attach(spec=output_spec, readonly=False)
+    output[:, column] = 2 * values[:, column]
+    is_writeable = values.flags.writeable
+    del values, output
+    input_block.close()
+    output_block.close()
+    return is_writeable
+
+
+def _crash(input_spec: SharedArraySpec) -> None:
+    attach(spec=input_spec)
+    _exit(1)
+
+
+class TestSharedArrays(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.values = asfortranarray(arange(0, 12, dtype="float64").reshape(4, 3))
+
+    def test_string_method(self):
+        self.assertEqual(first=str(SharedArrays()), second="Shared Arrays")
+
+    def test_publish_and_allocate_methods_in_process_pool(self):
+        with SharedArrays() as shared_arrays:
+            input_spec = shared_arrays.publish(key="values", array=self.values)
+            output_spec = shared_arrays.allocate(key="output", shape=self.values.shape)
+
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(_double_into_output, input_spec=input_spec, output_spec=output_spec, column=column)
+                    for column in range(0, 3)
+                ]
+                self.assertEqual(first=[future.result() for future in futures], second=[False, False, False])
+
+            self.assertEqual(first=input_spec[3], second="F")
+            self.assertEqual(first=len(shared_arrays), second=2)
+            self.assertTrue(expr=array_equal(shared_arrays.view(key="output"), 2 * self.values))
+
+            with self.assertRaises(expected_exception=ValueError):
+                shared_arrays.allocate(key="values", shape=(1,))
+
+        with self.assertRaises(expected_exception=FileNotFoundError):
+            attach(spec=input_spec)
+
+    def test_close_method_after_worker_crash(self):
+        with self.assertRaises(expected_exception=BrokenProcessPool):
+            with SharedArrays() as shared_arrays:
+                input_spec = shared_arrays.publish(key="values", array=zeros(shape=(2, 2)))
+
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    executor.submit(_crash, input_spec=input_spec).result()
+
+        self.assertEqual(first=len(shared_arrays), second=0)
+
+        with self.assertRaises(expected_exception=FileNotFoundError):
+            attach(spec=input_spec)
@@ -0,0 +1,74 @@
+from os import path as os_path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import array, nan
+from numpy.random import default_rng
+from pandas import DataFrame, testing as pd_testing
+from scipy.stats import genpareto
+
+from src.detecto.parallel.sketches import FeatureSketches, QuantileSketch
+
+
+class TestSketches(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        rng = default_rng(seed=7)
+        self.test_df = DataFrame(
+            data={
+                f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=20_000, random_state=rng)
+                for feature in range(0, 3)
+            }
+        )
+
+    def test_string_method(self):
+        self.assertEqual(first=str(QuantileSketch()), second="Quantile Sketch")
+        self.assertEqual(first=str(FeatureSketches()), second="Feature Sketches")
+
+    def test_quantile_method_is_exact_before_compaction(self):
+        sketch = QuantileSketch(k=200).update(values=array([10.0, 20.0, nan, 30.0, 40.0, 50.0]))
+
+        self.assertTrue(expr=sketch.is_exact)
+        self.assertEqual(first=sketch.count, second=5)
+        for q in (0.0, 0.5, 0.9, 0.99, 1.0):
+            self.assertAlmostEqual(
+                first=sketch.quantile(q=q), second=DataFrame(data=[10, 20, 30, 40, 50])[0].quantile(q=q)
+            )
+
+    def test_merged_partitions_estimate_global_quantiles(self):
+        partitions = [self.test_df.iloc[start : start + 2_000] for start in range(0, self.test_df.shape[0], 2_000)]
+        sketches = FeatureSketches.merge_all(
+            sketches=[FeatureSketches(k=200).update(dataset=partition) for partition in partitions]
+        )
+
+        for feature, sketch in sketches.sketches.items():
+            self.assertEqual(first=sketch.count, second=20_000)
+            self.assertLess(a=len(sketch), b=1_000)
+            for q in (0.5, 0.9, 0.99):
+                rank = (self.test_df[feature] <= sketch.quantile(q=q)).mean()
+                self.assertLess(a=abs(rank - q), b=0.01)
+
+    def test_save_and_load_methods(self):
+        sketches = FeatureSketches(k=64).update(dataset=self.test_df.iloc[:5_000])
+
+        with TemporaryDirectory() as output_dir:
+            loaded_sketches = FeatureSketches.load(path=sketches.save(path=os_path.join(output_dir, "sketches")))
+
+        pd_testing.assert_series_equal(left=loaded_sketches.quantiles(q=0.99), right=sketches.quantiles(q=0.99))
+
+        loaded_sketches.update(dataset=self.test_df.iloc[5_000:])
+        sketches.update(dataset=self.test_df.iloc[5_000:])
+        pd_testing.assert_series_equal(left=loaded_sketches.quantiles(q=0.99), right=sketches.quantiles(q=0.99))
+
+    def test_sketches_catch_value_error(self):
+        with self.assertRaises(expected_exception=ValueError):
+            QuantileSketch(k=4)
+
+        with self.assertRaises(expected_exception=ValueError):
+            QuantileSketch(k=64).merge(other=QuantileSketch(k=128))
+
+        with self.assertRaises(expected_exception=ValueError):
+            FeatureSketches(k=64).merge(other=FeatureSketches(k=128))
+
+        with self.assertRaises(expected_exception=ValueError):
+            FeatureSketches.merge_all(sketches=[])
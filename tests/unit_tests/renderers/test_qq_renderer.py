@@ -0,0 +1,73 @@
+from os import path as os_path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import arange, linspace
+
+from src.detecto.models.renderers.interface import Renderer
+from src.detecto.models.renderers.qq import QQRenderer, QQResult
+
+
+class TestQQRenderer(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.renderer = QQRenderer(features_per_page=2, file_format="svg", max_workers=2)
+        self.qq_results = [
+            QQResult(
+                feature_name=f"feature_{index}",
+                sample_quantiles=arange(1, 11, dtype=float),
+                theoretical_quantiles=linspace(start=0.5, stop=12.0, num=10),
+                c=0.1 * index,
+                loc=0.0,
+                scale=2.5,
+            )
+            for index in range(0, 3)
+        ]
+
+    def test_instance_is_abstract_class(self):
+        self.assertIsInstance(obj=self.renderer, cls=Renderer)
+
+    def test_string_method(self):
+        self.assertEqual(first=str(self.renderer), second="QQ Plot Renderer")
+        self.assertEqual(first=str(self.qq_results[0]), second="QQ Result of feature_0")
+
+    def test_qq_result_attributes(self):
+        self.assertEqual(first=len(self.qq_results[1]), second=10)
+        self.assertEqual(first=self.qq_results[1].params, second=(0.1, 0.0, 2.5))
+
+    def test_render_method_writes_pages_in_process_pool(self):
+        with TemporaryDirectory() as output_dir:
+            files = self.renderer.render(results=self.qq_results, output_dir=os_path.join(output_dir, "qq"))
+
+            self.assertEqual(
+                first=files,
+                second=[
+                    os_path.join(output_dir, "qq", "qq_plot_0000.svg"),
+                    os_path.join(output_dir, "qq", "qq_plot_0001.svg"),
+                ],
+            )
+            for file_path in files:
+                self.assertTrue(expr=os_path.isfile(file_path))
+
+    def test_render_method_in_process(self):
+        renderer = QQRenderer(features_per_page=5, max_workers=1)
+
+        with TemporaryDirectory() as output_dir:
+            files = renderer.render(results=self.qq_results, output_dir=output_dir, prefix="daily")
+
+            self.assertEqual(first=files, second=[os_path.join(output_dir, "daily_0000.png")])
+            self.assertTrue(expr=os_path.isfile(files[0]))
+
+    def test_render_method_catches_value_error(self):
+        with self.assertRaises(expected_exception=ValueError):
+            QQRenderer(features_per_page=0)
+
+        with self.assertRaises(expected_exception=ValueError):
+            QQRenderer(file_format="jpeg")  # type: ignore
+
+        with TemporaryDirectory() as output_dir:
+            with self.assertRaises(expected_exception=ValueError):
+                self.renderer.render(results=[], output_dir=output_dir)
+
+    def tearDown(self) -> None:
+        return super().tearDown()
@@ -0,0 +1,197 @@
+from json import dumps
+from os import path as os_path
+from tempfile import TemporaryDirectory
+from threading import Event
+from unittest import TestCase
+from unittest.mock import patch
+
+from numpy.random import default_rng
+from pandas import DataFrame, date_range, testing as pd_testing
+from scipy.stats import genpareto
+
+from src.detecto.instrumentation.recorder import Recorder
+from src.detecto.models.detectors.pot import POTDetecto
+from src.detecto.serving.follower import TailFollower
+
+
+class TestTailFollower(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        rng = default_rng(seed=7)
+        self.test_df = DataFrame(
+            data={
+                f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=90, random_state=rng)
+                for feature in range(0, 2)
+            }
+        )
+        self.output_dir = TemporaryDirectory()
+        self.path = os_path.join(self.output_dir.name, "metrics.csv")
+        self.state_dir = os_path.join(self.output_dir.name, "state")
+        self.detector = self.__fitted_detector()
+        self.expected_detector = self.__fitted_detector()
+        self.expected_detector.update(dataset=self.test_df.iloc[60:])
+
+    def tearDown(self) -> None:
+        self.output_dir.cleanup()
+        super().tearDown()
+
+    def __fitted_detector(self) -> POTDetecto:
+        detector = POTDetecto(recorder=Recorder())
+        detector.timeframe.set_interval(total_rows=60, prod_mode=True)
+        detector.compute_exceedance_threshold(dataset=self.test_df.iloc[:60], q=0.90, keep_history=True)
+        detector.extract_exceedance(dataset=self.test_df.iloc[:60])
+        detector.fit(dataset=self.test_df.iloc[:60])
+        detector.compute_anomaly_threshold(q=0.80)
+        return detector
+
+    def __append(self, text: str) -> None:
+        with open(self.path, "a") as file:
+            file.write(text)
+
+    def __csv_lines(self, first_row: int, last_row: int) -> str:
+        return self.test_df.iloc[first_row:last_row].to_csv(header=False, index=False)
+
+    def __expected_anomalies(self, first_row: int, last_row: int) -> DataFrame:
+        scores = self.expected_detector.anomaly_score_dataset["total_anomaly_score"].iloc[-30:].reset_index(drop=True)  # type: ignore
+        scores = scores.iloc[first_row - 60 : last_row - 60]
+        return scores[scores > self.expected_detector.anomaly_threshold].to_frame()
+
+    def test_string_method(self):
+        self.__append(text="df_1_feature_0,df_1_feature_1\n")
+        self.assertEqual(
+            first=str(TailFollower(path=self.path, state_dir=self.state_dir, detector=self.detector)),
+            second="Tail Follower",
+        )
+
+    def test_poll_method_reads_only_new_complete_lines(self):
+        self.__append(text="df_1_feature_0,df_1_feature_1\n" + self.__csv_lines(first_row=60, last_row=70) + "1.0,")
+        follower = TailFollower(path=self.path, state_dir=self.state_dir, detector=self.detector, batch_rows=4)
+
+        first_anomalies = follower.poll()
+        self.assertEqual(first=follower.rows_read, second=10)
+        self.assertEqual(first=follower.poll().shape[0], second=0)
+
+        with open(self.path, "r+") as file:
+            file.truncate(file.seek(0, 2) - len("1.0,"))
+        self.__append(text=self.__csv_lines(first_row=70, last_row=90))
+        second_anomalies = follower.poll()
+
+        pd_testing.assert_frame_equal(
+            left=self.detector.anomaly_score_dataset, right=self.expected_detector.anomaly_score_dataset
+        )
+        pd_testing.assert_frame_equal(
+            left=first_anomalies, right=self.__expected_anomalies(first_row=60, last_row=70), check_index_type=False
+        )
+        pd_testing.assert_frame_equal(
+            left=second_anomalies, right=self.__expected_anomalies(first_row=70, last_row=90), check_index_type=False
+        )
+        self.assertEqual(first=self.detector.recorder.counters["rows_followed"], second=30)
+
+    def test_restart_resumes_without_rescoring(self):
+        self.__append(text="df_1_feature_0,df_1_feature_1\n" + self.__csv_lines(first_row=60, last_row=75))
+        TailFollower(path=self.path, state_dir=self.state_dir, detector=self.detector).poll()
+        self.__append(text=self.__csv_lines(first_row=75, last_row=90))
+
+        follower = TailFollower(path=self.path, state_dir=self.state_dir)
+        self.assertEqual(first=follower.rows_read, second=15)
+        anomalies = follower.poll()
+
+        pd_testing.assert_frame_equal(
+            left=follower.detector.anomaly_score_dataset, right=self.expected_detector.anomaly_score_dataset
+        )
+        pd_testing.assert_frame_equal(
+            left=anomalies, right=self.__expected_anomalies(first_row=75, last_row=90), check_index_type=False
+        )
+
+    def test_restart_after_interrupted_checkpoint(self):
+        self.__append(text="df_1_feature_0,df_1_feature_1\n" + self.__csv_lines(first_row=60, last_row=75))
+        TailFollower(path=self.path, state_dir=self.state_dir, detector=self.detector).poll()
+        self.__append(text=self.__csv_lines(first_row=75, last_row=90))
+
+        with patch.object(target=POTDetecto, attribute="save", side_effect=OSError("disk full")):
+            with self.assertRaises(expected_exception=OSError):
+                TailFollower(path=self.path, state_dir=self.state_dir).poll()
+
+        follower = TailFollower(path=self.path, state_dir=self.state_dir)
+        self.assertEqual(first=follower.rows_read, second=15)
+        follower.poll()
+        pd_testing.assert_frame_equal(
+            left=follower.detector.anomaly_score_dataset, right=self.expected_detector.anomaly_score_dataset
+        )
+
+    def test_follow_method_with_ndjson(self):
+        path = os_path.join(self.output_dir.name, "metrics.ndjson")
+        timestamps = date_range(start="2024-01-01", periods=30, freq="min")
+        with open(path, "w") as file:
+            for timestamp, row in zip(timestamps, self.test_df.iloc[60:].to_dict(orient="records")):
+                file.write(dumps({"timestamp": str(timestamp), **row}) + "\n")
+
+        detector = self.__fitted_detector()
+        detector.exceedance_dataset.index = date_range(end="2023-12-31 23:59", periods=60, freq="min")  # type: ignore
+        detector.exceedance_threshold_dataset.index = detector.exceedance_dataset.index  # type: ignore
+        follower = TailFollower(
+            path=path,
+            state_dir=self.state_dir,
+            detector=detector,
+            index_col="timestamp",
+            batch_rows=10,
+            poll_interval=0.01,
+        )
+        stop = Event()
+        anomalies = []
+        for batch_anomalies in follower.follow(stop=stop):
+            anomalies.append(batch_anomalies)
+            if follower.rows_read == 30:
+                stop.set()
+
+        expected_anomalies = self.__expected_anomalies(first_row=60, last_row=90)
+        self.assertEqual(
+            first=[timestamp for batch in anomalies for timestamp in batch.index],
+            second=list(timestamps[expected_anomalies.index]),
+        )
+        self.assertEqual(
+            first=TailFollower(path=path, state_dir=self.state_dir, index_col="timestamp").rows_read, second=30
+        )
+
+    def test_poll_method_follows_truncated_file_from_start(self):
+        self.__append(text="df_1_feature_0,df_1_feature_1\n" + self.__csv_lines(first_row=60, last_row=80))
+        follower = TailFollower(path=self.path, state_dir=self.state_dir, detector=self.detector)
+        follower.poll()
+
+        with open(self.path, "w") as file:
+            file.write("df_1_feature_0,df_1_feature_1\n" + self.__csv_lines(first_row=80, last_row=90))
+        follower.poll()
+
+        self.assertEqual(first=follower.rows_read, second=30)
+        self.assertEqual(first=self.detector.recorder.counters["files_rotated"], second=1)
+        pd_testing.assert_frame_equal(
+            left=self.detector.anomaly_score_dataset, right=self.expected_detector.anomaly_score_dataset
+        )
+
+    def test_start_at_end_skips_existing_lines(self):
+        self.__append(text="df_1_feature_0,df_1_feature_1\n" + self.__csv_lines(first_row=0, last_row=60))
+        follower = TailFollower(path=self.path, state_dir=self.state_dir, detector=self.detector, start="end")
+        self.__append(text=self.__csv_lines(first_row=60, last_row=90))
+        follower.poll()
+
+        self.assertEqual(first=follower.rows_read, second=30)
+        pd_testing.assert_frame_equal(
+            left=self.detector.anomaly_score_dataset, right=self.expected_detector.anomaly_score_dataset
+        )
+
+    def test_tail_follower_catches_value_error(self):
+        with self.assertRaises(expected_exception=ValueError):
+            TailFollower(path=self.path, state_dir=self.state_dir)
+
+        with self.assertRaises(expected_exception=ValueError):
+            TailFollower(
+                path=os_path.join(self.output_dir.name, "metrics.json"),
+                state_dir=self.state_dir,
+                detector=self.detector,
+            )
+
+        with self.assertRaises(expected_exception=ValueError):
+            TailFollower(path=self.path, state_dir=self.state_dir, detector=self.detector, batch_rows=0)
+
+        with self.assertRaises(expected_exception=ValueError):
+            TailFollower(path=self.path, state_dir=self.state_dir, detector=POTDetecto())
@@ -0,0 +1,140 @@
+from concurrent.futures import ThreadPoolExecutor
+from os import path as os_path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from numpy import array, float64, isnan, testing as np_testing, where
+from numpy.random import default_rng
+from pandas import DataFrame
+from scipy.stats import genpareto
+
+from src.detecto.models.detectors.pot import POTDetecto
+from src.detecto.serving.model import POTScoringModel
+
+
+class TestPOTScoringModel(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        rng = default_rng(seed=7)
+        self.test_df = DataFrame(
+            data={
+                **{
+                    f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=500, random_state=rng)
+                    for feature in range(0, 3)
+                },
+                "df_1_feature_constant": 1.0,
+            }
+        )
+        self.detector = POTDetecto()
+        self.detector.timeframe.set_interval(total_rows=60)
+        self.detector.compute_exceedance_threshold(dataset=self.test_df.iloc[:60], q=0.90)
+        self.detector.extract_exceedance(dataset=self.test_df.iloc[:60])
+        self.detector.fit(dataset=self.test_df.iloc[:60])
+        self.detector.compute_anomaly_threshold(q=0.80)
+        self.model = self.detector.to_scoring_model()
+
+    def test_string_method(self):
+        self.assertEqual(first=str(self.model), second="POT Scoring Model")
+
+    def test_score_methods_equal_gpd_survival_function(self):
+        batch = self.test_df.iloc[60:]
+        exceedances = batch.to_numpy() - self.model.thresholds
+        expected_scores = where(
+            (exceedances > 0) & ~isnan(self.model.c),
+            1 / genpareto.sf(x=exceedances, c=self.model.c, loc=0, scale=self.model.scale),
+            0.0,
+        )
+
+        self.assertEqual(first=self.model.features, second=tuple(self.test_df.columns))
+        self.assertTrue(expr=isnan(self.model.c[-1]))
+        np_testing.assert_allclose(actual=self.model.score_features(batch=batch), desired=expected_scores, rtol=1e-10)
+        np_testing.assert_allclose(
+            actual=self.model.score(batch=batch), desired=expected_scores.sum(axis=1), rtol=1e-10
+        )
+        np_testing.assert_array_equal(
+            x=self.model.predict(batch=batch.to_numpy()),
+            y=expected_scores.sum(axis=1) > self.detector.anomaly_threshold,
+        )
+        np_testing.assert_allclose(
+            actual=self.model.score(batch=batch.iloc[0].to_numpy()), desired=expected_scores[:1].sum(axis=1)
+        )
+
+    def test_to_scoring_model_method_exports_last_fitted_params(self):
+        for feature_index, feature_name in enumerate(self.test_df.columns[:-1]):
+            last_params = [
+                row_params[feature_index][feature_name]["gpd_params"]  # type: ignore
+                for row_params in self.detector.params.values()
+                if row_params[feature_index][feature_name]["gpd_params"]["scale"] != 0  # type: ignore
+            ][-1]
+
+            self.assertEqual(first=self.model.c[feature_index], second=last_params["c"])  # type: ignore
+            self.assertEqual(first=self.model.scale[feature_index], second=last_params["scale"])  # type: ignore
+
+        with TemporaryDirectory() as output_dir:
+            loaded_model = POTDetecto.load(path=self.detector.save(path=os_path.join(output_dir, "pot_model")))
+
+        np_testing.assert_array_equal(x=loaded_model.to_scoring_model().c, y=self.model.c)
+        np_testing.assert_array_equal(x=loaded_model.to_scoring_model().scale, y=self.model.scale)
+
+        float32_detector = POTDetecto(dtype="float32")
+        float32_detector.timeframe.set_interval(total_rows=60)
+        float32_detector.compute_exceedance_threshold(dataset=self.test_df.iloc[:60], q=0.90)
+        float32_detector.extract_exceedance(dataset=self.test_df.iloc[:60])
+        float32_detector.fit(dataset=self.test_df.iloc[:60])
+        float32_model = float32_detector.to_scoring_model()
+
+        self.assertEqual(first=float32_model.c.dtype, second=float64)
+        self.assertEqual(first=float32_model.thresholds.dtype, second=float64)
+        np_testing.assert_allclose(actual=float32_model.scale, desired=self.model.scale, rtol=1e-4)
+
+    def test_score_method_is_thread_safe(self):
+        batches = [self.test_df.iloc[start : start + 10].to_numpy() for start in range(0, 500, 10)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            concurrent_scores = list(executor.map(self.model.score, batches))
+
+        for batch, scores in zip(batches, concurrent_scores):
+            np_testing.assert_array_equal(x=scores, y=self.model.score(batch=batch))
+
+    def test_model_is_frozen(self):
+        with self.assertRaises(expected_exception=AttributeError):
+            self.model.anomaly_threshold = 0.0  # type: ignore
+
+        with self.assertRaises(expected_exception=ValueError):
+            self.model.thresholds[0] = 0.0
+
+    def test_save_and_load_methods(self):
+        with TemporaryDirectory() as output_dir:
+            loaded_model = POTScoringModel.load(path=self.model.save(path=os_path.join(output_dir, "scoring_model")))
+
+            with self.assertRaises(expected_exception=ValueError):
+                POTScoringModel.load(path=self.detector.save(path=os_path.join(output_dir, "pot_model")))
+
+        np_testing.assert_array_equal(x=loaded_model.score(batch=self.test_df), y=self.model.score(batch=self.test_df))
+        self.assertEqual(first=loaded_model.anomaly_threshold, second=self.model.anomaly_threshold)
+
+    def test_model_catches_value_error(self):
+        with self.assertRaises(expected_exception=ValueError):
+            self.model.score(batch=self.test_df.drop(columns=["df_1_feature_0"]))
+
+        with self.assertRaises(expected_exception=ValueError):
+            self.model.score(batch=self.test_df.to_numpy()[:, :2])
+
+        with self.assertRaises(expected_exception=ValueError):
+            POTScoringModel(features=("a",), thresholds=array([1.0]), c=array([0.1]), scale=array([1.0])).predict(
+                batch=array([[2.0]])
+            )
+
+        with self.assertRaises(expected_exception=ValueError):
+            POTScoringModel(features=("a", "b"), thresholds=array([1.0]), c=array([0.1]), scale=array([1.0]))
+
+        with self.assertRaises(expected_exception=ValueError):
+            POTDetecto().to_scoring_model()
+
+        unfitted_detector = POTDetecto()
+        unfitted_detector.timeframe.set_interval(total_rows=60)
+        unfitted_detector.compute_exceedance_threshold(dataset=self.test_df.iloc[:60], q=0.90)
+        unfitted_detector.extract_exceedance(dataset=self.test_df.iloc[:60])
+
+        with self.assertRaises(expected_exception=ValueError):
+            unfitted_detector.to_scoring_model()
@@ -0,0 +1,164 @@
+from asyncio import gather, open_connection
+from json import dumps, loads
+from math import isfinite
+from os import path as os_path
+from tempfile import TemporaryDirectory
+from unittest import IsolatedAsyncioTestCase
+
+from numpy import array, testing as np_testing
+from numpy.random import default_rng
+from pandas import DataFrame
+from scipy.stats import genpareto
+
+from src.detecto.models.detectors.pot import POTDetecto
+from src.detecto.serving.model import POTScoringModel
+from src.detecto.serving.server import load_scoring_model, ScoringServer
+
+
+async def _request(
+    address: tuple[str, int], method: str, path: str, body: bytes = b"", content_type: str = "application/json"
+) -> tuple[int, bytes]:
+    (reader, writer) = await open_connection(*address)
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    (head, _, content) = response.partition(b"\r\n\r\n")
+    return (int(head.split()[1]), content)
+
+
+class TestScoringServer(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        rng = default_rng(seed=7)
+        self.test_df = DataFrame(
+            data={
+                f"df_1_feature_{feature}": genpareto.rvs(c=0.3, scale=10.0, size=100, random_state=rng)
+                for feature in range(0, 3)
+            }
+        )
+        self.detector = POTDetecto()
+        self.detector.timeframe.set_interval(total_rows=60)
+        self.detector.compute_exceedance_threshold(dataset=self.test_df.iloc[:60], q=0.90)
+        self.detector.extract_exceedance(dataset=self.test_df.iloc[:60])
+        self.detector.fit(dataset=self.test_df.iloc[:60])
+        self.detector.compute_anomaly_threshold(q=0.80)
+        self.model = self.detector.to_scoring_model()
+        self.batch = self.test_df.iloc[60:]
+
+    def __expected_scores(self, batch: DataFrame) -> list[float | None]:
+        return [score if isfinite(score) else None for score in self.model.score(batch=batch).tolist()]
+
+    def test_string_method(self):
+        self.assertEqual(first=str(ScoringServer(model=self.model)), second="Scoring Server")
+
+    async def test_score_endpoint_with_json(self):
+        async with ScoringServer(model=self.model) as server:
+            (status, content) = await _request(
+                address=server.address,
+                method="POST",
+                path="/score",
+                body=dumps(self.batch.to_dict(orient="records")).encode(),
+            )
+
+        result = loads(content)
+        self.assertEqual(first=status, second=200)
+        self.assertEqual(first=result["total_anomaly_score"], second=self.__expected_scores(batch=self.batch))
+        self.assertEqual(first=result["is_anomaly"], second=self.model.predict(batch=self.batch).tolist())
+
+    async def test_score_endpoint_micro_batches_concurrent_requests(self):
+        async with ScoringServer(model=self.model, batch_window=0.05) as server:
+            responses = await gather(
+                *[
+                    _request(address=server.address, method="POST", path="/score", body=dumps(row).encode())
+                    for row in self.batch.to_numpy().tolist()
+                ]
+            )
+            (_, metrics_content) = await _request(address=server.address, method="GET", path="/metrics")
+
+        for (status, content), (_, row) in zip(responses, self.batch.iterrows()):
+            self.assertEqual(first=status, second=200)
+            self.assertEqual(
+                first=loads(content)["total_anomaly_score"], second=self.__expected_scores(batch=row.to_frame().T)
+            )
+
+        metrics = loads(metrics_content)
+        self.assertEqual(first=metrics["counters"]["requests"], second=40)
+        self.assertEqual(first=metrics["counters"]["rows_scored"], second=40)
+        self.assertLess(a=metrics["counters"]["batches"], b=40)
+        self.assertGreater(a=metrics["rows_per_second"], b=0.0)
+        self.assertGreaterEqual(a=metrics["latency_ms"]["p99"], b=metrics["latency_ms"]["p50"])
+
+    async def test_score_endpoint_with_ndjson_and_keep_alive(self):
+        body = "".join(f"{dumps(record)}\n" for record in self.batch.iloc[:5].to_dict(orient="records")).encode()
+
+        async with ScoringServer(model=self.model) as server:
+            (reader, writer) = await open_connection(*server.address)
+            request = (
+                f"POST /score HTTP/1.1\r\nContent-Type: application/x-ndjson\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+            for _ in range(0, 2):
+                writer.write(request)
+                await writer.drain()
+                head = await reader.readuntil(separator=b"\r\n\r\n")
+                content_length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+                lines = (await reader.readexactly(content_length)).decode().splitlines()
+
+                self.assertIn(member=b"Connection: keep-alive", container=head)
+                self.assertEqual(
+                    first=[loads(line)["total_anomaly_score"] for line in lines],
+                    second=self.__expected_scores(batch=self.batch.iloc[:5]),
+                )
+            writer.close()
+            await writer.wait_closed()
+
+    async def test_server_catches_bad_requests(self):
+        async with ScoringServer(model=self.model, max_body_bytes=64) as server:
+            self.assertEqual(
+                first=await _request(address=server.address, method="GET", path="/health"), second=(200, b"ok")
+            )
+            self.assertEqual(
+                first=(await _request(address=server.address, method="GET", path="/other"))[0], second=404
+            )
+            self.assertEqual(
+                first=(await _request(address=server.address, method="GET", path="/score"))[0], second=405
+            )
+            self.assertEqual(
+                first=(await _request(address=server.address, method="POST", path="/score", body=b"{"))[0], second=400
+            )
+            self.assertEqual(
+                first=(await _request(address=server.address, method="POST", path="/score", body=b"[1.0]"))[0],
+                second=400,
+            )
+            self.assertEqual(
+                first=(await _request(address=server.address, method="POST", path="/score", body=b"[" + b"1.0," * 32))[
+                    0
+                ],
+                second=413,
+            )
+            self.assertEqual(first=server.recorder.counters["bad_requests"], second=3)
+
+    def test_load_scoring_model_function(self):
+        with TemporaryDirectory() as output_dir:
+            models = [
+                load_scoring_model(path=self.model.save(path=os_path.join(output_dir, "scoring_model"))),
+                load_scoring_model(path=self.detector.save(path=os_path.join(output_dir, "pot_model"))),
+            ]
+
+        for model in models:
+            np_testing.assert_allclose(
+                actual=model.score(batch=self.batch), desired=self.model.score(batch=self.batch)
+            )
+
+        with self.assertRaises(expected_exception=ValueError):
+            ScoringServer(
+                model=POTScoringModel(features=("a",), thresholds=array([1.0]), c=array([0.1]), scale=array([1.0]))
+            )
+
+        with self.assertRaises(expected_exception=ValueError):
+            ScoringServer(model=self.model).address
@@ -1,7 +1,11 @@
+from os import path as os_path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
+from numpy import load, save
 from pandas import DataFrame, testing as pd_testing
 
+from src.detecto.io.cache import StageCache
 from src.detecto.standalone.pot_detecto import (
     compute_extreme_anomaly_threshold,
     compute_pot_threshold,
@@ -131,6 +135,51 @@ class TestStandalonePOTDetectoFunctions(TestCase):
         pd_testing.assert_frame_equal(left=extreme_anomaly_score_df, right=expected_extreme_anomaly_score_df)
         self.assertEqual(first=type(gpd_params), second=dict)
 
+    def test_functions_with_cache(self):
+        with TemporaryDirectory() as cache_dir:
+            cache = StageCache(path=cache_dir)
+            results = []
+
+            for _ in range(0, 2):
+                pot_threshold_df = compute_pot_threshold(dataset=self.df_1, t0=self.t0, q=0.90, cache=cache)
+                pot_df = extract_pot_data(dataset=self.df_1, pot_threshold_dataset=pot_threshold_df, cache=cache)
+                (params, anomaly_score_df) = fit_pot_data(
+                    dataset=self.df_1, pot_dataset=pot_df, t0=self.t0, cache=cache
+                )
+                results.append((pot_threshold_df, pot_df, params, anomaly_score_df))
+
+            self.assertEqual(first=(cache.misses, cache.hits), second=(3, 3))
+
+            pd_testing.assert_frame_equal(
+                left=results[1][0], right=compute_pot_threshold(dataset=self.df_1, t0=self.t0, q=0.90)
+            )
+            pd_testing.assert_frame_equal(left=results[1][1], right=results[0][1])
+            pd_testing.assert_frame_equal(left=results[1][3], right=results[0][3])
+            self.assertEqual(first=results[1][2], second=results[0][2])
+
+    def test_functions_with_memory_mapped_dataset(self):
+        with TemporaryDirectory() as output_dir:
+            save(file=os_path.join(output_dir, "dataset.npy"), arr=self.df_1.to_numpy(dtype=float))
+            memory_map = load(file=os_path.join(output_dir, "dataset.npy"), mmap_mode="r")
+            expected_df = self.df_1.astype(float).set_axis(["feature_0", "feature_1"], axis=1)
+
+            pot_threshold_df = compute_pot_threshold(dataset=memory_map, t0=self.t0, q=0.90)
+            pot_df = extract_pot_data(dataset=memory_map, pot_threshold_dataset=pot_threshold_df)
+            (params, anomaly_score_df) = fit_pot_data(dataset=memory_map, pot_dataset=pot_df, t0=self.t0)
+            expected_pot_threshold_df = compute_pot_threshold(dataset=expected_df, t0=self.t0, q=0.90)
+            expected_pot_df = extract_pot_data(dataset=expected_df, pot_threshold_dataset=expected_pot_threshold_df)
+
+            pd_testing.assert_frame_equal(left=pot_threshold_df, right=expected_pot_threshold_df)
+            pd_testing.assert_frame_equal(left=pot_df, right=expected_pot_df)
+
+            (expected_params, expected_anomaly_score_df) = fit_pot_data(
+                dataset=expected_df, pot_dataset=expected_pot_df, t0=self.t0
+            )
+
+            pd_testing.assert_frame_equal(left=anomaly_score_df, right=expected_anomaly_score_df)
+            self.assertEqual(first=params, second=expected_params)
+            del memory_map
+
     def test_compute_extreme_anomaly_threshold_function(self):
         expected_extreme_anomaly_threshold = 2.04403430931313
         test_df = DataFrame(
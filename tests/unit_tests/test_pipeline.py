@@ -0,0 +1,255 @@
+from json import loads
+from os import path as os_path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch, PropertyMock
+
+from pandas import DataFrame, testing as pd_testing
+
+from src.detecto.datasets.synthetic import SyntheticPOTDataset
+from src.detecto.instrumentation.exporters import JSONLinesExporter, PrometheusExporter
+from src.detecto.instrumentation.recorder import NullRecorder, Recorder
+from src.detecto.io.store import read_store
+from src.detecto.models.detectors.pot import POTDetecto
+from src.detecto.models.notifications.slack import SlackNotification
+from src.detecto.pipeline import Pipeline
+
+
+class TestPipeline(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dataset = (
+            SyntheticPOTDataset(rows=200, features=2, seed=0, exceedance_rate=0.1)
+            .to_frame()
+            .drop(columns=["is_anomaly"])
+        )
+        self.webhook_url = "https://hooks.slack.com/services/TEST/TOKEN/WEBHOOK"
+
+    def test_init_method(self):
+        pipeline = Pipeline(
+            dataset=self.dataset,
+            temporal_feature="timestamp",
+            detecto_method="pot",
+            notification_platform="slack",
+            webhook_url=self.webhook_url,
+        )
+
+        self.assertIsInstance(obj=pipeline.detecto, cls=POTDetecto)
+        self.assertIsInstance(obj=pipeline.notification, cls=SlackNotification)
+        self.assertIsInstance(obj=pipeline.recorder, cls=NullRecorder)
+        self.assertEqual(first=list(pipeline.dataset.columns), second=["feature_0", "feature_1"])
+        self.assertEqual(first=pipeline.detecto.timeframe.t2, second=1)  # type: ignore
+
+    def test_execute_method(self):
+        pipeline = Pipeline(
+            dataset=self.dataset,
+            temporal_feature="timestamp",
+            detecto_method="pot",
+            notification_platform="slack",
+            webhook_url=self.webhook_url,
+        )
+        anomaly_dataset = pipeline.execute()
+
+        self.assertIsInstance(obj=anomaly_dataset, cls=DataFrame)
+        self.assertEqual(first=anomaly_dataset.shape, second=(1, 1))
+        self.assertEqual(first=pipeline.run_report, second={"stages": {}, "counters": {}, "histograms": {}})
+
+    def test_execute_method_with_instrumentation(self):
+        events: list[tuple[str, dict]] = []
+        pipeline = Pipeline(
+            dataset=self.dataset,
+            temporal_feature="timestamp",
+            detecto_method="pot",
+            notification_platform="slack",
+            instrument=True,
+            hooks=[lambda event, payload: events.append((event, payload))],
+            webhook_url=self.webhook_url,
+        )
+        pipeline.execute()
+        report = pipeline.run_report
+
+        self.assertIsInstance(obj=pipeline.recorder, cls=Recorder)
+        self.assertIs(expr1=pipeline.detecto.recorder, expr2=pipeline.recorder)  # type: ignore
+        self.assertEqual(
+            first=set(report["stages"].keys()),
+            second={
+                "execute",
+                "compute_exceedance_threshold",
+                "extract_exceedance",
+                "fit",
+                "compute_anomaly_threshold",
+                "detect",
+                "evaluate",
+            },
+        )
+        self.assertGreaterEqual(a=report["stages"]["execute"]["wall_s"], b=report["stages"]["fit"]["wall_s"])
+        self.assertEqual(first=report["counters"]["rows_processed"], second=200)
+        self.assertEqual(first=report["counters"]["features_processed"], second=2)
+        self.assertEqual(first=report["counters"]["rows_fitted"], second=200 - pipeline.detecto.timeframe.t0)  # type: ignore
+        self.assertEqual(
+            first=sum(report["histograms"]["optimizer_iterations"].values()), second=report["counters"]["gpd_fits"]
+        )
+        self.assertEqual(first=events[-1], second=("run", report))
+
+        pipeline.execute()
+
+        self.assertEqual(first=pipeline.run_report["stages"]["execute"]["calls"], second=1)
+
+    def test_execute_method_with_exporters_and_notification(self):
+        self.dataset.loc[self.dataset.index[-1], "feature_1"] = 10_000.0
+
+        with TemporaryDirectory() as output_dir:
+            prometheus_path = os_path.join(output_dir, "detecto.prom")
+            jsonl_path = os_path.join(output_dir, "detecto.jsonl")
+            pipeline = Pipeline(
+                dataset=self.dataset,
+                temporal_feature="timestamp",
+                detecto_method="pot",
+                notification_platform="slack",
+                hooks=[PrometheusExporter(path=prometheus_path), JSONLinesExporter(path=jsonl_path)],
+                webhook_url=self.webhook_url,
+            )
+
+            with patch.object(SlackNotification, "send", new_callable=PropertyMock) as mock_send:
+                anomaly_dataset = pipeline.execute(notify=True)
+
+            with open(prometheus_path) as file:
+                prometheus_lines = file.read().splitlines()
+            with open(jsonl_path) as file:
+                metrics = loads(file.readline())
+
+        self.assertTrue(expr=anomaly_dataset["is_anomaly"].iloc[-1])
+        mock_send.assert_called_once()
+        self.assertIn(
+            member="Column: feature_1 | Anomaly: 10000.0",
+            container=pipeline.notification._SlackNotification__payload,  # type: ignore
+        )
+        self.assertIn(member="detecto_anomalies_detected 1.0", container=prometheus_lines)
+        self.assertEqual(first=metrics["rows_processed"], second=200)
+        self.assertEqual(first=metrics["features_processed"], second=2)
+        self.assertGreater(a=metrics["fits_per_second"], b=0.0)
+        self.assertEqual(
+            first=metrics["notification_duration_seconds"], second=metrics["stage_duration_seconds"]["notification"]
+        )
+
+    def test_execute_method_with_profile(self):
+        pipeline = Pipeline(
+            dataset=self.dataset,
+            temporal_feature="timestamp",
+            detecto_method="pot",
+            notification_platform="slack",
+            webhook_url=self.webhook_url,
+        )
+
+        with TemporaryDirectory() as output_dir:
+            pipeline.execute(profile="tracemalloc", profile_dir=output_dir)
+
+            self.assertEqual(first=pipeline.profile_report["method"], second="tracemalloc")  # type: ignore
+            self.assertEqual(
+                first=pipeline.profile_report["files"],  # type: ignore
+                second=[
+                    os_path.join(output_dir, "execute_profile.tracemalloc"),
+                    os_path.join(output_dir, "execute_profile.summary.txt"),
+                ],
+            )
+            self.assertGreater(a=len(pipeline.profile_report["summary"]), b=0)  # type: ignore
+
+    def test_execute_method_with_incremental_mode(self):
+        with TemporaryDirectory() as output_dir:
+            state_path = os_path.join(output_dir, "pot_state")
+            first_pipeline = Pipeline(
+                dataset=self.dataset.iloc[:195],
+                temporal_feature="timestamp",
+                detecto_method="pot",
+                notification_platform="slack",
+                instrument=True,
+                state_path=state_path,
+                webhook_url=self.webhook_url,
+            )
+            first_pipeline.execute(incremental=True)
+
+            self.assertTrue(expr=os_path.isfile(os_path.join(state_path, "metadata.json")))
+
+            pipeline = Pipeline(
+                dataset=self.dataset,
+                temporal_feature="timestamp",
+                detecto_method="pot",
+                notification_platform="slack",
+                instrument=True,
+                state_path=state_path,
+                webhook_url=self.webhook_url,
+            )
+            anomaly_dataset = pipeline.execute(incremental=True)
+            report = pipeline.run_report
+
+            self.assertEqual(first=anomaly_dataset.shape, second=(1, 1))
+            self.assertEqual(first=report["counters"]["rows_updated"], second=5)
+            self.assertNotIn(member="fit", container=report["stages"])
+            self.assertNotIn(member="evaluate", container=report["stages"])
+            self.assertNotIn(member="compute_anomaly_threshold", container=report["stages"])
+            self.assertEqual(
+                first=pipeline.detecto.anomaly_threshold, second=first_pipeline.detecto.anomaly_threshold  # type: ignore
+            )
+            self.assertEqual(first=read_store(path=state_path)[1]["rows"]["exceedance_dataset"], second=200)
+            self.assertLessEqual(a=report["counters"].get("gpd_fits", 0), b=5 * 2)
+            self.assertEqual(first=POTDetecto.load(path=state_path).exceedance_dataset.shape, second=(200, 2))  # type: ignore
+
+            detector = POTDetecto()
+            detector.timeframe.t0, detector.timeframe.t1, detector.timeframe.t2 = (
+                first_pipeline.detecto.timeframe.t0,  # type: ignore
+                first_pipeline.detecto.timeframe.t1 + 5,  # type: ignore
+                1,
+            )
+            detector.compute_exceedance_threshold(dataset=pipeline.dataset)
+            detector.extract_exceedance(dataset=pipeline.dataset)
+            detector.fit(dataset=pipeline.dataset)
+            pd_testing.assert_frame_equal(
+                left=pipeline.detecto.anomaly_score_dataset, right=detector.anomaly_score_dataset  # type: ignore
+            )
+
+            with self.assertRaises(expected_exception=ValueError):
+                Pipeline(
+                    dataset=self.dataset.iloc[:190],
+                    temporal_feature="timestamp",
+                    detecto_method="pot",
+                    notification_platform="slack",
+                    state_path=state_path,
+                    webhook_url=self.webhook_url,
+                ).execute(incremental=True)
+
+            new_rows_state_path = os_path.join(output_dir, "new_rows_pot_state")
+            Pipeline(
+                dataset=self.dataset.iloc[:195],
+                temporal_feature="timestamp",
+                detecto_method="pot",
+                notification_platform="slack",
+                state_path=new_rows_state_path,
+                webhook_url=self.webhook_url,
+            ).execute(incremental=True)
+            new_rows_pipeline = Pipeline(
+                dataset=self.dataset.iloc[195:],
+                temporal_feature="timestamp",
+                detecto_method="pot",
+                notification_platform="slack",
+                instrument=True,
+                state_path=new_rows_state_path,
+                webhook_url=self.webhook_url,
+            )
+
+            pd_testing.assert_frame_equal(left=new_rows_pipeline.execute(incremental=True), right=anomaly_dataset)
+            self.assertEqual(first=new_rows_pipeline.run_report["counters"]["rows_updated"], second=5)
+            pd_testing.assert_frame_equal(
+                left=new_rows_pipeline.detecto.anomaly_score_dataset, right=detector.anomaly_score_dataset  # type: ignore
+            )
+
+        with self.assertRaises(expected_exception=ValueError):
+            Pipeline(
+                dataset=self.dataset,
+                temporal_feature="timestamp",
+                detecto_method="pot",
+                notification_platform="slack",
+                webhook_url=self.webhook_url,
+            ).execute(incremental=True)
+
+    def tearDown(self) -> None:
+        return super().tearDown()